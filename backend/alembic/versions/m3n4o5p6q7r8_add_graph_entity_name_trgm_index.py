@@ -0,0 +1,44 @@
+"""add trigram index on graph entity names
+
+Revision ID: m3n4o5p6q7r8
+Revises: e734c8f0c44e
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "m3n4o5p6q7r8"
+down_revision: Union[str, Sequence[str], None] = "e734c8f0c44e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index graph_entities.name for GraphRAG's substring ILIKE lookup.
+
+    PostgreSQL only: a pg_trgm GIN index serves ``name ILIKE '%term%'``.
+    SQLite keeps the existing B-tree index on name.
+    """
+    conn = op.get_bind()
+    if conn.dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_graph_entities_name_trgm "
+        "ON graph_entities USING gin (name gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Drop the graph entity name trigram index."""
+    conn = op.get_bind()
+    if conn.dialect.name != "postgresql":
+        return
+
+    op.execute(sa.text("DROP INDEX IF EXISTS idx_graph_entities_name_trgm"))
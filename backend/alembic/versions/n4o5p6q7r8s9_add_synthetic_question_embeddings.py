@@ -0,0 +1,57 @@
+"""add synthetic question embeddings
+
+Revision ID: n4o5p6q7r8s9
+Revises: m3n4o5p6q7r8
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "n4o5p6q7r8s9"
+down_revision: Union[str, Sequence[str], None] = "m3n4o5p6q7r8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add embedding and updated_at columns to synthetic_questions."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if "synthetic_questions" not in inspector.get_table_names():
+        return
+    existing_cols = {c["name"] for c in inspector.get_columns("synthetic_questions")}
+
+    if "embedding" not in existing_cols:
+        op.add_column(
+            "synthetic_questions",
+            sa.Column("embedding", sa.Text(), nullable=True),
+        )
+
+    if "updated_at" not in existing_cols:
+        op.add_column(
+            "synthetic_questions",
+            sa.Column(
+                "updated_at",
+                sa.DateTime(timezone=True),
+                nullable=False,
+                server_default=sa.func.current_timestamp(),
+            ),
+        )
+
+
+def downgrade() -> None:
+    """Remove synthetic question embedding columns."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if "synthetic_questions" not in inspector.get_table_names():
+        return
+    existing_cols = {c["name"] for c in inspector.get_columns("synthetic_questions")}
+
+    for col in ("updated_at", "embedding"):
+        if col in existing_cols:
+            op.drop_column("synthetic_questions", col)
@@ -0,0 +1,48 @@
+"""add resource keyset pagination indexes
+
+Revision ID: o5p6q7r8s9t0
+Revises: n4o5p6q7r8s9
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "o5p6q7r8s9t0"
+down_revision: Union[str, Sequence[str], None] = "n4o5p6q7r8s9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_INDEXES = {
+    "idx_resources_created_id": ("created_at", "id"),
+    "idx_resources_updated_id": ("updated_at", "id"),
+    "idx_resources_quality_id": ("quality_score", "id"),
+    "idx_resources_title_id": ("title", "id"),
+}
+
+
+def upgrade() -> None:
+    """Index (sort column, id) for each sortable resource list column.
+
+    list_resources pages with ``WHERE (col, id) < (:col, :id) ORDER BY col,
+    id``; these indexes let each page be a short index range scan in either
+    direction.
+    """
+    for name, columns in _INDEXES.items():
+        op.execute(
+            sa.text(
+                f"CREATE INDEX IF NOT EXISTS {name} "
+                f"ON resources ({', '.join(columns)})"
+            )
+        )
+
+
+def downgrade() -> None:
+    """Drop the resource keyset pagination indexes."""
+    for name in _INDEXES:
+        op.execute(sa.text(f"DROP INDEX IF EXISTS {name}"))
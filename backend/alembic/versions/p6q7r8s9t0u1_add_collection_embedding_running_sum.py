@@ -0,0 +1,45 @@
+"""add collection embedding running sum
+
+Revision ID: p6q7r8s9t0u1
+Revises: o5p6q7r8s9t0
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "p6q7r8s9t0u1"
+down_revision: Union[str, Sequence[str], None] = "o5p6q7r8s9t0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store each collection's embedding as a running sum plus member count.
+
+    Existing collections keep embedding_sum NULL; the first membership change
+    recomputes them exactly and fills it in.
+    """
+    op.add_column("collections", sa.Column("embedding_sum", sa.JSON(), nullable=True))
+    op.add_column(
+        "collections",
+        sa.Column("embedding_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "collections",
+        sa.Column(
+            "embedding_updates", sa.Integer(), nullable=False, server_default="0"
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop the collection embedding running sum columns."""
+    with op.batch_alter_table("collections") as batch_op:
+        batch_op.drop_column("embedding_updates")
+        batch_op.drop_column("embedding_count")
+        batch_op.drop_column("embedding_sum")
@@ -0,0 +1,42 @@
+"""add collection member embedding checksum
+
+Revision ID: q7r8s9t0u1v2
+Revises: p6q7r8s9t0u1
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "q7r8s9t0u1v2"
+down_revision: Union[str, Sequence[str], None] = "p6q7r8s9t0u1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Record which embedding each member contributed to its collection's sum.
+
+    Running sums built before this column existed have no per-member record,
+    so they are cleared; the next membership change recomputes them exactly.
+    """
+    op.add_column(
+        "collection_resources",
+        sa.Column("embedding_checksum", sa.String(16), nullable=True),
+    )
+    op.execute(
+        sa.text(
+            "UPDATE collections SET embedding_sum = NULL, embedding_count = 0 "
+            "WHERE embedding_sum IS NOT NULL"
+        )
+    )
+
+
+def downgrade() -> None:
+    """Drop the collection member embedding checksum."""
+    with op.batch_alter_table("collection_resources") as batch_op:
+        batch_op.drop_column("embedding_checksum")
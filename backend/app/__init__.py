@@ -271,22 +271,59 @@ async def lifespan(app: FastAPI):
                 "✓ Cloud mode: ML models will NOT be loaded (queued to edge worker via Redis)"
             )
         else:
-            # Warmup embedding model to avoid cold start latency (EDGE mode only)
+            # Warmup ML models to avoid cold start latency (EDGE mode only).
+            # Models land in the process-wide registry, so the per-request
+            # services below reuse these copies instead of loading their own.
             logger.info("Edge mode: Loading ML models for local processing")
-            try:
+
+            def _warmup_embedding():
                 from .shared.embeddings import EmbeddingService
 
-                embedding_service = EmbeddingService()
-                if embedding_service.warmup():
-                    logger.info("✓ Embedding model warmed up successfully")
-                else:
+                return EmbeddingService().warmup()
+
+            def _warmup_splade():
+                from .modules.search.sparse_embeddings_real import RealSPLADEService
+
+                return RealSPLADEService(None).warmup()
+
+            def _warmup_reranker():
+                from .modules.search.reranking import RerankingService
+
+                return RerankingService(None).warmup()
+
+            def _warmup_summarizer():
+                from .shared.ai_core import Summarizer
+
+                return Summarizer().warmup()
+
+            def _warmup_tagger():
+                from .shared.ai_core import ZeroShotTagger
+
+                return ZeroShotTagger().warmup()
+
+            warmups = {
+                "embedding": _warmup_embedding,
+                "splade": _warmup_splade,
+                "reranker": _warmup_reranker,
+                "summarizer": _warmup_summarizer,
+                "tagger": _warmup_tagger,
+            }
+            for name in settings.MODEL_WARMUP:
+                warmup = warmups.get(name)
+                if warmup is None:
+                    logger.warning(f"Unknown model in MODEL_WARMUP: {name}")
+                    continue
+                try:
+                    if warmup():
+                        logger.info(f"✓ {name} model warmed up successfully")
+                    else:
+                        logger.warning(
+                            f"⚠ {name} model warmup failed - first use may be slow"
+                        )
+                except Exception as e:
                     logger.warning(
-                        "⚠ Embedding model warmup failed - first encoding may be slow"
+                        f"{name} model warmup failed: {e} - first use may be slow"
                     )
-            except Exception as e:
-                logger.warning(
-                    f"Embedding model warmup failed: {e} - first encoding may be slow"
-                )
 
         # Initialize Redis cache connection (lazy - will connect on first use)
         try:
@@ -300,11 +337,24 @@ async def lifespan(app: FastAPI):
                 # Don't ping on startup - let it connect on first use
                 # This avoids blocking startup on Redis cold starts (5-15s on Upstash free tier)
                 logger.info("✓ Redis cache initialized (will connect on first use)")
+                if settings.CACHE_NEAR_ENABLED:
+                    cache.enable_near_cache()
         except Exception as e:
             logger.warning(
                 f"Redis cache initialization failed: {e} - caching will be disabled"
             )
 
+    # Move event handlers off the request path
+    if settings.EVENT_BUS_ASYNC:
+        from .shared.event_bus import event_bus
+
+        for event_type in settings.EVENT_BUS_COALESCE_EVENTS:
+            event_bus.coalesce(event_type)
+        event_bus.start_async_dispatch(
+            workers=settings.EVENT_BUS_WORKERS,
+            queue_size=settings.EVENT_BUS_QUEUE_SIZE,
+        )
+
     # Register event hooks for automatic data consistency
     try:
         from .events.hooks import register_all_hooks
@@ -323,6 +373,14 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down Neo Alexandria 2.0...")
 
+    from .shared.cache import cache
+    from .shared.event_bus import event_bus
+    from .shared.graph_analytics import shutdown_analytics_pool
+
+    event_bus.stop_async_dispatch()
+    cache.disable_near_cache()
+    shutdown_analytics_pool()
+
 
 def create_app() -> FastAPI:
     """
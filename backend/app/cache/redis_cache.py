@@ -167,7 +167,8 @@ class RedisCache:
             pattern: Redis key pattern (e.g., "search_query:*")
         """
         try:
-            keys = self.redis.keys(pattern)
+            # SCAN instead of KEYS so Redis is not blocked for the whole keyspace
+            keys = list(self.redis.scan_iter(match=pattern, count=500))
             if keys:
                 deleted = self.redis.delete(*keys)
                 self.stats.record_invalidation(deleted)
@@ -96,6 +96,8 @@ class Settings(BaseSettings):
     RATE_LIMIT_FREE_TIER: int = 100  # requests per minute
     RATE_LIMIT_PREMIUM_TIER: int = 1000  # requests per minute
     RATE_LIMIT_ADMIN_TIER: int = 10000  # 0 = unlimited
+    RATE_LIMIT_LOCAL_BATCH: int = 10  # Tokens leased from Redis per call (<= 1 disables)
+    RATE_LIMIT_LOCAL_LEASE_SECONDS: float = 1.0  # Unused leased tokens expire after this
 
     # File Upload Validation
     ALLOWED_FILE_EXTENSIONS: set[str] = {
@@ -339,6 +341,58 @@ class Settings(BaseSettings):
     DEFAULT_HYBRID_SEARCH_WEIGHT: float = 0.5  # 0.0=keyword only, 1.0=semantic only
     EMBEDDING_CACHE_SIZE: int = 1000  # for model caching if needed
 
+    # Process-wide model registry (app/shared/model_registry.py)
+    MODEL_WARMUP: list[str] = ["embedding"]  # embedding, splade, reranker, summarizer, tagger
+    MODEL_REGISTRY_MAX_BYTES: int | None = None  # Unload LRU models above this budget
+
+    # Shared cache service (app/shared/cache.py)
+    CACHE_TAG_TTL: int = 86400  # Minimum lifetime of tag sets in Redis
+    CACHE_SCAN_COUNT: int = 500  # Keys per SCAN step in delete_pattern
+    CACHE_SERIALIZER: Literal["json", "msgpack"] = "json"  # msgpack: needs msgpack installed
+    CACHE_NEAR_ENABLED: bool = True  # In-process tier in front of Redis (API process)
+    CACHE_NEAR_SIZE: int = 4096  # Entries kept in the in-process tier
+    CACHE_NEAR_TTL: int = 30  # Max seconds an entry is served without Redis
+    CACHE_NEAR_PREFIXES: list[str] = [
+        "hover:",
+        "quality:",
+        "communities:",
+        "graph_layout:",
+        "search_query:",
+    ]  # Only these keys use the in-process tier
+    CACHE_INVALIDATION_CHANNEL: str = "cache:invalidate"  # Pub/sub channel
+    CACHE_STALE_TTL: int = 300  # Seconds expired values are served during a refresh
+    CACHE_EARLY_REFRESH_BETA: float = 1.0  # XFetch eagerness; 0 disables early refresh
+    CACHE_LOCK_TTL: int = 30  # Seconds a cross-process recompute lock is held at most
+    CACHE_LOCK_WAIT: float = 5.0  # Seconds a miss waits for another process's value
+
+    # Query embedding cache (in-process LRU + Redis, app/shared/cache.py)
+    QUERY_EMBEDDING_CACHE_SIZE: int = 2048  # Entries kept in the in-process tier
+    QUERY_EMBEDDING_CACHE_TTL: int = 86400  # Redis TTL in seconds
+    QUERY_EMBEDDING_MODEL_VERSION: str = "1"  # Bump to invalidate cached query vectors
+    QUERY_EMBEDDING_CACHE_REDIS: bool = True  # Share cached query vectors through Redis
+
+    # Cross-encoder reranking (app/modules/search/reranking.py)
+    RERANK_BACKEND: Literal["torch", "int8", "onnx"] = "torch"  # int8/onnx: CPU-only paths
+    RERANK_BATCH_SIZE: int = 32  # Pairs per forward pass, batched by length
+    RERANK_CACHE_SIZE: int = 50000  # Scores kept in the in-process tier
+    RERANK_CACHE_TTL: int = 86400  # Redis TTL in seconds
+    RERANK_CACHE_REDIS: bool = True  # Share rerank scores through Redis
+
+    # In-process ANN vector index (app/shared/vector_index.py)
+    VECTOR_INDEX_DIR: str | None = None  # Persist question index snapshots here when set
+    VECTOR_INDEX_NPROBE: int = 8  # Inverted lists scanned per query
+    VECTOR_INDEX_EXACT_THRESHOLD: int = 4096  # Brute-force below this many vectors
+    VECTOR_INDEX_REFRESH_SECONDS: float = 10.0  # Min interval between delta syncs
+
+    # Shared embedding matrix store (app/shared/embedding_store.py)
+    EMBEDDING_STORE_DIR: str | None = None  # Memory-mapped snapshots here when set
+    EMBEDDING_STORE_DTYPE: str = "float32"  # "float16" halves snapshot size
+
+    # Three-way hybrid search leg execution (app/services/search_service.py)
+    SEARCH_PARALLEL_LEGS: bool = True  # Run FTS/dense/sparse legs concurrently
+    SEARCH_LEG_WORKERS: int = 8  # Thread pool size shared by all search requests
+    SEARCH_LEG_TIMEOUT_MS: int = 2000  # Per-leg deadline; late legs return no results
+
     # Graph configuration - Hybrid Knowledge Graph
     DEFAULT_GRAPH_NEIGHBORS: int = 7
     GRAPH_OVERVIEW_MAX_EDGES: int = 50
@@ -347,6 +401,38 @@ class Settings(BaseSettings):
     GRAPH_WEIGHT_CLASSIFICATION: float = 0.1
     GRAPH_VECTOR_MIN_SIM_THRESHOLD: float = 0.85  # for overview candidate pruning
 
+    # Shared multi-layer graph store (app/shared/graph_store.py)
+    GRAPH_STORE_DIR: str | None = None  # Persist graph snapshots here when set
+    GRAPH_STORE_REFRESH_SECONDS: float = 10.0  # Min interval between delta syncs
+    GRAPH_STORE_REBUILD_SECONDS: float = 900.0  # Full rebuild (drops stale edges)
+
+    # node2vec/DeepWalk walk generation (app/shared/graph_walks.py)
+    GRAPH_WALK_SHARD_SIZE: int = 4096  # Start nodes per walk shard
+    GRAPH_WALK_WORKERS: int = 4  # Walk processes per embedding job (1 = inline)
+    GRAPH_EMBEDDING_JOBS_REDIS: bool = True  # Share embedding job state across workers
+
+    # Background graph analytics (app/modules/graph/analytics.py)
+    GRAPH_ANALYTICS_WORKERS: int = 2  # Analytics processes (0 = thread executor)
+    GRAPH_ANALYTICS_REFRESH_SECONDS: float = 600.0  # Age at which results are stale
+    GRAPH_ANALYTICS_EXACT_BETWEENNESS_MAX_NODES: int = 2000  # Sample above this
+    GRAPH_ANALYTICS_BETWEENNESS_SAMPLES: int = 256  # Sources for approximate runs
+    GRAPH_ANALYTICS_PAGERANK_DAMPING: float = 0.85
+    GRAPH_ANALYTICS_RESOLUTIONS: list[float] = [1.0]  # Louvain resolutions to cache
+
+    # Event bus dispatch (app/shared/event_bus.py)
+    EVENT_BUS_ASYNC: bool = True  # Run handlers on a worker pool, not in emit()
+    EVENT_BUS_WORKERS: int = 4  # Handler worker threads in async mode
+    EVENT_BUS_QUEUE_SIZE: int = 1000  # Queued events per priority before inline
+    EVENT_BUS_COALESCE_EVENTS: list[str] = ["resource.updated"]  # Keyed by id
+
+    # Resource listing (app/modules/resources/service.py)
+    # Planner estimates below this are replaced by an exact COUNT(*)
+    RESOURCE_LIST_EXACT_COUNT_BELOW: int = 10000
+
+    # Collection embeddings (app/modules/collections/service.py)
+    # Incremental running-sum updates before an exact recompute from members
+    COLLECTION_EMBEDDING_RESYNC_EVERY: int = 500
+
     # Personalized Recommendation Engine
     RECOMMENDATION_PROFILE_SIZE: int = 50
     RECOMMENDATION_KEYWORD_COUNT: int = 5
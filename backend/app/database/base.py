@@ -30,6 +30,7 @@ import asyncio
 import os
 
 from ..config.settings import get_settings
+from ..shared.database import AppSession
 
 # Get settings instance
 settings = get_settings()
@@ -164,7 +165,10 @@ def get_async_session_local():
     global _async_session_local
     if _async_session_local is None:
         _async_session_local = async_sessionmaker(
-            get_async_engine(), class_=AsyncSession, expire_on_commit=False
+            get_async_engine(),
+            class_=AsyncSession,
+            sync_session_class=AppSession,
+            expire_on_commit=False,
         )
     return _async_session_local
 
@@ -174,7 +178,7 @@ def get_session_local():
     global _session_local
     if _session_local is None:
         _session_local = sessionmaker(
-            autocommit=False, autoflush=False, bind=get_sync_engine()
+            autocommit=False, autoflush=False, bind=get_sync_engine(), class_=AppSession
         )
     return _session_local
 
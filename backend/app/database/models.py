@@ -313,6 +313,11 @@ class Resource(Base):
 
     __table_args__ = (
         Index("idx_resources_sparse_updated", "sparse_embedding_updated_at"),
+        # Keyset pagination over (sort column, id) in list_resources
+        Index("idx_resources_created_id", "created_at", "id"),
+        Index("idx_resources_updated_id", "updated_at", "id"),
+        Index("idx_resources_quality_id", "quality_score", "id"),
+        Index("idx_resources_title_id", "title", "id"),
     )
 
     def __repr__(self) -> str:
@@ -538,6 +543,11 @@ class CollectionResource(Base):
     added_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.current_timestamp()
     )
+    # Checksum of the embedding this member contributed to the collection's
+    # running sum; NULL when it contributed none
+    embedding_checksum: Mapped[str | None] = mapped_column(
+        String(16), nullable=True, default=None
+    )
 
     __table_args__ = (
         Index("idx_collection_resources_collection", "collection_id"),
@@ -573,6 +583,18 @@ class Collection(Base):
     embedding: Mapped[List[float] | None] = mapped_column(
         JSON, nullable=True, default=None
     )
+    # Running sum of member embeddings and how many members it covers;
+    # embedding is this sum normalized. Updated incrementally on add/remove.
+    embedding_sum: Mapped[List[float] | None] = mapped_column(
+        JSON, nullable=True, default=None
+    )
+    embedding_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    # Incremental updates since the last exact recompute
+    embedding_updates: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.current_timestamp()
     )
@@ -1060,10 +1082,20 @@ class SyntheticQuestion(Base):
     # Question data
     question_text: Mapped[str] = mapped_column(Text, nullable=False)
 
+    # JSON-encoded question embedding, indexed in-process for question
+    # search (app/shared/vector_index.py); Text like resources.embedding
+    embedding: Mapped[str | None] = mapped_column(Text, nullable=True)
+
     # Audit fields
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.current_timestamp()
     )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.current_timestamp(),
+        onupdate=func.current_timestamp(),
+    )
 
     # Relationships
     chunk: Mapped["DocumentChunk"] = relationship(
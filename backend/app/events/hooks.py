@@ -262,14 +262,16 @@ def on_resource_updated_invalidate_caches(event: Event) -> None:
     Delay: 0 seconds (immediate)
 
     This hook ensures that cached data doesn't become stale when resources
-    are updated. It invalidates multiple cache key patterns to ensure all
-    derived data caches are cleared.
+    are updated. It deletes the resource's own keys and every key registered
+    under its tags, so no keyspace scan is needed.
 
     Cache keys invalidated:
     - embedding:{resource_id} - Embedding vector cache
     - quality:{resource_id} - Quality score cache
     - resource:{resource_id} - Full resource data cache
-    - search_query:* - All search query result caches
+    - tag resource:{resource_id} - Hover, quality, community and layout
+      entries that depend on the resource
+    - tag search_query - All search query result caches
 
     Args:
         event: Event object containing resource_id in data
@@ -283,24 +285,25 @@ def on_resource_updated_invalidate_caches(event: Event) -> None:
     try:
         from ..tasks.celery_tasks import invalidate_cache_task
 
-        # Build list of cache keys to invalidate
+        # Build list of cache keys and tags to invalidate
         cache_keys = [
             f"embedding:{resource_id}",
             f"quality:{resource_id}",
             f"resource:{resource_id}",
-            "search_query:*",  # Invalidate all search query caches
         ]
+        tags = [f"resource:{resource_id}", "search_query"]
 
         # Queue cache invalidation with URGENT priority and no delay
         invalidate_cache_task.apply_async(
             args=[cache_keys],
+            kwargs={"tags": tags},
             priority=9,  # URGENT priority
             countdown=0,  # Immediate execution
         )
 
         logger.info(
             f"Queued URGENT cache invalidation for resource {resource_id} "
-            f"({len(cache_keys)} keys/patterns, priority=9, immediate)"
+            f"({len(cache_keys)} keys, {len(tags)} tags, priority=9, immediate)"
         )
 
     except Exception as e:
@@ -371,11 +374,13 @@ def on_resource_deleted_update_collections(event: Event) -> None:
     Delay: 5 seconds (debounce)
 
     This hook ensures that collection embeddings are recomputed when a member
-    resource is deleted. The 5-second delay allows multiple deletions to be
-    batched if needed.
+    resource is deleted. Only the collections listed in the event's
+    collection_ids (recorded before the delete) are recomputed; nothing is
+    queued for resources that were in no collection. The 5-second delay
+    allows multiple deletions to be batched if needed.
 
     Args:
-        event: Event object containing resource_id in data
+        event: Event object containing resource_id and collection_ids in data
     """
     resource_id = event.data.get("resource_id")
 
@@ -383,12 +388,16 @@ def on_resource_deleted_update_collections(event: Event) -> None:
         logger.warning("resource_deleted event missing resource_id")
         return
 
+    collection_ids = event.data.get("collection_ids")
+    if collection_ids is not None and not collection_ids:
+        return
+
     try:
         from ..tasks.celery_tasks import update_collection_embeddings_task
 
         # Queue collection embedding update with MEDIUM priority and 5s delay
         update_collection_embeddings_task.apply_async(
-            args=[resource_id],
+            args=[resource_id, collection_ids],
             priority=5,  # MEDIUM priority
             countdown=5,  # 5-second debounce delay
         )
@@ -405,6 +414,53 @@ def on_resource_deleted_update_collections(event: Event) -> None:
         )
 
 
+# ============================================================================
+# Hook 5.8: Vector Index Maintenance on Resource Deletion
+# ============================================================================
+
+
+def on_resource_deleted_update_vector_index(event: Event) -> None:
+    """
+    Hook: Drop a deleted resource from the in-process ANN index, the
+    shared resource embedding store, the sparse inverted index and the
+    shared graph store.
+
+    Triggered by: resource.deleted event
+    Priority: HIGH (runs inline, no task queued)
+
+    Embedding changes reach the index through updated_at delta refreshes,
+    but deleted rows leave no trace to refresh from, so they are removed
+    here to keep them out of dense search results.
+
+    Args:
+        event: Event object containing resource_id in data
+    """
+    resource_id = event.data.get("resource_id")
+
+    if not resource_id:
+        logger.warning("resource_deleted event missing resource_id")
+        return
+
+    try:
+        from ..shared.graph_store import get_graph_store
+        from ..shared.sparse_index import get_resource_sparse_index
+        from ..shared.subject_index import get_resource_subject_index
+        from ..shared.vector_index import get_resource_vector_index
+
+        # Also drops the resource from the shared "resources" embedding store
+        get_resource_vector_index().remove(str(resource_id))
+        get_resource_sparse_index().remove(str(resource_id))
+        get_resource_subject_index().remove(str(resource_id))
+        get_graph_store().remove_node(str(resource_id))
+        logger.debug(f"Removed resource {resource_id} from vector index")
+
+    except Exception as e:
+        logger.error(
+            f"Error removing resource {resource_id} from vector index: {e}",
+            exc_info=True,
+        )
+
+
 # ============================================================================
 # Hook Registration
 # ============================================================================
@@ -426,6 +482,7 @@ def register_all_hooks() -> None:
     5. Cache invalidation (resource updates)
     6. Author normalization (author extraction)
     7. Collection embedding update (resource deletion)
+    8. Vector index maintenance (resource deletion)
     """
     hooks = [
         (SystemEvent.RESOURCE_CONTENT_CHANGED, on_content_changed_regenerate_embedding),
@@ -435,6 +492,7 @@ def register_all_hooks() -> None:
         (SystemEvent.RESOURCE_UPDATED, on_resource_updated_invalidate_caches),
         (SystemEvent.AUTHORS_EXTRACTED, on_author_extracted_normalize_names),
         (SystemEvent.RESOURCE_DELETED, on_resource_deleted_update_collections),
+        (SystemEvent.RESOURCE_DELETED, on_resource_deleted_update_vector_index),
     ]
 
     # Create wrapper to convert dict payload to Event object for backward compatibility
@@ -33,6 +33,7 @@ from sqlalchemy import select, or_, and_
 
 from .model import Annotation
 from ...database.models import Resource
+from ...shared.embedding_store import get_embedding_store, load_missing
 # Lazy import embeddings to avoid loading models in CLOUD mode
 # from ...shared.embeddings import EmbeddingGenerator
 
@@ -629,10 +630,10 @@ class AnnotationService:
 
         Algorithm:
         1. Generate embedding for query text
-        2. Retrieve all user annotations that have embeddings
-        3. Compute cosine similarity between query and each annotation
-        4. Sort by similarity descending
-        5. Return top N matches with similarity scores
+        2. Retrieve the ids of user annotations that have embeddings
+        3. Score those rows of the shared annotation embedding matrix in one
+           batched product and select the top N with argpartition
+        4. Load the matching annotations in ranked order
 
         Args:
             user_id: User ID to filter annotations by
@@ -655,31 +656,35 @@ class AnnotationService:
         except Exception:
             return []
 
-        # Retrieve user annotations with embeddings
-        query_stmt = select(Annotation).filter(
+        # Retrieve ids of user annotations with embeddings
+        id_stmt = select(Annotation.id).filter(
             and_(Annotation.user_id == user_id, Annotation.embedding.isnot(None))
         )
+        candidate_ids = [str(ann_id) for ann_id in self.db.execute(id_stmt).scalars()]
 
-        result = self.db.execute(query_stmt)
-        annotations = result.scalars().all()
-
-        if not annotations:
+        if not candidate_ids:
             return []
 
-        # Compute cosine similarity for each annotation
-        results = []
-        for annotation in annotations:
-            if annotation.embedding:
-                similarity = self._cosine_similarity(
-                    query_embedding, annotation.embedding
-                )
-                results.append((annotation, similarity))
+        store = get_embedding_store("annotations", self.db)
+
+        # Rows written since the last store sync are read directly
+        load_missing(store, self.db, candidate_ids)
 
-        # Sort by similarity descending
-        results.sort(key=lambda x: x[1], reverse=True)
+        scored = store.similar(query_embedding, k=limit, candidate_ids=candidate_ids)
+        if not scored:
+            return []
 
-        # Return top N matches
-        return results[:limit]
+        annotations = self.db.execute(
+            select(Annotation).filter(Annotation.id.in_([ann_id for ann_id, _ in scored]))
+        ).scalars()
+        by_id = {str(annotation.id): annotation for annotation in annotations}
+
+        # Clamp to [0, 1] like _cosine_similarity
+        return [
+            (by_id[ann_id], max(0.0, min(1.0, similarity)))
+            for ann_id, similarity in scored
+            if ann_id in by_id
+        ]
 
     def search_annotations_by_tags(
         self, user_id: str, tags: List[str], match_all: bool = False
@@ -747,6 +752,8 @@ class AnnotationService:
                 # Update annotation with embedding
                 annotation.embedding = embedding
                 self.db.commit()
+
+                get_embedding_store("annotations").upsert(str(annotation.id), embedding)
         except Exception:
             # Silently fail - embedding generation is not critical
             # In production, this should be logged
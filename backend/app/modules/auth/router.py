@@ -27,7 +27,7 @@ from ...shared.security import (
     validate_token_type,
     validate_redirect_url,
 )
-from ...shared.cache import cache
+from ...shared.rate_limiter import rate_limiter
 from ...config.settings import get_settings
 from .schema import (
     TokenResponse,
@@ -73,48 +73,34 @@ async def check_auth_login_rate_limit(request: Request) -> None:
     window_key = f"auth_login_rate_limit:{client_ip}"
 
     try:
-        from ...shared.cache import RedisCache
-
-        cache = RedisCache()
-
-        # Get current count
-        current = cache.redis.get(window_key)
-        count = int(current) if current else 0
-
-        if count >= AUTH_LOGIN_RATE_LIMIT:
-            # Rate limit exceeded
-            ttl = cache.redis.ttl(window_key)
-            reset_time = int(time.time()) + ttl
-
-            logger.warning(
-                f"Auth login rate limit exceeded for IP {client_ip}: "
-                f"{count}/{AUTH_LOGIN_RATE_LIMIT} attempts"
-            )
-
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail="Too many login attempts. Please try again in 15 minutes.",
-                headers={
-                    "Retry-After": str(ttl),
-                    "X-RateLimit-Limit": str(AUTH_LOGIN_RATE_LIMIT),
-                    "X-RateLimit-Remaining": "0",
-                    "X-RateLimit-Reset": str(reset_time),
-                },
-            )
-
-        # Increment counter
-        pipe = cache.redis.pipeline()
-        pipe.incr(window_key)
-        pipe.expire(window_key, AUTH_LOGIN_WINDOW)
-        pipe.execute()
-
-    except HTTPException:
-        raise
+        decision = rate_limiter.hit(
+            window_key, AUTH_LOGIN_RATE_LIMIT, AUTH_LOGIN_WINDOW
+        )
     except Exception as e:
         # Fail open - allow request if Redis is unavailable
         logger.warning(f"Auth rate limit check failed: {e}")
         return
 
+    if decision is not None and not decision.allowed:
+        logger.warning(
+            f"Auth login rate limit exceeded for IP {client_ip}: "
+            f"{AUTH_LOGIN_RATE_LIMIT} attempts per {AUTH_LOGIN_WINDOW}s"
+        )
+
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=(
+                "Too many login attempts. "
+                f"Please try again in {decision.retry_after} seconds."
+            ),
+            headers={
+                "Retry-After": str(decision.retry_after),
+                "X-RateLimit-Limit": str(AUTH_LOGIN_RATE_LIMIT),
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(decision.reset),
+            },
+        )
+
 
 async def check_auth_refresh_rate_limit(request: Request) -> None:
     """Check rate limit for /auth/refresh endpoint.
@@ -128,48 +114,34 @@ async def check_auth_refresh_rate_limit(request: Request) -> None:
     window_key = f"auth_refresh_rate_limit:{client_ip}"
 
     try:
-        from ...shared.cache import RedisCache
-
-        cache = RedisCache()
-
-        # Get current count
-        current = cache.redis.get(window_key)
-        count = int(current) if current else 0
-
-        if count >= AUTH_REFRESH_RATE_LIMIT:
-            # Rate limit exceeded
-            ttl = cache.redis.ttl(window_key)
-            reset_time = int(time.time()) + ttl
-
-            logger.warning(
-                f"Auth refresh rate limit exceeded for IP {client_ip}: "
-                f"{count}/{AUTH_REFRESH_RATE_LIMIT} attempts"
-            )
-
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail="Too many token refresh attempts. Please try again in 1 hour.",
-                headers={
-                    "Retry-After": str(ttl),
-                    "X-RateLimit-Limit": str(AUTH_REFRESH_RATE_LIMIT),
-                    "X-RateLimit-Remaining": "0",
-                    "X-RateLimit-Reset": str(reset_time),
-                },
-            )
-
-        # Increment counter
-        pipe = cache.redis.pipeline()
-        pipe.incr(window_key)
-        pipe.expire(window_key, AUTH_REFRESH_WINDOW)
-        pipe.execute()
-
-    except HTTPException:
-        raise
+        decision = rate_limiter.hit(
+            window_key, AUTH_REFRESH_RATE_LIMIT, AUTH_REFRESH_WINDOW
+        )
     except Exception as e:
         # Fail open - allow request if Redis is unavailable
         logger.warning(f"Auth refresh rate limit check failed: {e}")
         return
 
+    if decision is not None and not decision.allowed:
+        logger.warning(
+            f"Auth refresh rate limit exceeded for IP {client_ip}: "
+            f"{AUTH_REFRESH_RATE_LIMIT} attempts per {AUTH_REFRESH_WINDOW}s"
+        )
+
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=(
+                "Too many token refresh attempts. "
+                f"Please try again in {decision.retry_after} seconds."
+            ),
+            headers={
+                "Retry-After": str(decision.retry_after),
+                "X-RateLimit-Limit": str(AUTH_REFRESH_RATE_LIMIT),
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(decision.reset),
+            },
+        )
+
 
 # ============================================================================
 # OAuth2 Password Flow Endpoints
@@ -629,18 +601,19 @@ async def get_rate_limit_status(current_user: TokenData = Depends(get_current_us
     else:
         limit = settings.RATE_LIMIT_FREE_TIER
 
-    # Get current usage from Redis
-    window_key = f"rate_limit:{current_user.user_id}:{int(time.time() // 60)}"
+    # Default values if unlimited or Redis unavailable
+    remaining = limit if limit > 0 else 0
+    reset = int(time.time())
 
     try:
-        current = cache.get(window_key) or 0
-        remaining = max(0, limit - current) if limit > 0 else 0
-        reset = int(time.time() // 60 + 1) * 60
+        # Reads the GCRA bucket without counting a request
+        decision = rate_limiter.get_status(
+            str(current_user.user_id), current_user.tier
+        )
+        if decision is not None:
+            remaining, reset = decision.remaining, decision.reset
     except Exception as e:
         logger.warning(f"Error getting rate limit status: {e}")
-        # Return default values if Redis unavailable
-        remaining = limit if limit > 0 else 0
-        reset = int(time.time() // 60 + 1) * 60
 
     return RateLimitInfo(
         limit=limit, remaining=remaining, reset=reset, tier=current_user.tier
@@ -14,18 +14,21 @@ Related files:
 Key Features:
 - Create and manage user collections
 - Add/remove resources from collections
-- Compute collection embeddings (average of member resource embeddings)
+- Compute collection embeddings (average of member resource embeddings),
+  kept as a running sum that add/remove update incrementally
 - Find similar resources based on collection embedding
 - Support hierarchical collections (parent/subcollections)
 """
 
+import hashlib
+import json
 import logging
 import uuid
 from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any, Tuple
 
 import numpy as np
-from sqlalchemy import or_
+from sqlalchemy import func, or_
 from sqlalchemy.orm import Session, joinedload
 
 logger = logging.getLogger(__name__)
@@ -33,6 +36,25 @@ logger = logging.getLogger(__name__)
 # Import from local model file to avoid circular dependencies
 from .model import Collection, CollectionResource
 from .schema import CollectionUpdate
+from ...shared.embedding_store import get_embedding_store, load_missing
+
+
+def _embedding_checksum(embedding: List[float]) -> str:
+    """Fingerprint of the vector a member contributes to a running sum."""
+    data = np.asarray(embedding, dtype=np.float64).tobytes()
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _parse_embedding(embedding: Any) -> Optional[List[float]]:
+    """Decode a resource embedding stored as a list (JSON) or string (Text)."""
+    if isinstance(embedding, str):
+        try:
+            embedding = json.loads(embedding)
+        except (json.JSONDecodeError, TypeError):
+            return None
+    if isinstance(embedding, list) and embedding:
+        return embedding
+    return None
 
 
 class CollectionService:
@@ -350,8 +372,13 @@ class CollectionService:
 
             self.db.commit()
 
-            # Recompute collection embedding
-            self.compute_collection_embedding(collection_id)
+            # Fold the new members into the collection embedding
+            self._update_collection_embedding(
+                collection,
+                added_ids=[
+                    rid for rid in new_resource_ids if rid in existing_resource_ids
+                ],
+            )
 
             # Emit collection.resource_added events
             from .handlers import emit_collection_resource_added
@@ -429,14 +456,8 @@ class CollectionService:
             raise ValueError("Collection not found or access denied")
 
         # Delete associations
-        removed_count = (
-            self.db.query(CollectionResource)
-            .filter(
-                CollectionResource.collection_id == collection_id,
-                CollectionResource.resource_id.in_(resource_ids),
-            )
-            .delete(synchronize_session=False)
-        )
+        members = self._members(collection_id, resource_ids)
+        removed_count = self._delete_members(collection_id, list(members))
 
         if removed_count > 0:
             # Update collection timestamp
@@ -444,8 +465,8 @@ class CollectionService:
 
             self.db.commit()
 
-            # Recompute collection embedding
-            self.compute_collection_embedding(collection_id)
+            # Take the removed members out of the collection embedding
+            self._update_collection_embedding(collection, removed=members)
 
             # Emit collection.resource_removed events
             from .handlers import emit_collection_resource_removed
@@ -535,8 +556,9 @@ class CollectionService:
         Compute collection embedding as average of member resource embeddings.
 
         This enables collection-level semantic similarity and recommendations.
-        The embedding is computed by averaging the dense embeddings of all
-        resources in the collection that have embeddings.
+        The embedding is computed exactly from the dense embeddings of all
+        resources in the collection that have embeddings, and also resets the
+        running sum that membership changes update incrementally.
 
         Args:
             collection_id: Collection UUID
@@ -547,9 +569,9 @@ class CollectionService:
         # Import Resource from database.models
         from ...database.models import Resource
 
-        # Get all resources in collection with embeddings
-        resources = (
-            self.db.query(Resource)
+        # Get embeddings of all resources in collection
+        rows = (
+            self.db.query(Resource.id, Resource.embedding)
             .join(CollectionResource, Resource.id == CollectionResource.resource_id)
             .filter(
                 CollectionResource.collection_id == collection_id,
@@ -557,58 +579,184 @@ class CollectionService:
             )
             .all()
         )
+        embeddings = {}
+        for row in rows:
+            embedding = _parse_embedding(row.embedding)
+            if embedding is not None:
+                embeddings[row.id] = embedding
 
-        if not resources:
-            # No resources with embeddings - clear collection embedding
-            collection = (
-                self.db.query(Collection).filter(Collection.id == collection_id).first()
+        collection = (
+            self.db.query(Collection).filter(Collection.id == collection_id).first()
+        )
+        if not collection:
+            return None
+
+        # Record what each member now contributes to the running sum
+        for association in self.db.query(CollectionResource).filter(
+            CollectionResource.collection_id == collection_id
+        ):
+            embedding = embeddings.get(association.resource_id)
+            association.embedding_checksum = (
+                _embedding_checksum(embedding) if embedding is not None else None
             )
 
-            if collection:
-                collection.embedding = None
-                self.db.commit()
+        total = None
+        if embeddings:
+            total = np.asarray(list(embeddings.values()), dtype=np.float64).sum(axis=0)
+        collection.embedding_updates = 0
+        self._store_collection_embedding(collection, total, len(embeddings))
+        return collection.embedding
 
-            return None
+    def _update_collection_embedding(
+        self,
+        collection: Collection,
+        added_ids: Optional[List[uuid.UUID]] = None,
+        removed: Optional[Dict[uuid.UUID, Optional[str]]] = None,
+    ) -> Optional[List[float]]:
+        """
+        Apply a membership change to the collection embedding in O(dim).
+
+        Adds the new members' embeddings to the running sum and subtracts the
+        removed members' instead of reloading every member. Each membership
+        records a checksum of the vector it contributed, so a removed member
+        is only subtracted if it still has that exact embedding; members that
+        contributed nothing are skipped. Falls back to
+        compute_collection_embedding when a removed member's embedding changed
+        since it was counted, for collections that predate the running sum,
+        and every COLLECTION_EMBEDDING_RESYNC_EVERY updates to shed
+        floating-point drift.
 
-        # Extract embeddings - handle both JSON strings (SQLite/Text) and lists (PostgreSQL/JSON)
-        import json
-
-        embeddings = []
-        for resource in resources:
-            embedding = resource.embedding
-            if embedding:
-                # If stored as JSON string, parse it
-                if isinstance(embedding, str):
-                    try:
-                        embedding = json.loads(embedding)
-                    except (json.JSONDecodeError, TypeError):
-                        continue
-                if isinstance(embedding, list):
-                    embeddings.append(embedding)
-
-        if not embeddings:
-            return None
+        Args:
+            collection: Collection whose membership changed (already committed)
+            added_ids: Resources added to the collection
+            removed: Removed members mapped to their recorded checksums
+                (from _members, read before the memberships were deleted)
 
-        # Compute average embedding
-        embeddings_array = np.array(embeddings)
-        avg_embedding = np.mean(embeddings_array, axis=0)
+        Returns:
+            Updated embedding vector or None if no members have embeddings
+        """
+        from ...config.settings import get_settings
 
-        # Normalize to unit length for cosine similarity
-        norm = np.linalg.norm(avg_embedding)
-        if norm > 0:
-            avg_embedding = avg_embedding / norm
+        updates = (collection.embedding_updates or 0) + 1
+        if (
+            collection.embedding_sum is None and collection.embedding is not None
+        ) or updates >= get_settings().COLLECTION_EMBEDDING_RESYNC_EVERY:
+            return self.compute_collection_embedding(collection.id)
 
-        # Store in collection
-        collection = (
-            self.db.query(Collection).filter(Collection.id == collection_id).first()
-        )
+        added = self._resource_embeddings(added_ids or [])
+        counted = {
+            rid: checksum for rid, checksum in (removed or {}).items() if checksum
+        }
+        current = self._resource_embeddings(list(counted))
+        removed_vectors = []
+        for resource_id, checksum in counted.items():
+            vector = current.get(resource_id)
+            if vector is None or _embedding_checksum(vector) != checksum:
+                # The sum holds a vector this member no longer has
+                return self.compute_collection_embedding(collection.id)
+            removed_vectors.append(vector)
+        if not added and not removed_vectors:
+            return collection.embedding
+
+        vectors = list(added.values()) + removed_vectors
+        if collection.embedding_sum is None:
+            total = np.zeros(len(vectors[0]), dtype=np.float64)
+        else:
+            total = np.asarray(collection.embedding_sum, dtype=np.float64)
+        count = (collection.embedding_count or 0) + len(added) - len(removed_vectors)
+        if count < 0 or {len(vector) for vector in vectors} != {total.shape[0]}:
+            return self.compute_collection_embedding(collection.id)
+
+        if added:
+            total += np.asarray(list(added.values()), dtype=np.float64).sum(axis=0)
+            for association in self.db.query(CollectionResource).filter(
+                CollectionResource.collection_id == collection.id,
+                CollectionResource.resource_id.in_(list(added)),
+            ):
+                association.embedding_checksum = _embedding_checksum(
+                    added[association.resource_id]
+                )
+        if removed_vectors:
+            total -= np.asarray(removed_vectors, dtype=np.float64).sum(axis=0)
+        collection.embedding_updates = updates
+        self._store_collection_embedding(collection, total if count else None, count)
+        return collection.embedding
+
+    def _store_collection_embedding(
+        self, collection: Collection, total: Optional[np.ndarray], count: int
+    ) -> None:
+        """Persist a running sum, its normalized embedding, and sync the store."""
+        if total is None or count <= 0:
+            # No resources with embeddings - clear collection embedding
+            collection.embedding_sum = None
+            collection.embedding_count = 0
+            collection.embedding = None
+        else:
+            collection.embedding_sum = total.tolist()
+            collection.embedding_count = count
+            # Normalize to unit length for cosine similarity (same as the mean)
+            norm = np.linalg.norm(total)
+            collection.embedding = (total / norm if norm > 0 else total).tolist()
+        collection.updated_at = datetime.now(timezone.utc)
+        self.db.commit()
 
-        if collection:
-            collection.embedding = avg_embedding.tolist()
-            collection.updated_at = datetime.now(timezone.utc)
-            self.db.commit()
+        store = get_embedding_store("collections")
+        if collection.embedding is None:
+            store.remove(str(collection.id))
+        else:
+            store.upsert(str(collection.id), collection.embedding)
+
+    def _resource_embeddings(
+        self, resource_ids: List[uuid.UUID]
+    ) -> Dict[uuid.UUID, List[float]]:
+        """Load the embeddings of the given resources (those that have one)."""
+        if not resource_ids:
+            return {}
 
-        return avg_embedding.tolist()
+        from ...database.models import Resource
+
+        rows = (
+            self.db.query(Resource.id, Resource.embedding)
+            .filter(Resource.id.in_(resource_ids), Resource.embedding.isnot(None))
+            .all()
+        )
+        embeddings = {}
+        for row in rows:
+            embedding = _parse_embedding(row.embedding)
+            if embedding is not None:
+                embeddings[row.id] = embedding
+        return embeddings
+
+    def _members(
+        self, collection_id: uuid.UUID, resource_ids: List[uuid.UUID]
+    ) -> Dict[uuid.UUID, Optional[str]]:
+        """Map which of resource_ids are members to their embedding checksums."""
+        return {
+            row.resource_id: row.embedding_checksum
+            for row in self.db.query(
+                CollectionResource.resource_id, CollectionResource.embedding_checksum
+            )
+            .filter(
+                CollectionResource.collection_id == collection_id,
+                CollectionResource.resource_id.in_(resource_ids),
+            )
+            .all()
+        }
+
+    def _delete_members(
+        self, collection_id: uuid.UUID, resource_ids: List[uuid.UUID]
+    ) -> int:
+        """Delete collection associations; returns the number removed."""
+        if not resource_ids:
+            return 0
+        return (
+            self.db.query(CollectionResource)
+            .filter(
+                CollectionResource.collection_id == collection_id,
+                CollectionResource.resource_id.in_(resource_ids),
+            )
+            .delete(synchronize_session=False)
+        )
 
     def find_similar_resources(
         self,
@@ -622,7 +770,8 @@ class CollectionService:
         Find resources similar to a collection based on collection embedding.
 
         Uses cosine similarity between collection embedding and resource embeddings
-        to find semantically related resources.
+        to find semantically related resources, scored in one batched product
+        against the shared resource embedding store.
 
         Args:
             collection_id: Collection UUID
@@ -645,13 +794,11 @@ class CollectionService:
         if not collection.embedding:
             raise ValueError("Collection has no embedding - add resources first")
 
-        collection_embedding = np.array(collection.embedding)
-
         # Get resources to exclude if requested
         excluded_ids = set()
         if exclude_collection_resources:
             excluded_ids = {
-                cr.resource_id
+                str(cr.resource_id)
                 for cr in self.db.query(CollectionResource.resource_id)
                 .filter(CollectionResource.collection_id == collection_id)
                 .all()
@@ -660,55 +807,42 @@ class CollectionService:
         # Import Resource from database.models
         from ...database.models import Resource
 
-        # Get all resources with embeddings
-        query = self.db.query(Resource).filter(Resource.embedding.isnot(None))
-
-        if excluded_ids:
-            query = query.filter(~Resource.id.in_(excluded_ids))
-
-        resources = query.all()
+        # Score every resource embedding in one batched product
+        store = get_embedding_store("resources", self.db)
+        scored = store.similar(
+            collection.embedding,
+            k=limit,
+            exclude_ids=excluded_ids,
+            min_similarity=min_similarity,
+        )
+        if not scored:
+            return []
 
-        # Compute similarities - handle embeddings as either JSON strings or lists
-        import json
+        resources = {
+            str(resource.id): resource
+            for resource in self.db.query(Resource)
+            .filter(Resource.id.in_([resource_id for resource_id, _ in scored]))
+            .all()
+        }
 
         similarities = []
-        for resource in resources:
-            embedding = resource.embedding
-            if not embedding:
-                continue
-
-            # Parse JSON string if needed
-            if isinstance(embedding, str):
-                try:
-                    embedding = json.loads(embedding)
-                except (json.JSONDecodeError, TypeError):
-                    continue
-
-            if not isinstance(embedding, list):
+        for resource_id, similarity in scored:
+            resource = resources.get(resource_id)
+            if resource is None:
                 continue
+            similarities.append(
+                {
+                    "resource_id": resource.id,
+                    "title": resource.title,
+                    "description": resource.description,
+                    "similarity_score": similarity,
+                    "quality_score": resource.quality_score,
+                    "type": resource.type,
+                    "creator": resource.creator,
+                }
+            )
 
-            resource_embedding = np.array(embedding)
-
-            # Cosine similarity
-            similarity = float(np.dot(collection_embedding, resource_embedding))
-
-            if similarity >= min_similarity:
-                similarities.append(
-                    {
-                        "resource_id": resource.id,
-                        "title": resource.title,
-                        "description": resource.description,
-                        "similarity_score": similarity,
-                        "quality_score": resource.quality_score,
-                        "type": resource.type,
-                        "creator": resource.creator,
-                    }
-                )
-
-        # Sort by similarity and limit
-        similarities.sort(key=lambda x: x["similarity_score"], reverse=True)
-
-        return similarities[:limit]
+        return similarities
 
     def find_collections_with_resource(
         self, resource_id: uuid.UUID
@@ -767,10 +901,8 @@ class CollectionService:
         if not collection.embedding:
             raise ValueError("Collection has no embedding - add resources first")
 
-        collection_embedding = np.array(collection.embedding)
-
-        # Get all other collections with embeddings
-        query = self.db.query(Collection).filter(
+        # Get ids of all other visible collections with embeddings
+        query = self.db.query(Collection.id).filter(
             Collection.embedding.isnot(None), Collection.id != collection_id
         )
 
@@ -783,45 +915,58 @@ class CollectionService:
             # No owner specified - only public collections
             query = query.filter(Collection.visibility == "public")
 
-        collections = query.all()
+        candidate_ids = [str(row.id) for row in query.all()]
+        if not candidate_ids:
+            return []
+
+        store = get_embedding_store("collections", self.db)
+        load_missing(store, self.db, candidate_ids)
+        scored = store.similar(
+            collection.embedding,
+            k=limit,
+            candidate_ids=candidate_ids,
+            min_similarity=min_similarity,
+        )
+        if not scored:
+            return []
+
+        matched_ids = [other_id for other_id, _ in scored]
+        collections = {
+            str(other.id): other
+            for other in self.db.query(Collection)
+            .filter(Collection.id.in_(matched_ids))
+            .all()
+        }
+
+        # Resource counts for all matches in one grouped query
+        resource_counts = {
+            str(other_id): count
+            for other_id, count in self.db.query(
+                CollectionResource.collection_id, func.count()
+            )
+            .filter(CollectionResource.collection_id.in_(matched_ids))
+            .group_by(CollectionResource.collection_id)
+            .all()
+        }
 
-        # Compute similarities
         similarities = []
-        for other_collection in collections:
-            if not other_collection.embedding or not isinstance(
-                other_collection.embedding, list
-            ):
+        for other_id, similarity in scored:
+            other_collection = collections.get(other_id)
+            if other_collection is None:
                 continue
+            similarities.append(
+                {
+                    "collection_id": other_collection.id,
+                    "name": other_collection.name,
+                    "description": other_collection.description,
+                    "similarity_score": similarity,
+                    "resource_count": resource_counts.get(other_id, 0),
+                    "visibility": other_collection.visibility,
+                    "owner_id": other_collection.owner_id,
+                }
+            )
 
-            other_embedding = np.array(other_collection.embedding)
-
-            # Cosine similarity
-            similarity = float(np.dot(collection_embedding, other_embedding))
-
-            if similarity >= min_similarity:
-                # Get resource count
-                resource_count = (
-                    self.db.query(CollectionResource)
-                    .filter(CollectionResource.collection_id == other_collection.id)
-                    .count()
-                )
-
-                similarities.append(
-                    {
-                        "collection_id": other_collection.id,
-                        "name": other_collection.name,
-                        "description": other_collection.description,
-                        "similarity_score": similarity,
-                        "resource_count": resource_count,
-                        "visibility": other_collection.visibility,
-                        "owner_id": other_collection.owner_id,
-                    }
-                )
-
-        # Sort by similarity and limit
-        similarities.sort(key=lambda x: x["similarity_score"], reverse=True)
-
-        return similarities[:limit]
+        return similarities
 
     def validate_parent_hierarchy(
         self, collection_id: uuid.UUID, new_parent_id: uuid.UUID
@@ -886,7 +1031,7 @@ class CollectionService:
         Add multiple resources to a collection in a single batch operation.
 
         This is more efficient than adding resources one at a time and
-        triggers embedding recomputation only once after all resources
+        updates the collection embedding only once after all resources
         are added.
 
         Args:
@@ -954,8 +1099,8 @@ class CollectionService:
 
             self.db.commit()
 
-            # Recompute collection embedding once for all added resources
-            self.compute_collection_embedding(collection_id)
+            # Update collection embedding once for all added resources
+            self._update_collection_embedding(collection, added_ids=valid_ids)
 
         return {
             "added": added_count,
@@ -970,7 +1115,7 @@ class CollectionService:
         Remove multiple resources from a collection in a single batch operation.
 
         This is more efficient than removing resources one at a time and
-        triggers embedding recomputation only once after all resources
+        updates the collection embedding only once after all resources
         are removed.
 
         Args:
@@ -996,14 +1141,8 @@ class CollectionService:
             raise ValueError("Collection not found or access denied")
 
         # Delete associations
-        removed_count = (
-            self.db.query(CollectionResource)
-            .filter(
-                CollectionResource.collection_id == collection_id,
-                CollectionResource.resource_id.in_(resource_ids),
-            )
-            .delete(synchronize_session=False)
-        )
+        members = self._members(collection_id, resource_ids)
+        removed_count = self._delete_members(collection_id, list(members))
 
         not_found_count = len(resource_ids) - removed_count
 
@@ -1013,7 +1152,7 @@ class CollectionService:
 
             self.db.commit()
 
-            # Recompute collection embedding once for all removed resources
-            self.compute_collection_embedding(collection_id)
+            # Update collection embedding once for all removed resources
+            self._update_collection_embedding(collection, removed=members)
 
         return {"removed": removed_count, "not_found": not_found_count}
@@ -11,9 +11,15 @@ Architecture
        ▼
   GitHubFetcher.fetch_chunk()
        │
-       ├─ Cache HIT  → return from Redis  (< 5 ms)
-       └─ Cache MISS → GET raw GitHub URL → slice lines → store in Redis
-                                                         → return code
+       ├─ Chunk cache HIT → return from Redis  (< 5 ms)
+       └─ Chunk cache MISS → whole-file body for (uri, ref)
+              ├─ in-process LRU / Redis file cache (SHA-pinned refs only)
+              ├─ in-flight download for the same (uri, ref) → await it
+              └─ GET raw GitHub URL → cache body
+          → slice lines → store chunk in Redis → return code
+
+Ten chunks from the same file cost one GitHub request: concurrent callers
+share a single download, and every line range is sliced from that body.
 
 Rate limits
 ───────────
@@ -25,9 +31,11 @@ Set GITHUB_API_TOKEN in your environment to use the authenticated limit.
 Cache key format
 ────────────────
   github:chunk:{sha40}:{path_hash}:{start}:{end}
+  github:file:{sha40}:{path_hash}        (zlib-compressed, base64 text)
 
   Using the commit SHA (not branch name) guarantees cache correctness even
-  when branches are force-pushed.
+  when branches are force-pushed. File bodies are only cached when the ref
+  is a full commit SHA, since the content at a SHA never changes.
 
 Dependencies
 ────────────
@@ -37,8 +45,13 @@ Dependencies
 from __future__ import annotations
 
 import asyncio
+import base64
 import hashlib
 import logging
+import re
+import threading
+import zlib
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional
 from urllib.parse import urlparse
@@ -57,6 +70,12 @@ CACHE_TTL_SECONDS = 3600          # 1-hour TTL matches vision doc
 CACHE_KEY_PREFIX  = "github:chunk"
 MAX_FILE_BYTES    = 2 * 1024 * 1024  # 2 MB safety cap for a single file fetch
 
+FILE_CACHE_TTL_SECONDS = 86400    # bodies at a pinned SHA are immutable
+FILE_CACHE_KEY_PREFIX  = "github:file"
+LOCAL_FILE_CACHE_MAX_BYTES = 64 * 1024 * 1024  # compressed bytes kept in-process
+
+_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
+
 
 # ── Data classes ───────────────────────────────────────────────────────────────
 
@@ -75,6 +94,21 @@ class FetchRequest:
         ref_short = self.branch_reference[:40]   # cap SHA / branch length
         return f"{CACHE_KEY_PREFIX}:{ref_short}:{path_hash}:{self.start_line}:{self.end_line}"
 
+    def file_key(self) -> tuple[str, str]:
+        """(uri, ref) identity shared by every line range of the same file."""
+        return (self.github_uri, self.branch_reference)
+
+    def file_cache_key(self) -> str:
+        """Redis key for the whole-file body."""
+        path_hash = hashlib.sha1(self.github_uri.encode()).hexdigest()[:16]
+        return f"{FILE_CACHE_KEY_PREFIX}:{self.branch_reference[:40]}:{path_hash}"
+
+    @property
+    def is_pinned(self) -> bool:
+        """True when the URI is pinned to a full commit SHA (immutable)."""
+        ref = self.branch_reference
+        return bool(_SHA_RE.match(ref)) and f"/{ref}/" in self.github_uri
+
 
 @dataclass
 class FetchResult:
@@ -86,6 +120,71 @@ class FetchResult:
     error: Optional[str] = None
 
 
+# ── Whole-file body cache ──────────────────────────────────────────────────────
+
+def _compress(body: str) -> bytes:
+    return zlib.compress(body.encode("utf-8"), 6)
+
+
+def _decompress(blob: bytes) -> str:
+    return zlib.decompress(blob).decode("utf-8")
+
+
+class _FileBodyCache:
+    """
+    Process-wide LRU of zlib-compressed file bodies keyed by (uri, sha).
+
+    Bounded by total compressed bytes rather than entry count so a few
+    large files can't crowd out hundreds of small ones. Shared by every
+    GitHubFetcher instance; only SHA-pinned bodies are stored.
+    """
+
+    def __init__(self, max_bytes: int = LOCAL_FILE_CACHE_MAX_BYTES) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, str]) -> Optional[str]:
+        with self._lock:
+            blob = self._entries.get(key)
+            if blob is None:
+                return None
+            self._entries.move_to_end(key)
+        return _decompress(blob)
+
+    def put(self, key: tuple[str, str], body: str) -> None:
+        blob = _compress(body)
+        if len(blob) > self._max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            self._entries[key] = blob
+            self._bytes += len(blob)
+            while self._bytes > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+_file_cache = _FileBodyCache()
+
+
+def _slice_lines(body: str, start_line: int, end_line: int) -> str:
+    """Return the 1-based inclusive line range of `body`."""
+    lines = body.splitlines()
+    # Convert 1-based inclusive range to 0-based Python slice
+    start = max(0, start_line - 1)
+    end   = min(len(lines), end_line)
+    return "\n".join(lines[start:end])
+
+
 # ── Redis connection factory ───────────────────────────────────────────────────
 
 def _make_redis_client() -> aioredis.Redis:
@@ -137,6 +236,9 @@ class GitHubFetcher:
         self._http = http_client
         self._owns_redis = redis_client is None
         self._owns_http  = http_client is None
+        # (uri, ref) → download shared by concurrent fetches of the same file
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
+        self.stats = {"github_requests": 0, "coalesced": 0, "file_cache_hits": 0}
 
     # ── Context manager ────────────────────────────────────────────────────
 
@@ -182,9 +284,10 @@ class GitHubFetcher:
             logger.debug("Cache HIT %s (%.1f ms)", cache_key, latency)
             return FetchResult(req, cached, cache_hit=True, latency_ms=latency)
 
-        # 2. Fetch from GitHub
+        # 2. Slice from the whole-file body (cached, in flight, or downloaded)
         try:
-            code = await self._fetch_raw(req)
+            body, file_cached = await self._get_file_body(req)
+            code = _slice_lines(body, req.start_line, req.end_line)
         except Exception as exc:
             latency = (time.monotonic() - t0) * 1000
             logger.error("GitHub fetch failed for %s: %s", req.github_uri, exc)
@@ -197,26 +300,90 @@ class GitHubFetcher:
             logger.warning("Redis SETEX failed: %s", exc)
 
         latency = (time.monotonic() - t0) * 1000
-        logger.debug("Cache MISS %s — fetched in %.1f ms", cache_key, latency)
-        return FetchResult(req, code, cache_hit=False, latency_ms=latency)
+        logger.debug("Cache MISS %s — resolved in %.1f ms", cache_key, latency)
+        return FetchResult(req, code, cache_hit=file_cached, latency_ms=latency)
 
     async def fetch_many(self, requests: list[FetchRequest]) -> list[FetchResult]:
         """
-        Fetch multiple chunks in parallel, bounded by self._concurrency.
+        Fetch multiple chunks in parallel.
 
-        Returns results in the same order as the input list.
+        GitHub downloads are bounded by self._concurrency and shared between
+        chunks of the same file. Returns results in the same order as the
+        input list.
         """
-        async def _bounded(req: FetchRequest) -> FetchResult:
-            async with self._semaphore:
-                return await self.fetch_chunk(req)
-
-        return list(await asyncio.gather(*[_bounded(r) for r in requests]))
+        return list(await asyncio.gather(*[self.fetch_chunk(r) for r in requests]))
 
     # ── Internal helpers ───────────────────────────────────────────────────
 
+    async def _get_file_body(self, req: FetchRequest) -> tuple[str, bool]:
+        """
+        Return (body, served_from_cache) for the file behind `req`.
+
+        Concurrent callers for the same (uri, ref) await one shared download.
+        The download is shielded so a caller's timeout doesn't cancel it for
+        everyone else waiting on the same file.
+        """
+        key = req.file_key()
+        if req.is_pinned:
+            body = _file_cache.get(key)
+            if body is not None:
+                self.stats["file_cache_hits"] += 1
+                return body, True
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(pending)
+
+        task = asyncio.ensure_future(self._load_file_body(req))
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._forget_inflight(key, t))
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, key: tuple[str, str], task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the result as retrieved even if every waiter timed out.
+        if not task.cancelled():
+            task.exception()
+
+    async def _load_file_body(self, req: FetchRequest) -> tuple[str, bool]:
+        """Probe the Redis file cache for pinned refs, else download."""
+        pinned = req.is_pinned
+        if pinned:
+            try:
+                cached = await self._redis.get(req.file_cache_key())
+            except Exception as exc:
+                logger.warning("Redis GET failed, bypassing file cache: %s", exc)
+                cached = None
+            if isinstance(cached, str):
+                try:
+                    body = _decompress(base64.b64decode(cached))
+                except Exception as exc:
+                    logger.warning("Discarding corrupt file cache entry: %s", exc)
+                else:
+                    _file_cache.put(req.file_key(), body)
+                    self.stats["file_cache_hits"] += 1
+                    return body, True
+
+        body = await self._fetch_raw(req)
+
+        if pinned:
+            _file_cache.put(req.file_key(), body)
+            try:
+                # The Redis client decodes responses, so store base64 text.
+                await self._redis.set(
+                    req.file_cache_key(),
+                    base64.b64encode(_compress(body)).decode("ascii"),
+                    ex=FILE_CACHE_TTL_SECONDS,
+                )
+            except Exception as exc:
+                logger.warning("Redis SET of file body failed: %s", exc)
+        return body, False
+
     async def _fetch_raw(self, req: FetchRequest) -> str:
         """
-        Download the raw file from GitHub and slice the requested line range.
+        Download the whole raw file from GitHub.
 
         Validates that the URI is a legitimate raw.githubusercontent.com URL
         before making the request to prevent SSRF.
@@ -224,6 +391,7 @@ class GitHubFetcher:
         _validate_github_uri(req.github_uri)
 
         async with self._semaphore:
+            self.stats["github_requests"] += 1
             response = await self._http.get(req.github_uri)
 
         if response.status_code == 404:
@@ -244,12 +412,7 @@ class GitHubFetcher:
                 f"File exceeds {MAX_FILE_BYTES // 1024} KB safety cap: "
                 f"{req.github_uri}"
             )
-
-        lines = content.splitlines()
-        # Convert 1-based inclusive range to 0-based Python slice
-        start = max(0, req.start_line - 1)
-        end   = min(len(lines), req.end_line)
-        return "\n".join(lines[start:end])
+        return content
 
     @staticmethod
     def _build_headers() -> dict[str, str]:
@@ -0,0 +1,264 @@
+"""
+Graph Analytics Job
+
+Computes whole-graph centrality (degree, betweenness, PageRank) and Louvain
+communities in the background and stores them in graph_centrality_cache and
+community_assignments, so API requests read those tables instead of running
+NetworkX on the event loop.
+
+The job reads the shared graph store's arrays, runs the kernels from
+app/shared/graph_analytics.py in the analytics process pool (approximate
+betweenness above GRAPH_ANALYTICS_EXACT_BETWEENNESS_MAX_NODES nodes) and
+replaces the cached rows in one transaction. Only one run is in flight per
+process; readers trigger a run when the cached results are older than
+GRAPH_ANALYTICS_REFRESH_SECONDS.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.config.settings import get_settings
+from app.database.models import CommunityAssignment, GraphCentralityCache, Resource
+from app.shared.graph_analytics import (
+    betweenness_sample_size,
+    centrality_scores,
+    louvain_partition,
+    run_analytics,
+)
+
+logger = logging.getLogger(__name__)
+
+# Rows per bulk insert
+_INSERT_BATCH = 5000
+
+_run_lock = threading.Lock()
+_last_run: Dict[str, Any] = {}
+
+
+def analytics_running() -> bool:
+    """Whether a refresh is in progress in this process."""
+    return _run_lock.locked()
+
+
+def last_analytics_run() -> Dict[str, Any]:
+    """Summary of the last completed (or failed) run in this process."""
+    return dict(_last_run)
+
+
+def compute_graph_analytics(
+    db: Session, resolutions: Optional[Iterable[float]] = None
+) -> Dict[str, Any]:
+    """
+    Recompute centrality and communities and replace the cached rows.
+
+    Args:
+        db: Database session (committed on success)
+        resolutions: Louvain resolutions to store (default: settings)
+
+    Returns:
+        Run summary (nodes, edges, approximate, duration_seconds, ...)
+    """
+    from app.shared.graph_store import get_graph_store
+
+    settings = get_settings()
+    if resolutions is None:
+        resolutions = settings.GRAPH_ANALYTICS_RESOLUTIONS
+    start = time.time()
+
+    node_ids, src, dst, weight = get_graph_store(db).live_edges()
+    n = len(node_ids)
+    samples = betweenness_sample_size(
+        n,
+        settings.GRAPH_ANALYTICS_EXACT_BETWEENNESS_MAX_NODES,
+        settings.GRAPH_ANALYTICS_BETWEENNESS_SAMPLES,
+    )
+    betweenness, pagerank = run_analytics(
+        centrality_scores,
+        n,
+        src,
+        dst,
+        weight,
+        settings.GRAPH_ANALYTICS_PAGERANK_DAMPING,
+        samples,
+        0,
+    )
+
+    # Distinct neighbors per direction, as GraphStore.degrees counts them
+    pairs = np.unique(src.astype(np.int64) * max(n, 1) + dst)
+    out_degree = np.bincount(pairs // max(n, 1), minlength=n)
+    in_degree = np.bincount(pairs % max(n, 1), minlength=n)
+
+    position = {node_id: idx for idx, node_id in enumerate(node_ids)}
+    resources = [
+        (rid, position.get(str(rid))) for (rid,) in db.query(Resource.id).all()
+    ]
+    computed_at = datetime.now(timezone.utc)
+
+    centrality_rows = []
+    for rid, idx in resources:
+        if idx is None:
+            centrality_rows.append(
+                dict(
+                    resource_id=rid,
+                    in_degree=0,
+                    out_degree=0,
+                    betweenness=0.0,
+                    pagerank=0.0,
+                    computed_at=computed_at,
+                )
+            )
+        else:
+            centrality_rows.append(
+                dict(
+                    resource_id=rid,
+                    in_degree=int(in_degree[idx]),
+                    out_degree=int(out_degree[idx]),
+                    betweenness=float(betweenness[idx]),
+                    pagerank=float(pagerank[idx]),
+                    computed_at=computed_at,
+                )
+            )
+
+    community_rows: Dict[float, List[Dict[str, Any]]] = {}
+    for resolution in resolutions:
+        try:
+            labels, modularity = run_analytics(
+                louvain_partition, n, src, dst, weight, resolution, 0
+            )
+        except ImportError as e:
+            logger.error(f"Skipping community detection, library not installed: {e}")
+            break
+        community_rows[resolution] = [
+            dict(
+                resource_id=rid,
+                community_id=int(labels[idx]),
+                modularity=modularity,
+                resolution=resolution,
+                computed_at=computed_at,
+            )
+            for rid, idx in resources
+            if idx is not None
+        ]
+
+    # Swap the cached rows in one transaction so readers never see a mix
+    db.query(GraphCentralityCache).delete(synchronize_session=False)
+    _bulk_insert(db, GraphCentralityCache, centrality_rows)
+    for resolution, rows in community_rows.items():
+        db.query(CommunityAssignment).filter(
+            CommunityAssignment.resolution == resolution
+        ).delete(synchronize_session=False)
+        _bulk_insert(db, CommunityAssignment, rows)
+    db.commit()
+
+    summary = {
+        "nodes": n,
+        "edges": int(len(src)),
+        "resources": len(resources),
+        "approximate": samples is not None,
+        "betweenness_samples": samples,
+        "resolutions": list(community_rows),
+        "computed_at": computed_at.isoformat(),
+        "duration_seconds": round(time.time() - start, 3),
+    }
+    logger.info(
+        f"Graph analytics computed for {n} nodes / {len(src)} edges in "
+        f"{summary['duration_seconds']:.2f}s"
+        + (f" (betweenness sampled from {samples} sources)" if samples else "")
+    )
+    return summary
+
+
+def _bulk_insert(db: Session, model, rows: List[Dict[str, Any]]) -> None:
+    for start in range(0, len(rows), _INSERT_BATCH):
+        db.bulk_insert_mappings(model, rows[start : start + _INSERT_BATCH])
+
+
+def refresh_graph_analytics(
+    session_factory: Optional[Callable[[], Session]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Run compute_graph_analytics unless a run is already in progress.
+
+    Meant for FastAPI BackgroundTasks: opens its own database session since
+    the request session is closed by the time the job runs.
+
+    Args:
+        session_factory: Session factory (default: app.shared.database.SessionLocal)
+
+    Returns:
+        Run summary, or None if another run was in progress or this one failed
+    """
+    if session_factory is None:
+        from app.shared.database import SessionLocal as session_factory
+
+    if not _run_lock.acquire(blocking=False):
+        logger.debug("Graph analytics refresh already running")
+        return None
+    try:
+        db = session_factory()
+    except Exception:
+        _run_lock.release()
+        raise
+
+    try:
+        summary = compute_graph_analytics(db)
+        _last_run.clear()
+        _last_run.update(summary, status="completed")
+        return summary
+    except Exception as e:
+        logger.error(f"Graph analytics refresh failed: {e}", exc_info=True)
+        db.rollback()
+        _last_run.clear()
+        _last_run.update(
+            status="failed",
+            error=str(e),
+            failed_at=datetime.now(timezone.utc).isoformat(),
+        )
+        return None
+    finally:
+        db.close()
+        _run_lock.release()
+
+
+def analytics_freshness(computed_at: Optional[datetime]) -> Dict[str, Any]:
+    """
+    Staleness metadata for results computed at ``computed_at``.
+
+    Returns:
+        {"computed_at", "age_seconds", "stale", "refreshing"}; results are
+        stale when missing or older than GRAPH_ANALYTICS_REFRESH_SECONDS
+    """
+    if computed_at is None:
+        return {
+            "computed_at": None,
+            "age_seconds": None,
+            "stale": True,
+            "refreshing": analytics_running(),
+        }
+    if computed_at.tzinfo is None:
+        # SQLite returns naive datetimes; the job always writes UTC
+        computed_at = computed_at.replace(tzinfo=timezone.utc)
+    age = (datetime.now(timezone.utc) - computed_at).total_seconds()
+    return {
+        "computed_at": computed_at.isoformat(),
+        "age_seconds": round(max(age, 0.0), 3),
+        "stale": age > get_settings().GRAPH_ANALYTICS_REFRESH_SECONDS,
+        "refreshing": analytics_running(),
+    }
+
+
+def latest_centrality_run(db: Session) -> Optional[datetime]:
+    """Timestamp of the newest cached centrality rows, if any."""
+    return db.query(func.max(GraphCentralityCache.computed_at)).scalar()
+
+
+def reset_graph_analytics() -> None:
+    """Forget the last run summary (used by tests)."""
+    _last_run.clear()
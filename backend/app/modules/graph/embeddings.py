@@ -4,15 +4,34 @@ Graph Embeddings Service
 Implements Node2Vec and DeepWalk embeddings for citation graph analysis.
 Provides embedding generation, storage, retrieval, and similarity search.
 
+Walks are generated over CSR arrays by app/shared/graph_walks.py and
+streamed to a corpus file that the skip-gram trainer reads, so neither the
+NetworkX graph nor the full walk list is materialised. Generation runs as
+a background job with progress reporting (see run_embedding_job).
+
 Note: Uses custom implementation compatible with Python 3.13 instead of node2vec package.
 """
 
+import json
 import logging
+import os
+import tempfile
+import threading
 import time
 import random
-from typing import List, Dict, Any, Optional, Tuple
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Callable, List, Dict, Any, Optional, Tuple
 from sqlalchemy.orm import Session
-from uuid import UUID
+from uuid import UUID, uuid4
+
+from ...shared.embedding_store import EmbeddingStore
+from ...shared.graph_walks import (
+    WalkGraph,
+    generate_walks,
+    walk_lengths,
+    write_walk_corpus,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +43,9 @@ class GraphEmbeddingsService:
         self.db = db
         self.embeddings_cache: Dict[str, List[float]] = {}
         self._graph_cache = None
+        # Normalised matrix view of embeddings_cache for similarity search
+        self._similarity_store: Optional[EmbeddingStore] = None
+        self._similarity_store_size = -1
 
     def _build_networkx_graph(self):
         """Build NetworkX graph from citation data."""
@@ -60,6 +82,28 @@ class GraphEmbeddingsService:
         )
         return G
 
+    def _build_walk_graph(self) -> WalkGraph:
+        """Build the citation graph as CSR arrays from id columns only."""
+        from app.database.models import Citation, Resource
+
+        citations = self.db.query(
+            Citation.source_resource_id, Citation.target_resource_id
+        ).all()
+        resource_ids = self.db.query(Resource.id).all()
+
+        graph = WalkGraph.from_edges(
+            (str(row[0]) for row in resource_ids),
+            (
+                (str(source), str(target))
+                for source, target in citations
+                if source and target
+            ),
+        )
+        logger.info(
+            f"Built walk graph with {graph.num_nodes} nodes and {graph.num_edges} edges"
+        )
+        return graph
+
     def _generate_random_walks(
         self, G, num_walks: int, walk_length: int, p: float = 1.0, q: float = 1.0
     ) -> List[List[str]]:
@@ -76,15 +120,14 @@ class GraphEmbeddingsService:
         Returns:
             List of walks, where each walk is a list of node IDs
         """
+        graph = WalkGraph.from_networkx(G)
+        node_ids = graph.node_ids
         walks = []
-        nodes = list(G.nodes())
 
-        for _ in range(num_walks):
-            random.shuffle(nodes)
-            for node in nodes:
-                walk = self._node2vec_walk(G, node, walk_length, p, q)
-                if len(walk) > 1:  # Only include walks with at least 2 nodes
-                    walks.append(walk)
+        for batch in generate_walks(graph, num_walks, walk_length, p, q):
+            for row, length in zip(batch.tolist(), walk_lengths(batch).tolist()):
+                if length > 1:  # Only include walks with at least 2 nodes
+                    walks.append([node_ids[i] for i in row[:length]])
 
         logger.info(f"Generated {len(walks)} random walks")
         return walks
@@ -95,6 +138,9 @@ class GraphEmbeddingsService:
         """
         Perform a single biased random walk from start_node.
 
+        Reference implementation of the transition rule that
+        app/shared/graph_walks.py applies to whole shards at once.
+
         Args:
             G: NetworkX graph
             start_node: Starting node
@@ -172,11 +218,15 @@ class GraphEmbeddingsService:
         window: int = 10,
         min_count: int = 1,
         workers: int = 4,
+        walk_workers: Optional[int] = None,
+        progress_callback: Optional[Callable[[str, float], None]] = None,
     ) -> Dict[str, Any]:
         """
         Compute Node2Vec embeddings for the citation graph.
 
         Uses custom implementation with gensim Word2Vec for Python 3.13 compatibility.
+        Walks are written shard by shard to a temporary corpus file which
+        Word2Vec trains from directly (``corpus_file``).
 
         Args:
             dimensions: Embedding dimensionality (default: 128)
@@ -187,6 +237,10 @@ class GraphEmbeddingsService:
             window: Context window size (default: 10)
             min_count: Minimum word count (default: 1)
             workers: Number of worker threads (default: 4)
+            walk_workers: Walk processes (default: GRAPH_WALK_WORKERS)
+            progress_callback: Optional callback(stage, fraction) where stage is
+                "building_graph", "walking", "training" or "storing" and
+                fraction is the completed share of that stage
 
         Returns:
             Dict with status, embeddings_computed, dimensions, and execution_time
@@ -200,10 +254,17 @@ class GraphEmbeddingsService:
                 "gensim is required for graph embeddings. Install with: pip install gensim"
             )
 
-        # Build NetworkX graph
-        G = self._build_networkx_graph()
+        from ...config.settings import get_settings
 
-        if G.number_of_nodes() == 0:
+        settings = get_settings()
+        report = progress_callback or (lambda stage, fraction: None)
+
+        # Build CSR graph
+        report("building_graph", 0.0)
+        graph = self._build_walk_graph()
+        report("building_graph", 1.0)
+
+        if graph.num_nodes == 0:
             logger.warning("Graph has no nodes, cannot compute embeddings")
             return {
                 "status": "error",
@@ -213,49 +274,72 @@ class GraphEmbeddingsService:
                 "execution_time": 0.0,
             }
 
-        # Generate random walks
-        logger.info(f"Generating random walks with p={p}, q={q}")
-        walks = self._generate_random_walks(G, num_walks, walk_length, p, q)
-
-        if len(walks) == 0:
-            logger.warning("No walks generated, cannot compute embeddings")
-            return {
-                "status": "error",
-                "message": "No walks generated",
-                "embeddings_computed": 0,
-                "dimensions": dimensions,
-                "execution_time": 0.0,
-            }
+        with tempfile.TemporaryDirectory(prefix="node2vec-") as corpus_dir:
+            corpus_path = os.path.join(corpus_dir, "walks.txt")
+
+            # Generate random walks
+            logger.info(f"Generating random walks with p={p}, q={q}")
+            walks_generated = write_walk_corpus(
+                graph,
+                corpus_path,
+                num_walks=num_walks,
+                walk_length=walk_length,
+                p=p,
+                q=q,
+                workers=walk_workers or settings.GRAPH_WALK_WORKERS,
+                shard_size=settings.GRAPH_WALK_SHARD_SIZE,
+                progress=lambda done, total: report("walking", done / total),
+            )
 
-        # Train Word2Vec model
-        logger.info(f"Training Word2Vec model with dimensions={dimensions}")
-        model = Word2Vec(
-            sentences=walks,
-            vector_size=dimensions,
-            window=window,
-            min_count=min_count,
-            workers=workers,
-            sg=1,  # Skip-gram
-            hs=0,  # Negative sampling
-            negative=5,
-            epochs=5,
-        )
+            if walks_generated == 0:
+                logger.warning("No walks generated, cannot compute embeddings")
+                return {
+                    "status": "error",
+                    "message": "No walks generated",
+                    "embeddings_computed": 0,
+                    "dimensions": dimensions,
+                    "execution_time": 0.0,
+                }
+
+            # Train Word2Vec model on the streamed corpus
+            logger.info(f"Training Word2Vec model with dimensions={dimensions}")
+            epochs = 5
+            report("training", 0.0)
+            model = Word2Vec(
+                corpus_file=corpus_path,
+                vector_size=dimensions,
+                window=window,
+                min_count=min_count,
+                workers=workers,
+                sg=1,  # Skip-gram
+                hs=0,  # Negative sampling
+                negative=5,
+                epochs=epochs,
+                callbacks=[_epoch_progress(report, epochs)],
+            )
 
-        # Extract embeddings
+        # Extract embeddings (corpus tokens are dense node indexes)
+        report("storing", 0.0)
         embeddings = {}
-        for node in G.nodes():
-            try:
-                embeddings[node] = model.wv[node].tolist()
-            except KeyError:
+        missing = 0
+        for index, node in enumerate(graph.node_ids):
+            token = str(index)
+            if token in model.wv.key_to_index:
+                embeddings[node] = model.wv[token].tolist()
+            else:
                 # Node not in vocabulary (isolated node with no walks)
-                logger.warning(f"Node {node} not in vocabulary, using zero vector")
+                missing += 1
                 embeddings[node] = [0.0] * dimensions
+        if missing:
+            logger.warning(f"{missing} nodes not in vocabulary, using zero vectors")
 
         # Cache embeddings
         self.embeddings_cache.update(embeddings)
+        self._similarity_store = None
 
         # Store in database
         self._store_embeddings(embeddings, algorithm="node2vec")
+        report("storing", 1.0)
 
         execution_time = time.time() - start_time
         logger.info(
@@ -268,6 +352,7 @@ class GraphEmbeddingsService:
             "dimensions": dimensions,
             "execution_time": execution_time,
             "algorithm": "node2vec",
+            "walks_generated": walks_generated,
             "parameters": {
                 "p": p,
                 "q": q,
@@ -284,6 +369,8 @@ class GraphEmbeddingsService:
         window: int = 10,
         min_count: int = 1,
         workers: int = 4,
+        walk_workers: Optional[int] = None,
+        progress_callback: Optional[Callable[[str, float], None]] = None,
     ) -> Dict[str, Any]:
         """
         Compute DeepWalk embeddings (Node2Vec with p=1, q=1).
@@ -295,6 +382,8 @@ class GraphEmbeddingsService:
             window: Context window size (default: 10)
             min_count: Minimum word count (default: 1)
             workers: Number of worker threads (default: 4)
+            walk_workers: Walk processes (default: GRAPH_WALK_WORKERS)
+            progress_callback: Optional callback(stage, fraction)
 
         Returns:
             Dict with status, embeddings_computed, dimensions, and execution_time
@@ -309,6 +398,8 @@ class GraphEmbeddingsService:
             window=window,
             min_count=min_count,
             workers=workers,
+            walk_workers=walk_workers,
+            progress_callback=progress_callback,
         )
         result["algorithm"] = "deepwalk"
         return result
@@ -386,20 +477,25 @@ class GraphEmbeddingsService:
             logger.warning(f"No embedding found for resource {resource_id}")
             return []
 
-        similarities = []
-        node_id = str(resource_id)
-
-        # Compute cosine similarity with all other nodes
-        for other_id, other_embedding in self.embeddings_cache.items():
-            if other_id != node_id:
-                similarity = self._cosine_similarity(target_embedding, other_embedding)
-                if similarity >= min_similarity:
-                    similarities.append((other_id, similarity))
-
-        # Sort by similarity descending
-        similarities.sort(key=lambda x: x[1], reverse=True)
+        # Score all other nodes in one batched product
+        return self._get_similarity_store().similar(
+            target_embedding,
+            k=limit,
+            exclude_ids=[str(resource_id)],
+            min_similarity=min_similarity,
+        )
 
-        return similarities[:limit]
+    def _get_similarity_store(self) -> EmbeddingStore:
+        """Return the matrix view of embeddings_cache, rebuilding it if stale."""
+        if (
+            self._similarity_store is None
+            or self._similarity_store_size != len(self.embeddings_cache)
+        ):
+            store = EmbeddingStore("graph_structural")
+            store.load_items(self.embeddings_cache.items())
+            self._similarity_store = store
+            self._similarity_store_size = len(self.embeddings_cache)
+        return self._similarity_store
 
     def _cosine_similarity(self, vec_a: List[float], vec_b: List[float]) -> float:
         """
@@ -485,4 +581,276 @@ class GraphEmbeddingsService:
     def clear_cache(self) -> None:
         """Clear the embeddings cache."""
         self.embeddings_cache.clear()
+        self._similarity_store = None
         logger.info("Embeddings cache cleared")
+
+
+def _epoch_progress(report: Callable[[str, float], None], epochs: int):
+    """Word2Vec callback reporting ("training", epochs done / epochs)."""
+    from gensim.models.callbacks import CallbackAny2Vec
+
+    class EpochProgress(CallbackAny2Vec):
+        def __init__(self):
+            self.epoch = 0
+
+        def on_epoch_end(self, model):
+            self.epoch += 1
+            report("training", self.epoch / epochs)
+
+    return EpochProgress()
+
+
+# ============================================================================
+# Background generation jobs
+# ============================================================================
+
+# Share of overall job progress covered by each stage
+_STAGE_SPANS = {
+    "building_graph": (0.0, 0.05),
+    "walking": (0.05, 0.5),
+    "training": (0.5, 0.95),
+    "storing": (0.95, 1.0),
+}
+
+# Finished jobs kept for status polling (process-local registry)
+_MAX_FINISHED_JOBS = 50
+
+# With GRAPH_EMBEDDING_JOBS_REDIS, job state lives in Redis so any API worker
+# can report a job's progress, and the active-job key admits one job across
+# workers. Without Redis the registry below is per process, which is only
+# correct with a single API worker.
+_JOB_KEY_PREFIX = "graph_embedding_job"
+_ACTIVE_JOB_KEY = f"{_JOB_KEY_PREFIX}:active"
+# Seconds a job stays pollable in Redis
+_JOB_TTL_SECONDS = 7 * 24 * 3600
+# Seconds without progress after which a claim (e.g. of a crashed worker) lapses
+_ACTIVE_JOB_TTL_SECONDS = 6 * 3600
+
+_jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_jobs_lock = threading.Lock()
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _job_redis():
+    """Redis client holding job state, or None for the process-local registry."""
+    from ...config.settings import get_settings
+
+    if not get_settings().GRAPH_EMBEDDING_JOBS_REDIS:
+        return None
+    from ...shared.cache import cache
+
+    return cache.redis
+
+
+def _job_key(job_id: str) -> str:
+    return f"{_JOB_KEY_PREFIX}:{job_id}"
+
+
+def _redis_load_job(client, job_id: str) -> Optional[Dict[str, Any]]:
+    raw = client.get(_job_key(job_id))
+    return json.loads(raw) if raw else None
+
+
+def _redis_store_job(client, job: Dict[str, Any]) -> None:
+    client.set(
+        _job_key(job["job_id"]), json.dumps(job, default=str), ex=_JOB_TTL_SECONDS
+    )
+
+
+def _with_job_store(redis_op: Callable, local_op: Callable, *args: Any) -> Any:
+    """Run ``redis_op(client, *args)``, or ``local_op(*args)`` without Redis."""
+    client = _job_redis()
+    if client is not None:
+        try:
+            return redis_op(client, *args)
+        except Exception as e:
+            logger.warning(f"Embedding job store unavailable, using process registry: {e}")
+    return local_op(*args)
+
+
+def create_embedding_job(
+    algorithm: str, parameters: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """
+    Register a pending embedding generation job.
+
+    Args:
+        algorithm: "node2vec" or "deepwalk"
+        parameters: Keyword arguments for the compute_* method
+
+    Returns:
+        Snapshot of the new job, or None if another job is pending or running
+    """
+    job = {
+        "job_id": str(uuid4()),
+        "algorithm": algorithm,
+        "parameters": dict(parameters),
+        "status": "pending",
+        "stage": None,
+        "progress": 0.0,
+        "result": None,
+        "error": None,
+        "created_at": _now(),
+        "started_at": None,
+        "completed_at": None,
+    }
+    return _with_job_store(_redis_create_job, _local_create_job, job)
+
+
+def _redis_create_job(client, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if not client.set(
+        _ACTIVE_JOB_KEY, job["job_id"], nx=True, ex=_ACTIVE_JOB_TTL_SECONDS
+    ):
+        return None
+    _redis_store_job(client, job)
+    return dict(job)
+
+
+def _local_create_job(job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    with _jobs_lock:
+        if any(e["status"] in ("pending", "running") for e in _jobs.values()):
+            return None
+        _jobs[job["job_id"]] = job
+        finished = [
+            job_id
+            for job_id, entry in _jobs.items()
+            if entry["status"] in ("completed", "failed")
+        ]
+        for job_id in finished[: max(0, len(finished) - _MAX_FINISHED_JOBS)]:
+            del _jobs[job_id]
+        return dict(job)
+
+
+def get_embedding_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """Return a snapshot of a job, or None if unknown."""
+    return _with_job_store(_redis_load_job, _local_get_job, job_id)
+
+
+def _local_get_job(job_id: str) -> Optional[Dict[str, Any]]:
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+        return dict(job) if job is not None else None
+
+
+def active_embedding_job() -> Optional[Dict[str, Any]]:
+    """Return the pending or running job, if any."""
+    return _with_job_store(_redis_active_job, _local_active_job)
+
+
+def _redis_active_job(client) -> Optional[Dict[str, Any]]:
+    job_id = client.get(_ACTIVE_JOB_KEY)
+    job = _redis_load_job(client, job_id) if job_id else None
+    if job is not None and job["status"] in ("pending", "running"):
+        return job
+    return None
+
+
+def _local_active_job() -> Optional[Dict[str, Any]]:
+    with _jobs_lock:
+        for job in _jobs.values():
+            if job["status"] in ("pending", "running"):
+                return dict(job)
+    return None
+
+
+def _update_embedding_job(job_id: str, **fields: Any) -> None:
+    _with_job_store(_redis_update_job, _local_update_job, job_id, fields)
+
+
+def _redis_update_job(client, job_id: str, fields: Dict[str, Any]) -> None:
+    job = _redis_load_job(client, job_id)
+    if job is None:
+        return
+    job.update(fields)
+    _redis_store_job(client, job)
+    if job["status"] in ("completed", "failed"):
+        # Only this job's completion releases its own claim
+        if client.get(_ACTIVE_JOB_KEY) == job_id:
+            client.delete(_ACTIVE_JOB_KEY)
+    else:
+        client.expire(_ACTIVE_JOB_KEY, _ACTIVE_JOB_TTL_SECONDS)
+
+
+def _local_update_job(job_id: str, fields: Dict[str, Any]) -> None:
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+        if job is not None:
+            job.update(fields)
+
+
+def run_embedding_job(
+    job_id: str, session_factory: Optional[Callable[[], Session]] = None
+) -> None:
+    """
+    Run a registered job to completion, recording stage and progress.
+
+    Meant for FastAPI BackgroundTasks: opens its own database session since
+    the request session is closed by the time the job runs.
+
+    Args:
+        job_id: Id returned by create_embedding_job
+        session_factory: Session factory (default: app.shared.database.SessionLocal)
+    """
+    job = get_embedding_job(job_id)
+    if job is None:
+        logger.warning(f"Unknown embedding job {job_id}")
+        return
+
+    if session_factory is None:
+        from app.shared.database import SessionLocal as session_factory
+
+    def report(stage: str, fraction: float) -> None:
+        lo, hi = _STAGE_SPANS[stage]
+        fraction = min(max(fraction, 0.0), 1.0)
+        _update_embedding_job(
+            job_id, stage=stage, progress=round(lo + (hi - lo) * fraction, 4)
+        )
+
+    _update_embedding_job(job_id, status="running", started_at=_now())
+    db = session_factory()
+    try:
+        service = GraphEmbeddingsService(db)
+        if job["algorithm"] == "deepwalk":
+            compute = service.compute_deepwalk_embeddings
+        else:
+            compute = service.compute_node2vec_embeddings
+        result = compute(progress_callback=report, **job["parameters"])
+
+        if result.get("status") == "success":
+            _update_embedding_job(
+                job_id,
+                status="completed",
+                progress=1.0,
+                result=result,
+                completed_at=_now(),
+            )
+            logger.info(
+                f"Embedding job {job_id} generated {job['algorithm']} embeddings: "
+                f"{result['embeddings_computed']} nodes, "
+                f"{result['execution_time']:.2f}s"
+            )
+        else:
+            _update_embedding_job(
+                job_id,
+                status="failed",
+                result=result,
+                error=result.get("message"),
+                completed_at=_now(),
+            )
+    except Exception as e:
+        logger.error(f"Embedding job {job_id} failed: {e}", exc_info=True)
+        _update_embedding_job(
+            job_id, status="failed", error=str(e), completed_at=_now()
+        )
+    finally:
+        db.close()
+
+
+def reset_embedding_jobs() -> None:
+    """Forget all local jobs and release any shared claim (used by tests)."""
+    with _jobs_lock:
+        _jobs.clear()
+    _with_job_store(lambda client: client.delete(_ACTIVE_JOB_KEY), lambda: None)
@@ -13,6 +13,7 @@ Events Emitted:
 
 Events Subscribed:
 - resource.chunked: Triggers automatic graph extraction if enabled
+- citation.extracted: Patches the resource's edges in the shared graph store
 """
 
 import logging
@@ -253,6 +254,47 @@ def handle_resource_chunked(event: Event) -> None:
         )
 
 
+def handle_citation_extracted(event: Event) -> None:
+    """
+    Handle citation.extracted event by refreshing the resource's graph edges.
+
+    Re-reads the citations and graph edges touching the resource and swaps
+    them into the process-wide graph store, so neighbor and centrality
+    queries see new citations without waiting for the next delta sync.
+
+    Args:
+        event: Event object containing resource_id and citations
+    """
+    resource_id = event.data.get("resource_id")
+
+    if not resource_id:
+        logger.warning("citation.extracted event missing resource_id")
+        return
+
+    try:
+        from app.shared.database import SessionLocal
+        from app.shared.graph_store import get_graph_store, refresh_resource_edges
+
+        store = get_graph_store()
+        if not store.loaded:
+            # Nothing cached yet; the first graph query builds from scratch
+            return
+
+        db = SessionLocal()
+        try:
+            refresh_resource_edges(store, db, str(resource_id))
+        finally:
+            db.close()
+
+        logger.debug(f"Refreshed graph store edges for resource {resource_id}")
+
+    except Exception as e:
+        logger.error(
+            f"Error refreshing graph edges for resource {resource_id}: {str(e)}",
+            exc_info=True,
+        )
+
+
 def register_handlers():
     """
     Register all event handlers for the graph module.
@@ -262,4 +304,7 @@ def register_handlers():
     # Subscribe to resource.chunked for automatic graph extraction
     event_bus.subscribe("resource.chunked", handle_resource_chunked)
 
+    # Keep the shared graph store in step with citation extraction
+    event_bus.subscribe("citation.extracted", handle_citation_extracted)
+
     logger.info("Graph module event handlers registered")
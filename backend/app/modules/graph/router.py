@@ -14,7 +14,7 @@ import logging
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.shared.database import get_db, get_sync_db
@@ -24,8 +24,15 @@ from app.modules.graph.service import (
     find_hybrid_neighbors,
     generate_global_overview,
 )
-from app.modules.graph.embeddings import GraphEmbeddingsService
+from app.modules.graph.embeddings import (
+    GraphEmbeddingsService,
+    active_embedding_job,
+    create_embedding_job,
+    get_embedding_job,
+    run_embedding_job,
+)
 from app.config.settings import get_settings
+from app.shared.cache import cached
 from app.shared.event_bus import event_bus
 
 logger = logging.getLogger(__name__)
@@ -282,13 +289,15 @@ def get_global_overview(
 
 @router.post(
     "/embeddings/generate",
+    status_code=202,
     summary="Generate graph embeddings",
     description=(
-        "Generate Node2Vec or DeepWalk embeddings for the citation graph. "
-        "This endpoint computes embeddings for all nodes in the graph and caches them."
+        "Start a background job that generates Node2Vec or DeepWalk embeddings "
+        "for the citation graph. Poll GET /embeddings/jobs/{job_id} for progress."
     ),
 )
 def generate_graph_embeddings(
+    background: BackgroundTasks,
     algorithm: str = Query(
         "node2vec", description="Algorithm to use: 'node2vec' or 'deepwalk'"
     ),
@@ -301,71 +310,89 @@ def generate_graph_embeddings(
     q: float = Query(
         1.0, ge=0.1, le=10.0, description="In-out parameter (Node2Vec only)"
     ),
-    db: Session = Depends(get_sync_db),
 ) -> dict:
     """
-    Generate graph embeddings using Node2Vec or DeepWalk algorithm.
+    Start graph embedding generation using Node2Vec or DeepWalk.
 
-    This endpoint:
-    1. Builds a NetworkX graph from citation data
-    2. Trains the specified embedding algorithm
-    3. Extracts embeddings for all nodes
+    The job runs in this worker after the response is sent. Its state is
+    shared through Redis (GRAPH_EMBEDDING_JOBS_REDIS), so any worker can
+    answer status polls and only one job runs across workers; without Redis
+    jobs are tracked per process, which requires a single API worker.
+
+    Steps:
+    1. Builds CSR arrays from citation data
+    2. Streams sharded random walks to a corpus file
+    3. Trains the skip-gram model on the corpus
     4. Caches embeddings for fast retrieval
 
     Args:
+        background: FastAPI background task queue
         algorithm: Algorithm to use ("node2vec" or "deepwalk")
         dimensions: Embedding dimensionality (default: 128)
         walk_length: Length of random walks (default: 80)
         num_walks: Number of walks per node (default: 10)
         p: Return parameter for Node2Vec (default: 1.0)
         q: In-out parameter for Node2Vec (default: 1.0)
-        db: Database session dependency
 
     Returns:
-        dict: Response with status, embeddings_computed, dimensions, and execution_time
+        dict: The pending job (job_id, status, stage, progress, parameters)
 
     Raises:
-        HTTPException: If embedding generation fails
+        HTTPException: 400 for an unknown algorithm, 409 if a job is already running
     """
-    try:
-        embeddings_service = GraphEmbeddingsService(db)
-
-        if algorithm.lower() == "deepwalk":
-            result = embeddings_service.compute_deepwalk_embeddings(
-                dimensions=dimensions, walk_length=walk_length, num_walks=num_walks
-            )
-        elif algorithm.lower() == "node2vec":
-            result = embeddings_service.compute_node2vec_embeddings(
-                dimensions=dimensions,
-                walk_length=walk_length,
-                num_walks=num_walks,
-                p=p,
-                q=q,
-            )
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid algorithm: {algorithm}. Must be 'node2vec' or 'deepwalk'",
-            )
-
-        logger.info(
-            f"Generated {algorithm} embeddings: "
-            f"{result['embeddings_computed']} nodes, "
-            f"{result['execution_time']:.2f}s"
-        )
-
-        return result
-
-    except ImportError as e:
-        logger.error(f"Missing dependency for graph embeddings: {e}")
+    algorithm = algorithm.lower()
+    parameters = {
+        "dimensions": dimensions,
+        "walk_length": walk_length,
+        "num_walks": num_walks,
+    }
+    if algorithm == "node2vec":
+        parameters.update(p=p, q=q)
+    elif algorithm != "deepwalk":
         raise HTTPException(
-            status_code=500, detail=f"Missing required dependency: {str(e)}"
+            status_code=400,
+            detail=f"Invalid algorithm: {algorithm}. Must be 'node2vec' or 'deepwalk'",
         )
-    except Exception as e:
-        logger.error(f"Error generating graph embeddings: {e}")
+
+    job = create_embedding_job(algorithm, parameters)
+    if job is None:
+        active = active_embedding_job()
         raise HTTPException(
-            status_code=500, detail="Internal server error while generating embeddings"
+            status_code=409,
+            detail=(
+                f"Embedding job {active['job_id']} is already {active['status']}"
+                if active is not None
+                else "An embedding job is already running"
+            ),
         )
+    background.add_task(run_embedding_job, job["job_id"])
+    logger.info(f"Queued {algorithm} embedding job {job['job_id']}")
+    return job
+
+
+@router.get(
+    "/embeddings/jobs/{job_id}",
+    summary="Get embedding job status",
+    description="Return the status, current stage and progress of an embedding job.",
+)
+def get_graph_embeddings_job(job_id: str) -> dict:
+    """
+    Get the status of a graph embedding generation job.
+
+    Args:
+        job_id: Id returned by POST /embeddings/generate
+
+    Returns:
+        dict: Job status ("pending", "running", "completed", "failed"), stage,
+        progress in [0, 1], and the generation result once completed
+
+    Raises:
+        HTTPException: 404 if the job is unknown
+    """
+    job = get_embedding_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Embedding job {job_id} not found")
+    return job
 
 
 @router.get(
@@ -1479,193 +1506,18 @@ def _get_hover_information_impl(
         HTTPException: If resource is not found or hover extraction fails
     """
     import time
-    from app.modules.graph.schema import (
-        HoverInformationResponse,
-        LocationInfo,
-    )
-    from app.modules.graph.logic.static_analysis import StaticAnalysisService
-    from app.database.models import Resource, DocumentChunk
-    from app.shared.cache import CacheService
 
     start_time = time.time()
 
     try:
-        # Check cache first (5-minute TTL)
-        cache_service = CacheService()
-        cache_key = f"hover:{resource_id}:{file_path}:{line}:{column}"
-
-        cached_result = cache_service.get(cache_key)
-        if cached_result:
-            logger.debug(f"Cache hit for hover info: {cache_key}")
-            return cached_result
-
-        # Verify resource exists
-        resource = db.query(Resource).filter(Resource.id == resource_id).first()
-
-        if not resource:
-            raise HTTPException(
-                status_code=404, detail=f"Resource with ID {resource_id} not found"
-            )
-
-        # Get resource metadata to determine language
-        language = resource.language
-
-        # Try to infer language from file extension if not in metadata
-        if not language:
-            ext_map = {
-                ".py": "python",
-                ".js": "javascript",
-                ".jsx": "javascript",
-                ".ts": "typescript",
-                ".tsx": "typescript",
-                ".java": "java",
-                ".cpp": "cpp",
-                ".cc": "cpp",
-                ".cxx": "cpp",
-                ".go": "go",
-                ".rs": "rust",
-            }
-            for ext, lang in ext_map.items():
-                if file_path.endswith(ext):
-                    language = lang
-                    break
-
-        # Validate language support
-        supported_languages = [
-            "python",
-            "javascript",
-            "typescript",
-            "java",
-            "cpp",
-            "go",
-            "rust",
-        ]
-        if language and language not in supported_languages:
-            # Return empty context for unsupported languages
-            response = HoverInformationResponse(
-                symbol_name=None,
-                symbol_type=None,
-                definition_location=None,
-                documentation=None,
-                related_chunks=[],
-                context_lines=[],
-            )
-            return response.model_dump()
-
-        # Find the chunk containing this position
-        chunks = (
-            db.query(DocumentChunk)
-            .filter(DocumentChunk.resource_id == resource_id)
-            .all()
-        )
-
-        target_chunk = None
-        for chunk in chunks:
-            chunk_metadata = chunk.chunk_metadata or {}
-            start_line = chunk_metadata.get("start_line", 0)
-            end_line = chunk_metadata.get("end_line", 0)
-
-            if start_line <= line <= end_line:
-                target_chunk = chunk
-                break
-
-        if not target_chunk:
-            # No chunk found for this position - return empty context
-            response = HoverInformationResponse(
-                symbol_name=None,
-                symbol_type=None,
-                definition_location=None,
-                documentation=None,
-                related_chunks=[],
-                context_lines=[],
-            )
-            return response.model_dump()
-
-        # Extract context lines from chunk content
-        chunk_lines = target_chunk.content.split("\n")
-        chunk_metadata = target_chunk.chunk_metadata or {}
-        chunk_start_line = chunk_metadata.get("start_line", 1)
-
-        # Calculate relative line number within chunk
-        relative_line = line - chunk_start_line
-
-        # Get context lines (3 before and 3 after)
-        context_start = max(0, relative_line - 3)
-        context_end = min(len(chunk_lines), relative_line + 4)
-        context_lines = chunk_lines[context_start:context_end]
-
-        # Use StaticAnalyzer to extract symbol information
-        symbol_name = None
-        symbol_type = None
-        definition_location = None
-        documentation = None
-
-        if language:
-            try:
-                # Use StaticAnalyzer for proper AST-based symbol extraction
-                static_analyzer = StaticAnalysisService(db)
-
-                # Calculate column position within chunk content
-                # For now, use column parameter directly
-                symbol_info = static_analyzer.get_symbol_at_position(
-                    code=target_chunk.content,
-                    language=language,
-                    line=relative_line + 1,  # Convert to 1-indexed within chunk
-                    column=column,
-                )
-
-                if symbol_info:
-                    symbol_name = symbol_info.get("symbol_name")
-                    symbol_type = symbol_info.get("symbol_type")
-                    documentation = symbol_info.get("documentation")
-
-                    # Build definition location
-                    def_loc = symbol_info.get("definition_location")
-                    if def_loc:
-                        # Convert chunk-relative line to file-absolute line
-                        absolute_line = chunk_start_line + def_loc["line"] - 1
-                        definition_location = LocationInfo(
-                            file_path=file_path,
-                            line=absolute_line,
-                            column=def_loc.get("column", 0),
-                        )
-
-                logger.debug(
-                    f"StaticAnalyzer extracted: symbol={symbol_name}, "
-                    f"type={symbol_type}, has_doc={documentation is not None}"
-                )
-
-            except Exception as e:
-                logger.warning(f"StaticAnalyzer failed, using fallback: {e}")
-                # Fall back to simple heuristics if static analysis fails
-                symbol_info = None
-
-        # Find related chunks based on embedding similarity
-        # Note: DocumentChunk uses embedding_id (UUID reference) not direct embedding field
-        # For now, return empty related_chunks list
-        # TODO: Implement proper embedding lookup via embedding_id if needed
-        related_chunks = []
-
-        # Future enhancement: Query embeddings table using embedding_id
-        # if target_chunk and target_chunk.embedding_id:
-        #     # Query embedding service or embeddings table
-        #     # Compute similarity with other chunk embeddings
-        #     pass
-
-        # Build response
-        response = HoverInformationResponse(
-            symbol_name=symbol_name,
-            symbol_type=symbol_type,
-            definition_location=definition_location,
-            documentation=documentation,
-            related_chunks=related_chunks,
-            context_lines=context_lines,
+        result_dict = _compute_hover_information(
+            resource_id=resource_id,
+            file_path=file_path,
+            line=line,
+            column=column,
+            db=db,
         )
 
-        # Cache the result for 5 minutes
-        result_dict = response.model_dump()
-        cache_service.set(cache_key, result_dict, ttl=300)
-
         # Check performance target
         elapsed_time = time.time() - start_time
         if elapsed_time > 0.1:
@@ -1695,57 +1547,250 @@ def _get_hover_information_impl(
         )
 
 
+
+@cached(
+    "hover:{resource_id}:{file_path}:{line}:{column}",
+    ttl=300,
+    tags=["resource:{resource_id}"],
+)
+def _compute_hover_information(
+    resource_id: UUID,
+    file_path: str,
+    line: int,
+    column: int,
+    db: Session,
+) -> dict:
+    """
+    Build hover information for a code position (cached for 5 minutes).
+
+    Concurrent requests for the same position share one computation, and an
+    expired entry is served while a single request rebuilds it.
+    """
+    from app.modules.graph.schema import (
+        HoverInformationResponse,
+        LocationInfo,
+    )
+    from app.modules.graph.logic.static_analysis import StaticAnalysisService
+    from app.database.models import Resource, DocumentChunk
+
+    # Verify resource exists
+    resource = db.query(Resource).filter(Resource.id == resource_id).first()
+
+    if not resource:
+        raise HTTPException(
+            status_code=404, detail=f"Resource with ID {resource_id} not found"
+        )
+
+    # Get resource metadata to determine language
+    language = resource.language
+
+    # Try to infer language from file extension if not in metadata
+    if not language:
+        ext_map = {
+            ".py": "python",
+            ".js": "javascript",
+            ".jsx": "javascript",
+            ".ts": "typescript",
+            ".tsx": "typescript",
+            ".java": "java",
+            ".cpp": "cpp",
+            ".cc": "cpp",
+            ".cxx": "cpp",
+            ".go": "go",
+            ".rs": "rust",
+        }
+        for ext, lang in ext_map.items():
+            if file_path.endswith(ext):
+                language = lang
+                break
+
+    # Validate language support
+    supported_languages = [
+        "python",
+        "javascript",
+        "typescript",
+        "java",
+        "cpp",
+        "go",
+        "rust",
+    ]
+    if language and language not in supported_languages:
+        # Return empty context for unsupported languages
+        response = HoverInformationResponse(
+            symbol_name=None,
+            symbol_type=None,
+            definition_location=None,
+            documentation=None,
+            related_chunks=[],
+            context_lines=[],
+        )
+        return response.model_dump()
+
+    # Find the chunk containing this position
+    chunks = (
+        db.query(DocumentChunk)
+        .filter(DocumentChunk.resource_id == resource_id)
+        .all()
+    )
+
+    target_chunk = None
+    for chunk in chunks:
+        chunk_metadata = chunk.chunk_metadata or {}
+        start_line = chunk_metadata.get("start_line", 0)
+        end_line = chunk_metadata.get("end_line", 0)
+
+        if start_line <= line <= end_line:
+            target_chunk = chunk
+            break
+
+    if not target_chunk:
+        # No chunk found for this position - return empty context
+        response = HoverInformationResponse(
+            symbol_name=None,
+            symbol_type=None,
+            definition_location=None,
+            documentation=None,
+            related_chunks=[],
+            context_lines=[],
+        )
+        return response.model_dump()
+
+    # Extract context lines from chunk content
+    chunk_lines = target_chunk.content.split("\n")
+    chunk_metadata = target_chunk.chunk_metadata or {}
+    chunk_start_line = chunk_metadata.get("start_line", 1)
+
+    # Calculate relative line number within chunk
+    relative_line = line - chunk_start_line
+
+    # Get context lines (3 before and 3 after)
+    context_start = max(0, relative_line - 3)
+    context_end = min(len(chunk_lines), relative_line + 4)
+    context_lines = chunk_lines[context_start:context_end]
+
+    # Use StaticAnalyzer to extract symbol information
+    symbol_name = None
+    symbol_type = None
+    definition_location = None
+    documentation = None
+
+    if language:
+        try:
+            # Use StaticAnalyzer for proper AST-based symbol extraction
+            static_analyzer = StaticAnalysisService(db)
+
+            # Calculate column position within chunk content
+            # For now, use column parameter directly
+            symbol_info = static_analyzer.get_symbol_at_position(
+                code=target_chunk.content,
+                language=language,
+                line=relative_line + 1,  # Convert to 1-indexed within chunk
+                column=column,
+            )
+
+            if symbol_info:
+                symbol_name = symbol_info.get("symbol_name")
+                symbol_type = symbol_info.get("symbol_type")
+                documentation = symbol_info.get("documentation")
+
+                # Build definition location
+                def_loc = symbol_info.get("definition_location")
+                if def_loc:
+                    # Convert chunk-relative line to file-absolute line
+                    absolute_line = chunk_start_line + def_loc["line"] - 1
+                    definition_location = LocationInfo(
+                        file_path=file_path,
+                        line=absolute_line,
+                        column=def_loc.get("column", 0),
+                    )
+
+            logger.debug(
+                f"StaticAnalyzer extracted: symbol={symbol_name}, "
+                f"type={symbol_type}, has_doc={documentation is not None}"
+            )
+
+        except Exception as e:
+            logger.warning(f"StaticAnalyzer failed, using fallback: {e}")
+            # Fall back to simple heuristics if static analysis fails
+            symbol_info = None
+
+    # Find related chunks based on embedding similarity
+    # Note: DocumentChunk uses embedding_id (UUID reference) not direct embedding field
+    # For now, return empty related_chunks list
+    # TODO: Implement proper embedding lookup via embedding_id if needed
+    related_chunks = []
+
+    # Future enhancement: Query embeddings table using embedding_id
+    # if target_chunk and target_chunk.embedding_id:
+    #     # Query embedding service or embeddings table
+    #     # Compute similarity with other chunk embeddings
+    #     pass
+
+    # Build response
+    response = HoverInformationResponse(
+        symbol_name=symbol_name,
+        symbol_type=symbol_type,
+        definition_location=definition_location,
+        documentation=documentation,
+        related_chunks=related_chunks,
+        context_lines=context_lines,
+    )
+
+    return response.model_dump()
+
 @router.get(
     "/centrality",
-    summary="Compute graph centrality metrics",
+    summary="Get graph centrality metrics",
     description=(
-        "Compute centrality metrics for specified resources. "
-        "Returns degree centrality, betweenness centrality, and PageRank scores. "
-        "Results are cached for 10 minutes. Target response time: <2s for 1000 nodes."
+        "Return degree, betweenness and PageRank centrality for specified resources "
+        "from the background graph analytics job, with staleness metadata. Stale "
+        "results trigger a background refresh."
     ),
 )
-async def get_centrality_metrics(
+def get_centrality_metrics(
+    background: BackgroundTasks,
     resource_ids: str = Query(
         ...,
         description="Comma-separated list of resource UUIDs",
         example="123e4567-e89b-12d3-a456-426614174000,223e4567-e89b-12d3-a456-426614174001",
     ),
-    damping_factor: float = Query(
-        0.85,
-        ge=0.01,
-        le=0.99,
-        description="PageRank damping factor (default 0.85)",
-    ),
     db: Session = Depends(get_sync_db),
 ) -> dict:
     """
-    Compute centrality metrics for specified resources.
+    Get centrality metrics for specified resources.
 
-    This endpoint computes multiple centrality measures:
+    Metrics are computed for the whole graph by the graph analytics job
+    (app/modules/graph/analytics.py) and stored in graph_centrality_cache;
+    this endpoint only reads that table:
     - Degree centrality: Number of direct connections (in-degree and out-degree)
     - Betweenness centrality: How often a node appears on shortest paths
+      (sampled from a subset of sources on large graphs)
     - PageRank: Importance based on incoming link structure
 
-    Results are cached for 10 minutes to improve performance. The cache is
-    invalidated when the graph structure changes.
+    When the stored metrics are older than GRAPH_ANALYTICS_REFRESH_SECONDS
+    (or missing), a refresh is queued and the current values are returned
+    with stale=true.
 
     Args:
+        background: FastAPI background task queue
         resource_ids: Comma-separated list of resource UUIDs
-        damping_factor: PageRank damping factor (0.01-0.99, default 0.85)
         db: Database session dependency
 
     Returns:
-        CentralityResponse: Centrality metrics for requested resources
+        CentralityResponse: Centrality metrics for requested resources, plus
+        computed_at, age_seconds, stale and refreshing
 
     Raises:
-        HTTPException: If resource IDs are invalid or computation fails
+        HTTPException: If resource IDs are invalid
     """
     import time
-    from datetime import datetime, timedelta, timezone
+    from app.modules.graph.analytics import (
+        analytics_freshness,
+        latest_centrality_run,
+        refresh_graph_analytics,
+    )
     from app.modules.graph.schema import CentralityMetrics, CentralityResponse
-    from app.modules.graph.service import GraphService
     from app.database.models import GraphCentralityCache
-    from app.shared.cache import CacheService
 
     start_time = time.time()
 
@@ -1765,101 +1810,23 @@ async def get_centrality_metrics(
                 detail="At least one resource ID must be provided",
             )
 
-        # Check cache first (10-minute TTL)
-        cache_service = CacheService()
-        cache_key = f"centrality:{','.join(str(rid) for rid in resource_id_list)}:{damping_factor}"
-
-        cached_result = cache_service.get(cache_key)
-        if cached_result:
-            logger.debug(f"Cache hit for centrality metrics: {cache_key}")
-            elapsed_time = time.time() - start_time
-            cached_result["computation_time_ms"] = elapsed_time * 1000
-            cached_result["cached"] = True
-            return cached_result
-
-        # Check database cache (10-minute TTL)
-        cache_cutoff = datetime.now(timezone.utc) - timedelta(minutes=10)
-        db_cached_metrics = (
+        rows = (
             db.query(GraphCentralityCache)
-            .filter(
-                GraphCentralityCache.resource_id.in_(resource_id_list),
-                GraphCentralityCache.computed_at >= cache_cutoff,
-            )
+            .filter(GraphCentralityCache.resource_id.in_(resource_id_list))
             .all()
         )
+        # Keep the newest row per resource
+        cached_by_id = {}
+        for row in rows:
+            current = cached_by_id.get(row.resource_id)
+            if current is None or row.computed_at > current.computed_at:
+                cached_by_id[row.resource_id] = row
 
-        # Build map of cached metrics
-        cached_by_id = {cache.resource_id: cache for cache in db_cached_metrics}
-
-        # Identify resources that need computation
-        needs_computation = [rid for rid in resource_id_list if rid not in cached_by_id]
-
-        # Compute metrics for uncached resources
-        computed_metrics = {}
-        if needs_computation:
-            graph_service = GraphService(db)
-
-            # Compute all centrality metrics
-            degree_metrics = await graph_service.compute_degree_centrality(
-                [int(rid) for rid in needs_computation]
-            )
-            betweenness_metrics = await graph_service.compute_betweenness_centrality(
-                [int(rid) for rid in needs_computation]
-            )
-            pagerank_metrics = await graph_service.compute_pagerank(
-                [int(rid) for rid in needs_computation],
-                damping_factor=damping_factor,
-            )
-
-            # Store computed metrics in database cache
-            for resource_id in needs_computation:
-                resource_id_int = int(resource_id)
-                degree = degree_metrics.get(resource_id_int, {})
-                betweenness = betweenness_metrics.get(resource_id_int, 0.0)
-                pagerank = pagerank_metrics.get(resource_id_int, 0.0)
-
-                # Create cache entry
-                cache_entry = GraphCentralityCache(
-                    resource_id=resource_id,
-                    in_degree=degree.get("in_degree", 0),
-                    out_degree=degree.get("out_degree", 0),
-                    betweenness=betweenness,
-                    pagerank=pagerank,
-                    computed_at=datetime.now(timezone.utc),
-                )
-                db.add(cache_entry)
-
-                computed_metrics[resource_id] = cache_entry
-
-            db.commit()
-
-        # Build response combining cached and computed metrics
         metrics_dict = {}
         for resource_id in resource_id_list:
-            if resource_id in cached_by_id:
-                cache = cached_by_id[resource_id]
-                metrics_dict[resource_id] = CentralityMetrics(
-                    resource_id=resource_id,
-                    in_degree=cache.in_degree,
-                    out_degree=cache.out_degree,
-                    total_degree=cache.in_degree + cache.out_degree,
-                    betweenness=cache.betweenness,
-                    pagerank=cache.pagerank,
-                    computed_at=cache.computed_at.isoformat(),
-                )
-            elif resource_id in computed_metrics:
-                cache = computed_metrics[resource_id]
-                metrics_dict[resource_id] = CentralityMetrics(
-                    resource_id=resource_id,
-                    in_degree=cache.in_degree,
-                    out_degree=cache.out_degree,
-                    total_degree=cache.in_degree + cache.out_degree,
-                    betweenness=cache.betweenness,
-                    pagerank=cache.pagerank,
-                    computed_at=cache.computed_at.isoformat(),
-                )
-            else:
-                # Resource not found in graph
+            cache = cached_by_id.get(resource_id)
+            if cache is None:
+                # Not in the last analytics run (unknown or newer resource)
                 metrics_dict[resource_id] = CentralityMetrics(
                     resource_id=resource_id,
                     in_degree=0,
@@ -1867,48 +1834,94 @@ async def get_centrality_metrics(
                     total_degree=0,
                     betweenness=0.0,
                     pagerank=0.0,
-                    computed_at=datetime.now(timezone.utc).isoformat(),
+                    computed_at=None,
                 )
+                continue
+            metrics_dict[resource_id] = CentralityMetrics(
+                resource_id=resource_id,
+                in_degree=cache.in_degree,
+                out_degree=cache.out_degree,
+                total_degree=cache.in_degree + cache.out_degree,
+                betweenness=cache.betweenness,
+                pagerank=cache.pagerank,
+                computed_at=cache.computed_at.isoformat(),
+            )
+
+        if cached_by_id:
+            computed_at = min(row.computed_at for row in cached_by_id.values())
+        else:
+            computed_at = latest_centrality_run(db)
+        freshness = analytics_freshness(computed_at)
+        if freshness["stale"] and not freshness["refreshing"]:
+            background.add_task(refresh_graph_analytics)
+            freshness["refreshing"] = True
+            logger.info("Queued graph analytics refresh (stale centrality metrics)")
 
-        # Build response
         elapsed_time = time.time() - start_time
         response = CentralityResponse(
             metrics=metrics_dict,
             computation_time_ms=elapsed_time * 1000,
-            cached=len(needs_computation) == 0,
+            cached=bool(cached_by_id),
+            **freshness,
         )
-
-        # Cache the result for 10 minutes
-        result_dict = response.model_dump()
-        cache_service.set(cache_key, result_dict, ttl=600)
-
-        # Check performance target
-        if elapsed_time > 2.0:
-            logger.warning(
-                f"Centrality computation exceeded 2s target: {elapsed_time:.2f}s "
-                f"({len(resource_id_list)} resources)"
-            )
-        else:
-            logger.debug(
-                f"Centrality computation completed in {elapsed_time:.2f}s "
-                f"({len(resource_id_list)} resources)"
-            )
-
-        return result_dict
+        return response.model_dump()
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error computing centrality metrics: {e}", exc_info=True)
-        # Return empty metrics instead of 500 error for empty graph
-        logger.warning("Returning empty centrality metrics due to error (likely empty graph)")
+        logger.error(f"Error reading centrality metrics: {e}", exc_info=True)
         return {
             "metrics": {},
             "computation_time_ms": 0.0,
             "cached": False,
+            "computed_at": None,
+            "age_seconds": None,
+            "stale": True,
+            "refreshing": False,
         }
 
 
+@router.post(
+    "/analytics/refresh",
+    status_code=202,
+    summary="Refresh graph analytics",
+    description=(
+        "Queue a background recomputation of centrality metrics and communities "
+        "for the whole graph."
+    ),
+)
+def refresh_graph_analytics_endpoint(background: BackgroundTasks) -> dict:
+    """
+    Queue a graph analytics refresh.
+
+    The job recomputes degree, betweenness and PageRank centrality and Louvain
+    communities (GRAPH_ANALYTICS_RESOLUTIONS) in the analytics process pool
+    and replaces graph_centrality_cache and community_assignments.
+
+    Args:
+        background: FastAPI background task queue
+
+    Returns:
+        dict: {"status": "queued", "last_run": summary of the previous run}
+
+    Raises:
+        HTTPException: 409 if a refresh is already running
+    """
+    from app.modules.graph.analytics import (
+        analytics_running,
+        last_analytics_run,
+        refresh_graph_analytics,
+    )
+
+    if analytics_running():
+        raise HTTPException(
+            status_code=409, detail="Graph analytics refresh is already running"
+        )
+
+    background.add_task(refresh_graph_analytics)
+    return {"status": "queued", "last_run": last_analytics_run() or None}
+
+
 @router.post(
     "/communities",
     summary="Detect communities in knowledge graph",
@@ -1965,7 +1978,7 @@ async def detect_communities(
     )
     from app.modules.graph.service import CommunityDetectionService
     from app.database.models import CommunityAssignment
-    from app.shared.cache import CacheService
+    from app.shared.cache import cache as cache_service
 
     start_time = time.time()
 
@@ -1992,16 +2005,18 @@ async def detect_communities(
             )
 
         # Check cache first (15-minute TTL)
-        cache_service = CacheService()
         cache_key = f"communities:{','.join(str(rid) for rid in sorted(resource_id_list))}:{resolution}"
 
         cached_result = cache_service.get(cache_key)
         if cached_result:
             logger.debug(f"Cache hit for community detection: {cache_key}")
             elapsed_time = time.time() - start_time
-            cached_result["computation_time_ms"] = elapsed_time * 1000
-            cached_result["cached"] = True
-            return cached_result
+            # Copy: the near-cache hands out shared objects
+            return {
+                **cached_result,
+                "computation_time_ms": elapsed_time * 1000,
+                "cached": True,
+            }
 
         # Check database cache (15-minute TTL)
         cache_cutoff = datetime.now(timezone.utc) - timedelta(minutes=15)
@@ -2095,7 +2110,12 @@ async def detect_communities(
 
         # Cache the result for 15 minutes
         result_dict_response = response.model_dump()
-        cache_service.set(cache_key, result_dict_response, ttl=900)
+        cache_service.set(
+            cache_key,
+            result_dict_response,
+            ttl=900,
+            tags=[f"resource:{rid}" for rid in resource_id_list],
+        )
 
         # Check performance target
         if elapsed_time > 10.0:
@@ -2179,7 +2199,7 @@ async def compute_graph_layout(
     import time
     from app.modules.graph.schema import GraphLayoutResponse
     from app.modules.graph.service import GraphVisualizationService
-    from app.shared.cache import CacheService
+    from app.shared.cache import cache as cache_service
 
     start_time = time.time()
 
@@ -2200,16 +2220,18 @@ async def compute_graph_layout(
             )
 
         # Check cache
-        cache_service = CacheService()
         cache_key = f"graph_layout:{','.join(str(rid) for rid in resource_id_list)}:{layout_type}"
 
         cached_result = cache_service.get(cache_key)
         if cached_result:
             logger.debug(f"Cache hit for graph layout: {cache_key}")
             elapsed_time = time.time() - start_time
-            cached_result["computation_time_ms"] = elapsed_time * 1000
-            cached_result["cached"] = True
-            return cached_result
+            # Copy: the near-cache hands out shared objects
+            return {
+                **cached_result,
+                "computation_time_ms": elapsed_time * 1000,
+                "cached": True,
+            }
 
         # Compute layout
         viz_service = GraphVisualizationService(db)
@@ -2229,7 +2251,12 @@ async def compute_graph_layout(
 
         # Cache result for 10 minutes
         result_dict_response = response.model_dump(mode="json")
-        cache_service.set(cache_key, result_dict_response, ttl=600)
+        cache_service.set(
+            cache_key,
+            result_dict_response,
+            ttl=600,
+            tags=[f"resource:{rid}" for rid in resource_id_list],
+        )
 
         elapsed_time = time.time() - start_time
 
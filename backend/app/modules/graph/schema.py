@@ -698,7 +698,8 @@ class CentralityMetrics(BaseModel):
 class CentralityResponse(BaseModel):
     """Response schema for centrality metrics API.
 
-    Returns centrality metrics for requested resources.
+    Returns centrality metrics for requested resources, as stored by the
+    background graph analytics job, with staleness metadata.
     """
 
     metrics: dict[UUID, CentralityMetrics] = Field(
@@ -708,6 +709,18 @@ class CentralityResponse(BaseModel):
         ..., description="Time taken to compute metrics (milliseconds)"
     )
     cached: bool = Field(..., description="Whether results were retrieved from cache")
+    computed_at: Optional[str] = Field(
+        None, description="When the oldest returned metrics were computed"
+    )
+    age_seconds: Optional[float] = Field(
+        None, description="Age of the returned metrics in seconds"
+    )
+    stale: bool = Field(
+        False, description="Whether the metrics are missing or out of date"
+    )
+    refreshing: bool = Field(
+        False, description="Whether an analytics refresh is running or queued"
+    )
 
 
 class CommunityDetectionResult(BaseModel):
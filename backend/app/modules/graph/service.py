@@ -340,115 +340,117 @@ def compute_hybrid_weight(
     return max(0.0, min(1.0, hybrid_weight))
 
 
+# Candidates gathered per requested neighbor by each candidate leg
+_CANDIDATES_PER_NEIGHBOR = 2
+
+
 def _gather_vector_candidates(
     db: Session,
     source_resource: db_models.Resource,
     limit: int,
 ) -> Set[UUID]:
     """
-    Gather candidate resources based on vector similarity.
+    Gather the nearest resources by embedding from the shared ANN index.
 
     Args:
         db: Database session
         source_resource: Source resource with embedding
-        limit: Maximum number of candidates to gather
+        limit: Number of neighbors requested
 
     Returns:
         Set of candidate resource IDs
     """
-    candidate_ids: Set[UUID] = set()
-
-    if source_resource.embedding:
-        vector_candidates = (
-            db.query(db_models.Resource)
-            .filter(
-                db_models.Resource.id != source_resource.id,
-                db_models.Resource.embedding.isnot(None),
-                func.json_array_length(db_models.Resource.embedding) > 0,
-            )
-            .limit(limit * 2)
-            .all()
-        )
+    from app.shared.embedding_store import parse_embedding
+    from app.shared.vector_index import get_resource_vector_index
 
-        for candidate in vector_candidates:
-            if candidate.embedding:
-                candidate_ids.add(candidate.id)
+    vector = parse_embedding(source_resource.embedding)
+    if not vector:
+        return set()
 
-    return candidate_ids
+    source_id = str(source_resource.id)
+    index = get_resource_vector_index().ensure_ready(db)
+    hits = index.search(vector, k=limit * _CANDIDATES_PER_NEIGHBOR + 1)
+    return {UUID(item_id) for item_id, _ in hits if item_id != source_id}
 
 
 def _gather_subject_candidates(
     db: Session,
     source_resource: db_models.Resource,
+    limit: Optional[int] = None,
 ) -> Set[UUID]:
     """
-    Gather candidate resources based on shared subjects.
+    Gather the resources sharing the most subjects with the source.
+
+    Uses the in-process subject -> resource inverted index.
 
     Args:
         db: Database session
         source_resource: Source resource with subjects
+        limit: Number of neighbors requested (None gathers every match)
 
     Returns:
         Set of candidate resource IDs
     """
-    candidate_ids: Set[UUID] = set()
-
-    if source_resource.subject:
-        subject_conditions = []
-        for subject in source_resource.subject:
-            subject_conditions.append(
-                func.lower(
-                    func.cast(db_models.Resource.subject, db_models.String)
-                ).like(f"%{subject.lower()}%")
-            )
-
-        if subject_conditions:
-            shared_subject_candidates = (
-                db.query(db_models.Resource)
-                .filter(
-                    db_models.Resource.id != source_resource.id,
-                    or_(*subject_conditions),
-                )
-                .all()
-            )
+    from app.shared.subject_index import get_resource_subject_index
 
-            for candidate in shared_subject_candidates:
-                candidate_ids.add(candidate.id)
+    if not source_resource.subject:
+        return set()
 
-    return candidate_ids
+    index = get_resource_subject_index().ensure_ready(db)
+    ranked = index.shared_subjects(
+        source_resource.subject,
+        k=limit * _CANDIDATES_PER_NEIGHBOR if limit is not None else None,
+        exclude_ids=[str(source_resource.id)],
+    )
+    return {UUID(item_id) for item_id, _ in ranked}
 
 
 def _gather_classification_candidates(
     db: Session,
     source_resource: db_models.Resource,
+    limit: Optional[int] = None,
 ) -> Set[UUID]:
     """
     Gather candidate resources based on classification code match.
 
+    When more resources share the code than the candidate budget allows,
+    the ones closest to the source embedding are kept.
+
     Args:
         db: Database session
         source_resource: Source resource with classification code
+        limit: Number of neighbors requested (None gathers every match)
 
     Returns:
         Set of candidate resource IDs
     """
-    candidate_ids: Set[UUID] = set()
+    from app.shared.embedding_store import get_embedding_store, parse_embedding
+    from app.shared.subject_index import get_resource_subject_index
 
-    if source_resource.classification_code:
-        classification_candidates = (
-            db.query(db_models.Resource)
-            .filter(
-                db_models.Resource.id != source_resource.id,
-                db_models.Resource.classification_code
-                == source_resource.classification_code,
-            )
-            .all()
-        )
+    if not source_resource.classification_code:
+        return set()
 
-        for candidate in classification_candidates:
-            candidate_ids.add(candidate.id)
+    index = get_resource_subject_index().ensure_ready(db)
+    member_ids = index.with_classification(
+        source_resource.classification_code, exclude_ids=[str(source_resource.id)]
+    )
+    budget = limit * _CANDIDATES_PER_NEIGHBOR if limit is not None else None
+    if budget is not None and len(member_ids) > budget:
+        vector = parse_embedding(source_resource.embedding)
+        ranked = []
+        if vector:
+            ranked = [
+                item_id
+                for item_id, _ in get_embedding_store("resources", db).similar(
+                    vector, k=budget, candidate_ids=member_ids
+                )
+            ]
+        # Members without embeddings fill any remaining slots in id order
+        ranked_set = set(ranked)
+        ranked += [i for i in member_ids if i not in ranked_set][: budget - len(ranked)]
+        member_ids = ranked
 
-    return candidate_ids
+    return {UUID(item_id) for item_id in member_ids}
 
 
 def _score_candidate(
@@ -468,10 +470,15 @@ def _score_candidate(
     Returns:
         Tuple of (hybrid_weight, edge_details)
     """
-    # Vector similarity score
+    # Vector similarity score (embeddings are stored as JSON text)
+    from app.shared.embedding_store import parse_embedding
+
     vector_score = 0.0
     if source_resource.embedding and candidate.embedding:
-        vector_score = cosine_similarity(source_resource.embedding, candidate.embedding)
+        vector_score = cosine_similarity(
+            parse_embedding(source_resource.embedding) or [],
+            parse_embedding(candidate.embedding) or [],
+        )
 
     # Tag overlap score
     tag_score, shared_subjects = compute_tag_overlap_score(
@@ -557,8 +564,9 @@ def find_hybrid_neighbors(
     """
     Find hybrid-scored neighbors for a given resource.
 
-    Gathers candidates from vector similarity, shared subjects, and classification
-    matches, then scores and ranks them using the hybrid weighting scheme.
+    Gathers a bounded candidate set (nearest embeddings from the ANN index,
+    resources sharing the most subjects, and classification matches), then
+    scores and ranks them using the hybrid weighting scheme.
 
     Args:
         db: Database session
@@ -581,11 +589,12 @@ def find_hybrid_neighbors(
     if not source_resource:
         return KnowledgeGraph(nodes=[], edges=[])
 
-    # Gather candidates from multiple sources
+    # Gather a bounded candidate set from the ANN, subject and
+    # classification indexes
     candidate_ids: Set[UUID] = set()
     candidate_ids.update(_gather_vector_candidates(db, source_resource, limit))
-    candidate_ids.update(_gather_subject_candidates(db, source_resource))
-    candidate_ids.update(_gather_classification_candidates(db, source_resource))
+    candidate_ids.update(_gather_subject_candidates(db, source_resource, limit))
+    candidate_ids.update(_gather_classification_candidates(db, source_resource, limit))
 
     # Return early if no candidates found
     if not candidate_ids:
@@ -620,42 +629,144 @@ def find_hybrid_neighbors(
     )
 
 
+def _embedding_matrix(
+    resources: List[db_models.Resource],
+) -> Tuple[List[int], "np.ndarray"]:
+    """
+    Stack resource embeddings into one L2-normalised float32 matrix.
+
+    Embeddings are parsed from their stored JSON text; rows whose dimension
+    differs from the first embedding are skipped.
+
+    Args:
+        resources: Resources (or rows with an ``embedding`` attribute)
+
+    Returns:
+        Tuple of (positions in ``resources``, matrix with one row per position)
+    """
+    from app.shared.embedding_store import normalize_rows, parse_embedding
+
+    positions: List[int] = []
+    vectors: List[List[float]] = []
+    dim = None
+    for position, res in enumerate(resources):
+        vector = parse_embedding(res.embedding)
+        if not vector:
+            continue
+        if dim is None:
+            dim = len(vector)
+        elif len(vector) != dim:
+            continue
+        positions.append(position)
+        vectors.append(vector)
+
+    if not vectors:
+        return [], np.zeros((0, 0), dtype=np.float32)
+    return positions, normalize_rows(np.asarray(vectors, dtype=np.float32))
+
+
 def _find_high_vector_similarity_pairs(
     resources: List[db_models.Resource],
     vector_threshold: float,
-) -> Set[Tuple[UUID, UUID]]:
+    per_resource: Optional[int] = None,
+    embedded: Optional[Tuple[List[int], "np.ndarray"]] = None,
+) -> dict:
     """
     Find resource pairs with high vector similarity.
 
+    Runs a blocked matrix-multiply similarity join over the normalised
+    embedding matrix instead of comparing every pair in Python.
+
     Args:
         resources: List of resources to compare
         vector_threshold: Minimum similarity threshold
+        per_resource: Optional cap on partners kept per resource
+        embedded: Precomputed ``_embedding_matrix(resources)`` result
 
     Returns:
-        Set of resource ID pairs (ordered with smaller UUID first)
+        Dict mapping resource ID pairs (smaller UUID first) to similarity
     """
-    candidate_pairs: Set[Tuple[UUID, UUID]] = set()
+    from app.shared.embedding_store import similarity_join
 
-    for i, res_a in enumerate(resources):
-        if not res_a.embedding:
-            continue
+    positions, matrix = embedded or _embedding_matrix(resources)
+    if len(positions) < 2:
+        return {}
 
-        for j, res_b in enumerate(resources[i + 1 :], i + 1):
-            if not res_b.embedding:
-                continue
+    left, right, scores = similarity_join(matrix, vector_threshold, k=per_resource)
 
-            vector_sim = cosine_similarity(res_a.embedding, res_b.embedding)
-            if vector_sim >= vector_threshold:
-                pair = (
-                    (res_a.id, res_b.id)
-                    if res_a.id < res_b.id
-                    else (res_b.id, res_a.id)
-                )
-                candidate_pairs.add(pair)
+    candidate_pairs = {}
+    for i, j, score in zip(left.tolist(), right.tolist(), scores.tolist()):
+        id_a = resources[positions[i]].id
+        id_b = resources[positions[j]].id
+        pair = (id_a, id_b) if id_a < id_b else (id_b, id_a)
+        candidate_pairs[pair] = min(1.0, score)
 
     return candidate_pairs
 
 
+# Posting entries expanded per block when counting shared subjects
+_TAG_BLOCK_ENTRIES = 1 << 22
+
+
+def _shared_subject_counts(
+    subject_lists: List[Optional[List[str]]],
+    max_block_entries: int = _TAG_BLOCK_ENTRIES,
+):
+    """
+    Count shared subjects for every pair of rows that shares one.
+
+    Computes the sparse product of the resource x subject incidence matrix
+    with its transpose from subject posting lists, a block of rows at a
+    time, emitting only pairs i < j.
+
+    Args:
+        subject_lists: Subjects per row
+        max_block_entries: Bound on posting entries expanded per block
+
+    Yields:
+        Tuples of (left rows, right rows, shared counts) arrays per block,
+        in ascending left-row order
+    """
+    vocab: dict = {}
+    row_ids: List[int] = []
+    subject_ids: List[int] = []
+    for row, subjects in enumerate(subject_lists):
+        for subject in set(subjects or ()):
+            row_ids.append(row)
+            subject_ids.append(vocab.setdefault(subject, len(vocab)))
+    if not row_ids:
+        return
+
+    rows = np.asarray(row_ids, dtype=np.int64)
+    subjects = np.asarray(subject_ids, dtype=np.int64)
+    n = len(subject_lists)
+
+    # Posting lists: rows per subject, as CSR (post_ptr, post_rows)
+    post_rows = rows[np.lexsort((rows, subjects))]
+    post_ptr = np.zeros(len(vocab) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(subjects, minlength=len(vocab)), out=post_ptr[1:])
+    lengths = post_ptr[subjects + 1] - post_ptr[subjects]
+
+    start = 0
+    while start < len(rows):
+        # Grow the block up to the budget, then extend it to a row boundary
+        # so no pair is split across blocks
+        budget = np.cumsum(lengths[start:])
+        stop = start + max(1, int(np.searchsorted(budget, max_block_entries, "right")))
+        stop = int(np.searchsorted(rows, rows[stop - 1], "right"))
+
+        counts = lengths[start:stop]
+        total = int(counts.sum())
+        left = np.repeat(rows[start:stop], counts)
+        offsets = np.repeat(post_ptr[subjects[start:stop]] - (np.cumsum(counts) - counts), counts)
+        right = post_rows[offsets + np.arange(total)]
+
+        keep = right > left
+        keys, shared = np.unique(left[keep] * n + right[keep], return_counts=True)
+        yield keys // n, keys % n, shared
+        start = stop
+
+
 def _find_high_tag_overlap_pairs(
     resources: List[db_models.Resource],
     limit: int,
@@ -670,35 +781,35 @@ def _find_high_tag_overlap_pairs(
     Returns:
         Set of resource ID pairs (ordered with smaller UUID first)
     """
-    tag_pairs: List[Tuple[Tuple[UUID, UUID], int]] = []
-
-    for i, res_a in enumerate(resources):
-        if not res_a.subject:
-            continue
-
-        for j, res_b in enumerate(resources[i + 1 :], i + 1):
-            if not res_b.subject:
-                continue
-
-            _, shared_subjects = compute_tag_overlap_score(res_a.subject, res_b.subject)
-            if shared_subjects:
-                pair = (
-                    (res_a.id, res_b.id)
-                    if res_a.id < res_b.id
-                    else (res_b.id, res_a.id)
-                )
-                tag_pairs.append((pair, len(shared_subjects)))
-
-    # Sort by shared count and take top limit
-    tag_pairs.sort(key=lambda x: x[1], reverse=True)
-    top_tag_pairs = tag_pairs[:limit]
+    if limit <= 0:
+        return set()
+
+    # Running top `limit` by shared count; ties keep resource order
+    best_left = np.zeros(0, dtype=np.int64)
+    best_right = np.zeros(0, dtype=np.int64)
+    best_shared = np.zeros(0, dtype=np.int64)
+    for left, right, shared in _shared_subject_counts([r.subject for r in resources]):
+        best_left = np.concatenate([best_left, left])
+        best_right = np.concatenate([best_right, right])
+        best_shared = np.concatenate([best_shared, shared])
+        order = np.lexsort((best_right, best_left, -best_shared))[:limit]
+        best_left, best_right, best_shared = (
+            best_left[order],
+            best_right[order],
+            best_shared[order],
+        )
 
-    return {pair for pair, _ in top_tag_pairs}
+    tag_pairs: Set[Tuple[UUID, UUID]] = set()
+    for i, j in zip(best_left.tolist(), best_right.tolist()):
+        id_a, id_b = resources[i].id, resources[j].id
+        tag_pairs.add((id_a, id_b) if id_a < id_b else (id_b, id_a))
+    return tag_pairs
 
 
 def _score_resource_pair(
     res_a: db_models.Resource,
     res_b: db_models.Resource,
+    vector_score: Optional[float] = None,
 ) -> Tuple[float, GraphEdgeDetails]:
     """
     Score a pair of resources for global overview.
@@ -706,14 +817,21 @@ def _score_resource_pair(
     Args:
         res_a: First resource
         res_b: Second resource
+        vector_score: Precomputed vector similarity, if known
 
     Returns:
         Tuple of (hybrid_weight, edge_details)
     """
     # Vector similarity score
-    vector_score = 0.0
-    if res_a.embedding and res_b.embedding:
-        vector_score = cosine_similarity(res_a.embedding, res_b.embedding)
+    if vector_score is None:
+        vector_score = 0.0
+        if res_a.embedding and res_b.embedding:
+            from app.shared.embedding_store import parse_embedding
+
+            vector_score = cosine_similarity(
+                parse_embedding(res_a.embedding) or [],
+                parse_embedding(res_b.embedding) or [],
+            )
 
     # Tag overlap score
     tag_score, shared_subjects = compute_tag_overlap_score(
@@ -816,9 +934,17 @@ def generate_global_overview(
     if vector_threshold is None:
         vector_threshold = settings.GRAPH_VECTOR_MIN_SIM_THRESHOLD
 
-    # Load all resources with embeddings and subjects
+    # Load the columns needed for scoring and nodes of every resource with
+    # an embedding or subjects
     resources = (
-        db.query(db_models.Resource)
+        db.query(
+            db_models.Resource.id,
+            db_models.Resource.title,
+            db_models.Resource.type,
+            db_models.Resource.classification_code,
+            db_models.Resource.subject,
+            db_models.Resource.embedding,
+        )
         .filter(
             or_(
                 db_models.Resource.embedding.isnot(None),
@@ -831,15 +957,18 @@ def generate_global_overview(
     if len(resources) < 2:
         return KnowledgeGraph(nodes=[], edges=[])
 
-    # Gather candidate pairs from multiple sources
-    candidate_pairs: Set[Tuple[UUID, UUID]] = set()
-    candidate_pairs.update(
-        _find_high_vector_similarity_pairs(resources, vector_threshold)
+    # Gather candidate pairs from multiple sources; each resource keeps at
+    # most `limit` vector partners since only `limit` edges are returned
+    positions, matrix = _embedding_matrix(resources)
+    vector_pairs = _find_high_vector_similarity_pairs(
+        resources, vector_threshold, per_resource=limit, embedded=(positions, matrix)
     )
+    candidate_pairs: Set[Tuple[UUID, UUID]] = set(vector_pairs)
     candidate_pairs.update(_find_high_tag_overlap_pairs(resources, limit))
 
-    # Score all candidate pairs
+    # Score all candidate pairs, reusing the normalised embedding rows
     resources_by_id = {res.id: res for res in resources}
+    row_by_id = {resources[p].id: row for row, p in enumerate(positions)}
     scored_pairs: List[Tuple[Tuple[UUID, UUID], float, GraphEdgeDetails]] = []
 
     for pair in candidate_pairs:
@@ -850,7 +979,18 @@ def generate_global_overview(
         if not res_a or not res_b:
             continue
 
-        hybrid_weight, edge_details = _score_resource_pair(res_a, res_b)
+        vector_score = vector_pairs.get(pair)
+        if vector_score is None:
+            row_a, row_b = row_by_id.get(res_a_id), row_by_id.get(res_b_id)
+            vector_score = (
+                float(np.clip(matrix[row_a] @ matrix[row_b], -1.0, 1.0))
+                if row_a is not None and row_b is not None
+                else 0.0
+            )
+
+        hybrid_weight, edge_details = _score_resource_pair(
+            res_a, res_b, vector_score=vector_score
+        )
 
         # Skip pairs with very low weights
         if hybrid_weight < 0.1:
@@ -936,7 +1076,7 @@ class GraphService:
             NetworkX MultiGraph object or dict-based graph structure
         """
         try:
-            import networkx as nx
+            import networkx  # noqa: F401
         except ImportError:
             # Return a simple dict-based graph structure if networkx not available
             return {"nodes": [], "edges": []}
@@ -945,58 +1085,52 @@ class GraphService:
         if not refresh_cache and self._has_cached_graph():
             return self._get_cached_graph()
 
-        G = nx.MultiGraph()
+        # The process-wide store is synced incrementally; its NetworkX view
+        # is shared between services and must not be mutated
+        G = self._graph_store(refresh=refresh_cache).to_networkx()
 
-        # Add all resources as nodes
-        from app.database.models import Resource, Citation, GraphEdge
+        # Cache the graph using accessor method
+        self._set_cached_graph(G)
 
-        resources = self.db.query(Resource).all()
+        return G
 
-        for resource in resources:
-            G.add_node(
-                str(resource.id),
-                title=resource.title,
-                type=resource.type,
-                quality_overall=resource.quality_overall
-                if hasattr(resource, "quality_overall")
-                else 0.5,
-            )
+    def _graph_store(self, refresh: bool = False):
+        """
+        Get the shared graph store, synced with this session's database.
 
-        # Add citation edges from Citation table
-        citations = (
-            self.db.query(Citation)
-            .filter(Citation.target_resource_id.isnot(None))
-            .all()
-        )
+        Args:
+            refresh: If True, rebuild the store from the database
 
-        for citation in citations:
-            G.add_edge(
-                str(citation.source_resource_id),
-                str(citation.target_resource_id),
-                edge_type="citation",
-                weight=1.0,
-                key="citation",
-            )
+        Returns:
+            GraphStore shared by every GraphService in the process
+        """
+        from app.shared.graph_store import get_graph_store
 
-        # Add edges from GraphEdge table
-        graph_edges = self.db.query(GraphEdge).all()
-        for edge in graph_edges:
-            G.add_edge(
-                str(edge.source_id),
-                str(edge.target_id),
-                edge_type=edge.edge_type,
-                weight=edge.weight,
-                key=edge.edge_type,
-            )
+        return get_graph_store(self.db, force=refresh)
 
-        # Cache the graph using accessor method
-        self._set_cached_graph(G)
+    def add_citation_edges(self, resource_id, citations=None) -> int:
+        """
+        Refresh the stored edges of a resource after citation extraction.
 
-        return G
+        Args:
+            resource_id: Resource whose citations were (re)extracted
+            citations: Extracted citation payloads (unused; edges are re-read
+                from the Citation and GraphEdge tables so resolved targets and
+                deletions are picked up)
+
+        Returns:
+            int: Number of edges now incident to the resource
+        """
+        from app.shared.graph_store import refresh_resource_edges
+
+        store = self._graph_store()
+        refresh_resource_edges(store, self.db, str(resource_id))
+        self._clear_cache()
+        return sum(len(edges) for edges in store.neighbors(str(resource_id)).values())
 
     def _get_one_hop_neighbors(
         self,
-        G,
+        store,
         resource_id: str,
         edge_types: Optional[List[str]],
         min_weight: float,
@@ -1005,7 +1139,7 @@ class GraphService:
         Get direct (1-hop) neighbors from graph.
 
         Args:
-            G: NetworkX graph
+            store: Shared GraphStore
             resource_id: Source resource ID
             edge_types: Filter by edge types
             min_weight: Minimum edge weight threshold
@@ -1015,13 +1149,8 @@ class GraphService:
         """
         collection = NeighborCollection()
 
-        for neighbor in G.neighbors(resource_id):
-            edge_data = G.get_edge_data(resource_id, neighbor)
-
-            for key, data in edge_data.items():
-                edge_type = data.get("edge_type", "unknown")
-                weight = data.get("weight", 1.0)
-
+        for neighbor, edges in store.neighbors(resource_id).items():
+            for edge_type, weight in edges:
                 # Apply filters
                 if edge_types and edge_type not in edge_types:
                     continue
@@ -1029,7 +1158,7 @@ class GraphService:
                     continue
 
                 # Get neighbor node data for quality score
-                neighbor_node_data = G.nodes.get(neighbor, {})
+                neighbor_node_data = store.node_attrs(neighbor)
                 quality = neighbor_node_data.get("quality_overall", 0.5)
 
                 neighbor_data = {
@@ -1053,7 +1182,7 @@ class GraphService:
 
     def _get_two_hop_neighbors(
         self,
-        G,
+        store,
         resource_id: str,
         edge_types: Optional[List[str]],
         min_weight: float,
@@ -1062,7 +1191,7 @@ class GraphService:
         Get 2-hop neighbors from graph.
 
         Args:
-            G: NetworkX graph
+            store: Shared GraphStore
             resource_id: Source resource ID
             edge_types: Filter by edge types
             min_weight: Minimum edge weight threshold
@@ -1073,32 +1202,22 @@ class GraphService:
         collection = NeighborCollection()
         visited = {resource_id}
 
-        for neighbor1 in G.neighbors(resource_id):
+        for neighbor1, edges_1 in store.neighbors(resource_id).items():
             if neighbor1 in visited:
                 continue
 
-            edge_data_1 = G.get_edge_data(resource_id, neighbor1)
-
-            for key1, data1 in edge_data_1.items():
-                edge_type_1 = data1.get("edge_type", "unknown")
-                weight_1 = data1.get("weight", 1.0)
-
+            for edge_type_1, weight_1 in edges_1:
                 if edge_types and edge_type_1 not in edge_types:
                     continue
                 if weight_1 < min_weight:
                     continue
 
                 # Explore second hop
-                for neighbor2 in G.neighbors(neighbor1):
+                for neighbor2, edges_2 in store.neighbors(neighbor1).items():
                     if neighbor2 == resource_id or neighbor2 in visited:
                         continue
 
-                    edge_data_2 = G.get_edge_data(neighbor1, neighbor2)
-
-                    for key2, data2 in edge_data_2.items():
-                        edge_type_2 = data2.get("edge_type", "unknown")
-                        weight_2 = data2.get("weight", 1.0)
-
+                    for edge_type_2, weight_2 in edges_2:
                         if edge_types and edge_type_2 not in edge_types:
                             continue
                         if weight_2 < min_weight:
@@ -1107,7 +1226,7 @@ class GraphService:
                         total_weight = weight_1 * weight_2
 
                         # Get neighbor node data for quality score
-                        neighbor_node_data = G.nodes.get(neighbor2, {})
+                        neighbor_node_data = store.node_attrs(neighbor2)
                         quality = neighbor_node_data.get("quality_overall", 0.5)
 
                         neighbor_data = {
@@ -1149,19 +1268,19 @@ class GraphService:
         Returns:
             List of neighbor dictionaries with paths and scores
         """
-        G = self.build_multilayer_graph()
+        store = self._graph_store()
 
-        if not G.has_node(resource_id):
+        if not store.has_node(resource_id):
             return []
 
         # Get neighbors based on hop count using encapsulated collection
         if hops == 1:
             collection = self._get_one_hop_neighbors(
-                G, resource_id, edge_types, min_weight
+                store, resource_id, edge_types, min_weight
             )
         elif hops == 2:
             collection = self._get_two_hop_neighbors(
-                G, resource_id, edge_types, min_weight
+                store, resource_id, edge_types, min_weight
             )
         else:
             collection = NeighborCollection()
@@ -1197,34 +1316,12 @@ class GraphService:
                 }
             }
         """
-        try:
-            import networkx as nx
-        except ImportError:
-            logger.error("NetworkX not installed, cannot compute centrality")
-            return {}
-
-        # Build graph
-        G = self.build_multilayer_graph()
-
-        # Convert to directed graph for in/out degree calculation
-        DG = nx.DiGraph()
-        for u, v, data in G.edges(data=True):
-            DG.add_edge(u, v, **data)
+        # Degrees come straight from the shared store's CSR adjacency
+        degrees = self._graph_store().degrees([str(rid) for rid in resource_ids])
 
         results = {}
         for resource_id in resource_ids:
-            resource_id_str = str(resource_id)
-            if not DG.has_node(resource_id_str):
-                results[resource_id] = {
-                    "in_degree": 0,
-                    "out_degree": 0,
-                    "total_degree": 0,
-                }
-                continue
-
-            in_degree = DG.in_degree(resource_id_str)
-            out_degree = DG.out_degree(resource_id_str)
-
+            in_degree, out_degree = degrees.get(str(resource_id), (0, 0))
             results[resource_id] = {
                 "in_degree": in_degree,
                 "out_degree": out_degree,
@@ -1250,24 +1347,30 @@ class GraphService:
             Dictionary mapping resource_id to betweenness centrality score (0-1)
         """
         try:
-            import networkx as nx
+            import networkx  # noqa: F401
         except ImportError:
             logger.error("NetworkX not installed, cannot compute centrality")
             return {}
 
-        # Build graph
-        G = self.build_multilayer_graph()
-
-        # Compute betweenness centrality for all nodes
-        betweenness = nx.betweenness_centrality(G, weight="weight")
+        from app.shared.graph_analytics import (
+            betweenness_sample_size,
+            betweenness_scores,
+            run_analytics_async,
+        )
 
-        # Extract results for requested resources
-        results = {}
-        for resource_id in resource_ids:
-            resource_id_str = str(resource_id)
-            results[resource_id] = betweenness.get(resource_id_str, 0.0)
+        # Run over the shared store's arrays in the analytics pool; large
+        # graphs get k-sample approximate betweenness
+        node_ids, src, dst, weight = self._graph_store().live_edges()
+        samples = betweenness_sample_size(
+            len(node_ids),
+            settings.GRAPH_ANALYTICS_EXACT_BETWEENNESS_MAX_NODES,
+            settings.GRAPH_ANALYTICS_BETWEENNESS_SAMPLES,
+        )
+        betweenness = await run_analytics_async(
+            betweenness_scores, len(node_ids), src, dst, weight, samples, 0
+        )
 
-        return results
+        return self._scores_for(resource_ids, node_ids, betweenness)
 
     async def compute_pagerank(
         self, resource_ids: List[int], damping_factor: float = 0.85
@@ -1287,7 +1390,7 @@ class GraphService:
             Dictionary mapping resource_id to PageRank score
         """
         try:
-            import networkx as nx
+            import networkx  # noqa: F401
         except ImportError:
             logger.error("NetworkX not installed, cannot compute centrality")
             return {}
@@ -1299,28 +1402,31 @@ class GraphService:
             )
             damping_factor = 0.85
 
-        # Build graph
-        G = self.build_multilayer_graph()
+        from app.shared.graph_analytics import pagerank_scores, run_analytics_async
 
-        # Convert to directed graph for PageRank
-        DG = nx.DiGraph()
-        for u, v, data in G.edges(data=True):
-            weight = data.get("weight", 1.0)
-            DG.add_edge(u, v, weight=weight)
+        node_ids, src, dst, weight = self._graph_store().live_edges()
 
-        # Compute PageRank for all nodes
+        # Compute PageRank for all nodes in the analytics pool
         try:
-            pagerank = nx.pagerank(DG, alpha=damping_factor, weight="weight")
+            pagerank = await run_analytics_async(
+                pagerank_scores, len(node_ids), src, dst, weight, damping_factor
+            )
         except Exception as e:
             logger.error(f"Error computing PageRank: {e}")
             return {resource_id: 0.0 for resource_id in resource_ids}
 
-        # Extract results for requested resources
+        return self._scores_for(resource_ids, node_ids, pagerank)
+
+    @staticmethod
+    def _scores_for(
+        resource_ids: List[int], node_ids: List[str], scores
+    ) -> dict[int, float]:
+        """Pick the per-node scores of the requested resources (0.0 if absent)."""
+        position = {node_id: idx for idx, node_id in enumerate(node_ids)}
         results = {}
         for resource_id in resource_ids:
-            resource_id_str = str(resource_id)
-            results[resource_id] = pagerank.get(resource_id_str, 0.0)
-
+            idx = position.get(str(resource_id))
+            results[resource_id] = float(scores[idx]) if idx is not None else 0.0
         return results
 
 
@@ -1367,8 +1473,8 @@ class CommunityDetectionService:
             }
         """
         try:
-            import networkx as nx
-            import community as community_louvain
+            import networkx  # noqa: F401
+            import community  # noqa: F401
         except ImportError as e:
             logger.error(f"Required library not installed: {e}")
             logger.error("Install with: pip install python-louvain")
@@ -1431,82 +1537,53 @@ class CommunityDetectionService:
                 "community_sizes": {0: len(resources)} if resources else {},
             }
 
-        # Create graph with requested resources
-        G = nx.MultiGraph()
-        resource_id_strs = [str(r.id) for r in resources]
+        from app.shared.graph_analytics import louvain_partition, run_analytics_async
 
-        # Add nodes
-        for resource in resources:
-            G.add_node(
-                str(resource.id),
-                title=resource.title,
-                type=resource.type,
-            )
+        resource_id_strs = [str(r.id) for r in resources]
+        position = {node: idx for idx, node in enumerate(resource_id_strs)}
 
         # Add edges between requested resources
         edges = (
-            self.db.query(GraphEdge)
+            self.db.query(GraphEdge.source_id, GraphEdge.target_id, GraphEdge.weight)
             .filter(
                 GraphEdge.source_id.in_(resource_id_strs),
                 GraphEdge.target_id.in_(resource_id_strs),
             )
             .all()
         )
+        edges = [
+            (position[str(source)], position[str(target)], weight)
+            for source, target, weight in edges
+            if str(source) in position and str(target) in position
+        ]
+        src = np.array([e[0] for e in edges], dtype=np.int32)
+        dst = np.array([e[1] for e in edges], dtype=np.int32)
+        weights = np.array(
+            [1.0 if e[2] is None else e[2] for e in edges], dtype=np.float64
+        )
 
-        for edge in edges:
-            G.add_edge(
-                str(edge.source_id),
-                str(edge.target_id),
-                edge_type=edge.edge_type,
-                weight=edge.weight,
-            )
-
-        if len(G.nodes()) < 2:
-            logger.warning(f"Not enough nodes in subgraph: {len(G.nodes())}")
-            return {
-                "communities": {n: 0 for n in G.nodes()},
-                "modularity": 0.0,
-                "num_communities": 1 if G.nodes() else 0,
-                "community_sizes": {0: len(G.nodes())} if G.nodes() else {},
-            }
-
-        # Convert to simple graph (Louvain requires undirected, no multi-edges)
-        simple_graph = nx.Graph()
-        for u, v, data in G.edges(data=True):
-            weight = data.get("weight", 1.0)
-            if simple_graph.has_edge(u, v):
-                # Combine weights for multi-edges
-                simple_graph[u][v]["weight"] += weight
-            else:
-                simple_graph.add_edge(u, v, weight=weight)
-
-        # Add isolated nodes
-        for node in G.nodes():
-            if node not in simple_graph:
-                simple_graph.add_node(node)
-
-        # Run Louvain community detection
+        # Run Louvain community detection in the analytics pool
         try:
-            partition = community_louvain.best_partition(
-                simple_graph, weight="weight", resolution=resolution
-            )
-
-            # Compute modularity
-            modularity = community_louvain.modularity(
-                partition, simple_graph, weight="weight"
+            labels, modularity = await run_analytics_async(
+                louvain_partition,
+                len(resource_id_strs),
+                src,
+                dst,
+                weights,
+                resolution,
             )
         except Exception as e:
             logger.error(f"Error in Louvain algorithm: {e}")
             # Return single community as fallback
             return {
-                "communities": {n: 0 for n in G.nodes()},
+                "communities": {n: 0 for n in resource_id_strs},
                 "modularity": 0.0,
                 "num_communities": 1,
-                "community_sizes": {0: len(G.nodes())},
+                "community_sizes": {0: len(resource_id_strs)},
             }
 
-        # Convert partition - keep node IDs as strings (matching graph node format)
-        communities = {node: comm_id for node, comm_id in partition.items()}
+        # Keep node IDs as strings (matching graph node format)
+        communities = dict(zip(resource_id_strs, labels.tolist()))
 
         # Compute community sizes
         community_sizes = {}
@@ -12,7 +12,8 @@ What gets stored in Postgres
     - start_line / end_line → line span in the file
     - ast_node_type / symbol_name → symbol identity
     - semantic_summary → signature + docstring (used for embeddings)
-    - embedding        → vector stored on the Resource row
+    - chunk_metadata.embedding_vector → per-symbol vector
+• Resource.embedding – vector of the file's first embedded symbol
 
 What does NOT get stored
 ────────────────────────
@@ -32,6 +33,17 @@ we embed a lightweight semantic summary:
 This is typically 2–5× smaller than the full body yet carries equal or
 better semantic signal for retrieval.
 
+Summaries are encoded in batched forward passes (bounded by
+_EMBED_BATCH_TOKEN_BUDGET) instead of one call per symbol; the embed stage
+groups consecutive files so small files still fill a batch.
+
+Pipeline stages
+───────────────
+  parse  (process pool) ─▶ queue ─▶ embed (batched) ─▶ queue ─▶ write (DB)
+
+Queues are bounded (_STAGE_QUEUE_SIZE), so throughput is set by the slowest
+stage. IngestionResult.stage_stats reports the rate of each one.
+
 Dependencies
 ────────────
   pip install gitpython pathspec sentence-transformers
@@ -49,9 +61,15 @@ Usage
 from __future__ import annotations
 
 import ast
+import asyncio
 import logging
+import os
 import shutil
 import tempfile
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -61,6 +79,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.models import DocumentChunk, Resource
 from app.modules.resources.logic.classification import classify_file
+from app.shared.model_registry import get_model_registry
 from app.utils.path_exclusions import has_excluded_ancestor, is_excluded_file
 
 logger = logging.getLogger(__name__)
@@ -88,11 +107,54 @@ _EXTENSION_LANGUAGE: dict[str, str] = {
 # Maximum characters of docstring to include in the semantic summary
 _MAX_DOCSTRING_CHARS = 512
 
-# Batch size for DB flushes
-_BATCH_SIZE = 50
+# Chunks written per bulk insert + commit. Each batch costs three round-trips
+# (resources, chunks, commit) however many files it spans.
+_BATCH_SIZE = 500
+
+# Resource rows per multi-row INSERT on PostgreSQL (15 bind params per row;
+# asyncpg caps a statement at 32767).
+_RESOURCE_ROWS_PER_INSERT = 1000
+
+# Upper bound on summaries per encode call and their approximate token count
+# (~4 chars per token). Keeps activation memory flat on CPU-only edge workers
+# for files with thousands of symbols.
+_EMBED_BATCH_MAX_ITEMS = 64
+_EMBED_BATCH_TOKEN_BUDGET = 8192
+
+# Staged ingestion (parse → embed → write). Parsing runs in a process pool;
+# the queues between stages are bounded so a slow stage applies backpressure
+# upstream instead of letting parsed files pile up in memory.
+_PARSE_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+_STAGE_QUEUE_SIZE = 64
+# The embed stage merges consecutive parsed files into one encode group until
+# it holds this many summaries, so small files still fill a forward pass.
+_EMBED_GROUP_MAX_SUMMARIES = 256
+
+
+# ── Result dataclasses ─────────────────────────────────────────────────────────
+
+@dataclass
+class StageStats:
+    """Work done by one pipeline stage (parse, embed or write)."""
+    items: int = 0
+    busy_seconds: float = 0.0   # summed across workers, excludes queue waits
+    workers: int = 1
+
+    @property
+    def items_per_second(self) -> float:
+        """Sustained file rate if the stage never waited on its neighbours."""
+        if self.busy_seconds <= 0:
+            return 0.0
+        return self.items * self.workers / self.busy_seconds
 
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "items": self.items,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "workers": self.workers,
+            "items_per_second": round(self.items_per_second, 2),
+        }
 
-# ── Result dataclass ───────────────────────────────────────────────────────────
 
 @dataclass
 class IngestionResult:
@@ -110,11 +172,21 @@ class IngestionResult:
     errors: list[dict[str, str]] = field(default_factory=list)
     # Track resource IDs for staleness management
     resource_ids: list[str] = field(default_factory=list)
+    # Per-stage throughput keyed by "parse" / "embed" / "write"
+    stage_stats: dict[str, StageStats] = field(default_factory=dict)
 
     @property
     def storage_saved_mb(self) -> float:
         return self.estimated_storage_saved_bytes / (1024 * 1024)
 
+    @property
+    def bottleneck_stage(self) -> str | None:
+        """Name of the stage with the lowest sustained throughput."""
+        active = {k: v for k, v in self.stage_stats.items() if v.items}
+        if not active:
+            return None
+        return min(active, key=lambda k: active[k].items_per_second)
+
 
 # ── AST symbol extractor ───────────────────────────────────────────────────────
 
@@ -320,6 +392,107 @@ def chunk_generic_file(
     return chunks
 
 
+# ── Parse stage (runs in worker processes) ─────────────────────────────────────
+
+@dataclass
+class _ChunkSpec:
+    """Picklable description of one DocumentChunk, built off the event loop."""
+    start_line: int
+    end_line: int
+    node_type: str
+    symbol_name: str
+    summary: str
+    dependencies: list[str] | None = None
+
+
+@dataclass
+class _ParsedFile:
+    """Everything the embed and write stages need — raw content is dropped."""
+    rel_path: str
+    name: str
+    language: str
+    classification: str
+    chunks: list[_ChunkSpec]
+    storage_saved_bytes: int = 0
+    parse_seconds: float = 0.0
+
+
+def _parse_source_file(file_path: str, root_path: str) -> _ParsedFile:
+    """
+    Read one file and turn it into chunk specs.
+
+    Module-level so it can be shipped to a ProcessPoolExecutor. Python files
+    go through the stdlib `ast`, other `_AST_SUPPORTED` languages through
+    Tree-Sitter, and anything that yields no symbols falls back to
+    fixed-size line chunks.
+    """
+    t0 = time.perf_counter()
+    path = Path(file_path)
+    try:
+        content = path.read_text(encoding="utf-8")
+    except UnicodeDecodeError:
+        content = path.read_text(encoding="latin-1")
+
+    rel_path = str(path.relative_to(root_path)).replace("\\", "/")
+    language = _EXTENSION_LANGUAGE.get(path.suffix.lower(), "unknown")
+    module_path = rel_path.replace("/", ".").removesuffix(".py")
+    classification = classify_file(path, content)
+
+    # Pick the AST extractor: stdlib ast for Python, Tree-Sitter for
+    # everything in _AST_SUPPORTED. If Tree-Sitter fails to load (e.g.
+    # tree_sitter_languages missing in the container), we fall through
+    # to chunk_generic_file rather than crash the whole ingest.
+    symbols = []
+    summary_fn = None
+    if language == "python":
+        extractor = PythonASTExtractor()
+        symbols = extractor.extract(content, module_path)
+        summary_fn = lambda s: extractor.build_semantic_summary(s, language)
+    elif language in _AST_SUPPORTED:
+        from .language_parser import LanguageParser, build_semantic_summary
+        ts_parser = LanguageParser.for_path(path)
+        if ts_parser is not None:
+            symbols = ts_parser.extract(content, module_path)
+            summary_fn = lambda s: build_semantic_summary(s, language)
+
+    chunks: list[_ChunkSpec] = []
+    saved = 0
+    if symbols and summary_fn is not None:
+        for sym in symbols:
+            chunks.append(_ChunkSpec(
+                start_line=sym.start_line,
+                end_line=sym.end_line,
+                node_type=sym.node_type,
+                symbol_name=sym.qualified_name,
+                summary=summary_fn(sym),
+                dependencies=sym.dependencies[:30],
+            ))
+            # Estimate bytes saved: avg symbol body ≈ 800 chars
+            saved += 800
+    else:
+        # Generic chunking — used for unsupported languages OR when the
+        # Tree-Sitter parser failed to produce any symbols.
+        for start, end, summary in chunk_generic_file(content):
+            chunks.append(_ChunkSpec(
+                start_line=start,
+                end_line=end,
+                node_type="block",
+                symbol_name=f"{rel_path}:{start}-{end}",
+                summary=summary,
+            ))
+            saved += (end - start) * 40  # ~40 chars/line
+
+    return _ParsedFile(
+        rel_path=rel_path,
+        name=path.name,
+        language=language,
+        classification=classification,
+        chunks=chunks,
+        storage_saved_bytes=saved,
+        parse_seconds=time.perf_counter() - t0,
+    )
+
+
 # ── Main pipeline class ────────────────────────────────────────────────────────
 
 class HybridIngestionPipeline:
@@ -337,16 +510,31 @@ class HybridIngestionPipeline:
     6. Store Resource + DocumentChunk rows with github_uri pointers
     7. Return IngestionResult with storage/performance statistics
 
+    Steps 3–6 run as three concurrent stages joined by bounded queues:
+    parse (process pool) → embed (batched across files) → write (single
+    AsyncSession). Total time tracks the slowest stage rather than the sum
+    of all three; IngestionResult.stage_stats reports each stage's rate.
+
     The cloned repo is deleted after ingestion — nothing is persisted locally.
     """
 
-    def __init__(self, db: AsyncSession, embedding_service: object | None = None) -> None:
+    def __init__(
+        self,
+        db: AsyncSession,
+        embedding_service: object | None = None,
+        parse_workers: int = _PARSE_WORKERS,
+        queue_size: int = _STAGE_QUEUE_SIZE,
+    ) -> None:
         self.db = db
         self._extractor = PythonASTExtractor()
         # Optional EdgeWorker EmbeddingService — when provided, all embedding
         # calls go through this single GPU-loaded model instead of the
         # MiniLM fallback in `_generate_embedding`.
         self._embedding_service = embedding_service
+        # 0 parses in the default thread executor instead of a process pool
+        # (useful where fork/spawn is unavailable, and in tests).
+        self._parse_workers = max(0, parse_workers)
+        self._queue_size = max(1, queue_size)
 
     async def _embed(self, text: str) -> list[float] | None:
         """Generate one embedding using the injected service or the fallback."""
@@ -363,6 +551,29 @@ class HybridIngestionPipeline:
                 return None
         return await _generate_embedding(text)
 
+    async def _embed_many(self, texts: list[str]) -> list[list[float] | None]:
+        """Embed summaries in token-budgeted batches, preserving input order."""
+        vectors: list[list[float] | None] = []
+        for start, end in _embedding_batches(texts):
+            vectors.extend(await self._embed_batch(texts[start:end]))
+        return vectors
+
+    async def _embed_batch(self, texts: list[str]) -> list[list[float] | None]:
+        """Encode one batch in a single forward pass."""
+        if self._embedding_service is not None:
+            batch_generate = getattr(self._embedding_service, "batch_generate", None)
+            if batch_generate is None:
+                return [await self._embed(text) for text in texts]
+            import asyncio
+            loop = asyncio.get_event_loop()
+            try:
+                vecs = await loop.run_in_executor(None, batch_generate, texts)
+                return [list(vec) if vec is not None and len(vec) else None for vec in vecs]
+            except Exception as exc:
+                logger.warning("Injected batch embedding failed: %s", exc)
+                return [None] * len(texts)
+        return await _generate_embeddings(texts)
+
     # ── Public entry point ─────────────────────────────────────────────────
 
     async def ingest_github_repo(
@@ -379,12 +590,11 @@ class HybridIngestionPipeline:
             git_url:         HTTPS clone URL (validated for safety).
             branch:          Branch or tag to clone.
             file_extensions: Tuple of extensions to process.
-            batch_size:      Number of chunks to flush per DB transaction.
+            batch_size:      Number of chunks written per bulk insert + commit.
 
         Returns:
             IngestionResult with detailed statistics.
         """
-        import time
         if not git_url.startswith("https://"):
             raise ValueError("Only HTTPS clone URLs are accepted.")
 
@@ -397,47 +607,15 @@ class HybridIngestionPipeline:
             result = IngestionResult(repo_url=git_url, branch=branch, commit_sha=commit_sha)
 
             gitignore_spec = self._load_gitignore(temp_path)
-            pending_chunks: list[DocumentChunk] = []
-
-            for file_path in self._iter_source_files(
-                temp_path, gitignore_spec, file_extensions
-            ):
-                try:
-                    new_chunks = await self._process_file(
-                        file_path=file_path,
-                        root_path=temp_path,
-                        git_url=git_url,
-                        commit_sha=commit_sha,
-                        result=result,
-                    )
-                    pending_chunks.extend(new_chunks)
-
-                    if len(pending_chunks) >= batch_size:
-                        await self._flush(pending_chunks, result)
-                        pending_chunks.clear()
-
-                except Exception as exc:
-                    rel = str(file_path.relative_to(temp_path))
-                    logger.error("File failed: %s — %s", rel, exc, exc_info=True)
-                    result.files_failed += 1
-                    result.errors.append({"path": rel, "error": str(exc)})
-                    # A transient DB blip (e.g. NeonDB pooler dropping the
-                    # connection mid-batch) leaves the AsyncSession in an
-                    # invalid-transaction state. Without rolling back, every
-                    # subsequent file fails with "Can't reconnect until invalid
-                    # transaction is rolled back" — that's how the Linux ingest
-                    # cascaded into 57k failures. Rollback here keeps the
-                    # session usable for the next file.
-                    try:
-                        await self.db.rollback()
-                    except Exception as rb_exc:
-                        logger.warning(
-                            "Rollback after file failure also failed: %s", rb_exc
-                        )
-
-            # Flush remaining
-            if pending_chunks:
-                await self._flush(pending_chunks, result)
+            await self._run_stages(
+                root_path=temp_path,
+                gitignore_spec=gitignore_spec,
+                file_extensions=file_extensions,
+                git_url=git_url,
+                commit_sha=commit_sha,
+                result=result,
+                batch_size=batch_size,
+            )
 
         finally:
             try:
@@ -465,6 +643,15 @@ class HybridIngestionPipeline:
             result.ingestion_time_seconds,
             result.storage_saved_mb,
         )
+        if result.stage_stats:
+            logger.info(
+                "Stage throughput (files/s): %s — bottleneck: %s",
+                ", ".join(
+                    f"{name}={stats.items_per_second:.1f}"
+                    for name, stats in result.stage_stats.items()
+                ),
+                result.bottleneck_stage,
+            )
         return result
 
     # ── Private helpers ────────────────────────────────────────────────────
@@ -534,202 +721,396 @@ class HybridIngestionPipeline:
                 continue
             yield path
 
-    async def _process_file(
+    # ── Pipeline stages ────────────────────────────────────────────────────
+
+    async def _run_stages(
         self,
-        file_path: Path,
         root_path: Path,
+        gitignore_spec: pathspec.PathSpec | None,
+        file_extensions: tuple[str, ...],
+        git_url: str,
+        commit_sha: str,
+        result: IngestionResult,
+        batch_size: int,
+    ) -> None:
+        """Run parse → embed → write concurrently until every file is written."""
+        parsed_q: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        embedded_q: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        result.stage_stats.update(
+            parse=StageStats(workers=max(1, self._parse_workers)),
+            embed=StageStats(),
+            write=StageStats(),
+        )
+
+        tasks = [
+            asyncio.ensure_future(self._parse_stage(
+                root_path, gitignore_spec, file_extensions, parsed_q, result,
+            )),
+            asyncio.ensure_future(self._embed_stage(parsed_q, embedded_q, result)),
+            asyncio.ensure_future(self._write_stage(
+                embedded_q, git_url, commit_sha, result, batch_size,
+            )),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # One stage died: the others would block forever on a full or
+            # empty queue, so tear them all down before propagating.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _parse_stage(
+        self,
+        root_path: Path,
+        gitignore_spec: pathspec.PathSpec | None,
+        file_extensions: tuple[str, ...],
+        parsed_q: asyncio.Queue,
+        result: IngestionResult,
+    ) -> None:
+        """Fan files out to the parse pool, keeping 2× workers in flight."""
+        loop = asyncio.get_running_loop()
+        stats = result.stage_stats["parse"]
+        max_in_flight = stats.workers * 2
+        executor = self._new_parse_executor()
+        # future → (relative path, executor it was submitted to)
+        in_flight: dict[asyncio.Future, tuple[str, ProcessPoolExecutor | None]] = {}
+
+        async def drain(return_when: str) -> None:
+            nonlocal executor
+            done, _ = await asyncio.wait(in_flight, return_when=return_when)
+            for fut in done:
+                rel, submitted_to = in_flight.pop(fut)
+                try:
+                    parsed = fut.result()
+                except BrokenProcessPool as exc:
+                    # A worker died (e.g. a native parser crash). Every other
+                    # in-flight future fails the same way; start a new pool
+                    # so the rest of the repository still gets parsed.
+                    self._record_file_failure(result, rel, exc)
+                    if submitted_to is executor and executor is not None:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        executor = self._new_parse_executor()
+                    continue
+                except Exception as exc:
+                    self._record_file_failure(result, rel, exc)
+                    continue
+                stats.items += 1
+                stats.busy_seconds += parsed.parse_seconds
+                await parsed_q.put(parsed)
+
+        try:
+            for file_path in self._iter_source_files(
+                root_path, gitignore_spec, file_extensions
+            ):
+                rel = str(file_path.relative_to(root_path))
+                fut = loop.run_in_executor(
+                    executor, _parse_source_file, str(file_path), str(root_path)
+                )
+                in_flight[fut] = (rel, executor)
+                if len(in_flight) >= max_in_flight:
+                    await drain(asyncio.FIRST_COMPLETED)
+            while in_flight:
+                await drain(asyncio.FIRST_COMPLETED)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+        await parsed_q.put(None)
+
+    def _new_parse_executor(self) -> ProcessPoolExecutor | None:
+        """Process pool for parsing, or None for the default thread executor."""
+        if self._parse_workers <= 0:
+            return None
+        return ProcessPoolExecutor(max_workers=self._parse_workers)
+
+    async def _embed_stage(
+        self,
+        parsed_q: asyncio.Queue,
+        embedded_q: asyncio.Queue,
+        result: IngestionResult,
+    ) -> None:
+        """Group queued files and encode their summaries in shared batches."""
+        stats = result.stage_stats["embed"]
+        finished = False
+        while not finished:
+            parsed = await parsed_q.get()
+            if parsed is None:
+                break
+            group = [parsed]
+            pending = len(parsed.chunks)
+            # Take whatever is already queued — never wait for more, so a
+            # slow parse stage doesn't add latency here.
+            while pending < _EMBED_GROUP_MAX_SUMMARIES and not parsed_q.empty():
+                nxt = parsed_q.get_nowait()
+                if nxt is None:
+                    finished = True
+                    break
+                group.append(nxt)
+                pending += len(nxt.chunks)
+
+            t0 = time.perf_counter()
+            summaries = [c.summary for p in group for c in p.chunks]
+            vectors = await self._embed_many(summaries) if summaries else []
+            stats.busy_seconds += time.perf_counter() - t0
+            stats.items += len(group)
+
+            offset = 0
+            for p in group:
+                n = len(p.chunks)
+                await embedded_q.put((p, vectors[offset:offset + n]))
+                offset += n
+        await embedded_q.put(None)
+
+    async def _write_stage(
+        self,
+        embedded_q: asyncio.Queue,
+        git_url: str,
+        commit_sha: str,
+        result: IngestionResult,
+        batch_size: int,
+    ) -> None:
+        """Persist embedded files on the pipeline's one AsyncSession.
+
+        Files accumulate until they hold `batch_size` chunks and are then
+        written with one multi-row resource INSERT and one bulk chunk INSERT.
+        """
+        stats = result.stage_stats["write"]
+        batch: list[tuple[_ParsedFile, list[list[float] | None]]] = []
+        pending = 0
+
+        async def write_pending() -> None:
+            t0 = time.perf_counter()
+            await self._write_batch(batch, git_url, commit_sha, result)
+            stats.busy_seconds += time.perf_counter() - t0
+            stats.items += len(batch)
+            batch.clear()
+
+        while True:
+            item = await embedded_q.get()
+            if item is None:
+                break
+            batch.append(item)
+            pending += len(item[0].chunks)
+            if pending >= batch_size:
+                await write_pending()
+                pending = 0
+
+        # Flush remaining
+        if batch:
+            await write_pending()
+
+    @staticmethod
+    def _record_file_failure(
+        result: IngestionResult, rel_path: str, exc: BaseException
+    ) -> None:
+        logger.error("File failed: %s — %s", rel_path, exc, exc_info=exc)
+        result.files_failed += 1
+        result.errors.append({"path": rel_path, "error": str(exc)})
+
+    async def _write_batch(
+        self,
+        batch: list[tuple[_ParsedFile, list[list[float] | None]]],
         git_url: str,
         commit_sha: str,
         result: IngestionResult,
-    ) -> list[DocumentChunk]:
+    ) -> None:
         """
-        Process one source file and return the DocumentChunk list.
+        Insert a batch of parsed files and their chunks, then commit.
 
-        Reads the file only to extract AST metadata and compute embeddings —
-        the content is then discarded without being written to the DB.
+        Three round-trips per batch regardless of file count: resources,
+        chunks, commit. If the batch fails it is rolled back and retried one
+        file at a time so a single bad row doesn't drop its neighbours.
         """
+        resource_rows: list[dict[str, object]] = []
+        chunk_rows: list[dict[str, object]] = []
+        for parsed, vectors in batch:
+            resource_row, rows = self._build_rows(parsed, vectors, git_url, commit_sha)
+            resource_rows.append(resource_row)
+            chunk_rows.extend(rows)
+
         try:
-            content = file_path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            content = file_path.read_text(encoding="latin-1")
+            await self._insert_resources(resource_rows)
+            if chunk_rows:
+                from sqlalchemy import insert as _sql_insert
+                await self.db.execute(_sql_insert(DocumentChunk.__table__), chunk_rows)
+            await self.db.commit()
+        except Exception as exc:
+            # A transient DB blip (e.g. NeonDB pooler dropping the
+            # connection mid-batch) leaves the AsyncSession in an
+            # invalid-transaction state. Without rolling back, every
+            # subsequent file fails with "Can't reconnect until invalid
+            # transaction is rolled back" — that's how the Linux ingest
+            # cascaded into 57k failures. Rollback here keeps the
+            # session usable for the next batch.
+            try:
+                await self.db.rollback()
+            except Exception as rb_exc:
+                logger.warning("Rollback after batch failure also failed: %s", rb_exc)
+            if len(batch) > 1:
+                logger.warning(
+                    "Bulk write of %d files failed (%s); retrying one by one",
+                    len(batch), exc,
+                )
+                for item in batch:
+                    await self._write_batch([item], git_url, commit_sha, result)
+            else:
+                self._record_file_failure(result, batch[0][0].rel_path, exc)
+            return
+
+        logger.debug(
+            "Wrote %d resources / %d chunks", len(resource_rows), len(chunk_rows)
+        )
+        for (parsed, _), row in zip(batch, resource_rows):
+            result.resources_created += 1
+            result.resource_ids.append(str(row["id"]))
+            result.chunks_created += len(parsed.chunks)
+            result.estimated_storage_saved_bytes += parsed.storage_saved_bytes
 
-        rel_path = str(file_path.relative_to(root_path)).replace("\\", "/")
-        language = _EXTENSION_LANGUAGE.get(file_path.suffix.lower(), "unknown")
-        module_path = rel_path.replace("/", ".").removesuffix(".py")
+    def _build_rows(
+        self,
+        parsed: _ParsedFile,
+        vectors: list[list[float] | None],
+        git_url: str,
+        commit_sha: str,
+    ) -> tuple[dict[str, object], list[dict[str, object]]]:
+        """
+        Build the resource row and chunk rows for one parsed file.
+
+        IDs are generated client-side so chunks can reference their resource
+        without waiting for a RETURNING round-trip. The raw content never
+        reaches this stage — only summaries, line spans and vectors.
+        """
+        rel_path = parsed.rel_path
+        language = parsed.language
+        classification = parsed.classification
+        resource_id = uuid.uuid4()
 
         # Build GitHub raw URL for this file
         # e.g. https://raw.githubusercontent.com/owner/repo/SHA/path/file.py
         raw_base = _github_raw_base(git_url, commit_sha)
         file_github_uri = f"{raw_base}/{rel_path}"
 
-        # Create Resource row (one per file) — no raw content stored.
-        # Use raw SQL because the `read_status` column is a custom Postgres
-        # enum and the ORM's String mapping sends VARCHAR which Postgres
-        # refuses to auto-cast (DatatypeMismatchError).
-        import json as _json
-        from sqlalchemy import text as _sql_text
-
-        classification = classify_file(file_path, content)
-        subject = [classification, language]
-        relation = [
-            f"classification:{classification}",
-            f"language:{language}",
-            f"git:commit:{commit_sha}",
-            f"git:url:{git_url}",
-        ]
-        inserted = await self.db.execute(
-            _sql_text(
-                """
-                INSERT INTO resources (
-                    id, title, description, source, identifier, coverage,
-                    type, format, language, classification_code,
-                    subject, relation, read_status, quality_score,
-                    created_at, updated_at
-                ) VALUES (
-                    gen_random_uuid(), :title, :description, :source, :identifier, :coverage,
-                    :type, :format, :language, :classification_code,
-                    CAST(:subject AS jsonb), CAST(:relation AS jsonb),
-                    CAST(:read_status AS read_status), :quality_score,
-                    NOW(), NOW()
-                ) RETURNING id
-                """
-            ),
-            {
-                "title": file_path.name,
-                "description": f"{language.title()} source — {rel_path}",
-                "source": git_url,
-                "identifier": rel_path,
-                "coverage": commit_sha,
-                "type": "code_file",
-                "format": f"text/{language}",
-                "language": language,
-                "classification_code": classification,
-                "subject": _json.dumps(subject),
-                "relation": _json.dumps(relation),
-                "read_status": "unread",
-                "quality_score": 0.0,
-            },
-        )
-        resource_id = inserted.scalar_one()
-        # Provide a small shim so the rest of _process_file (which references
-        # `resource.id`) keeps working without touching the ORM session.
-        class _ResourceShim:
-            __slots__ = ("id",)
-            def __init__(self, rid): self.id = rid
-        resource = _ResourceShim(resource_id)
-        result.resources_created += 1
-        result.resource_ids.append(str(resource_id))
-
-        # Extract symbols
-        chunks: list[DocumentChunk] = []
-
-        # Embedding to write back to the resource via vector CAST.
+        chunk_rows: list[dict[str, object]] = []
+        # Embedding to store on the resource itself.
         first_embedding: list[float] | None = None
-
-        # Pick the AST extractor: stdlib ast for Python, Tree-Sitter for
-        # everything in _AST_SUPPORTED. If Tree-Sitter fails to load (e.g.
-        # tree_sitter_languages missing in the container), we fall through
-        # to chunk_generic_file rather than crash the whole ingest.
-        symbols = []
-        summary_fn = None
-        if language == "python":
-            symbols = self._extractor.extract(content, module_path)
-            summary_fn = lambda s: self._extractor.build_semantic_summary(s, language)
-        elif language in _AST_SUPPORTED:
-            from .language_parser import LanguageParser, build_semantic_summary
-            ts_parser = LanguageParser.for_path(file_path)
-            if ts_parser is not None:
-                symbols = ts_parser.extract(content, module_path)
-                summary_fn = lambda s: build_semantic_summary(s, language)
-
-        if symbols and summary_fn is not None:
-            for idx, sym in enumerate(symbols):
-                summary = summary_fn(sym)
-                embedding_vector = await self._embed(summary)
-                chunk = DocumentChunk(
-                    resource_id=resource.id,
-                    chunk_index=idx,
-                    content=None,          # ← no raw code stored
-                    is_remote=True,
-                    github_uri=file_github_uri,
-                    branch_reference=commit_sha,
-                    start_line=sym.start_line,
-                    end_line=sym.end_line,
-                    ast_node_type=sym.node_type,
-                    symbol_name=sym.qualified_name,
-                    semantic_summary=summary,
-                    chunk_metadata={
-                        "language": language,
-                        "dependencies": sym.dependencies[:30],
-                    },
-                )
-                self.db.add(chunk)
-                chunks.append(chunk)
-
-                if embedding_vector and first_embedding is None:
+        for idx, (spec, embedding_vector) in enumerate(zip(parsed.chunks, vectors)):
+            chunk_metadata: dict[str, object] = {"language": language}
+            if spec.dependencies is not None:
+                chunk_metadata["dependencies"] = spec.dependencies
+            if embedding_vector:
+                chunk_metadata["embedding_vector"] = embedding_vector
+                if first_embedding is None:
                     first_embedding = embedding_vector
+            chunk_rows.append({
+                "id": uuid.uuid4(),
+                "resource_id": resource_id,
+                "chunk_index": idx,
+                "content": None,          # ← no raw code stored
+                "is_remote": True,
+                "github_uri": file_github_uri,
+                "branch_reference": commit_sha,
+                "start_line": spec.start_line,
+                "end_line": spec.end_line,
+                "ast_node_type": spec.node_type,
+                "symbol_name": spec.symbol_name,
+                "semantic_summary": spec.summary,
+                "chunk_metadata": chunk_metadata,
+            })
+
+        resource_row: dict[str, object] = {
+            "id": resource_id,
+            "title": parsed.name,
+            "description": f"{language.title()} source — {rel_path}",
+            "source": git_url,
+            "identifier": rel_path,
+            "coverage": commit_sha,
+            "type": "code_file",
+            "format": f"text/{language}",
+            "language": language,
+            "classification_code": classification,
+            "subject": [classification, language],
+            "relation": [
+                f"classification:{classification}",
+                f"language:{language}",
+                f"git:commit:{commit_sha}",
+                f"git:url:{git_url}",
+            ],
+            "read_status": "unread",
+            "quality_score": 0.0,
+            "embedding": first_embedding,
+        }
+        return resource_row, chunk_rows
+
+    async def _insert_resources(self, rows: list[dict[str, object]]) -> None:
+        """
+        Insert resource rows in as few statements as the dialect allows.
+
+        PostgreSQL gets one multi-row INSERT … VALUES per
+        _RESOURCE_ROWS_PER_INSERT rows. It has to be raw SQL because
+        `read_status` is a custom Postgres enum and `embedding` a pgvector
+        column — the ORM's String/Text mappings send VARCHAR, which Postgres
+        refuses to auto-cast (DatatypeMismatchError). SQLite stores both as
+        text, so a Core executemany with the table's Python defaults works.
+        """
+        import json as _json
 
-                # Estimate bytes saved: avg symbol body ≈ 800 chars
-                result.estimated_storage_saved_bytes += 800
-
-        else:
-            # Generic chunking — used for unsupported languages OR when the
-            # Tree-Sitter parser failed to produce any symbols.
-            line_chunks = chunk_generic_file(content)
-            for idx, (start, end, summary) in enumerate(line_chunks):
-                embedding_vector = await self._embed(summary)
-                chunk = DocumentChunk(
-                    resource_id=resource.id,
-                    chunk_index=idx,
-                    content=None,
-                    is_remote=True,
-                    github_uri=file_github_uri,
-                    branch_reference=commit_sha,
-                    start_line=start,
-                    end_line=end,
-                    ast_node_type="block",
-                    symbol_name=f"{rel_path}:{start}-{end}",
-                    semantic_summary=summary,
-                    chunk_metadata={"language": language},
-                )
-                self.db.add(chunk)
-                chunks.append(chunk)
-
-                if embedding_vector and first_embedding is None:
-                    first_embedding = embedding_vector
+        if self._dialect_name() != "postgresql":
+            from sqlalchemy import insert as _sql_insert
+            await self.db.execute(
+                _sql_insert(Resource.__table__),
+                [
+                    {
+                        **row,
+                        "embedding": _json.dumps(row["embedding"])
+                        if row["embedding"] else None,
+                    }
+                    for row in rows
+                ],
+            )
+            return
 
-                result.estimated_storage_saved_bytes += (end - start) * 40  # ~40 chars/line
+        from sqlalchemy import text as _sql_text
 
-        # pgvector column requires explicit CAST — see asyncpg-cast memory.
-        if first_embedding:
-            import json as _json
-            from sqlalchemy import text as _sql_text
+        for start in range(0, len(rows), _RESOURCE_ROWS_PER_INSERT):
+            page = rows[start:start + _RESOURCE_ROWS_PER_INSERT]
+            values: list[str] = []
+            params: dict[str, object] = {}
+            for i, row in enumerate(page):
+                values.append(
+                    f"(CAST(:id_{i} AS uuid), :title_{i}, :description_{i}, "
+                    f":source_{i}, :identifier_{i}, :coverage_{i}, :type_{i}, "
+                    f":format_{i}, :language_{i}, :classification_code_{i}, "
+                    f"CAST(:subject_{i} AS jsonb), CAST(:relation_{i} AS jsonb), "
+                    f"CAST(:read_status_{i} AS read_status), :quality_score_{i}, "
+                    f"CAST(:embedding_{i} AS vector), NOW(), NOW())"
+                )
+                for key, value in row.items():
+                    if key == "id":
+                        value = str(value)
+                    elif key in ("subject", "relation"):
+                        value = _json.dumps(value)
+                    elif key == "embedding":
+                        value = _json.dumps(value) if value else None
+                    params[f"{key}_{i}"] = value
             await self.db.execute(
                 _sql_text(
-                    "UPDATE resources SET embedding = CAST(:embedding AS vector) "
-                    "WHERE id = CAST(:resource_id AS uuid)"
+                    "INSERT INTO resources ("
+                    "id, title, description, source, identifier, coverage, "
+                    "type, format, language, classification_code, "
+                    "subject, relation, read_status, quality_score, "
+                    "embedding, created_at, updated_at"
+                    ") VALUES " + ", ".join(values)
                 ),
-                {
-                    "resource_id": str(resource.id),
-                    "embedding": _json.dumps(first_embedding),
-                },
+                params,
             )
 
-        result.chunks_created += len(chunks)
-        return chunks
-
-    async def _flush(
-        self, chunks: list[DocumentChunk], result: IngestionResult
-    ) -> None:
-        """Commit a batch of chunks to the database."""
+    def _dialect_name(self) -> str:
+        """Dialect of the session's bind, assuming PostgreSQL (production)."""
         try:
-            await self.db.commit()
-            logger.debug("Flushed %d chunks", len(chunks))
-        except Exception as exc:
-            await self.db.rollback()
-            logger.error("Batch commit failed: %s", exc, exc_info=True)
-            result.files_failed += 1
-            result.errors.append({"batch": "db_commit_error", "error": str(exc)})
+            return self.db.get_bind().dialect.name
+        except Exception:
+            return "postgresql"
 
 
 # ── Utilities ──────────────────────────────────────────────────────────────────
@@ -746,6 +1127,75 @@ def _github_raw_base(git_url: str, commit_sha: str) -> str:
     return f"{url}/{commit_sha}"
 
 
+def _embedding_batches(
+    texts: list[str],
+    token_budget: int = _EMBED_BATCH_TOKEN_BUDGET,
+    max_items: int = _EMBED_BATCH_MAX_ITEMS,
+) -> list[tuple[int, int]]:
+    """
+    Split `texts` into contiguous [start, end) ranges for batched encoding.
+
+    A range closes when it reaches `max_items` or its estimated token count
+    (len // 4) would exceed `token_budget`. A single oversized text still
+    gets its own batch.
+    """
+    ranges: list[tuple[int, int]] = []
+    start = 0
+    tokens = 0
+    for i, text in enumerate(texts):
+        cost = max(1, len(text or "") // 4)
+        if i > start and (i - start >= max_items or tokens + cost > token_budget):
+            ranges.append((start, i))
+            start, tokens = i, 0
+        tokens += cost
+    if start < len(texts):
+        ranges.append((start, len(texts)))
+    return ranges
+
+
+def _get_fallback_model():
+    """Load the MiniLM fallback model once per process (model registry)."""
+    from sentence_transformers import SentenceTransformer
+    model = get_model_registry().get(
+        "sentence-transformer:all-MiniLM-L6-v2",
+        lambda: SentenceTransformer("all-MiniLM-L6-v2"),
+    )
+    if model is None:
+        raise RuntimeError("all-MiniLM-L6-v2 embedding model unavailable")
+    return model
+
+
+async def _generate_embeddings(texts: list[str]) -> list[list[float] | None]:
+    """
+    Batched counterpart of `_generate_embedding`.
+
+    Encodes all non-empty `texts` in one `model.encode` call; empty inputs
+    and failures map to None so ingestion continues without vectors.
+    """
+    valid = [(i, text) for i, text in enumerate(texts) if text and text.strip()]
+    vectors: list[list[float] | None] = [None] * len(texts)
+    if not valid:
+        return vectors
+    try:
+        model = _get_fallback_model()
+        import asyncio
+        loop = asyncio.get_event_loop()
+        encoded = await loop.run_in_executor(
+            None,
+            lambda: model.encode([text for _, text in valid], batch_size=len(valid)),
+        )
+        for (i, _), vector in zip(valid, encoded):
+            vectors[i] = vector.tolist()
+    except ImportError:
+        logger.warning(
+            "sentence-transformers not installed — embeddings skipped. "
+            "Run: pip install sentence-transformers"
+        )
+    except Exception as exc:
+        logger.warning("Batch embedding generation failed: %s", exc)
+    return vectors
+
+
 async def _generate_embedding(text: str) -> list[float] | None:
     """
     Generate a vector embedding for `text`.
@@ -755,11 +1205,8 @@ async def _generate_embedding(text: str) -> list[float] | None:
     GPU / model download.
     """
     try:
-        from sentence_transformers import SentenceTransformer
         # Module-level singleton — loaded once per process
-        if not hasattr(_generate_embedding, "_model"):
-            _generate_embedding._model = SentenceTransformer("all-MiniLM-L6-v2")
-        model = _generate_embedding._model
+        model = _get_fallback_model()
         # Run in default executor to avoid blocking the event loop
         import asyncio
         loop = asyncio.get_event_loop()
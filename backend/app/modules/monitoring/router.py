@@ -5,6 +5,7 @@ Provides endpoints for:
 - Performance metrics summary
 - User engagement metrics
 - ML model health (classification removed)
+- Resident ML models (shared model registry)
 - Cache statistics
 - Event history
 - Worker status
@@ -129,6 +130,19 @@ async def ml_model_health_check() -> Dict[str, Any]:
     return await service.ml_model_health_check()
 
 
+@router.get("/models", response_model=Dict[str, Any])
+async def get_loaded_models() -> Dict[str, Any]:
+    """
+    List the ML models loaded in this process.
+
+    Returns:
+        Dictionary with resident memory, device, load time and usage per
+        model, plus total resident bytes and the configured budget
+    """
+    service = MonitoringService()
+    return await service.get_loaded_models()
+
+
 @router.get("/database", response_model=DatabaseMetrics)
 async def get_database_metrics(db: Session = Depends(get_sync_db)) -> Dict[str, Any]:
     """
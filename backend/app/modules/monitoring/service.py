@@ -14,7 +14,7 @@ from sqlalchemy.orm import Session
 
 from ...shared.database import get_pool_status
 from ...shared.event_bus import event_bus
-from ...shared.cache import cache
+from ...shared.cache import cache, get_query_embedding_cache
 from ...database.models import UserInteraction, UserProfile
 from ...utils.performance_monitoring import metrics as perf_metrics
 
@@ -208,6 +208,21 @@ class MonitoringService:
             "http_status": 200,
         }
 
+    async def get_loaded_models(self) -> Dict[str, Any]:
+        """
+        Resident ML models in this process (shared model registry).
+
+        Returns:
+            Dictionary with per-model resident memory, device, load time
+            and usage, plus the registry total and budget
+        """
+        from ...shared.model_registry import get_model_registry
+
+        return {
+            **get_model_registry().stats(),
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
     async def get_database_metrics(self, db: Session) -> Dict[str, Any]:
         """
         Get comprehensive database metrics.
@@ -383,7 +398,12 @@ class MonitoringService:
                     "hits": cache.stats.hits,
                     "misses": cache.stats.misses,
                     "invalidations": cache.stats.invalidations,
+                    "stale": cache.stats.stale,
+                    "coalesced": cache.stats.coalesced,
+                    "early_refreshes": cache.stats.early_refreshes,
+                    "near_cache_hits": cache.near.stats.hits if cache.near else 0,
                     "total_requests": total_requests,
+                    "query_embeddings": get_query_embedding_cache().stats(),
                 },
             }
 
@@ -394,7 +394,9 @@ class QualityService:
     ) -> Optional[QualityScore]:
         """Get quality scores for a resource with caching.
 
-        First checks cache, then computes if not found and stores in cache.
+        Scores are served through cache.get_or_compute: concurrent requests
+        for the same resource share one computation, and expired scores are
+        served while a single request recomputes them.
 
         Args:
             resource_id: ID of the resource to evaluate
@@ -403,37 +405,37 @@ class QualityService:
         Returns:
             QualityScore domain object with all dimension scores, or None if computation fails
         """
-        cache_key = f"quality:{resource_id}"
-
-        # Try cache first
-        cached_scores = cache.get(cache_key)
-        if cached_scores is not None:
-            logger.debug(f"Cache hit for quality scores: {resource_id}")
-            # Reconstruct QualityScore from cached dict
-            return QualityScore(
-                accuracy=cached_scores["accuracy"],
-                completeness=cached_scores["completeness"],
-                consistency=cached_scores["consistency"],
-                timeliness=cached_scores["timeliness"],
-                relevance=cached_scores["relevance"],
-            )
-
-        # Cache miss - compute quality
-        logger.debug(f"Cache miss for quality scores: {resource_id}")
-        quality_score = self.compute_quality(resource_id, weights)
 
-        # Store in cache if computation succeeded
-        if quality_score:
-            cache_data = {
+        def compute() -> Optional[Dict[str, float]]:
+            logger.debug(f"Cache miss for quality scores: {resource_id}")
+            quality_score = self.compute_quality(resource_id, weights)
+            if not quality_score:
+                return None
+            return {
                 "accuracy": quality_score.accuracy,
                 "completeness": quality_score.completeness,
                 "consistency": quality_score.consistency,
                 "timeliness": quality_score.timeliness,
                 "relevance": quality_score.relevance,
             }
-            cache.set(cache_key, cache_data, ttl=1800)  # 30 minutes TTL
 
-        return quality_score
+        cached_scores = cache.get_or_compute(
+            f"quality:{resource_id}",
+            compute,
+            ttl=1800,  # 30 minutes TTL
+            tags=[f"resource:{resource_id}"],
+        )
+        if cached_scores is None:
+            return None
+
+        # Reconstruct QualityScore from cached dict
+        return QualityScore(
+            accuracy=cached_scores["accuracy"],
+            completeness=cached_scores["completeness"],
+            consistency=cached_scores["consistency"],
+            timeliness=cached_scores["timeliness"],
+            relevance=cached_scores["relevance"],
+        )
 
     def compute_quality(
         self, resource_id: str, weights: Optional[Dict[str, float]] = None
@@ -198,7 +198,11 @@ def register_handlers() -> None:
     # Subscribe to resource.created for automatic chunking
     event_bus.subscribe("resource.created", handle_resource_created)
 
-    # Subscribe to resource.chunked to queue embedding tasks for the edge worker
-    event_bus.subscribe("resource.chunked", handle_resource_chunked)
+    # Subscribe to resource.chunked to queue embedding tasks for the edge worker.
+    # Runs inside emit() so the push is scheduled on the caller's event loop
+    # rather than via asyncio.run() on a dispatch worker thread.
+    event_bus.subscribe(
+        "resource.chunked", handle_resource_chunked, synchronous=True
+    )
 
     logger.info("Resources module event handlers registered")
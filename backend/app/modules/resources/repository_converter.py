@@ -464,9 +464,12 @@ def handle_repository_ingested(payload: Dict) -> None:
         asyncio.run(run_conversion())
 
 
-# Register event handler
+# Register event handler; synchronous so the conversion is scheduled on the
+# emitter's event loop (and its async sessions) instead of a dispatch worker
 from app.shared.event_bus import event_bus
-event_bus.subscribe("repository.ingested", handle_repository_ingested)
+event_bus.subscribe(
+    "repository.ingested", handle_repository_ingested, synchronous=True
+)
 
 logger.info("Repository converter initialized and subscribed to repository.ingested events")
 
@@ -478,6 +478,10 @@ async def get_resource_endpoint(
 class ResourceListResponse(BaseModel):
     items: list[ResourceRead]
     total: int
+    # False when total is a query planner estimate (pass exact_count=true)
+    total_exact: bool = True
+    # Pass as ?cursor= to fetch the next page; None on the last page
+    next_cursor: Optional[str] = None
 
 
 @router.get("", response_model=ResourceListResponse)
@@ -498,6 +502,8 @@ async def list_resources_endpoint(
     offset: int = 0,
     sort_by: str = "created_at",
     sort_dir: str = "desc",
+    cursor: Optional[str] = None,
+    exact_count: bool = False,
     db: Session = Depends(get_sync_db),
 ):
     # Parse comma-separated subject lists
@@ -522,11 +528,21 @@ async def list_resources_endpoint(
     page = PageParams(limit=limit, offset=offset)
     sort = SortParams(sort_by=sort_by, sort_dir=sort_dir)
 
-    items, total = list_resources(db, filters, page, sort)
+    try:
+        result = list_resources(
+            db, filters, page, sort, cursor=cursor, exact_count=exact_count
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
     # Map url for response
-    for it in items:
+    for it in result.items:
         it.url = it.source  # type: ignore[attr-defined]
-    return ResourceListResponse(items=items, total=total)
+    return ResourceListResponse(
+        items=result.items,
+        total=result.total,
+        total_exact=result.total_exact,
+        next_cursor=result.next_cursor,
+    )
 
 
 @router.get("/{resource_id}/status", response_model=ResourceStatus)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import base64
 import json
 import logging
 import uuid
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timezone
@@ -10,10 +12,10 @@ from datetime import datetime, timezone
 from sqlalchemy.orm import Session
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import func, or_, asc, desc, String, cast, select
+from sqlalchemy import func, or_, asc, desc, String, cast, select, literal, tuple_
 
 from ...database import models as db_models
-from ...shared.database import Base
+from ...shared.database import AppSession, Base
 from ...utils import content_extractor as ce
 from ...utils.text_processor import clean_text, readability_scores
 from .schema import ResourceUpdate, PageParams, SortParams, ResourceFilters
@@ -473,7 +475,7 @@ def process_ingestion(
         if engine_url:
             engine = create_engine(engine_url, echo=False)
             local_session_factory = sessionmaker(
-                autocommit=False, autoflush=False, bind=engine
+                autocommit=False, autoflush=False, bind=engine, class_=AppSession
             )
             session = local_session_factory()
         else:
@@ -1001,56 +1003,222 @@ def _apply_resource_filters(query, filters: ResourceFilters):
     return query
 
 
+# Sortable list columns; each has a (column, id) index for keyset paging
+_RESOURCE_SORT_COLUMNS = {
+    "created_at": db_models.Resource.created_at,
+    "updated_at": db_models.Resource.updated_at,
+    "quality_score": db_models.Resource.quality_score,
+    "title": db_models.Resource.title,
+}
+_DATETIME_SORT_COLUMNS = {"created_at", "updated_at"}
+
+
+@dataclass
+class ResourcePage:
+    """One page of list_resources results.
+
+    Attributes:
+        items: Resources on this page
+        total: Number of resources matching the filters
+        total_exact: False when total is a query planner estimate
+        next_cursor: Opaque cursor for the next page (None on the last page)
+    """
+
+    items: List[db_models.Resource]
+    total: int
+    total_exact: bool = True
+    next_cursor: Optional[str] = None
+
+
+def _resolve_sort(sort: SortParams) -> Tuple[str, bool]:
+    """Return (sort column name, descending), defaulting to created_at."""
+    sort_by = sort.sort_by if sort.sort_by in _RESOURCE_SORT_COLUMNS else None
+    # sort_by is prevented from being unknown by the router, but double-guard
+    return sort_by or "created_at", sort.sort_dir != "asc"
+
+
+def encode_resource_cursor(resource: db_models.Resource, sort: SortParams) -> str:
+    """
+    Encode the position after ``resource`` as an opaque keyset cursor.
+
+    The cursor carries the sort column, direction, the resource's sort value
+    and its id, so a cursor is only accepted for the ordering it came from.
+
+    Args:
+        resource: Last resource on the current page
+        sort: Sort parameters of the listing
+
+    Returns:
+        URL-safe cursor string
+    """
+    sort_by, descending = _resolve_sort(sort)
+    value = getattr(resource, sort_by)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = {
+        "s": sort_by,
+        "d": "desc" if descending else "asc",
+        "v": value,
+        "id": str(resource.id),
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_resource_cursor(cursor: str, sort: SortParams) -> Tuple[Any, uuid.UUID]:
+    """
+    Decode a cursor from encode_resource_cursor (pure helper).
+
+    Args:
+        cursor: Cursor string
+        sort: Sort parameters of the listing
+
+    Returns:
+        Tuple of (sort value, resource id)
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another sort
+    """
+    sort_by, descending = _resolve_sort(sort)
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if payload["s"] != sort_by or payload["d"] != ("desc" if descending else "asc"):
+            raise ValueError("cursor was issued for a different sort order")
+        value = payload["v"]
+        if sort_by in _DATETIME_SORT_COLUMNS:
+            value = datetime.fromisoformat(value)
+        return value, uuid.UUID(payload["id"])
+    except (ValueError, KeyError, TypeError) as exc:
+        raise ValueError(f"Invalid cursor: {exc}") from exc
+
+
+def _estimate_row_count(db: Session, query) -> Optional[int]:
+    """
+    Query planner's row estimate for ``query`` (PostgreSQL only).
+
+    EXPLAIN does not run the query, so this costs one planning pass
+    regardless of table size.
+
+    Returns:
+        Estimated row count, or None when no estimate is available
+    """
+    bind = db.get_bind()
+    if bind.dialect.name != "postgresql":
+        return None
+
+    compiled = query.compile(dialect=bind.dialect)
+    plan = (
+        db.connection()
+        .exec_driver_sql("EXPLAIN (FORMAT JSON) " + str(compiled), compiled.params)
+        .scalar()
+    )
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    try:
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _count_resources(db: Session, query, exact: bool) -> Tuple[int, bool]:
+    """
+    Count rows matching ``query`` (pure query helper).
+
+    Uses the planner estimate unless ``exact`` is set or the estimate is
+    small enough (RESOURCE_LIST_EXACT_COUNT_BELOW) for COUNT(*) to be cheap.
+
+    Returns:
+        Tuple of (count, is_exact)
+    """
+    if not exact:
+        from ...config.settings import get_settings
+
+        estimate = _estimate_row_count(db, query)
+        if (
+            estimate is not None
+            and estimate >= get_settings().RESOURCE_LIST_EXACT_COUNT_BELOW
+        ):
+            return estimate, False
+
+    count_query = select(func.count()).select_from(query.subquery())
+    return db.execute(count_query).scalar(), True
+
+
 def list_resources(
     db: Session,
     filters: ResourceFilters,
     page: PageParams,
     sort: SortParams,
-) -> Tuple[List[db_models.Resource], int]:
+    cursor: Optional[str] = None,
+    exact_count: bool = False,
+) -> ResourcePage:
     """
     Query for list of resources with filtering, pagination, and sorting (pure query).
 
+    Pages by keyset over (sort column, id): with a cursor from a previous
+    page, the query seeks past that row instead of skipping ``offset`` rows,
+    so every page costs the same. ``page.offset`` is only used without a
+    cursor. The total is an estimate on large PostgreSQL result sets unless
+    ``exact_count`` is set.
+
     Args:
         db: Database session
         filters: Resource filters
         page: Pagination parameters
         sort: Sort parameters
+        cursor: Cursor returned as next_cursor by the previous page
+        exact_count: Always run an exact COUNT(*)
 
     Returns:
-        Tuple of (resources, total_count)
-    """
-    try:
-        Base.metadata.create_all(bind=db.get_bind())
-    except Exception:
-        pass
+        ResourcePage with items, total and next_cursor
 
+    Raises:
+        ValueError: If the cursor is invalid
+    """
     query = select(db_models.Resource)
     query = _apply_resource_filters(query, filters)
 
     # Total before pagination
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = db.execute(count_query)
-    total = total_result.scalar()
-
-    # Sorting guard
-    sort_map = {
-        "created_at": db_models.Resource.created_at,
-        "updated_at": db_models.Resource.updated_at,
-        "quality_score": db_models.Resource.quality_score,
-        "title": db_models.Resource.title,
-    }
-    sort_col = sort_map.get(sort.sort_by)
-    if sort_col is None:
-        # This should be prevented by Pydantic Literal, but double-guard anyway
-        sort_col = db_models.Resource.created_at
-
-    order = asc(sort_col) if sort.sort_dir == "asc" else desc(sort_col)
-    query = query.order_by(order)
-
-    query = query.offset(page.offset).limit(page.limit)
-    result = db.execute(query)
-    items = result.scalars().all()
-    return items, total
+    total, total_exact = _count_resources(db, query, exact_count)
+
+    sort_by, descending = _resolve_sort(sort)
+    sort_col = _RESOURCE_SORT_COLUMNS[sort_by]
+    id_col = db_models.Resource.id
+    sort_key = sort_col
+    # SQLite keeps datetimes as text whose precision depends on the writer
+    # ('...:28' from CURRENT_TIMESTAMP, '...:28.000000' from a bound value),
+    # so text comparison puts a row before its own cursor. Compare and order
+    # by julianday instead, consistently for both.
+    normalize = (
+        sort_by in _DATETIME_SORT_COLUMNS and db.get_bind().dialect.name == "sqlite"
+    )
+    if normalize:
+        sort_key = func.julianday(sort_col)
+
+    if cursor:
+        value, last_id = decode_resource_cursor(cursor, sort)
+        bound = literal(value, sort_col.type)
+        if normalize:
+            bound = func.julianday(bound)
+        position = tuple_(sort_key, id_col)
+        after = tuple_(bound, literal(last_id, id_col.type))
+        query = query.filter(position < after if descending else position > after)
+    elif page.offset:
+        query = query.offset(page.offset)
+
+    order = desc if descending else asc
+    query = query.order_by(order(sort_key), order(id_col))
+
+    # One extra row tells whether there is a next page
+    items = list(db.execute(query.limit(page.limit + 1)).scalars().all())
+    next_cursor = None
+    if len(items) > page.limit:
+        items = items[: page.limit]
+        next_cursor = encode_resource_cursor(items[-1], sort)
+    return ResourcePage(
+        items=items, total=total, total_exact=total_exact, next_cursor=next_cursor
+    )
 
 
 def _apply_resource_updates(
@@ -1395,8 +1563,18 @@ def delete_resource(db: Session, resource_id) -> None:
 
     logger.info(f"Deleting resource {resource_id}")
 
-    # Store resource info for event
-    resource_info = {"resource_id": str(resource.id), "title": resource.title}
+    # Store resource info for event; memberships are cascade-deleted with the
+    # resource, so record which collections need their embeddings updated
+    collection_ids = db.execute(
+        select(db_models.CollectionResource.collection_id).filter(
+            db_models.CollectionResource.resource_id == resource.id
+        )
+    ).scalars()
+    resource_info = {
+        "resource_id": str(resource.id),
+        "title": resource.title,
+        "collection_ids": [str(collection_id) for collection_id in collection_ids],
+    }
 
     # Modifier: Delete associated annotations
     _delete_resource_annotations(db, resource_id)
@@ -2,15 +2,20 @@
 Search Event Handlers
 
 Emits search-related events for analytics and monitoring.
+Subscribes to resource.chunked events for synthetic question generation.
 
 Events Emitted:
 - search.executed: When a search query is executed
+
+Events Subscribed:
+- resource.chunked: Stores embedded synthetic questions if enabled
 """
 
 import logging
 from typing import Dict, Any
 
-from app.shared.event_bus import event_bus, EventPriority
+from app.shared.event_bus import event_bus, EventPriority, Event
+from app.config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -56,11 +61,67 @@ def emit_search_executed(
         logger.error(f"Error emitting search.executed event: {str(e)}", exc_info=True)
 
 
+def handle_resource_chunked(event: Event) -> None:
+    """
+    Handle resource.chunked event to store synthetic questions.
+
+    If SYNTHETIC_QUESTIONS_ENABLED is set, generates questions for every chunk
+    of the resource and stores them with their embeddings, which is what
+    question_search matches queries against.
+
+    Args:
+        event: Event object containing resource chunking data
+    """
+    settings = get_settings()
+
+    if not settings.SYNTHETIC_QUESTIONS_ENABLED:
+        logger.debug("Synthetic questions disabled, skipping resource.chunked handler")
+        return
+
+    resource_id = event.data.get("resource_id")
+    if not resource_id:
+        logger.warning(
+            "resource.chunked event missing resource_id, skipping question generation"
+        )
+        return
+
+    try:
+        # Import here to avoid circular dependencies
+        from app.shared.database import SessionLocal
+        from app.shared.embeddings import EmbeddingService
+        from app.modules.search.service import SyntheticQuestionService
+        from app.database.models import DocumentChunk
+
+        db = SessionLocal()
+
+        try:
+            chunks = (
+                db.query(DocumentChunk)
+                .filter(DocumentChunk.resource_id == resource_id)
+                .all()
+            )
+            service = SyntheticQuestionService(
+                db, embedding_service=EmbeddingService(db)
+            )
+            service.questions_per_chunk = settings.QUESTIONS_PER_CHUNK
+            service.store_questions(chunks)
+        finally:
+            db.close()
+
+    except Exception as e:
+        logger.error(
+            f"Error storing synthetic questions for resource {resource_id}: {str(e)}",
+            exc_info=True,
+        )
+
+
 def register_handlers():
     """
     Register all event handlers for the search module.
 
     This function should be called during application startup.
-    Currently, search module only emits events and doesn't subscribe to any.
     """
+    # Subscribe to resource.chunked for synthetic question generation
+    event_bus.subscribe("resource.chunked", handle_resource_chunked)
+
     logger.info("Search module event handlers registered")
@@ -2,9 +2,16 @@
 Reranking Service
 
 Provides ColBERT-style reranking functionality using cross-encoder models.
+
+Scores are cached per (model, query, resource id, resource updated_at) in
+app/shared/cache.py, so repeated queries and later result pages only score
+pairs not seen before. Inference runs on pairs sorted by length so each
+batch pads to similar lengths, and RERANK_BACKEND selects the plain torch
+model, a dynamically int8-quantized copy, or an ONNX Runtime export (CPU).
 """
 
-from typing import List, Tuple, Optional
+from functools import partial
+from typing import Any, List, Tuple, Optional
 from sqlalchemy.orm import Session
 import logging
 
@@ -19,6 +26,75 @@ except ImportError:
     CROSSENCODER_AVAILABLE = False
     logger.info("sentence-transformers CrossEncoder not available, reranking disabled")
 
+RERANK_BACKENDS = ("torch", "int8", "onnx")
+
+
+class OnnxCrossEncoder:
+    """CrossEncoder-compatible ``predict`` over an ONNX Runtime export.
+
+    Requires the optional ``optimum[onnxruntime]`` extra; the model is
+    exported from the Hugging Face checkpoint on first load.
+    """
+
+    def __init__(self, model_name: str, max_length: int = 512):
+        from optimum.onnxruntime import ORTModelForSequenceClassification
+        from transformers import AutoTokenizer
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.model = ORTModelForSequenceClassification.from_pretrained(
+            model_name, export=True
+        )
+        self.max_length = max_length
+
+    def predict(self, pairs: List[List[str]], batch_size: int = 32) -> List[float]:
+        scores: List[float] = []
+        for start in range(0, len(pairs), batch_size):
+            batch = pairs[start : start + batch_size]
+            features = self.tokenizer(
+                [query for query, _ in batch],
+                [doc for _, doc in batch],
+                padding=True,
+                truncation=True,
+                max_length=self.max_length,
+                return_tensors="np",
+            )
+            logits = self.model(**features).logits
+            scores.extend(float(row[0]) for row in logits)
+        return scores
+
+
+def predict_by_length(model: Any, pairs: List[List[str]], batch_size: int) -> List[float]:
+    """Score pairs in length-sorted batches and return scores in input order.
+
+    Similar-length pairs share a batch, so padding (and wasted compute)
+    stays small compared with batching in candidate order.
+    """
+    order = sorted(range(len(pairs)), key=lambda i: len(pairs[i][0]) + len(pairs[i][1]))
+    sorted_scores = model.predict([pairs[i] for i in order], batch_size=batch_size)
+    scores = [0.0] * len(pairs)
+    for position, index in enumerate(order):
+        scores[index] = float(sorted_scores[position])
+    return scores
+
+
+def _create_cross_encoder(model_name: str, backend: str) -> Any:
+    """Load the cross-encoder for the registry; runs once per process."""
+    logger.info(f"Loading cross-encoder model: {model_name} ({backend})")
+    if backend == "onnx":
+        model = OnnxCrossEncoder(model_name, max_length=512)
+    elif backend == "int8":
+        import torch
+
+        # Dynamic quantization only runs on CPU
+        model = CrossEncoder(model_name, max_length=512, device="cpu")
+        model.model = torch.quantization.quantize_dynamic(
+            model.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    else:
+        model = CrossEncoder(model_name, max_length=512)
+    logger.info("Cross-encoder model loaded successfully")
+    return model
+
 
 class RerankingService:
     """
@@ -29,7 +105,10 @@ class RerankingService:
     """
 
     def __init__(
-        self, db: Session, model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+        self,
+        db: Session,
+        model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2",
+        backend: Optional[str] = None,
     ):
         """
         Initialize reranking service.
@@ -37,12 +116,27 @@ class RerankingService:
         Args:
             db: Database session
             model_name: Cross-encoder model name
+            backend: "torch", "int8" or "onnx" (default: RERANK_BACKEND)
         """
+        from ...config.settings import get_settings
+
+        settings = get_settings()
         self.db = db
         self.model_name = model_name
+        self.backend = backend or settings.RERANK_BACKEND
+        if self.backend not in RERANK_BACKENDS:
+            raise ValueError(
+                f"Unknown rerank backend '{self.backend}', expected one of {RERANK_BACKENDS}"
+            )
+        self.batch_size = settings.RERANK_BATCH_SIZE
         self.model: Optional["CrossEncoder"] = None
         self._model_loaded = False
 
+    @property
+    def cache_key(self) -> str:
+        """Model identity used in rerank score cache keys."""
+        return f"{self.model_name}@{self.backend}"
+
     def _load_model(self):
         """Lazy load the cross-encoder model on first use."""
         if self._model_loaded:
@@ -50,17 +144,25 @@ class RerankingService:
 
         self._model_loaded = True
 
-        if not CROSSENCODER_AVAILABLE:
+        if not CROSSENCODER_AVAILABLE and self.backend != "onnx":
             logger.warning("CrossEncoder not available, reranking will be skipped")
             return
 
-        try:
-            logger.info(f"Loading cross-encoder model: {self.model_name}")
-            self.model = CrossEncoder(self.model_name, max_length=512)
-            logger.info("Cross-encoder model loaded successfully")
-        except Exception as e:
-            logger.warning(f"Could not load reranking model: {e}")
-            self.model = None
+        from ...shared.model_registry import get_model_registry
+
+        # One cross-encoder per process and backend, shared by every
+        # RerankingService
+        key = f"cross-encoder:{self.model_name}"
+        if self.backend != "torch":
+            key = f"{key}@{self.backend}"
+        self.model = get_model_registry().get(
+            key, partial(_create_cross_encoder, self.model_name, self.backend)
+        )
+
+    def warmup(self) -> bool:
+        """Load the cross-encoder ahead of the first request."""
+        self._load_model()
+        return self.model is not None
 
     def rerank(
         self, query: str, candidates: List[Tuple[str, float]], top_k: int = None
@@ -79,50 +181,68 @@ class RerankingService:
         if not candidates:
             return []
 
-        # Lazy load model on first use
-        self._load_model()
-
         try:
-            if self.model is None:
-                # No reranking model available, return candidates as-is
-                logger.debug(
-                    "Reranking model not available, returning original ranking"
-                )
-                return candidates[:top_k] if top_k else candidates
-
-            # Fetch resource content for reranking
+            # Fetch only the columns the pairs and cache keys need
             from ...database.models import Resource
+            from ...shared.cache import get_rerank_score_cache
 
             resource_ids = [rid for rid, _ in candidates]
-            resources = (
-                self.db.query(Resource).filter(Resource.id.in_(resource_ids)).all()
+            rows = (
+                self.db.query(
+                    Resource.id,
+                    Resource.title,
+                    Resource.description,
+                    Resource.updated_at,
+                )
+                .filter(Resource.id.in_(resource_ids))
+                .all()
             )
-
-            id_to_resource = {str(r.id): r for r in resources}
-
-            # Prepare query-document pairs
-            pairs = []
-            valid_ids = []
-
-            for resource_id, _ in candidates:
-                resource = id_to_resource.get(resource_id)
-                if resource:
-                    # Use title + description for reranking (faster than full content)
-                    doc_text = f"{resource.title or ''} {resource.description or ''}"
-                    pairs.append([query, doc_text])
-                    valid_ids.append(resource_id)
-
-            if not pairs:
+            id_to_row = {str(row.id): row for row in rows}
+            valid = [
+                (rid, id_to_row[rid]) for rid, _ in candidates if rid in id_to_row
+            ]
+            if not valid:
                 return candidates[:top_k] if top_k else candidates
 
-            # Compute relevance scores using cross-encoder
-            scores = self.model.predict(pairs)
-
-            # Combine IDs with new scores and sort by score descending
-            reranked = sorted(zip(valid_ids, scores), key=lambda x: x[1], reverse=True)
+            # Reuse scores from earlier identical queries / pages
+            cache = get_rerank_score_cache()
+            scores = cache.get_many(
+                self.cache_key, query, [(rid, row.updated_at) for rid, row in valid]
+            )
+            missing = [(rid, row) for rid, row in valid if rid not in scores]
+
+            if missing:
+                # Lazy load model only when something needs scoring
+                self._load_model()
+                if self.model is None:
+                    # No reranking model available, return candidates as-is
+                    logger.debug(
+                        "Reranking model not available, returning original ranking"
+                    )
+                    return candidates[:top_k] if top_k else candidates
+
+                # Use title + description for reranking (faster than full content)
+                pairs = [
+                    [query, f"{row.title or ''} {row.description or ''}"]
+                    for _, row in missing
+                ]
+                fresh = predict_by_length(self.model, pairs, self.batch_size)
+                cache.set_many(
+                    self.cache_key,
+                    query,
+                    [
+                        (rid, row.updated_at, score)
+                        for (rid, row), score in zip(missing, fresh)
+                    ],
+                )
+                scores.update((rid, score) for (rid, _), score in zip(missing, fresh))
 
-            # Convert scores to float for consistency
-            reranked = [(rid, float(score)) for rid, score in reranked]
+            # Sort by score descending
+            reranked = sorted(
+                ((rid, float(scores[rid])) for rid, _ in valid),
+                key=lambda x: x[1],
+                reverse=True,
+            )
 
             return reranked[:top_k] if top_k else reranked
 
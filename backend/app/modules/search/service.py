@@ -20,7 +20,9 @@ Architecture:
 from __future__ import annotations
 
 import heapq
+import json
 import logging
+import uuid
 from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy.orm import Session
@@ -33,6 +35,15 @@ from .sparse_embeddings import SparseEmbeddingService
 
 logger = logging.getLogger(__name__)
 
+# Ids per IN (...) clause; keeps well under SQLite's bound-parameter limit
+_IN_BATCH_SIZE = 500
+
+
+def _batched(ids: List[Any], size: int = _IN_BATCH_SIZE):
+    """Yield successive slices of ``ids`` for chunked IN queries."""
+    for start in range(0, len(ids), size):
+        yield ids[start : start + size]
+
 
 def _get_advanced_search_service():
     """Lazy import to avoid circular dependency."""
@@ -276,7 +287,18 @@ class SearchService:
 
     def _embed_query(self, query: str) -> Optional[List[float]]:
         """Edge-or-local query embedding, factored out so other strategies
-        can reuse it without duplicating the CLOUD-mode branching."""
+        can reuse it without duplicating the CLOUD-mode branching.
+
+        Repeated queries are served from the two-tier query embedding cache."""
+        from ...config.settings import get_settings
+        from ...shared.cache import get_query_embedding_cache
+
+        return get_query_embedding_cache().get_or_compute(
+            "dense", query, get_settings().EMBEDDING_MODEL_NAME, self._encode_query
+        )
+
+    def _encode_query(self, query: str) -> Optional[List[float]]:
+        """Run the encoder for a query (edge /embed in CLOUD mode, else local)."""
         import os
 
         if os.getenv("MODE") == "CLOUD":
@@ -431,6 +453,7 @@ class SearchService:
         """
         from ...database.models import GraphEntity, GraphRelationship, DocumentChunk
         from sqlalchemy import or_
+        from sqlalchemy.orm import joinedload
 
         logger.info(
             f"GraphRAG search: query='{query}', top_k={top_k}, max_hops={max_hops}"
@@ -443,76 +466,104 @@ class SearchService:
             logger.warning("No entities extracted from query")
             return []
 
-        # Find matching entities in knowledge graph
-        matching_entities = []
-        for entity_name in query_entities:
-            entities = (
-                self.db.query(GraphEntity)
-                .filter(GraphEntity.name.ilike(f"%{entity_name}%"))
-                .all()
+        # Find matching entities in knowledge graph with one query
+        # (served by the pg_trgm index on graph_entities.name on PostgreSQL)
+        matching_ids = [
+            entity_id
+            for (entity_id,) in self.db.query(GraphEntity.id)
+            .filter(
+                or_(
+                    *(
+                        GraphEntity.name.ilike(f"%{entity_name}%")
+                        for entity_name in dict.fromkeys(query_entities)
+                    )
+                )
             )
-            matching_entities.extend(entities)
+            .all()
+        ]
 
-        if not matching_entities:
+        if not matching_ids:
             logger.warning("No matching entities found in knowledge graph")
             return []
 
-        # Traverse relationships to find related entities
+        # Traverse relationships to find related entities, one query per hop
         related_entities = self._traverse_graph(
-            matching_entities, max_hops=max_hops, relation_types=relation_types
+            matching_ids, max_hops=max_hops, relation_types=relation_types
         )
+        paths = dict(related_entities)
 
-        # Retrieve chunks associated with entities via provenance
-        chunk_scores = {}
-        chunk_paths = {}
-        chunk_entities = {}
-
-        for entity, path in related_entities:
-            # Find relationships that have this entity and provenance
-            relationships = (
+        # Provenance relationships of every reached entity, fetched in bulk
+        # and grouped per entity
+        entity_relationships: Dict[Any, List[Any]] = {}
+        for ids in _batched(list(paths)):
+            for rel in (
                 self.db.query(GraphRelationship)
                 .filter(
                     or_(
-                        GraphRelationship.source_entity_id == entity.id,
-                        GraphRelationship.target_entity_id == entity.id,
+                        GraphRelationship.source_entity_id.in_(ids),
+                        GraphRelationship.target_entity_id.in_(ids),
                     ),
                     GraphRelationship.provenance_chunk_id.isnot(None),
                 )
                 .all()
-            )
+            ):
+                for entity_id in {rel.source_entity_id, rel.target_entity_id}:
+                    if entity_id in paths:
+                        entity_relationships.setdefault(entity_id, []).append(rel)
+
+        # Score chunks, visiting entities in traversal order
+        chunk_scores = {}
+        chunk_paths = {}
+
+        for entity_id, path in related_entities:
+            for rel in entity_relationships.get(entity_id, ()):
+                chunk_id = rel.provenance_chunk_id
+
+                # Compute score combining graph weight and path length
+                graph_score = rel.weight / (len(path) + 1)  # Decay by path length
 
-            for rel in relationships:
-                if rel.provenance_chunk_id:
-                    chunk_id = rel.provenance_chunk_id
+                if chunk_id not in chunk_scores or graph_score > chunk_scores[chunk_id]:
+                    chunk_scores[chunk_id] = graph_score
+                    chunk_paths[chunk_id] = path
 
-                    # Compute score combining graph weight and path length
-                    path_length = len(path)
-                    graph_score = rel.weight / (path_length + 1)  # Decay by path length
+        # Top-K via heap (O(N log K)), then one chunk+resource query and one
+        # entity query for every node on the selected paths
+        top = heapq.nlargest(top_k, chunk_scores.items(), key=lambda x: x[1])
+        if not top:
+            logger.info("GraphRAG search returned 0 results")
+            return []
 
-                    if (
-                        chunk_id not in chunk_scores
-                        or graph_score > chunk_scores[chunk_id]
-                    ):
-                        chunk_scores[chunk_id] = graph_score
-                        chunk_paths[chunk_id] = path
-                        chunk_entities[chunk_id] = entity
+        chunks = {
+            chunk.id: chunk
+            for chunk in self.db.query(DocumentChunk)
+            .options(joinedload(DocumentChunk.resource))
+            .filter(DocumentChunk.id.in_([chunk_id for chunk_id, _ in top]))
+            .all()
+        }
+        path_entity_ids = {
+            entity_id
+            for chunk_id, _ in top
+            for rel in chunk_paths[chunk_id]
+            for entity_id in (rel.source_entity_id, rel.target_entity_id)
+        }
+        entities = {}
+        for ids in _batched(list(path_entity_ids)):
+            for entity in (
+                self.db.query(GraphEntity.id, GraphEntity.name, GraphEntity.type)
+                .filter(GraphEntity.id.in_(ids))
+                .all()
+            ):
+                entities[entity.id] = entity
 
-        # Retrieve chunks; top-K via heap (O(N log K)).
         results = []
-        for chunk_id, score in heapq.nlargest(
-            top_k, chunk_scores.items(), key=lambda x: x[1]
-        ):
-            chunk = (
-                self.db.query(DocumentChunk)
-                .filter(DocumentChunk.id == chunk_id)
-                .first()
-            )
+        for chunk_id, score in top:
+            chunk = chunks.get(chunk_id)
             if chunk and chunk.resource:
                 # Convert graph path to serializable format
                 graph_path = []
-                for rel in chunk_paths[chunk_id]:
-                    source_entity = rel.source_entity
-                    target_entity = rel.target_entity
+                path = chunk_paths[chunk_id]
+                for rel in path:
+                    source_entity = entities[rel.source_entity_id]
                     graph_path.append(
                         {
                             "entity_id": str(source_entity.id),
@@ -522,17 +573,18 @@ class SearchService:
                             "weight": rel.weight,
                         }
                     )
+                if path:
                     # Add target entity as final node
-                    if rel == chunk_paths[chunk_id][-1]:
-                        graph_path.append(
-                            {
-                                "entity_id": str(target_entity.id),
-                                "entity_name": target_entity.name,
-                                "entity_type": target_entity.type,
-                                "relation_type": None,
-                                "weight": None,
-                            }
-                        )
+                    target_entity = entities[path[-1].target_entity_id]
+                    graph_path.append(
+                        {
+                            "entity_id": str(target_entity.id),
+                            "entity_name": target_entity.name,
+                            "entity_type": target_entity.type,
+                            "relation_type": None,
+                            "weight": None,
+                        }
+                    )
 
                 results.append(
                     {
@@ -586,67 +638,74 @@ class SearchService:
         return entities if entities else [query]  # Fallback to full query
 
     def _traverse_graph(
-        self, start_entities: List, max_hops: int = 2, relation_types: List[str] = None
+        self, start_ids: List, max_hops: int = 2, relation_types: List[str] = None
     ) -> List[Tuple]:
         """
-        Traverse knowledge graph from starting entities.
+        Traverse knowledge graph breadth-first from starting entities.
+
+        Each hop expands the whole frontier with one relationship query
+        (chunked IN lists), so the query count grows with max_hops rather
+        than with the number of reached entities.
 
         Args:
-            start_entities: List of GraphEntity objects to start from
+            start_ids: GraphEntity ids to start from
             max_hops: Maximum traversal depth
             relation_types: Filter by specific relation types
 
         Returns:
-            List of (entity, path) tuples where path is list of relationships
+            List of (entity_id, path) tuples in breadth-first order, where
+            path is the list of relationships from a start entity
         """
         from ...database.models import GraphRelationship
         from sqlalchemy import or_
 
-        visited = set()
-        results = []
-        queue = [(entity, []) for entity in start_entities]
-
-        while queue:
-            current_entity, path = queue.pop(0)
-
-            if current_entity.id in visited:
-                continue
-
-            visited.add(current_entity.id)
-            results.append((current_entity, path))
-
-            # Stop if we've reached max hops
-            if len(path) >= max_hops:
-                continue
-
-            # Find outgoing relationships
-            query = self.db.query(GraphRelationship).filter(
-                or_(
-                    GraphRelationship.source_entity_id == current_entity.id,
-                    GraphRelationship.target_entity_id == current_entity.id,
+        paths: Dict[Any, List[Any]] = {}
+        frontier = []
+        for entity_id in start_ids:
+            if entity_id not in paths:
+                paths[entity_id] = []
+                frontier.append(entity_id)
+
+        for _ in range(max_hops):
+            if not frontier:
+                break
+
+            # Relationships touching any frontier entity, grouped per entity
+            incident: Dict[Any, List[Any]] = {}
+            for ids in _batched(frontier):
+                query = self.db.query(GraphRelationship).filter(
+                    or_(
+                        GraphRelationship.source_entity_id.in_(ids),
+                        GraphRelationship.target_entity_id.in_(ids),
+                    )
                 )
-            )
 
-            # Filter by relation types if specified
-            if relation_types:
-                query = query.filter(
-                    GraphRelationship.relation_type.in_(relation_types)
-                )
+                # Filter by relation types if specified
+                if relation_types:
+                    query = query.filter(
+                        GraphRelationship.relation_type.in_(relation_types)
+                    )
 
-            relationships = query.all()
+                for rel in query.all():
+                    incident.setdefault(rel.source_entity_id, []).append(rel)
+                    if rel.target_entity_id != rel.source_entity_id:
+                        incident.setdefault(rel.target_entity_id, []).append(rel)
 
-            for rel in relationships:
-                # Get the other entity
-                if rel.source_entity_id == current_entity.id:
-                    next_entity = rel.target_entity
-                else:
-                    next_entity = rel.source_entity
+            next_frontier = []
+            for entity_id in frontier:
+                for rel in incident.get(entity_id, ()):
+                    # Get the other entity
+                    if rel.source_entity_id == entity_id:
+                        next_id = rel.target_entity_id
+                    else:
+                        next_id = rel.source_entity_id
 
-                if next_entity.id not in visited:
-                    new_path = path + [rel]
-                    queue.append((next_entity, new_path))
+                    if next_id not in paths:
+                        paths[next_id] = paths[entity_id] + [rel]
+                        next_frontier.append(next_id)
+            frontier = next_frontier
 
-        return results
+        return list(paths.items())
 
     # ========================================================================
     # Contradiction Discovery
@@ -784,41 +843,75 @@ class SearchService:
             - matching_question: SyntheticQuestion object
             - score: Question similarity score
         """
+        from sqlalchemy.orm import joinedload
+
         from ...database.models import SyntheticQuestion
-        from ...shared.embeddings import EmbeddingService
+        from ...shared.vector_index import get_question_vector_index
 
         logger.info(
             f"Question search: query='{query}', top_k={top_k}, hybrid={hybrid_mode}"
         )
 
         # Generate query embedding
-        embedding_service = EmbeddingService(self.db)
-        query_embedding = embedding_service.generate_embedding(query)
+        query_embedding = self._embed_query(query)
 
         if not query_embedding:
             logger.error("Failed to generate query embedding")
             return []
 
-        # Retrieve all synthetic questions
-        # In production, this would use vector similarity search
-        all_questions = self.db.query(SyntheticQuestion).all()
-
-        # Compute similarity scores
-        question_scores = []
-        for question in all_questions:
-            # In production, question embeddings would be stored and indexed
-            # For now, use text similarity
-            score = self._compute_similarity_score(query, question.question_text)
-            question_scores.append((question, score))
+        # Nearest questions from the in-process question index in one call.
+        # Over-fetch so chunk de-duplication can still fill top_k.
+        index = get_question_vector_index().ensure_ready(self.db)
+        top_questions = index.search(query_embedding, k=top_k * 3)
 
+        # Questions whose embedding is still pending fall back to text
+        # similarity (only those rows, and only the columns needed).
         # Top-K via size-K min-heap: O(N log K) instead of O(N log N).
-        top_questions = heapq.nlargest(top_k, question_scores, key=lambda x: x[1])
+        pending = self.db.query(
+            SyntheticQuestion.id, SyntheticQuestion.question_text
+        ).filter(SyntheticQuestion.embedding.is_(None))
+        text_questions = heapq.nlargest(
+            top_k * 3,
+            (
+                (str(question_id), self._compute_similarity_score(query, text))
+                for question_id, text in pending
+            ),
+            key=lambda x: x[1],
+        )
+
+        # Keyword overlap and cosine similarity are not on the same scale, so
+        # the two rankings are fused by rank; each result keeps its own score
+        if text_questions:
+            scores = dict(text_questions)
+            scores.update(top_questions)
+            fused = ReciprocalRankFusionService().fuse(
+                [top_questions, text_questions], top_k=top_k * 3
+            )
+            top_questions = [
+                (question_id, scores[question_id]) for question_id, _ in fused
+            ]
+
+        # One query for the winning questions and their chunks
+        questions = {}
+        ids = [question_id for question_id, _ in top_questions]
+        if ids:
+            questions = {
+                str(question.id): question
+                for question in self.db.query(SyntheticQuestion)
+                .options(joinedload(SyntheticQuestion.chunk))
+                .filter(SyntheticQuestion.id.in_(ids))
+                .all()
+            }
 
         # Retrieve chunks associated with matching questions
         results = []
         seen_chunks = set()
 
-        for question, score in top_questions:
+        for question_id, score in top_questions:
+            question = questions.get(question_id)
+            # Skip questions deleted since the index was synced
+            if question is None or question.chunk is None:
+                continue
             chunk = question.chunk
 
             # Deduplicate chunks
@@ -830,6 +923,8 @@ class SearchService:
             results.append(
                 {"chunk": chunk, "matching_question": question, "score": score}
             )
+            if len(results) >= top_k:
+                break
 
         # If hybrid mode, combine with semantic search
         if hybrid_mode:
@@ -1029,7 +1124,7 @@ class SyntheticQuestionService:
 
         Returns:
             List of question dictionaries with 'question_text', 'chunk_id',
-            and optionally 'embedding_id' keys
+            and optionally 'embedding_id' and 'embedding' keys
         """
         if not self.enabled:
             logger.debug("Synthetic question generation is disabled")
@@ -1055,6 +1150,11 @@ class SyntheticQuestionService:
                     embedding = self.embedding_service.generate_embedding(question_text)
                     if embedding:
                         question_dict["embedding_id"] = self._store_embedding(embedding)
+                        # Persisted on SyntheticQuestion.embedding (JSON
+                        # text) and picked up by the question vector index
+                        question_dict["embedding"] = json.dumps(
+                            [float(x) for x in embedding]
+                        )
                 except Exception as e:
                     logger.error(f"Error generating embedding for question: {e}")
 
@@ -1062,6 +1162,94 @@ class SyntheticQuestionService:
 
         return questions_with_embeddings
 
+    def store_questions(self, chunks: List[Any]) -> List[Any]:
+        """
+        Generate and persist synthetic questions for chunks.
+
+        Question embeddings are stored on SyntheticQuestion.embedding, where
+        the question vector index picks them up. Questions whose embedding
+        could not be generated are stored without one and filled in later by
+        backfill_embeddings.
+
+        Args:
+            chunks: DocumentChunk instances to generate questions for
+
+        Returns:
+            List of created SyntheticQuestion instances
+        """
+        from ...database.models import SyntheticQuestion
+
+        questions = [
+            SyntheticQuestion(
+                chunk_id=chunk.id,
+                question_text=question["question_text"],
+                embedding_id=(
+                    uuid.UUID(question["embedding_id"])
+                    if question.get("embedding_id")
+                    else None
+                ),
+                embedding=question.get("embedding"),
+            )
+            for chunk in chunks
+            for question in self.generate_questions(chunk.content, chunk.id)
+        ]
+        if questions:
+            self.db.add_all(questions)
+            self.db.commit()
+
+        logger.info(
+            f"Stored {len(questions)} synthetic questions for {len(chunks)} chunks"
+        )
+        return questions
+
+    def backfill_embeddings(self, batch_size: int = 100) -> int:
+        """
+        Embed stored questions that have no embedding yet.
+
+        Walks pending questions in id order, one batch per commit, so rows
+        whose embedding fails are skipped rather than retried forever.
+
+        Args:
+            batch_size: Questions embedded per batch
+
+        Returns:
+            Number of questions embedded
+        """
+        from ...database.models import SyntheticQuestion
+
+        if not self.embedding_service:
+            logger.warning("No embedding service; skipping question backfill")
+            return 0
+
+        embedded = 0
+        last_id = None
+        while True:
+            query = self.db.query(SyntheticQuestion).filter(
+                SyntheticQuestion.embedding.is_(None)
+            )
+            if last_id is not None:
+                query = query.filter(SyntheticQuestion.id > last_id)
+            batch = query.order_by(SyntheticQuestion.id).limit(batch_size).all()
+            if not batch:
+                break
+            last_id = batch[-1].id
+
+            for question in batch:
+                try:
+                    embedding = self.embedding_service.generate_embedding(
+                        question.question_text
+                    )
+                except Exception as e:
+                    logger.error(f"Error embedding question {question.id}: {e}")
+                    continue
+                if embedding:
+                    question.embedding = json.dumps([float(x) for x in embedding])
+                    embedded += 1
+            self.db.commit()
+
+        logger.info(f"Backfilled embeddings for {embedded} synthetic questions")
+        return embedded
+
     def _generate_questions_heuristic(self, text: str) -> List[str]:
         """
         Generate questions using heuristic rules.
@@ -160,6 +160,7 @@ class SparseEmbeddingService:
             batch_size: Batch size for processing
         """
         from ...database.models import Resource
+        from ...shared.sparse_index import get_resource_sparse_index
         import json
         from datetime import datetime
 
@@ -193,6 +194,11 @@ class SparseEmbeddingService:
 
                 # Commit batch
                 self.db.commit()
+
+                # Keep the sparse inverted index in step with the new vectors
+                sparse_index = get_resource_sparse_index()
+                for resource in batch:
+                    sparse_index.upsert(str(resource.id), resource.sparse_embedding)
                 logger.info(f"Processed {min(i + batch_size, total)}/{total} resources")
 
             logger.info(f"Completed sparse embedding generation for {total} resources")
@@ -7,6 +7,7 @@ Uses naver/splade-cocondenser-ensembledistil for production-grade sparse embeddi
 This replaces the TF-IDF fallback with actual transformer-based sparse representations.
 """
 
+from functools import partial
 from typing import Dict, List, Optional, Any
 from sqlalchemy.orm import Session
 import logging
@@ -27,6 +28,28 @@ if not SPLADE_AVAILABLE:
     )
 
 
+def _create_splade_model(model_name: str, device: str):
+    """Load (tokenizer, model) for the registry; runs once per process."""
+    global torch, AutoModelForMaskedLM, AutoTokenizer, np
+
+    import numpy as np
+    import torch
+    from transformers import AutoModelForMaskedLM, AutoTokenizer
+
+    logger.info(f"Loading SPLADE model: {model_name}")
+
+    # Load tokenizer
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+
+    # Load model
+    model = AutoModelForMaskedLM.from_pretrained(model_name)
+    model.to(device)
+    model.eval()  # Set to evaluation mode
+
+    logger.info(f"SPLADE model loaded successfully on {device}")
+    return tokenizer, model
+
+
 class RealSPLADEService:
     """
     Real SPLADE sparse embedding service using transformer models.
@@ -64,7 +87,7 @@ class RealSPLADEService:
         self._model_loaded = False
         
     def _load_model(self):
-        """Lazy load SPLADE model on first use."""
+        """Lazy load SPLADE model on first use (shared across instances)."""
         if self._model_loaded:
             return
             
@@ -76,30 +99,20 @@ class RealSPLADEService:
                 "Install with: pip install transformers torch"
             )
             return
-            
-        try:
-            global torch, AutoModelForMaskedLM, AutoTokenizer, np
 
-            import numpy as np
-            import torch
-            from transformers import AutoModelForMaskedLM, AutoTokenizer
+        from ...shared.model_registry import get_model_registry
 
-            logger.info(f"Loading SPLADE model: {self.model_name}")
-            
-            # Load tokenizer
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-            
-            # Load model
-            self.model = AutoModelForMaskedLM.from_pretrained(self.model_name)
-            self.model.to(self.device)
-            self.model.eval()  # Set to evaluation mode
-            
-            logger.info(f"SPLADE model loaded successfully on {self.device}")
-            
-        except Exception as e:
-            logger.error(f"Failed to load SPLADE model: {e}")
-            self.model = None
-            self.tokenizer = None
+        loaded = get_model_registry().get(
+            f"splade:{self.model_name}@{self.device}",
+            partial(_create_splade_model, self.model_name, self.device),
+        )
+        if loaded is not None:
+            self.tokenizer, self.model = loaded
+
+    def warmup(self) -> bool:
+        """Load the SPLADE model ahead of the first request."""
+        self._load_model()
+        return self.model is not None and self.tokenizer is not None
     
     def generate_embedding(self, text: str, max_length: int = 256) -> Dict[int, float]:
         """
@@ -251,6 +264,7 @@ class RealSPLADEService:
             force_update: If True, regenerate even if embedding exists
         """
         from ...database.models import Resource
+        from ...shared.sparse_index import get_resource_sparse_index
         from sqlalchemy import or_
         
         try:
@@ -289,6 +303,11 @@ class RealSPLADEService:
                 
                 # Commit batch
                 self.db.commit()
+
+                # Keep the sparse inverted index in step with the new vectors
+                sparse_index = get_resource_sparse_index()
+                for resource in batch:
+                    sparse_index.upsert(str(resource.id), resource.sparse_embedding)
                 logger.info(
                     f"Processed {min(i + batch_size, total)}/{total} resources"
                 )
@@ -11,7 +11,7 @@ Key Features:
 - Optimized with HNSW and IVFFlat indexes
 """
 
-from typing import List, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 import logging
@@ -73,6 +73,13 @@ class RealVectorSearchService:
         else:
             raise ValueError(f"Unknown distance metric: {distance_metric}")
         
+        # Unfiltered cosine queries are served by the in-process ANN index
+        # once it has been built (see app/shared/vector_index.py)
+        if distance_metric == "cosine" and not filters:
+            ann_results = self._ann_dense_search(query_embedding, top_k)
+            if ann_results is not None:
+                return ann_results
+
         embedding_str = f"[{','.join(map(str, query_embedding))}]"
 
         where_conditions = ["embedding IS NOT NULL"]
@@ -109,6 +116,64 @@ class RealVectorSearchService:
         
         return [(row[0], float(row[1])) for row in rows]
     
+    def _ann_dense_search(
+        self, query_embedding: List[float], top_k: int
+    ) -> Optional[List[Tuple[str, float]]]:
+        """
+        Query the process-wide resource ANN index.
+
+        Args:
+            query_embedding: Query embedding vector
+            top_k: Number of results to return
+
+        Returns:
+            List of (resource_id, cosine_distance) tuples, or None when the
+            index is unavailable and the caller should fall back to pgvector
+        """
+        try:
+            from app.shared.vector_index import get_resource_vector_index
+        except ImportError:
+            return None
+
+        resource_index = get_resource_vector_index()
+        if not resource_index.index.is_built:
+            return None
+
+        index = resource_index.ensure_ready(self.db)
+        results = index.search(query_embedding, k=top_k)
+        logger.info(f"Dense vector search served {len(results)} results from ANN index")
+        return [(resource_id, 1.0 - similarity) for resource_id, similarity in results]
+
+    def _inverted_sparse_search(
+        self, query_sparse_embedding: Dict[int, float], top_k: int
+    ) -> Optional[List[Tuple[str, float]]]:
+        """
+        Query the process-wide sparse inverted index.
+
+        Uses min-overlap scoring to match the SQL formula below.
+
+        Args:
+            query_sparse_embedding: Query sparse embedding {token_id: weight}
+            top_k: Number of results to return
+
+        Returns:
+            List of (resource_id, score) tuples, or None when the index is
+            unavailable and the caller should fall back to SQL
+        """
+        try:
+            from app.shared.sparse_index import get_resource_sparse_index
+        except ImportError:
+            return None
+
+        sparse_index = get_resource_sparse_index()
+        if not sparse_index.index.is_built:
+            return None
+
+        index = sparse_index.ensure_ready(self.db)
+        results = index.search(query_sparse_embedding, k=top_k, scoring="min")
+        logger.info(f"Sparse vector search served {len(results)} results from inverted index")
+        return results
+
     def sparse_vector_search(
         self,
         query_sparse_embedding: Dict[int, float],
@@ -132,6 +197,13 @@ class RealVectorSearchService:
             logger.warning("Empty query sparse embedding")
             return []
 
+        # Unfiltered queries are served by the in-process inverted index
+        # once it has been built (see app/shared/sparse_index.py)
+        if not filters:
+            index_results = self._inverted_sparse_search(query_sparse_embedding, top_k)
+            if index_results is not None:
+                return index_results
+
         query_sparse_json = json.dumps(query_sparse_embedding)
 
         params: Dict[str, Any] = {
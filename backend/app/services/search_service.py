@@ -5,21 +5,51 @@ Legacy service for backward compatibility.
 Provides basic search functionality.
 """
 
-from typing import Any, Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
 import os
+import threading
 import time
-import json
-import numpy as np
 import httpx
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
 from sqlalchemy import text, or_
 
 from ..database.models import Resource
 from ..modules.search.rrf import ReciprocalRankFusionService
 from ..modules.search.reranking import RerankingService
 from ..modules.search.sparse_embeddings import SparseEmbeddingService
+from ..shared.cache import get_query_embedding_cache
 from ..shared.embeddings import EmbeddingService
+from ..shared.sparse_index import get_resource_sparse_index
+from ..shared.vector_index import get_resource_vector_index
+
+logger = logging.getLogger(__name__)
+
+# Thread pool shared by the retrieval legs of all hybrid searches, and one
+# slot per worker. A leg abandoned at its deadline keeps its worker (and DB
+# session) until it returns, so legs are only submitted while a slot is free
+# instead of queueing behind abandoned ones.
+_leg_executor: Optional[ThreadPoolExecutor] = None
+_leg_slots: Optional[threading.BoundedSemaphore] = None
+_leg_executor_lock = threading.Lock()
+
+
+def _get_leg_executor(
+    max_workers: int,
+) -> Tuple[ThreadPoolExecutor, threading.BoundedSemaphore]:
+    """Return the process-wide thread pool for search legs and its slots."""
+    global _leg_executor, _leg_slots
+    if _leg_executor is None:
+        with _leg_executor_lock:
+            if _leg_executor is None:
+                _leg_slots = threading.BoundedSemaphore(max_workers)
+                _leg_executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="search-leg"
+                )
+    return _leg_executor, _leg_slots
 
 
 class AdvancedSearchService:
@@ -72,7 +102,8 @@ class AdvancedSearchService:
         Execute three-way hybrid search combining FTS5, dense vectors, and sparse vectors.
 
         This method implements state-of-the-art search by:
-        1. Executing three retrieval methods in parallel (FTS5, dense, sparse)
+        1. Executing three retrieval methods in parallel (FTS5, dense, sparse),
+           each on its own session with its own deadline
         2. Merging results using Reciprocal Rank Fusion (RRF)
         3. Applying query-adaptive weighting based on query characteristics
         4. Optionally reranking top results using ColBERT cross-encoder
@@ -90,6 +121,7 @@ class AdvancedSearchService:
             - facets: Facet aggregations (None for now)
             - snippets: Dict mapping resource_id to highlighted snippet
             - metadata: Dict with latency_ms, method_contributions, weights_used
+              and timing (per-leg start/end offsets show how the legs overlap)
         """
         start_time = time.time()
 
@@ -97,34 +129,28 @@ class AdvancedSearchService:
         limit = query.limit if hasattr(query, "limit") else 20
         offset = query.offset if hasattr(query, "offset") else 0
 
-        def _safe_search(fn, *args, **kwargs):
-            """Run a search method; rollback if it aborts the transaction."""
-            t0 = time.time()
-            try:
-                result = fn(*args, **kwargs)
-            except Exception:
-                result = []
-            # Restore clean transaction state if the sub-search left it aborted
-            try:
-                db.rollback()
-            except Exception:
-                pass
-            return result, (time.time() - t0) * 1000
-
-        # Step 1: Execute FTS5 search (100 candidates)
-        fts_results, fts_time = _safe_search(
-            AdvancedSearchService._execute_fts_search, db, query_text, limit=100
-        )
-
-        # Step 2: Execute dense vector search (100 candidates)
-        dense_results, dense_time = _safe_search(
-            AdvancedSearchService._execute_dense_search, db, query_text, limit=100
+        # Steps 1-3: Execute FTS5, dense and sparse searches (100 candidates each)
+        legs = AdvancedSearchService._run_retrieval_legs(
+            db,
+            query_text,
+            [
+                ("fts5", AdvancedSearchService._execute_fts_search),
+                ("dense", AdvancedSearchService._execute_dense_search),
+                ("sparse", AdvancedSearchService._execute_sparse_search),
+            ],
+            limit=100,
         )
-
-        # Step 3: Execute sparse vector search (100 candidates)
-        sparse_results, sparse_time = _safe_search(
-            AdvancedSearchService._execute_sparse_search, db, query_text, limit=100
+        fts_results, fts_time = legs["fts5"]["results"], legs["fts5"]["elapsed_ms"]
+        dense_results, dense_time = legs["dense"]["results"], legs["dense"]["elapsed_ms"]
+        sparse_results, sparse_time = (
+            legs["sparse"]["results"],
+            legs["sparse"]["elapsed_ms"],
         )
+        retrieval_time = max(leg["end_ms"] for leg in legs.values())
+        leg_timing = {
+            name: {key: value for key, value in leg.items() if key != "results"}
+            for name, leg in legs.items()
+        }
 
         # Step 4: Apply query-adaptive weighting
         if adaptive_weighting:
@@ -166,8 +192,10 @@ class AdvancedSearchService:
                     "fts5_ms": fts_time,
                     "dense_ms": dense_time,
                     "sparse_ms": sparse_time,
+                    "retrieval_ms": retrieval_time,
                     "rrf_ms": rrf_time,
                     "rerank_ms": rerank_time,
+                    "legs": leg_timing,
                 },
             }
             return [], 0, None, {}, metadata
@@ -207,13 +235,143 @@ class AdvancedSearchService:
                 "fts5_ms": fts_time,
                 "dense_ms": dense_time,
                 "sparse_ms": sparse_time,
+                "retrieval_ms": retrieval_time,
                 "rrf_ms": rrf_time,
                 "rerank_ms": rerank_time,
+                "legs": leg_timing,
             },
         }
 
         return ordered_resources, total, None, snippets, metadata
 
+    @staticmethod
+    def _run_retrieval_legs(
+        db: Session,
+        query_text: str,
+        legs: List[Tuple[str, Callable[..., List[Tuple[str, float]]]]],
+        limit: int = 100,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run retrieval legs concurrently, each with its own session and deadline.
+
+        Each leg opens a session on the caller's engine and runs on the shared
+        leg thread pool. A leg that fails or misses SEARCH_LEG_TIMEOUT_MS
+        contributes no results, so one slow retriever degrades the result set
+        instead of adding its latency to the request. On PostgreSQL the leg's
+        statements also carry the remaining deadline as statement_timeout, so
+        the server cancels abandoned queries. When every pool worker is busy
+        the leg is skipped rather than queued.
+
+        Legs run sequentially on the caller's session when SEARCH_PARALLEL_LEGS
+        is off or the engine shares a single connection (StaticPool /
+        SingletonThreadPool, e.g. in-memory SQLite), where concurrent use of
+        that connection would be unsafe.
+
+        Args:
+            db: Caller's database session
+            query_text: Search query text
+            legs: List of (leg_name, search_fn) pairs; search_fn(db, query, limit=...)
+            limit: Candidates requested from each leg
+
+        Returns:
+            Dict mapping leg name to a dict with results, elapsed_ms, start_ms,
+            end_ms (offsets from the start of retrieval), timed_out and error
+        """
+        from ..config.settings import get_settings
+
+        settings = get_settings()
+        timeout_s = settings.SEARCH_LEG_TIMEOUT_MS / 1000.0
+        origin = time.perf_counter()
+
+        def _offset_ms(t: float) -> float:
+            return (t - origin) * 1000
+
+        def _run(fn, session: Session) -> Dict[str, Any]:
+            t0 = time.perf_counter()
+            error = None
+            try:
+                results = fn(session, query_text, limit=limit)
+            except Exception as e:
+                results, error = [], str(e)
+            t1 = time.perf_counter()
+            return {
+                "results": results,
+                "elapsed_ms": (t1 - t0) * 1000,
+                "start_ms": _offset_ms(t0),
+                "end_ms": _offset_ms(t1),
+                "timed_out": False,
+                "error": error,
+            }
+
+        bind = db.get_bind()
+        shared_connection = isinstance(
+            getattr(bind, "pool", None), (StaticPool, SingletonThreadPool)
+        )
+
+        if not settings.SEARCH_PARALLEL_LEGS or shared_connection:
+            outcomes = {}
+            for name, fn in legs:
+                outcomes[name] = _run(fn, db)
+                # Restore clean transaction state if the leg left it aborted
+                try:
+                    db.rollback()
+                except Exception:
+                    pass
+            return outcomes
+
+        def _run_isolated(fn) -> Dict[str, Any]:
+            session = Session(bind=bind)
+            try:
+                if bind.dialect.name == "postgresql":
+                    remaining_ms = timeout_s * 1000 - _offset_ms(time.perf_counter())
+                    session.execute(
+                        text(f"SET LOCAL statement_timeout = {max(1, int(remaining_ms))}")
+                    )
+                return _run(fn, session)
+            finally:
+                session.close()
+                slots.release()
+
+        executor, slots = _get_leg_executor(settings.SEARCH_LEG_WORKERS)
+        futures = {}
+        outcomes = {}
+        for name, fn in legs:
+            if not slots.acquire(blocking=False):
+                now = _offset_ms(time.perf_counter())
+                outcomes[name] = {
+                    "results": [],
+                    "elapsed_ms": 0.0,
+                    "start_ms": now,
+                    "end_ms": now,
+                    "timed_out": False,
+                    "error": "search leg pool saturated",
+                }
+                logger.warning(f"Search leg '{name}' skipped: all leg workers busy")
+                continue
+            futures[name] = executor.submit(_run_isolated, fn)
+
+        for name, future in futures.items():
+            remaining = max(0.0, timeout_s - (time.perf_counter() - origin))
+            try:
+                outcomes[name] = future.result(timeout=remaining)
+            except Exception:
+                # Leg missed its deadline; it finishes in the background,
+                # closes its own session and frees its slot
+                future.cancel()
+                now = _offset_ms(time.perf_counter())
+                outcomes[name] = {
+                    "results": [],
+                    "elapsed_ms": now,
+                    "start_ms": 0.0,
+                    "end_ms": now,
+                    "timed_out": True,
+                    "error": None,
+                }
+                logger.warning(
+                    f"Search leg '{name}' exceeded {settings.SEARCH_LEG_TIMEOUT_MS}ms deadline"
+                )
+        return outcomes
+
     @staticmethod
     def fts_search(
         db: Session, query: str, filters: Any, limit: int = 100, offset: int = 0
@@ -434,72 +592,41 @@ class AdvancedSearchService:
             List of (resource_id, similarity_score) tuples
         """
         try:
-            # Generate query embedding — delegate to edge worker via Tailscale Funnel in CLOUD mode
-            if os.getenv("MODE") == "CLOUD":
-                edge_url = os.getenv("EDGE_EMBEDDING_URL", "").rstrip("/")
-                if not edge_url:
-                    raise HTTPException(status_code=503, detail="EDGE_EMBEDDING_URL not configured")
-                try:
-                    resp = httpx.post(
-                        f"{edge_url}/embed",
-                        json={"text": query},
-                        timeout=5.0,
-                    )
-                    resp.raise_for_status()
-                    query_embedding = resp.json()["embedding"]
-                except Exception as exc:
-                    raise HTTPException(
-                        status_code=503,
-                        detail=f"embedding service unreachable: {exc}",
-                    )
-            else:
-                embedding_service = EmbeddingService(db)
-                query_embedding = embedding_service.generate_embedding(query)
-
-            if not query_embedding:
-                return []
+            def _encode(text: str) -> List[float]:
+                # Generate query embedding — delegate to edge worker via Tailscale Funnel in CLOUD mode
+                if os.getenv("MODE") == "CLOUD":
+                    edge_url = os.getenv("EDGE_EMBEDDING_URL", "").rstrip("/")
+                    if not edge_url:
+                        raise HTTPException(status_code=503, detail="EDGE_EMBEDDING_URL not configured")
+                    try:
+                        resp = httpx.post(
+                            f"{edge_url}/embed",
+                            json={"text": text},
+                            timeout=5.0,
+                        )
+                        resp.raise_for_status()
+                        return resp.json()["embedding"]
+                    except Exception as exc:
+                        raise HTTPException(
+                            status_code=503,
+                            detail=f"embedding service unreachable: {exc}",
+                        )
+                return EmbeddingService(db).generate_embedding(text)
 
-            # Fetch all resources with embeddings
-            resources = db.query(Resource).filter(Resource.embedding.isnot(None)).all()
+            from ..config.settings import get_settings
 
-            if not resources:
-                return []
-
-            # Compute cosine similarity
-            query_vec = np.array(query_embedding)
-            query_norm = np.linalg.norm(query_vec)
+            # Repeated queries are served from the query embedding cache
+            query_embedding = get_query_embedding_cache().get_or_compute(
+                "dense", query, get_settings().EMBEDDING_MODEL_NAME, _encode
+            )
 
-            if query_norm == 0:
+            if not query_embedding:
                 return []
 
-            similarities = []
-            for resource in resources:
-                try:
-                    resource_embedding = resource.embedding
-                    if isinstance(resource_embedding, str):
-                        resource_embedding = json.loads(resource_embedding)
-
-                    if not resource_embedding:
-                        continue
-
-                    resource_vec = np.array(resource_embedding)
-                    resource_norm = np.linalg.norm(resource_vec)
-
-                    if resource_norm == 0:
-                        continue
-
-                    # Cosine similarity
-                    similarity = np.dot(query_vec, resource_vec) / (
-                        query_norm * resource_norm
-                    )
-                    similarities.append((str(resource.id), float(similarity)))
-
-                except Exception:
-                    continue
-
-            # Sort by similarity descending and return top N
-            similarities.sort(key=lambda x: x[1], reverse=True)
-            return similarities[:limit]
+            # Query the process-wide ANN index (built lazily from
+            # resources.embedding and refreshed incrementally)
+            index = get_resource_vector_index().ensure_ready(db)
+            return index.search(query_embedding, k=limit)
 
         except HTTPException:
             raise
@@ -522,45 +649,19 @@ class AdvancedSearchService:
             List of (resource_id, score) tuples
         """
         try:
-            # Use sparse embedding service
+            # Use sparse embedding service (through the query embedding cache)
             sparse_service = SparseEmbeddingService(db)
-            query_sparse = sparse_service.generate_embedding(query)
-
-            if not query_sparse:
-                return []
-
-            # Fetch all resources with sparse embeddings
-            # Note: sparse_embedding may be JSONB (not TEXT), so avoid != "" comparison
-            resources = (
-                db.query(Resource)
-                .filter(Resource.sparse_embedding.isnot(None))
-                .all()
+            query_sparse = get_query_embedding_cache().get_or_compute(
+                "sparse", query, sparse_service.model_name, sparse_service.generate_embedding
             )
 
-            if not resources:
+            if not query_sparse:
                 return []
 
-            # Compute sparse similarity scores
-            scores = []
-            for resource in resources:
-                try:
-                    resource_sparse = json.loads(resource.sparse_embedding)
-
-                    # Compute dot product (sparse vectors are already normalized)
-                    score = 0.0
-                    for token_id, weight in query_sparse.items():
-                        if str(token_id) in resource_sparse:
-                            score += weight * resource_sparse[str(token_id)]
-
-                    if score > 0:
-                        scores.append((str(resource.id), float(score)))
-
-                except Exception:
-                    continue
-
-            # Sort by score descending and return top N
-            scores.sort(key=lambda x: x[1], reverse=True)
-            return scores[:limit]
+            # Score only the posting lists of the query tokens (built lazily
+            # from resources.sparse_embedding and refreshed incrementally)
+            index = get_resource_sparse_index().ensure_ready(db)
+            return index.search(query_sparse, k=limit)
 
         except Exception:
             # If sparse search fails, return empty results
@@ -8,19 +8,23 @@ Features:
 - Text summarization using BART-based models
 - Zero-shot classification for automatic tagging
 - Entity extraction (placeholder for future implementation)
-- Lazy loading and caching for optimal performance
+- Lazy loading through the process-wide model registry (one copy per model)
 - Graceful fallback when AI dependencies are unavailable
 - Thread-safe model loading and inference
 
 Related files:
 - app/shared/embeddings.py: Embedding generation
+- app/shared/model_registry.py: Process-wide model loading
 - app/config/settings.py: AI model configuration settings
 """
 
 from __future__ import annotations
 
+from functools import partial
 from typing import List, Optional, Sequence
 
+from .model_registry import get_model_registry
+
 # Lazy import transformers to avoid heavy import at module load in tests
 try:
     from transformers import pipeline  # type: ignore
@@ -43,25 +47,35 @@ class Summarizer:
         self.model_name = model_name
         self.max_length = max_length
         self.min_length = min_length
-        self._pipe = None
+
+    @property
+    def _pipe(self):
+        return get_model_registry().peek(f"pipeline:summarization:{self.model_name}")
 
     def _ensure_loaded(self):
         if self._pipe is None:
             if pipeline is None:  # pragma: no cover
                 # Leave pipe as None; caller will use fallback
                 return
-            try:
-                self._pipe = pipeline("summarization", model=self.model_name)
-            except Exception:
-                # Task may not be available in this transformers version
-                self._pipe = None
+            # Failures (e.g. task missing in this transformers version) leave
+            # the pipe as None for a cooldown instead of reloading per call
+            get_model_registry().get(
+                f"pipeline:summarization:{self.model_name}",
+                partial(pipeline, "summarization", model=self.model_name),
+            )
+
+    def warmup(self) -> bool:
+        """Load the summarization pipeline ahead of the first request."""
+        self._ensure_loaded()
+        return self._pipe is not None
 
     def summarize(self, text: str) -> str:
         text = (text or "").strip()
         if not text:
             return ""
         self._ensure_loaded()
-        if self._pipe is not None:
+        pipe = self._pipe
+        if pipe is not None:
             try:
                 # CRITICAL: Truncate input to prevent CUDA context overflow
                 # Most summarization models have 1024 token limit
@@ -69,7 +83,7 @@ class Summarizer:
                 if len(text) > 3000:
                     text = text[:3000]
                 
-                result = self._pipe(
+                result = pipe(
                     text,
                     max_length=self.max_length,
                     min_length=self.min_length,
@@ -104,7 +118,6 @@ class ZeroShotTagger:
         self.model_name = model_name
         self.multi_label = multi_label
         self.threshold = float(threshold)
-        self._pipe = None
         # Default broad candidate set; AuthorityControl will normalize downstream
         default_candidates = [
             "Artificial Intelligence",
@@ -128,22 +141,36 @@ class ZeroShotTagger:
             list(candidate_labels) if candidate_labels else default_candidates
         )
 
+    @property
+    def _pipe(self):
+        return get_model_registry().peek(
+            f"pipeline:zero-shot-classification:{self.model_name}"
+        )
+
     def _ensure_loaded(self):
         if self._pipe is None:
             if pipeline is None:  # pragma: no cover
                 # Leave pipe as None; caller will use heuristics
                 return
-            try:
-                self._pipe = pipeline("zero-shot-classification", model=self.model_name)
-            except Exception:
-                self._pipe = None
+            get_model_registry().get(
+                f"pipeline:zero-shot-classification:{self.model_name}",
+                partial(
+                    pipeline, "zero-shot-classification", model=self.model_name
+                ),
+            )
+
+    def warmup(self) -> bool:
+        """Load the zero-shot pipeline ahead of the first request."""
+        self._ensure_loaded()
+        return self._pipe is not None
 
     def generate_tags(self, text: str) -> List[str]:
         text = (text or "").strip()
         if not text:
             return []
         self._ensure_loaded()
-        if self._pipe is not None:
+        pipe = self._pipe
+        if pipe is not None:
             try:
                 # CRITICAL: Truncate input to prevent CUDA context overflow
                 # Zero-shot models typically have 1024 token limit
@@ -151,7 +178,7 @@ class ZeroShotTagger:
                 if len(text) > 3000:
                     text = text[:3000]
                 
-                res = self._pipe(
+                res = pipe(
                     text,
                     candidate_labels=self.candidate_labels,
                     multi_label=self.multi_label,
@@ -10,15 +10,36 @@ Features:
 - Hit/miss/invalidation statistics tracking
 - Key-based TTL strategy for different data types
 - JSON serialization for complex objects
+- Two-tier (in-process LRU + Redis) cache for query embeddings
+- Two-tier cache of cross-encoder rerank scores per (query, resource version)
+- Tag sets for dependency-based invalidation (no KEYS scans on the hot path)
+- Optional in-process near-cache in front of Redis, invalidated over pub/sub
+- Optional msgpack serialization (CACHE_SERIALIZER)
+- Stampede protection: single-flight, early refresh and stale-while-revalidate
+  via CacheService.get_or_compute and the @cached decorator
 
 Related files:
 - app/shared/embeddings.py: Uses cache for embedding storage
+- app/services/search_service.py: Dense/sparse query embeddings
+- app/modules/search/service.py: SearchService._embed_query
+- app/modules/search/reranking.py: RerankingService score reuse
 - app/config/settings.py: Redis configuration
 """
 
+import fnmatch
+import functools
+import hashlib
+import inspect
 import json
 import logging
-from typing import Any, Optional
+import math
+import random
+import threading
+import time
+import unicodedata
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 try:
     import os
@@ -29,11 +50,22 @@ except ImportError:
     REDIS_AVAILABLE = False
     redis = None  # type: ignore
 
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    msgpack = None  # type: ignore
+
 from ..config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# First byte of msgpack payloads; never starts a JSON document
+_MSGPACK_MARKER = b"\xc1"
+
 
 class CacheStats:
     """Track cache performance statistics.
@@ -42,12 +74,18 @@ class CacheStats:
         hits: Number of successful cache retrievals
         misses: Number of cache misses
         invalidations: Number of cache invalidations
+        stale: Number of expired values served while another caller refreshed
+        coalesced: Number of misses answered by another caller's computation
+        early_refreshes: Number of values recomputed before they expired
     """
 
     def __init__(self):
         self.hits = 0
         self.misses = 0
         self.invalidations = 0
+        self.stale = 0
+        self.coalesced = 0
+        self.early_refreshes = 0
 
     def record_hit(self):
         """Record a cache hit."""
@@ -57,6 +95,18 @@ class CacheStats:
         """Record a cache miss."""
         self.misses += 1
 
+    def record_stale(self):
+        """Record an expired value served during revalidation."""
+        self.stale += 1
+
+    def record_coalesced(self):
+        """Record a miss served by a concurrent computation."""
+        self.coalesced += 1
+
+    def record_early_refresh(self):
+        """Record a probabilistic refresh before expiry."""
+        self.early_refreshes += 1
+
     def record_invalidation(self, count: int = 1):
         """Record cache invalidation(s).
 
@@ -79,19 +129,191 @@ class CacheStats:
         self.hits = 0
         self.misses = 0
         self.invalidations = 0
+        self.stale = 0
+        self.coalesced = 0
+        self.early_refreshes = 0
+
+
+class NearCache:
+    """Bounded in-process LRU of decoded values in front of Redis.
+
+    Only keys starting with one of ``prefixes`` are held. Entries expire
+    after ``ttl`` seconds even without an invalidation message, which bounds
+    staleness if a pub/sub message is lost. Values are shared between
+    callers and must be treated as read-only.
+
+    Attributes:
+        max_entries: Capacity of the LRU
+        ttl: Maximum age of an entry in seconds
+        prefixes: Key prefixes held in this tier
+        generation: Bumped on every invalidation; a value read from Redis
+            is only stored if no invalidation happened during the read
+        stats: CacheStats for this tier
+    """
+
+    def __init__(self, max_entries: int, ttl: float, prefixes: Iterable[str]):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.prefixes = tuple(prefixes)
+        self.generation = 0
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def accepts(self, key: str) -> bool:
+        """Whether a key is held in this tier."""
+        return key.startswith(self.prefixes)
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Return (found, value) for a key."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.stats.record_hit()
+                    return True, entry[1]
+                del self._entries[key]
+        self.stats.record_miss()
+        return False, None
+
+    def set(self, key: str, value: Any, generation: int) -> None:
+        """Store a value read from Redis at ``generation``."""
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, keys: Iterable[str]) -> int:
+        """Drop keys; returns the number of entries removed."""
+        with self._lock:
+            self.generation += 1
+            removed = [key for key in keys if self._entries.pop(key, None)]
+        self.stats.record_invalidation(len(removed))
+        return len(removed)
+
+    def discard_matching(self, pattern: str) -> int:
+        """Drop keys matching a Redis glob pattern."""
+        with self._lock:
+            self.generation += 1
+            removed = [
+                key for key in self._entries if fnmatch.fnmatchcase(key, pattern)
+            ]
+            for key in removed:
+                del self._entries[key]
+        self.stats.record_invalidation(len(removed))
+        return len(removed)
+
+    def clear(self) -> int:
+        """Drop every entry."""
+        with self._lock:
+            self.generation += 1
+            count = len(self._entries)
+            self._entries.clear()
+        self.stats.record_invalidation(count)
+        return count
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key within a process.
+
+    The first caller for a key runs the function; callers arriving while it
+    runs wait and receive the same result (or exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+
+    def in_flight(self, key: str) -> bool:
+        """Whether a call for the key is running."""
+        return key in self._flights
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Run ``fn`` unless a call for ``key`` is running, then share its result.
+
+        Returns:
+            (result, shared) where shared is True if another caller computed it
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+
+        try:
+            flight.result = fn()
+            return flight.result, False
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
 
 
 class CacheService:
-    """Redis-based caching with TTL and pattern invalidation.
+    """Redis-based caching with TTL, tag and pattern invalidation.
 
     This class provides a high-level interface to Redis for caching
     with automatic TTL selection based on key patterns and statistics tracking.
 
+    Entries written with ``tags`` are registered in one Redis set per tag
+    (e.g. ``resource:<id>``), so ``invalidate_tags`` deletes exactly the
+    dependent keys. ``delete_pattern`` walks the keyspace with SCAN and is
+    only meant for rare, broad invalidations.
+
+    Once ``enable_near_cache`` is called, keys under CACHE_NEAR_PREFIXES are
+    also kept decoded in an in-process NearCache. Every write, delete and
+    invalidation publishes the affected keys on CACHE_INVALIDATION_CHANNEL,
+    and each process with a near-cache drops them when the message arrives.
+
+    ``get_or_compute`` (and the ``cached`` decorator) protect expensive
+    values from stampedes: concurrent misses are coalesced per key within
+    the process and behind a Redis lock across processes, values are
+    recomputed early with a probability that grows towards expiry, and
+    expired values are served for CACHE_STALE_TTL seconds while a single
+    caller recomputes them.
+
     Attributes:
         redis: Redis client instance
         stats: CacheStats instance for tracking performance
+        near: In-process tier, or None until enable_near_cache is called
+        serializer: "json" or "msgpack"
     """
 
+    TAG_PREFIX = "cache_tag"
+    LOCK_PREFIX = "cache_lock"
+    # Delete the lock only if we still own it
+    _RELEASE_LOCK = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then "
+        "return redis.call('del', KEYS[1]) else return 0 end"
+    )
+    # Keys per DEL command when deleting many keys
+    DELETE_BATCH = 500
+
     def __init__(self, redis_client: Optional["redis.Redis"] = None):
         """Initialize cache service.
 
@@ -99,6 +321,28 @@ class CacheService:
             redis_client: Optional Redis client instance. If not provided,
                          creates a new client using settings.
         """
+        config = get_settings()
+        self.near: Optional[NearCache] = None
+        self.tag_ttl = config.CACHE_TAG_TTL
+        self.scan_count = config.CACHE_SCAN_COUNT
+        self.invalidation_channel = config.CACHE_INVALIDATION_CHANNEL
+        self._near_prefixes = (
+            tuple(config.CACHE_NEAR_PREFIXES) if config.CACHE_NEAR_ENABLED else ()
+        )
+        self.serializer = config.CACHE_SERIALIZER
+        if self.serializer == "msgpack" and not MSGPACK_AVAILABLE:
+            logger.warning("msgpack not installed - caching values as JSON")
+            self.serializer = "json"
+        self._binary = None
+        self._origin = uuid.uuid4().hex
+        self._listener: Optional[threading.Thread] = None
+        self._listener_stop = threading.Event()
+        self.stale_ttl = config.CACHE_STALE_TTL
+        self.early_refresh_beta = config.CACHE_EARLY_REFRESH_BETA
+        self.lock_ttl = config.CACHE_LOCK_TTL
+        self.lock_wait = config.CACHE_LOCK_WAIT
+        self._flights = SingleFlight()
+
         if not REDIS_AVAILABLE:
             logger.warning("Redis not available - caching will be disabled")
             self.redis = None
@@ -227,21 +471,37 @@ class CacheService:
     def get(self, key: str) -> Optional[Any]:
         """Get cached value.
 
+        Keys held in the near-cache are served without a Redis round trip
+        until they are invalidated or expire locally.
+
         Args:
             key: Cache key
 
         Returns:
             Cached value if found, None otherwise
         """
+        near = self.near
+        if near is not None and near.accepts(key):
+            found, value = near.get(key)
+            if found:
+                self.stats.record_hit()
+                return value
+            generation = near.generation
+        else:
+            near = None
+
         if not self.redis:
             self.stats.record_miss()
             return None
 
         try:
-            value = self.redis.get(key)
+            value = self._value_client().get(key)
             if value:
                 self.stats.record_hit()
-                return json.loads(value)
+                decoded = self._loads(value)
+                if near is not None:
+                    near.set(key, decoded, generation)
+                return decoded
             self.stats.record_miss()
             return None
         except Exception as e:
@@ -249,21 +509,38 @@ class CacheService:
             self.stats.record_miss()
             return None
 
-    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+    ):
         """Set cached value with TTL.
 
         Args:
             key: Cache key
-            value: Value to cache (will be JSON-serialized)
+            value: Value to cache (serialized with CACHE_SERIALIZER)
             ttl: Time-to-live in seconds. If None, uses get_default_ttl()
+            tags: Tags this entry depends on (e.g. "resource:<id>");
+                invalidate_tags() on any of them deletes the entry
         """
+        if self.near is not None and self.near.accepts(key):
+            self.near.discard([key])
         if not self.redis:
             return
 
         try:
             ttl_seconds = ttl if ttl is not None else self.get_default_ttl(key)
-            serialized_value = json.dumps(value)
-            self.redis.setex(key, ttl_seconds, serialized_value)
+            pipe = self._value_client().pipeline(transaction=False)
+            pipe.setex(key, ttl_seconds, self._dumps(value))
+            for tag in tags or ():
+                tag_key = self.tag_key(tag)
+                pipe.sadd(tag_key, key)
+                # Stale members are harmless; the set only has to outlive them
+                pipe.expire(tag_key, max(ttl_seconds, self.tag_ttl))
+            self._publish(pipe, keys=[key])
+            pipe.execute()
         except Exception as e:
             logger.error(f"Redis set error for key {key}: {e}")
 
@@ -273,11 +550,16 @@ class CacheService:
         Args:
             key: Cache key to delete
         """
+        if self.near is not None and self.near.accepts(key):
+            self.near.discard([key])
         if not self.redis:
             return
 
         try:
-            deleted = self.redis.delete(key)
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.delete(key)
+            self._publish(pipe, keys=[key])
+            deleted = pipe.execute()[0]
             if deleted > 0:
                 self.stats.record_invalidation()
         except Exception as e:
@@ -293,23 +575,251 @@ class CacheService:
         """
         self.delete(key)
 
-    def delete_pattern(self, pattern: str):
+    def tag_key(self, tag: str) -> str:
+        """Redis key of the set holding the keys registered under a tag."""
+        return f"{self.TAG_PREFIX}:{tag}"
+
+    def invalidate_tags(self, *tags: str) -> int:
+        """Delete every key registered under any of the given tags.
+
+        Only the members of the tag sets are touched, so the cost is
+        proportional to the number of dependent keys rather than the
+        size of the keyspace.
+
+        Args:
+            tags: Tags passed to set(), e.g. "resource:<id>"
+
+        Returns:
+            Number of keys deleted
+        """
+        if not tags or not self.redis:
+            return 0
+
+        try:
+            tag_keys = [self.tag_key(tag) for tag in tags]
+            pipe = self.redis.pipeline(transaction=False)
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            members = [list(keys) for keys in pipe.execute()]
+            keys = sorted(set().union(*members))
+            if self.near is not None:
+                self.near.discard(keys)
+            if not keys:
+                return 0
+
+            pipe = self.redis.pipeline(transaction=False)
+            for start in range(0, len(keys), self.DELETE_BATCH):
+                pipe.delete(*keys[start : start + self.DELETE_BATCH])
+            # SREM rather than DEL: keys tagged meanwhile stay registered
+            for tag_key, tagged in zip(tag_keys, members):
+                if tagged:
+                    pipe.srem(tag_key, *tagged)
+            self._publish(pipe, keys=keys)
+            results = pipe.execute()
+            deleted = sum(results[: -(-len(keys) // self.DELETE_BATCH)])
+            self.stats.record_invalidation(deleted)
+            logger.info(f"Deleted {deleted} keys tagged {', '.join(tags)}")
+            return deleted
+        except Exception as e:
+            logger.error(f"Redis invalidate_tags error for tags {tags}: {e}")
+            return 0
+
+    def delete_pattern(self, pattern: str) -> int:
         """Delete all keys matching pattern.
 
+        Walks the keyspace with cursor-based SCAN so Redis is never blocked
+        for the whole keyspace; prefer invalidate_tags() on hot paths.
+
         Args:
             pattern: Redis key pattern (e.g., "search_query:*")
+
+        Returns:
+            Number of keys deleted
         """
+        if self.near is not None:
+            self.near.discard_matching(pattern)
         if not self.redis:
-            return
+            return 0
 
+        deleted = 0
         try:
-            keys = self.redis.keys(pattern)
-            if keys:
-                deleted = self.redis.delete(*keys)
+            batch: List[str] = []
+            for key in self.redis.scan_iter(match=pattern, count=self.scan_count):
+                batch.append(key)
+                if len(batch) >= self.DELETE_BATCH:
+                    deleted += self.redis.delete(*batch)
+                    batch = []
+            if batch:
+                deleted += self.redis.delete(*batch)
+            if self._near_prefixes:
+                self.redis.publish(self.invalidation_channel, self._message(pattern=pattern))
+            if deleted:
                 self.stats.record_invalidation(deleted)
                 logger.info(f"Deleted {deleted} keys matching pattern: {pattern}")
         except Exception as e:
             logger.error(f"Redis delete_pattern error for pattern {pattern}: {e}")
+        return deleted
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+        stale_ttl: Optional[int] = None,
+    ) -> Any:
+        """Return the cached value for a key, computing it at most once.
+
+        - Fresh value: returned, except that a caller is picked with rising
+          probability near expiry to recompute it early (XFetch).
+        - Expired value still within ``stale_ttl``: one caller (holding the
+          in-process flight and the Redis lock) recomputes it; everyone else
+          gets the stale value. If the recomputation fails the stale value
+          is returned.
+        - Missing value: concurrent callers in this process share one
+          computation; callers in other processes wait up to CACHE_LOCK_WAIT
+          for the lock holder's value before computing it themselves.
+
+        Values are stored in an envelope with their logical expiry, so keys
+        written here should only be read through get_or_compute. ``None``
+        results are returned but not cached.
+
+        Args:
+            key: Cache key
+            compute: Function producing the value
+            ttl: Seconds the value is fresh (default: get_default_ttl())
+            tags: Tags passed to set()
+            stale_ttl: Seconds an expired value may still be served
+                (default: CACHE_STALE_TTL)
+
+        Returns:
+            Cached or computed value
+        """
+        ttl_seconds = ttl if ttl is not None else self.get_default_ttl(key)
+        stale_seconds = stale_ttl if stale_ttl is not None else self.stale_ttl
+        tags = list(tags or ())
+
+        def fill():
+            return self._compute_and_store(
+                key, compute, ttl_seconds, stale_seconds, tags
+            )
+
+        entry = self._read_entry(key)
+        if entry is not None:
+            now = time.time()
+            expired = now >= entry["x"]
+            if not expired and not self._refresh_early(entry, now):
+                return entry["v"]
+            # Somebody is already recomputing: serve what we have
+            token = None if self._flights.in_flight(key) else self._acquire_lock(key)
+            if token is None:
+                if expired:
+                    self.stats.record_stale()
+                return entry["v"]
+            if not expired:
+                self.stats.record_early_refresh()
+            try:
+                return self._flights.do(key, fill)[0]
+            except Exception as e:
+                logger.warning(
+                    f"Refreshing cache key {key} failed, serving cached value: {e}"
+                )
+                if expired:
+                    self.stats.record_stale()
+                return entry["v"]
+            finally:
+                self._release_lock(key, token)
+
+        def fill_once():
+            token = self._acquire_lock(key)
+            if token is None:
+                # Another process is computing it; wait for its value
+                entry = self._wait_for_entry(key)
+                if entry is not None:
+                    self.stats.record_coalesced()
+                    return entry["v"]
+            try:
+                return fill()
+            finally:
+                self._release_lock(key, token)
+
+        value, shared = self._flights.do(key, fill_once)
+        if shared:
+            self.stats.record_coalesced()
+        return value
+
+    def _compute_and_store(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: int,
+        stale_ttl: int,
+        tags: List[str],
+    ) -> Any:
+        start = time.time()
+        value = compute()
+        if value is None:
+            return None
+        now = time.time()
+        # v: value, x: logical expiry (epoch seconds), d: compute time
+        entry = {"v": value, "x": now + ttl, "d": round(now - start, 4)}
+        self.set(key, entry, ttl=ttl + stale_ttl, tags=tags)
+        return value
+
+    def _read_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self.get(key)
+        if isinstance(entry, dict) and "v" in entry and "x" in entry:
+            return entry
+        return None
+
+    def _refresh_early(self, entry: Dict[str, Any], now: float) -> bool:
+        """XFetch: refresh before expiry with probability rising towards it."""
+        delta = entry.get("d") or 0.0
+        if delta <= 0 or self.early_refresh_beta <= 0:
+            return False
+        jitter = -math.log(1.0 - random.random())
+        return now + delta * self.early_refresh_beta * jitter >= entry["x"]
+
+    def _acquire_lock(self, key: str) -> Optional[str]:
+        """Take the cross-process recompute lock; returns a token or None."""
+        token = uuid.uuid4().hex
+        if not self.redis:
+            return token
+        try:
+            acquired = self.redis.set(
+                f"{self.LOCK_PREFIX}:{key}",
+                token,
+                nx=True,
+                px=int(self.lock_ttl * 1000),
+            )
+        except Exception as e:
+            logger.error(f"Redis lock error for key {key}: {e}")
+            return token
+        return token if acquired else None
+
+    def _release_lock(self, key: str, token: Optional[str]) -> None:
+        if token is None or not self.redis:
+            return
+        try:
+            self.redis.eval(self._RELEASE_LOCK, 1, f"{self.LOCK_PREFIX}:{key}", token)
+        except Exception as e:
+            # The lock expires after CACHE_LOCK_TTL anyway
+            logger.warning(f"Redis lock release error for key {key}: {e}")
+
+    def _wait_for_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Poll Redis (not the stats-counting get()) for another process's value."""
+        deadline = time.monotonic() + self.lock_wait
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            try:
+                raw = self._value_client().get(key)
+            except Exception:
+                return None
+            if raw:
+                entry = self._loads(raw)
+                if isinstance(entry, dict) and "v" in entry and "x" in entry:
+                    return entry
+        return None
 
     def get_default_ttl(self, key: str) -> int:
         """Get TTL based on key type.
@@ -352,9 +862,599 @@ class CacheService:
         except Exception:
             return False
 
+    def enable_near_cache(self, listen: bool = True) -> bool:
+        """Put an in-process NearCache in front of Redis.
+
+        Args:
+            listen: Start the pub/sub listener that applies invalidations
+                published by other processes
+
+        Returns:
+            True if the near-cache is active
+        """
+        if self.redis is None or not self._near_prefixes:
+            return False
+        if self.near is None:
+            config = get_settings()
+            self.near = NearCache(
+                config.CACHE_NEAR_SIZE, config.CACHE_NEAR_TTL, self._near_prefixes
+            )
+        if listen and self._listener is None:
+            self._listener_stop.clear()
+            self._listener = threading.Thread(
+                target=self._listen, name="cache-invalidation", daemon=True
+            )
+            self._listener.start()
+        logger.info(f"Near-cache enabled for {', '.join(self._near_prefixes)}")
+        return True
+
+    def disable_near_cache(self, timeout: float = 5.0) -> None:
+        """Stop the listener and drop the in-process tier."""
+        listener, self._listener = self._listener, None
+        self._listener_stop.set()
+        if listener is not None:
+            listener.join(timeout)
+        self.near = None
+
+    def _listen(self) -> None:
+        """Apply invalidations published by other processes until stopped."""
+        backoff = 1.0
+        while not self._listener_stop.is_set():
+            pubsub = None
+            try:
+                pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.invalidation_channel)
+                # Anything published while we were not subscribed is lost
+                if self.near is not None:
+                    self.near.clear()
+                backoff = 1.0
+                while not self._listener_stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self._apply_invalidation(message["data"])
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener error: {e}")
+                if self.near is not None:
+                    self.near.clear()
+                self._listener_stop.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+    def _apply_invalidation(self, data: Any) -> None:
+        near = self.near
+        if near is None:
+            return
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring malformed cache invalidation: {data!r}")
+            return
+        if message.get("origin") == self._origin:
+            return
+        if "pattern" in message:
+            near.discard_matching(message["pattern"])
+        else:
+            near.discard(message.get("keys", ()))
+
+    def _message(self, **body: Any) -> str:
+        return json.dumps({"origin": self._origin, **body})
+
+    def _publish(self, pipe, keys: List[str]) -> None:
+        """Queue a near-cache invalidation for keys any process may hold."""
+        held = [key for key in keys if key.startswith(self._near_prefixes)]
+        if held:
+            pipe.publish(self.invalidation_channel, self._message(keys=held))
+
+    def _value_client(self):
+        """Client for value reads/writes (bytes responses for msgpack)."""
+        if self.serializer != "msgpack":
+            return self.redis
+        if self._binary is None:
+            try:
+                pool = self.redis.connection_pool
+                self._binary = redis.Redis(
+                    connection_pool=redis.ConnectionPool(
+                        connection_class=pool.connection_class,
+                        **dict(pool.connection_kwargs, decode_responses=False),
+                    )
+                )
+            except Exception as e:
+                logger.warning(f"Binary Redis client unavailable, using JSON: {e}")
+                self.serializer = "json"
+                return self.redis
+        return self._binary
+
+    def _dumps(self, value: Any) -> Any:
+        if self.serializer == "msgpack":
+            return _MSGPACK_MARKER + msgpack.packb(value, use_bin_type=True)
+        return json.dumps(value)
+
+    @staticmethod
+    def _loads(raw: Any) -> Any:
+        if isinstance(raw, bytes) and raw[:1] == _MSGPACK_MARKER:
+            return msgpack.unpackb(raw[1:], raw=False)
+        return json.loads(raw)
+
 
 # Backward compatibility - maintain the old RedisCache class name
 RedisCache = CacheService
 
 # Global cache instance for backward compatibility
 cache = CacheService()
+
+
+def cached(
+    key: Any,
+    ttl: Optional[int] = None,
+    tags: Any = None,
+    stale_ttl: Optional[int] = None,
+    cache_service: Optional[CacheService] = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Serve a function's result through CacheService.get_or_compute.
+
+    Example:
+        @cached("quality:{resource_id}", ttl=1800, tags=["resource:{resource_id}"])
+        def quality_scores(self, resource_id): ...
+
+    Args:
+        key: Format string over the function's arguments, or a callable
+            taking the same arguments and returning the key
+        ttl: Seconds the result is fresh (default: get_default_ttl())
+        tags: Format strings like ``key``, or a callable returning tags
+        stale_ttl: Seconds an expired result may be served while one caller
+            recomputes it (default: CACHE_STALE_TTL)
+        cache_service: CacheService to use (default: the global cache)
+
+    Returns:
+        Decorator; results must be serializable, None results are not cached
+    """
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(fn)
+
+        def render(template: Any, args: tuple, kwargs: dict) -> Any:
+            if callable(template):
+                return template(*args, **kwargs)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            if isinstance(template, str):
+                return template.format(**bound.arguments)
+            return [tag.format(**bound.arguments) for tag in template]
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            service = cache_service or cache
+            return service.get_or_compute(
+                render(key, args, kwargs),
+                lambda: fn(*args, **kwargs),
+                ttl=ttl,
+                tags=render(tags, args, kwargs) if tags else None,
+                stale_ttl=stale_ttl,
+            )
+
+        return wrapper
+
+    return decorator
+
+
+class QueryEmbeddingCache:
+    """Two-tier cache of dense and sparse query embeddings.
+
+    Lookups try an in-process LRU first, then Redis, and only then call the
+    encoder (local model or edge /embed endpoint). Keys combine the embedding
+    kind, model name, model version and a hash of the normalised query text,
+    so a model change never serves stale vectors; entries of the previous
+    version are purged the first time a new version is seen.
+
+    Attributes:
+        max_entries: Capacity of the in-process LRU tier
+        ttl: Redis TTL in seconds
+        local_stats: CacheStats for the in-process tier
+        remote_stats: CacheStats for the Redis tier
+    """
+
+    KEY_PREFIX = "query_embedding"
+    # Seconds to skip Redis after a connection error
+    REMOTE_BACKOFF = 30.0
+
+    def __init__(
+        self,
+        cache_service: Optional[CacheService] = None,
+        max_entries: Optional[int] = None,
+        ttl: Optional[int] = None,
+        model_version: Optional[str] = None,
+    ):
+        """Initialize query embedding cache.
+
+        Args:
+            cache_service: Redis-backed CacheService for the shared tier
+                (defaults to the global cache instance unless
+                QUERY_EMBEDDING_CACHE_REDIS is off)
+            max_entries: LRU capacity (default: QUERY_EMBEDDING_CACHE_SIZE)
+            ttl: Redis TTL (default: QUERY_EMBEDDING_CACHE_TTL)
+            model_version: Version tag mixed into every key
+                (default: QUERY_EMBEDDING_MODEL_VERSION)
+        """
+        config = get_settings()
+        if cache_service is not None:
+            self.remote = cache_service
+        else:
+            self.remote = cache if config.QUERY_EMBEDDING_CACHE_REDIS else None
+        self.max_entries = (
+            max_entries if max_entries is not None else config.QUERY_EMBEDDING_CACHE_SIZE
+        )
+        self.ttl = ttl if ttl is not None else config.QUERY_EMBEDDING_CACHE_TTL
+        self.model_version = model_version or config.QUERY_EMBEDDING_MODEL_VERSION
+        self.local_stats = CacheStats()
+        self.remote_stats = CacheStats()
+        self._local: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._versions: Dict[str, str] = {}
+        self._remote_disabled_until = 0.0
+        self._flights = SingleFlight()
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Normalise query text for keying (Unicode NFKC, collapsed whitespace)."""
+        return " ".join(unicodedata.normalize("NFKC", text or "").split())
+
+    def make_key(
+        self, kind: str, text: str, model_name: str, model_version: Optional[str] = None
+    ) -> str:
+        """Build the cache key for a query embedding.
+
+        Args:
+            kind: "dense" or "sparse"
+            text: Raw query text
+            model_name: Encoder model name
+            model_version: Optional version override
+
+        Returns:
+            Cache key string
+        """
+        digest = hashlib.sha1(self.normalize(text).encode("utf-8")).hexdigest()
+        version = model_version or self.model_version
+        return f"{self.KEY_PREFIX}:{kind}:{model_name}:{version}:{digest}"
+
+    def get_or_compute(
+        self,
+        kind: str,
+        text: str,
+        model_name: str,
+        compute: Callable[[str], Any],
+        model_version: Optional[str] = None,
+    ) -> Any:
+        """Return the cached embedding for a query, computing it on a miss.
+
+        Empty results (encoder unavailable) are returned but not cached.
+
+        Args:
+            kind: "dense" or "sparse"
+            text: Raw query text
+            model_name: Encoder model name
+            compute: Function producing the embedding from the query text
+            model_version: Optional version override
+
+        Returns:
+            Dense vector (list of floats) or sparse vector (dict)
+        """
+        version = model_version or self.model_version
+        self._check_version(model_name, version)
+        key = self.make_key(kind, text, model_name, version)
+
+        with self._lock:
+            if key in self._local:
+                self._local.move_to_end(key)
+                self.local_stats.record_hit()
+                return self._local[key]
+        self.local_stats.record_miss()
+
+        def load():
+            value = self._remote_get(key, kind)
+            if value is None:
+                value = compute(text)
+                if not value:
+                    return value
+                self._remote_set(key, kind, value)
+            self._local_set(key, value)
+            return value
+
+        # Identical queries arriving together share one encoder call
+        value, shared = self._flights.do(key, load)
+        if shared:
+            self.local_stats.record_coalesced()
+        return value
+
+    def invalidate_model(self, model_name: str) -> None:
+        """Drop every cached query embedding produced by a model."""
+        with self._lock:
+            stale = [key for key in self._local if key.split(":")[2] == model_name]
+            for key in stale:
+                del self._local[key]
+        self.local_stats.record_invalidation(len(stale))
+        if self._remote_available():
+            self.remote.delete_pattern(f"{self.KEY_PREFIX}:*:{model_name}:*")
+        logger.info(f"Invalidated query embedding cache for model {model_name}")
+
+    def clear(self) -> None:
+        """Empty the in-process tier."""
+        with self._lock:
+            count = len(self._local)
+            self._local.clear()
+        self.local_stats.record_invalidation(count)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss statistics for both tiers."""
+        def _tier(stats: CacheStats) -> Dict[str, Any]:
+            return {
+                "hits": stats.hits,
+                "misses": stats.misses,
+                "invalidations": stats.invalidations,
+                "hit_rate": round(stats.hit_rate(), 4),
+            }
+
+        return {
+            "entries": len(self._local),
+            "max_entries": self.max_entries,
+            "coalesced": self.local_stats.coalesced,
+            "local": _tier(self.local_stats),
+            "redis": _tier(self.remote_stats),
+        }
+
+    def _check_version(self, model_name: str, version: str) -> None:
+        """Purge a model's entries when its version changes."""
+        previous = self._versions.get(model_name)
+        if previous == version:
+            return
+        self._versions[model_name] = version
+        if previous is not None:
+            logger.info(
+                f"Query embedding model {model_name} changed version "
+                f"{previous} -> {version}; invalidating cached vectors"
+            )
+            self.invalidate_model(model_name)
+
+    def _local_set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._local[key] = value
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_entries:
+                self._local.popitem(last=False)
+
+    def _remote_available(self) -> bool:
+        return (
+            self.remote is not None
+            and self.remote.redis is not None
+            and time.monotonic() >= self._remote_disabled_until
+        )
+
+    def _remote_get(self, key: str, kind: str) -> Any:
+        if not self._remote_available():
+            return None
+        try:
+            raw = self.remote.redis.get(key)
+        except Exception as e:
+            logger.warning(f"Query embedding cache disabled for {self.REMOTE_BACKOFF}s: {e}")
+            self._remote_disabled_until = time.monotonic() + self.REMOTE_BACKOFF
+            return None
+        if not raw:
+            self.remote_stats.record_miss()
+            return None
+        self.remote_stats.record_hit()
+        value = json.loads(raw)
+        if kind == "sparse":
+            # Stored as pairs so integer token ids survive JSON
+            return {token: weight for token, weight in value}
+        return value
+
+    def _remote_set(self, key: str, kind: str, value: Any) -> None:
+        if not self._remote_available():
+            return
+        payload = list(value.items()) if kind == "sparse" else value
+        try:
+            self.remote.redis.setex(key, self.ttl, json.dumps(payload))
+        except Exception as e:
+            logger.warning(f"Query embedding cache disabled for {self.REMOTE_BACKOFF}s: {e}")
+            self._remote_disabled_until = time.monotonic() + self.REMOTE_BACKOFF
+
+
+_query_embedding_cache: Optional[QueryEmbeddingCache] = None
+_query_embedding_cache_lock = threading.Lock()
+
+
+def get_query_embedding_cache() -> QueryEmbeddingCache:
+    """Return the process-wide query embedding cache (created lazily)."""
+    global _query_embedding_cache
+    if _query_embedding_cache is None:
+        with _query_embedding_cache_lock:
+            if _query_embedding_cache is None:
+                _query_embedding_cache = QueryEmbeddingCache()
+    return _query_embedding_cache
+
+
+def reset_query_embedding_cache() -> None:
+    """Discard the process-wide query embedding cache (used by tests)."""
+    global _query_embedding_cache
+    with _query_embedding_cache_lock:
+        _query_embedding_cache = None
+
+
+class RerankScoreCache:
+    """Two-tier cache of cross-encoder scores for (query, resource) pairs.
+
+    Keys combine the reranker model (and backend), a hash of the normalised
+    query, the resource id and the resource's ``updated_at``, so an edited
+    resource is rescored while identical queries and later result pages
+    reuse earlier scores. The Redis tier is read and written in one round
+    trip per rerank call (MGET / pipelined SETEX).
+
+    Attributes:
+        max_entries: Capacity of the in-process LRU tier
+        ttl: Redis TTL in seconds
+        local_stats: CacheStats for the in-process tier
+        remote_stats: CacheStats for the Redis tier
+    """
+
+    KEY_PREFIX = "rerank"
+    # Seconds to skip Redis after a connection error
+    REMOTE_BACKOFF = 30.0
+
+    def __init__(
+        self,
+        cache_service: Optional[CacheService] = None,
+        max_entries: Optional[int] = None,
+        ttl: Optional[int] = None,
+    ):
+        """Initialize rerank score cache.
+
+        Args:
+            cache_service: Redis-backed CacheService for the shared tier
+                (defaults to the global cache instance unless
+                RERANK_CACHE_REDIS is off)
+            max_entries: LRU capacity (default: RERANK_CACHE_SIZE)
+            ttl: Redis TTL (default: RERANK_CACHE_TTL)
+        """
+        config = get_settings()
+        if cache_service is not None:
+            self.remote = cache_service
+        else:
+            self.remote = cache if config.RERANK_CACHE_REDIS else None
+        self.max_entries = (
+            max_entries if max_entries is not None else config.RERANK_CACHE_SIZE
+        )
+        self.ttl = ttl if ttl is not None else config.RERANK_CACHE_TTL
+        self.local_stats = CacheStats()
+        self.remote_stats = CacheStats()
+        self._local: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._remote_disabled_until = 0.0
+
+    def make_key(self, model_key: str, query: str, resource_id: str, version: Any) -> str:
+        """Build the cache key for one (query, resource version) score."""
+        digest = hashlib.sha1(
+            QueryEmbeddingCache.normalize(query).encode("utf-8")
+        ).hexdigest()
+        stamp = version.isoformat() if hasattr(version, "isoformat") else str(version)
+        return f"{self.KEY_PREFIX}:{model_key}:{digest}:{resource_id}:{stamp}"
+
+    def get_many(
+        self, model_key: str, query: str, items: "list[tuple[str, Any]]"
+    ) -> Dict[str, float]:
+        """Look up scores for (resource_id, updated_at) items.
+
+        Returns:
+            Mapping of resource_id to score for the items found
+        """
+        keys = {rid: self.make_key(model_key, query, rid, version) for rid, version in items}
+        found: Dict[str, float] = {}
+        with self._lock:
+            for rid, key in keys.items():
+                if key in self._local:
+                    self._local.move_to_end(key)
+                    found[rid] = self._local[key]
+        for _ in found:
+            self.local_stats.record_hit()
+        for _ in range(len(keys) - len(found)):
+            self.local_stats.record_miss()
+
+        missing = [rid for rid in keys if rid not in found]
+        if missing and self._remote_available():
+            try:
+                raw = self.remote.redis.mget([keys[rid] for rid in missing])
+            except Exception as e:
+                logger.warning(f"Rerank score cache disabled for {self.REMOTE_BACKOFF}s: {e}")
+                self._remote_disabled_until = time.monotonic() + self.REMOTE_BACKOFF
+                raw = [None] * len(missing)
+            for rid, value in zip(missing, raw):
+                if value is None:
+                    self.remote_stats.record_miss()
+                    continue
+                self.remote_stats.record_hit()
+                found[rid] = float(value)
+                self._local_set(keys[rid], found[rid])
+        return found
+
+    def set_many(
+        self, model_key: str, query: str, items: "list[tuple[str, Any, float]]"
+    ) -> None:
+        """Store (resource_id, updated_at, score) items in both tiers."""
+        entries = [
+            (self.make_key(model_key, query, rid, version), float(score))
+            for rid, version, score in items
+        ]
+        for key, score in entries:
+            self._local_set(key, score)
+        if not entries or not self._remote_available():
+            return
+        try:
+            pipe = self.remote.redis.pipeline(transaction=False)
+            for key, score in entries:
+                pipe.setex(key, self.ttl, repr(score))
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Rerank score cache disabled for {self.REMOTE_BACKOFF}s: {e}")
+            self._remote_disabled_until = time.monotonic() + self.REMOTE_BACKOFF
+
+    def clear(self) -> None:
+        """Empty the in-process tier."""
+        with self._lock:
+            count = len(self._local)
+            self._local.clear()
+        self.local_stats.record_invalidation(count)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss statistics for both tiers."""
+        def _tier(stats: CacheStats) -> Dict[str, Any]:
+            return {
+                "hits": stats.hits,
+                "misses": stats.misses,
+                "invalidations": stats.invalidations,
+                "hit_rate": round(stats.hit_rate(), 4),
+            }
+
+        return {
+            "entries": len(self._local),
+            "max_entries": self.max_entries,
+            "local": _tier(self.local_stats),
+            "redis": _tier(self.remote_stats),
+        }
+
+    def _local_set(self, key: str, value: float) -> None:
+        with self._lock:
+            self._local[key] = value
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_entries:
+                self._local.popitem(last=False)
+
+    def _remote_available(self) -> bool:
+        return (
+            self.remote is not None
+            and self.remote.redis is not None
+            and time.monotonic() >= self._remote_disabled_until
+        )
+
+
+_rerank_score_cache: Optional[RerankScoreCache] = None
+_rerank_score_cache_lock = threading.Lock()
+
+
+def get_rerank_score_cache() -> RerankScoreCache:
+    """Return the process-wide rerank score cache (created lazily)."""
+    global _rerank_score_cache
+    if _rerank_score_cache is None:
+        with _rerank_score_cache_lock:
+            if _rerank_score_cache is None:
+                _rerank_score_cache = RerankScoreCache()
+    return _rerank_score_cache
+
+
+def reset_rerank_score_cache() -> None:
+    """Discard the process-wide rerank score cache (used by tests)."""
+    global _rerank_score_cache
+    with _rerank_score_cache_lock:
+        _rerank_score_cache = None
@@ -22,6 +22,17 @@ logger = logging.getLogger(__name__)
 P = ParamSpec("P")
 T = TypeVar("T")
 
+
+
+class AppSession(OrmSession):
+    """Session class produced by the application's session factories.
+
+    Session-level event listeners (e.g. the graph store's commit hooks)
+    attach to this class instead of to every SQLAlchemy Session in the
+    process.
+    """
+
+
 # Global engine and session factory (initialized by init_database)
 async_engine = None
 AsyncSessionLocal = None
@@ -372,7 +383,10 @@ def init_database(database_url: str | None = None, env: str = "prod") -> None:
 
             # Create async sessionmaker
             AsyncSessionLocal = async_sessionmaker(
-                async_engine, class_=AsyncSession, expire_on_commit=False
+                async_engine,
+                class_=AsyncSession,
+                sync_session_class=AppSession,
+                expire_on_commit=False,
             )
 
             # Create sync engine for background tasks
@@ -380,7 +394,7 @@ def init_database(database_url: str | None = None, env: str = "prod") -> None:
 
             # Create sync sessionmaker
             SessionLocal = sessionmaker(
-                autocommit=False, autoflush=False, bind=sync_engine
+                autocommit=False, autoflush=False, bind=sync_engine, class_=AppSession
             )
 
             # Setup event listeners
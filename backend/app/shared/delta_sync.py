@@ -0,0 +1,154 @@
+"""
+Neo Alexandria 2.0 - Watermark Delta Sync
+
+Shared machinery for the process-wide in-memory structures that mirror
+database columns. They are built lazily from the database and afterwards
+re-read only the rows whose timestamp moved past the last sync watermark,
+throttled to ``VECTOR_INDEX_REFRESH_SECONDS``.
+
+Features:
+- Overlapping delta window (``WATERMARK_OVERLAP``) shared by every mirror
+- ``WatermarkSyncedIndex`` base class with lazy build, throttled refresh
+  and expiry; subclasses only name their columns and how a row is applied
+
+Related files:
+- app/shared/vector_index.py: Dense ANN indexes
+- app/shared/sparse_index.py: Sparse inverted index
+- app/shared/subject_index.py: Subject inverted index
+- app/shared/embedding_store.py, app/shared/graph_store.py: Stores that
+  window their own delta queries with ``delta_window``
+"""
+
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Iterable, Optional, Tuple
+
+# Overlap the delta window so rows committed by transactions that started
+# before the last sync (or share its timestamp) are not missed
+WATERMARK_OVERLAP = timedelta(seconds=5)
+
+
+def delta_window(query, column, watermark):
+    """Restrict ``query`` to rows whose ``column`` is inside the delta window.
+
+    Args:
+        query: SQLAlchemy query
+        column: Timestamp column the watermark tracks
+        watermark: Last synced timestamp (None leaves the query unfiltered)
+
+    Returns:
+        The filtered query
+    """
+    if watermark is None:
+        return query
+    return query.filter(column >= watermark - WATERMARK_OVERLAP)
+
+
+def advance_watermark(current, value):
+    """Return the later of two watermarks, ignoring None."""
+    if value is None:
+        return current
+    if current is None or value > current:
+        return value
+    return current
+
+
+class WatermarkSyncedIndex:
+    """Base for process-wide indexes kept in sync via timestamp deltas.
+
+    Subclasses implement ``_columns`` (id, value columns..., timestamp),
+    ``_build_rows`` (rows passed to ``index.build``) and ``_apply`` (apply
+    one re-read row). ``index`` must provide ``is_built``, ``build`` and
+    ``remove``.
+    """
+
+    def __init__(self, index: Any) -> None:
+        from ..config.settings import get_settings
+
+        self.index = index
+        self.refresh_interval = get_settings().VECTOR_INDEX_REFRESH_SECONDS
+        self._watermark = None
+        self._last_refresh = 0.0
+        self._build_lock = threading.Lock()
+
+    def _columns(self) -> Tuple[Any, ...]:
+        """Return the (id, value columns..., timestamp) columns to mirror."""
+        raise NotImplementedError
+
+    def _build_rows(self, db) -> Iterable[Tuple[Any, ...]]:
+        """Return the rows ``index.build`` is rebuilt from."""
+        raise NotImplementedError
+
+    def _apply(self, item_id: str, *values: Any) -> None:
+        """Apply one row re-read by ``refresh``."""
+        raise NotImplementedError
+
+    def ensure_ready(self, db) -> Any:
+        """Build (or load) the index if needed and apply pending deltas.
+
+        Args:
+            db: Database session
+
+        Returns:
+            The underlying index
+        """
+        if not self.index.is_built:
+            with self._build_lock:
+                if not self.index.is_built and not self.load_persisted():
+                    self.rebuild(db)
+                    return self.index
+        if time.monotonic() - self._last_refresh >= self.refresh_interval:
+            self.refresh(db)
+        return self.index
+
+    def load_persisted(self) -> bool:
+        """Load a persisted snapshot instead of rebuilding (none by default)."""
+        return False
+
+    def rebuild(self, db) -> int:
+        """Rebuild the index from the database.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of items indexed
+        """
+        from sqlalchemy import func
+
+        self._watermark = db.query(func.max(self._columns()[-1])).scalar()
+        count = self.index.build(self._build_rows(db))
+        self._last_refresh = time.monotonic()
+        return count
+
+    def refresh(self, db) -> int:
+        """Apply changes made since the last sync.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of rows re-read from the database
+        """
+        self._last_refresh = time.monotonic()
+        columns = self._columns()
+        updated_col = columns[-1]
+        query = db.query(*columns)
+        if self._watermark is None:
+            query = query.filter(updated_col.isnot(None))
+        else:
+            query = delta_window(query, updated_col, self._watermark)
+        rows = query.all()
+        for item_id, *values, updated_at in rows:
+            self._apply(str(item_id), *values)
+            self._watermark = advance_watermark(self._watermark, updated_at)
+        return len(rows)
+
+    def expire(self) -> None:
+        """Force the next ensure_ready() call to refresh from the database."""
+        self._last_refresh = 0.0
+
+    def remove(self, item_id: str) -> None:
+        """Drop an item from the index."""
+        self.index.remove(str(item_id))
@@ -0,0 +1,812 @@
+"""
+Neo Alexandria 2.0 - Shared Embedding Matrix Store
+
+This module keeps one contiguous, L2-normalised matrix of embeddings per
+entity type (resources, annotations, collections, graph structural
+embeddings) so similarity queries run as a single batched matrix product
+instead of re-parsing JSON and building NumPy arrays row by row.
+
+Features:
+- One float32 (optionally float16) matrix per entity type with an id <-> row map
+- Memory-mapped .npy snapshots under EMBEDDING_STORE_DIR, shared through the
+  OS page cache by every uvicorn/Celery worker on the host
+- In-memory overlay for rows changed since the last snapshot, folded back in
+  by compact()
+- Delta sync from the database via updated_at watermarks
+- Shared top-k kernel (blocked matmul + argpartition) used by every
+  similarity call site
+- Blocked all-pairs similarity join (similarity_join) for graph building
+
+Related files:
+- app/shared/vector_index.py: ANN index built on the same top-k kernel
+- app/modules/annotations/service.py: Semantic annotation search
+- app/modules/collections/service.py: Similar resources/collections
+- app/modules/graph/embeddings.py: Similar nodes by structural embedding
+- app/modules/graph/service.py: Global overview candidate pairs
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from .delta_sync import advance_watermark, delta_window
+
+logger = logging.getLogger(__name__)
+
+# Rows scored per block when scanning a whole matrix (bounds temporaries
+# for float16 snapshots, which are upcast block by block)
+_SCORE_BLOCK_ROWS = 65536
+
+# Scores materialised per tile by similarity_join (16M float32 = 64 MB)
+_JOIN_BLOCK_CELLS = 1 << 24
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalise each row of a matrix (zero rows are left as zeros).
+
+    Args:
+        matrix: 2-D array of vectors
+
+    Returns:
+        float32 array of unit-length rows
+    """
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32, copy=False)
+
+
+def top_k(scores: np.ndarray, k: int, min_score: Optional[float] = None) -> np.ndarray:
+    """Return the indices of the k highest scores, best first.
+
+    Uses argpartition so only the selected k entries are sorted.
+
+    Args:
+        scores: 1-D score array (use -inf to mask entries out)
+        k: Number of indices to return
+        min_score: Optional minimum score (inclusive)
+
+    Returns:
+        Array of indices into ``scores`` sorted by score descending
+    """
+    if k <= 0 or len(scores) == 0:
+        return np.zeros(0, dtype=np.int64)
+    k = min(k, len(scores))
+    part = np.argpartition(-scores, k - 1)[:k]
+    order = part[np.argsort(-scores[part], kind="stable")]
+    keep = np.isfinite(scores[order])
+    if min_score is not None:
+        keep &= scores[order] >= min_score
+    return order[keep]
+
+
+def score_rows(matrix: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """Compute ``matrix @ query`` in float32, block by block.
+
+    Args:
+        matrix: 2-D (possibly memory-mapped, possibly float16) matrix
+        query: Normalised float32 query vector
+
+    Returns:
+        float32 score per row
+    """
+    n = len(matrix)
+    if matrix.dtype == np.float32 and n <= _SCORE_BLOCK_ROWS:
+        return matrix @ query
+    scores = np.empty(n, dtype=np.float32)
+    for start in range(0, n, _SCORE_BLOCK_ROWS):
+        block = np.asarray(matrix[start : start + _SCORE_BLOCK_ROWS], dtype=np.float32)
+        scores[start : start + len(block)] = block @ query
+    return scores
+
+
+def similarity_join(
+    matrix: np.ndarray,
+    threshold: float,
+    k: Optional[int] = None,
+    max_block_cells: int = _JOIN_BLOCK_CELLS,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find all row pairs i < j whose dot product is at least ``threshold``.
+
+    Rows are multiplied against the rows after them in tiles of at most
+    ``max_block_cells`` scores, so memory stays bounded for large matrices
+    and only the upper triangle is computed.
+
+    Args:
+        matrix: L2-normalised rows (see normalize_rows)
+        threshold: Minimum similarity (inclusive)
+        k: Optional cap on the partners kept per row (best first, chosen
+            with argpartition)
+        max_block_cells: Upper bound on the scores held per tile
+
+    Returns:
+        Tuple of (left rows, right rows, similarities) with left < right
+    """
+    matrix = np.asarray(matrix, dtype=np.float32)
+    n = len(matrix)
+    lefts: List[np.ndarray] = []
+    rights: List[np.ndarray] = []
+    values: List[np.ndarray] = []
+    block = max(1, min(n, max_block_cells // max(n, 1)))
+
+    for start in range(0, max(n - 1, 0), block):
+        stop = min(n, start + block)
+        sims = matrix[start:stop] @ matrix[start:].T
+        # Column c is row start + c: mask the diagonal and everything left of it
+        sims[np.tril_indices(stop - start, m=sims.shape[1])] = -np.inf
+        sims[sims < threshold] = -np.inf
+
+        if k is not None and 0 < k < sims.shape[1]:
+            cols = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+            scores = np.take_along_axis(sims, cols, axis=1)
+            rows, slots = np.nonzero(np.isfinite(scores))
+            cols = cols[rows, slots]
+            scores = scores[rows, slots]
+        else:
+            rows, cols = np.nonzero(np.isfinite(sims))
+            scores = sims[rows, cols]
+
+        lefts.append(rows + start)
+        rights.append(cols + start)
+        values.append(scores)
+
+    if not lefts:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, np.zeros(0, dtype=np.float32)
+    return (
+        np.concatenate(lefts).astype(np.int64),
+        np.concatenate(rights).astype(np.int64),
+        np.concatenate(values).astype(np.float32),
+    )
+
+
+def parse_embedding(value: Any) -> Optional[List[float]]:
+    """Convert a stored embedding (JSON text or list) into a list of floats.
+
+    Args:
+        value: Embedding as stored in the database
+
+    Returns:
+        List of floats, or None if the value is empty or unparseable
+    """
+    if value is None:
+        return None
+    if isinstance(value, (bytes, bytearray)):
+        value = value.decode("utf-8")
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return None
+        try:
+            value = json.loads(value)
+        except (ValueError, TypeError):
+            return None
+    if not isinstance(value, (list, tuple, np.ndarray)) or len(value) == 0:
+        return None
+    return list(value)
+
+
+class EmbeddingStore:
+    """Contiguous embedding matrix for one entity type.
+
+    The bulk of the vectors live in an immutable snapshot (memory-mapped
+    from ``directory`` when configured, otherwise held in memory). Vectors
+    written after the snapshot go into a small overlay that shadows the
+    snapshot row; ``compact()`` folds the overlay into a new snapshot.
+
+    Attributes:
+        entity: Entity type name (e.g. "resources")
+        directory: Snapshot directory, or None for a purely in-memory store
+        dtype: Snapshot storage dtype (float32 or float16)
+    """
+
+    def __init__(
+        self,
+        entity: str,
+        directory: Optional[str] = None,
+        dtype: str = "float32",
+        compact_threshold: int = 4096,
+    ) -> None:
+        if dtype not in ("float32", "float16"):
+            raise ValueError(f"Unsupported embedding store dtype: {dtype}")
+        self.entity = entity
+        self.directory = directory
+        self.dtype = np.dtype(dtype)
+        self.compact_threshold = compact_threshold
+        self.dim: Optional[int] = None
+
+        self._lock = threading.RLock()
+        self._matrix = np.zeros((0, 0), dtype=self.dtype)
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._shadowed = np.zeros(0, dtype=bool)
+        self._overlay: Dict[str, Optional[np.ndarray]] = {}
+        self._version: Optional[str] = None
+        self._loaded = False
+        # Bumped on every change, so dependants (the resource ANN index) can
+        # tell when to re-read the item set
+        self.generation = 0
+
+        # Database sync state (managed by sync_store())
+        self.watermark: Optional[datetime] = None
+        self._last_sync = 0.0
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether a snapshot (possibly empty) has been loaded or built."""
+        return self._loaded
+
+    def expire(self) -> None:
+        """Force the next sync_store() call to apply database deltas."""
+        self._last_sync = 0.0
+
+    def __len__(self) -> int:
+        with self._lock:
+            # Every overlay entry shadows its snapshot row (if any)
+            live_snapshot = len(self._ids) - int(self._shadowed.sum())
+            live_overlay = sum(1 for vec in self._overlay.values() if vec is not None)
+            return live_snapshot + live_overlay
+
+    def __contains__(self, item_id: str) -> bool:
+        return self.get(item_id) is not None
+
+    def ids(self) -> Set[str]:
+        """Return the ids of every live item."""
+        with self._lock:
+            if self._shadowed.any():
+                live = {i for i, hidden in zip(self._ids, self._shadowed) if not hidden}
+            else:
+                live = set(self._ids)
+            live.update(i for i, vec in self._overlay.items() if vec is not None)
+            return live
+
+    def stats(self) -> Dict[str, Any]:
+        """Return store statistics for monitoring endpoints."""
+        with self._lock:
+            return {
+                "entity": self.entity,
+                "size": len(self),
+                "snapshot_rows": len(self._ids),
+                "overlay_rows": len(self._overlay),
+                "dim": self.dim,
+                "dtype": self.dtype.name,
+                "memory_mapped": isinstance(self._matrix, np.memmap),
+                "snapshot_bytes": int(self._matrix.nbytes),
+                "version": self._version,
+            }
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, item_id: str) -> Optional[np.ndarray]:
+        """Return the normalised float32 vector for an item, if present."""
+        item_id = str(item_id)
+        with self._lock:
+            if item_id in self._overlay:
+                return self._overlay[item_id]
+            row = self._rows.get(item_id)
+            if row is None:
+                return None
+            return np.asarray(self._matrix[row], dtype=np.float32)
+
+    def similar(
+        self,
+        query: Sequence[float],
+        k: int = 10,
+        candidate_ids: Optional[Iterable[str]] = None,
+        exclude_ids: Optional[Iterable[str]] = None,
+        min_similarity: Optional[float] = None,
+    ) -> List[Tuple[str, float]]:
+        """Find the k most cosine-similar items to a query vector.
+
+        Args:
+            query: Query vector (any norm)
+            k: Number of results
+            candidate_ids: Restrict scoring to these ids (e.g. one user's rows)
+            exclude_ids: Ids that must not appear in the results
+            min_similarity: Optional minimum cosine similarity
+
+        Returns:
+            List of (item_id, similarity) tuples sorted by similarity descending
+        """
+        if k <= 0 or query is None or len(query) == 0:
+            return []
+        q = np.asarray(query, dtype=np.float32)
+        norm = float(np.linalg.norm(q))
+        if norm == 0.0:
+            return []
+        q = q / norm
+
+        excluded: Set[str] = {str(i) for i in exclude_ids} if exclude_ids else set()
+
+        with self._lock:
+            if self.dim is None or len(q) != self.dim:
+                return []
+
+            if candidate_ids is not None:
+                ids, matrix = self._gather(
+                    [str(i) for i in candidate_ids if str(i) not in excluded]
+                )
+                if not ids:
+                    return []
+                scores = matrix @ q
+            else:
+                scores = score_rows(self._matrix, q) if len(self._ids) else np.zeros(0, np.float32)
+                if len(scores):
+                    scores[self._shadowed] = -np.inf
+                    for item_id in excluded:
+                        row = self._rows.get(item_id)
+                        if row is not None:
+                            scores[row] = -np.inf
+                ids = list(self._ids)
+                overlay = [
+                    (item_id, vec)
+                    for item_id, vec in self._overlay.items()
+                    if vec is not None and item_id not in excluded
+                ]
+                if overlay:
+                    overlay_matrix = np.stack([vec for _, vec in overlay])
+                    scores = np.concatenate([scores, overlay_matrix @ q])
+                    ids = ids + [item_id for item_id, _ in overlay]
+
+            order = top_k(scores, k, min_similarity)
+            return [(ids[i], float(scores[i])) for i in order]
+
+    def similar_to_item(
+        self,
+        item_id: str,
+        k: int = 10,
+        candidate_ids: Optional[Iterable[str]] = None,
+        min_similarity: Optional[float] = None,
+    ) -> List[Tuple[str, float]]:
+        """Find items most similar to an item already in the store."""
+        vector = self.get(item_id)
+        if vector is None:
+            return []
+        return self.similar(
+            vector,
+            k=k,
+            candidate_ids=candidate_ids,
+            exclude_ids=[item_id],
+            min_similarity=min_similarity,
+        )
+
+    def gather(self, item_ids: Iterable[str]) -> Tuple[List[str], np.ndarray]:
+        """Return (found_ids, float32 matrix) for the live items among ``item_ids``."""
+        with self._lock:
+            return self._gather([str(i) for i in item_ids])
+
+    def _gather(self, item_ids: List[str]) -> Tuple[List[str], np.ndarray]:
+        """Collect the live vectors for the given ids into one matrix."""
+        found_ids: List[str] = []
+        snapshot_rows: List[int] = []
+        overlay_vecs: List[np.ndarray] = []
+        overlay_ids: List[str] = []
+        for item_id in item_ids:
+            if item_id in self._overlay:
+                vec = self._overlay[item_id]
+                if vec is not None:
+                    overlay_ids.append(item_id)
+                    overlay_vecs.append(vec)
+                continue
+            row = self._rows.get(item_id)
+            if row is not None:
+                found_ids.append(item_id)
+                snapshot_rows.append(row)
+
+        parts = []
+        if snapshot_rows:
+            parts.append(np.asarray(self._matrix[np.asarray(snapshot_rows)], dtype=np.float32))
+        if overlay_vecs:
+            parts.append(np.stack(overlay_vecs))
+        if not parts:
+            return [], np.zeros((0, self.dim or 0), dtype=np.float32)
+        return found_ids + overlay_ids, np.concatenate(parts)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def load_items(self, items: Iterable[Tuple[str, Sequence[float]]]) -> int:
+        """Replace the snapshot with the given (item_id, vector) pairs.
+
+        Args:
+            items: Iterable of (item_id, vector) pairs
+
+        Returns:
+            Number of vectors stored
+        """
+        ids: List[str] = []
+        rows: List[Sequence[float]] = []
+        dim: Optional[int] = None
+        for item_id, vector in items:
+            if vector is None or len(vector) == 0:
+                continue
+            if dim is None:
+                dim = len(vector)
+            elif len(vector) != dim:
+                logger.warning(
+                    f"Skipping {item_id} in embedding store '{self.entity}': "
+                    f"dimension {len(vector)} != {dim}"
+                )
+                continue
+            ids.append(str(item_id))
+            rows.append(vector)
+
+        matrix = (
+            normalize_rows(np.asarray(rows, dtype=np.float32))
+            if rows
+            else np.zeros((0, 0), dtype=np.float32)
+        )
+        with self._lock:
+            self._install_snapshot(ids, matrix)
+        return len(ids)
+
+    def upsert(self, item_id: str, vector: Optional[Sequence[float]]) -> bool:
+        """Insert or replace a single vector (goes to the overlay).
+
+        A no-op until the store is loaded: the first load reads the whole
+        table (or snapshot) anyway, and only load_items/load_snapshot may
+        mark the store loaded.
+
+        Args:
+            item_id: Item identifier
+            vector: Embedding vector; empty/None removes the item
+
+        Returns:
+            True if the vector was stored
+        """
+        item_id = str(item_id)
+        if vector is None or len(vector) == 0:
+            self.remove(item_id)
+            return False
+        with self._lock:
+            if not self._loaded:
+                return False
+            if self.dim is None:
+                self.dim = len(vector)
+            elif len(vector) != self.dim:
+                logger.warning(
+                    f"Rejected vector for {item_id} in embedding store '{self.entity}': "
+                    f"dimension {len(vector)} != {self.dim}"
+                )
+                return False
+            self._overlay[item_id] = normalize_rows(np.asarray(vector)[None, :])[0]
+            self._shadow(item_id)
+            self.generation += 1
+            if len(self._overlay) >= self.compact_threshold:
+                self.compact()
+            return True
+
+    def remove(self, item_id: str) -> None:
+        """Remove an item from the store."""
+        item_id = str(item_id)
+        with self._lock:
+            if item_id in self._rows:
+                self._overlay[item_id] = None  # tombstone over the snapshot row
+                self._shadow(item_id)
+            elif self._overlay.pop(item_id, None) is None:
+                return
+            self.generation += 1
+
+    def _shadow(self, item_id: str) -> None:
+        row = self._rows.get(item_id)
+        if row is not None:
+            self._shadowed[row] = True
+
+    def compact(self) -> None:
+        """Fold the overlay into a fresh snapshot (and publish it to disk)."""
+        with self._lock:
+            if not self._overlay:
+                return
+            live = ~self._shadowed
+            ids = [item_id for item_id, keep in zip(self._ids, live) if keep]
+            parts = []
+            if len(ids):
+                parts.append(np.asarray(self._matrix[live], dtype=np.float32))
+            overlay = [(i, v) for i, v in self._overlay.items() if v is not None]
+            if overlay:
+                ids += [i for i, _ in overlay]
+                parts.append(np.stack([v for _, v in overlay]))
+            matrix = np.concatenate(parts) if parts else np.zeros((0, self.dim or 0), np.float32)
+            self._install_snapshot(ids, matrix)
+
+    def _install_snapshot(self, ids: List[str], matrix: np.ndarray) -> None:
+        """Make (ids, matrix) the current snapshot, publishing it if on disk."""
+        if self.directory and len(ids):
+            matrix = self._publish(ids, matrix)
+        else:
+            matrix = matrix.astype(self.dtype, copy=False)
+        self._matrix = matrix
+        self._ids = ids
+        self._rows = {item_id: row for row, item_id in enumerate(ids)}
+        self._shadowed = np.zeros(len(ids), dtype=bool)
+        self._overlay = {}
+        if len(ids):
+            self.dim = matrix.shape[1]
+        self._loaded = True
+        self.generation += 1
+
+    # ------------------------------------------------------------------
+    # Disk snapshots
+    # ------------------------------------------------------------------
+
+    def _meta_path(self) -> str:
+        return os.path.join(self.directory, f"{self.entity}.meta.json")
+
+    def _snapshot_paths(self, version: str) -> Tuple[str, str]:
+        base = os.path.join(self.directory, f"{self.entity}-{version}")
+        return f"{base}.npy", f"{base}.ids.json"
+
+    def _publish(self, ids: List[str], matrix: np.ndarray) -> np.ndarray:
+        """Write a versioned snapshot and point the meta file at it.
+
+        Snapshot files are immutable and versioned, so readers that still
+        map an older version are unaffected by the swap.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        version = uuid.uuid4().hex[:12]
+        npy_path, ids_path = self._snapshot_paths(version)
+
+        out = np.lib.format.open_memmap(
+            npy_path, mode="w+", dtype=self.dtype, shape=matrix.shape
+        )
+        out[:] = matrix
+        out.flush()
+        del out
+        with open(ids_path, "w", encoding="utf-8") as fh:
+            json.dump(ids, fh)
+
+        previous = self._version
+        meta = {
+            "version": version,
+            "count": len(ids),
+            "dim": int(matrix.shape[1]),
+            "dtype": self.dtype.name,
+            "watermark": self.watermark.isoformat() if self.watermark else None,
+        }
+        tmp_meta = f"{self._meta_path()}.{version}.tmp"
+        with open(tmp_meta, "w", encoding="utf-8") as fh:
+            json.dump(meta, fh)
+        os.replace(tmp_meta, self._meta_path())
+        self._version = version
+
+        if previous and previous != version:
+            for path in self._snapshot_paths(previous):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+        logger.info(
+            f"Published embedding snapshot '{self.entity}' v{version} "
+            f"({len(ids)} x {matrix.shape[1]} {self.dtype.name})"
+        )
+        return np.load(npy_path, mmap_mode="r")
+
+    def load_snapshot(self) -> bool:
+        """Map the latest on-disk snapshot if it differs from the current one.
+
+        Returns:
+            True if a snapshot is mapped after the call
+        """
+        if not self.directory or not os.path.exists(self._meta_path()):
+            return False
+        try:
+            with open(self._meta_path(), encoding="utf-8") as fh:
+                meta = json.load(fh)
+            version = meta["version"]
+            if version == self._version:
+                return True
+            npy_path, ids_path = self._snapshot_paths(version)
+            matrix = np.load(npy_path, mmap_mode="r")
+            with open(ids_path, encoding="utf-8") as fh:
+                ids = json.load(fh)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Could not map embedding snapshot '{self.entity}': {e}")
+            return False
+
+        with self._lock:
+            overlay = self._overlay
+            self._matrix = matrix
+            self._ids = ids
+            self._rows = {item_id: row for row, item_id in enumerate(ids)}
+            self._shadowed = np.zeros(len(ids), dtype=bool)
+            self._overlay = {}
+            self._version = version
+            self.dim = int(meta["dim"]) if ids else self.dim
+            self._loaded = True
+            self.generation += 1
+            if meta.get("watermark"):
+                self.watermark = datetime.fromisoformat(meta["watermark"])
+            # Re-apply local writes made since that snapshot was taken
+            for item_id, vec in overlay.items():
+                if vec is None:
+                    self.remove(item_id)
+                else:
+                    self._overlay[item_id] = vec
+                    self._shadow(item_id)
+        logger.info(f"Mapped embedding snapshot '{self.entity}' v{version} ({len(ids)} rows)")
+        return True
+
+
+# ============================================================================
+# Database-backed entity stores
+# ============================================================================
+
+
+class EntitySpec:
+    """Describes where an entity's embeddings live in the database.
+
+    Attributes:
+        model: Callable returning the SQLAlchemy model (imported lazily)
+        id_column: Attribute name of the item id column
+        embedding_column: Attribute name of the embedding column
+        updated_column: Attribute name of the last-modified timestamp column
+    """
+
+    def __init__(
+        self,
+        model: Callable[[], Any],
+        id_column: str = "id",
+        embedding_column: str = "embedding",
+        updated_column: str = "updated_at",
+    ) -> None:
+        self.model = model
+        self.id_column = id_column
+        self.embedding_column = embedding_column
+        self.updated_column = updated_column
+
+    def columns(self):
+        model = self.model()
+        return (
+            getattr(model, self.id_column),
+            getattr(model, self.embedding_column),
+            getattr(model, self.updated_column),
+        )
+
+
+def _model(name: str) -> Callable[[], Any]:
+    def load():
+        from ..database import models
+
+        return getattr(models, name)
+
+    return load
+
+
+ENTITY_SPECS: Dict[str, EntitySpec] = {
+    "resources": EntitySpec(_model("Resource")),
+    "annotations": EntitySpec(_model("Annotation")),
+    "collections": EntitySpec(_model("Collection")),
+    "graph_structural": EntitySpec(
+        _model("GraphEmbedding"),
+        id_column="resource_id",
+        embedding_column="structural_embedding",
+    ),
+}
+
+def sync_store(store: EmbeddingStore, db, force: bool = False) -> EmbeddingStore:
+    """Bring a database-backed store up to date.
+
+    On first use the store maps the shared on-disk snapshot (or builds one
+    from the database); afterwards only rows whose ``updated_at`` moved past
+    the store watermark are re-read, at most every refresh interval.
+
+    Args:
+        store: Store registered in ENTITY_SPECS
+        db: Database session
+        force: Ignore the refresh throttle
+
+    Returns:
+        The same store, for chaining
+    """
+    from sqlalchemy import func
+    from ..config.settings import get_settings
+
+    spec = ENTITY_SPECS[store.entity]
+    id_col, emb_col, updated_col = spec.columns()
+    refresh_interval = get_settings().VECTOR_INDEX_REFRESH_SECONDS
+
+    with store._lock:
+        if not store.is_loaded and not store.load_snapshot():
+            store.watermark = db.query(func.max(updated_col)).scalar()
+            rows = db.query(id_col, emb_col).filter(emb_col.isnot(None)).yield_per(2000)
+            count = store.load_items(
+                (str(item_id), parse_embedding(embedding)) for item_id, embedding in rows
+            )
+            store._last_sync = time.monotonic()
+            logger.info(f"Built embedding store '{store.entity}' with {count} vectors")
+            return store
+
+        if not force and time.monotonic() - store._last_sync < refresh_interval:
+            return store
+        store._last_sync = time.monotonic()
+        store.load_snapshot()  # pick up a newer snapshot published by another worker
+
+        query = delta_window(
+            db.query(id_col, emb_col, updated_col), updated_col, store.watermark
+        )
+        for item_id, embedding, updated_at in query.all():
+            store.upsert(str(item_id), parse_embedding(embedding))
+            store.watermark = advance_watermark(store.watermark, updated_at)
+    return store
+
+
+def load_missing(store: EmbeddingStore, db, item_ids: Iterable[str]) -> int:
+    """Read the embeddings of ids the store does not hold yet.
+
+    Covers rows written since the last delta sync when a caller already
+    knows exactly which ids it is going to score.
+
+    Args:
+        store: Store registered in ENTITY_SPECS
+        db: Database session
+        item_ids: Ids about to be scored
+
+    Returns:
+        Number of vectors added to the store
+    """
+    missing = [str(item_id) for item_id in item_ids if str(item_id) not in store]
+    if not missing:
+        return 0
+    id_col, emb_col, _ = ENTITY_SPECS[store.entity].columns()
+    added = 0
+    for start in range(0, len(missing), 500):
+        batch = missing[start : start + 500]
+        for item_id, embedding in db.query(id_col, emb_col).filter(id_col.in_(batch)):
+            added += store.upsert(str(item_id), parse_embedding(embedding))
+    return added
+
+
+_stores: Dict[str, EmbeddingStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_embedding_store(entity: str, db=None) -> EmbeddingStore:
+    """Return the process-wide store for an entity type.
+
+    Args:
+        entity: One of ENTITY_SPECS ("resources", "annotations", ...)
+        db: Optional session; when given, the store is synced before returning
+
+    Returns:
+        The EmbeddingStore for the entity
+    """
+    if entity not in ENTITY_SPECS:
+        raise ValueError(f"Unknown embedding store entity: {entity}")
+    store = _stores.get(entity)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(entity)
+            if store is None:
+                from ..config.settings import get_settings
+
+                settings = get_settings()
+                store = EmbeddingStore(
+                    entity,
+                    directory=settings.EMBEDDING_STORE_DIR,
+                    dtype=settings.EMBEDDING_STORE_DTYPE,
+                )
+                _stores[entity] = store
+    if db is not None:
+        sync_store(store, db)
+    return store
+
+
+def reset_embedding_stores() -> None:
+    """Discard all process-wide stores (used by tests)."""
+    with _stores_lock:
+        _stores.clear()
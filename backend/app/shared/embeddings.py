@@ -9,19 +9,22 @@ Features:
 - Sparse embedding generation for hybrid search
 - Batch embedding generation for efficiency
 - Redis caching with intelligent TTL
-- Thread-safe model loading
+- One model copy per process via the shared model registry
 
 Related files:
 - app/shared/ai_core.py: Core AI operations
 - app/shared/cache.py: Caching layer
+- app/shared/model_registry.py: Process-wide model loading
 - app/shared/database.py: Database access
 """
 
 import logging
-import threading
+from functools import lru_cache, partial
 from typing import List, Optional
 from sqlalchemy.orm import Session
 
+from .model_registry import get_model_registry
+
 # Lazy import sentence-transformers for embeddings
 try:
     from sentence_transformers import SentenceTransformer  # type: ignore
@@ -31,54 +34,71 @@ except Exception:  # pragma: no cover
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _detect_device() -> str:
+    """Detect the best device for acceleration (once per process)."""
+    try:
+        import torch
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+    except ImportError:
+        device = "cpu"
+    logger.info(f"Embedding device: {device}")
+    return device
+
+
+def _load_sentence_transformer(model_name: str, device: str):
+    """Registry loader for a SentenceTransformer (holds no service state)."""
+    # FIX: Add trust_remote_code=True for nomic models
+    # FIX: Use GPU if available for 4-10x speedup
+    model = SentenceTransformer(model_name, trust_remote_code=True, device=device)
+    logger.info(f"Loaded embedding model on {device}: {model_name}")
+    return model
+
+
 class EmbeddingGenerator:
     """Abstraction around a sentence embedding model.
 
     Uses sentence-transformers with a configurable model for generating
-    vector embeddings from text content.
+    vector embeddings from text content. Generators are cheap to create: the
+    model itself lives in the process-wide model registry, shared by every
+    generator with the same model name and device.
     """
 
     def __init__(self, model_name: str = "nomic-ai/nomic-embed-text-v1") -> None:
         self.model_name = model_name
-        self._model = None
-        self._model_lock = threading.Lock()
         self._warmed_up = False
-        
-        # Detect best device for acceleration
-        try:
-            import torch
-            self.device = "cuda" if torch.cuda.is_available() else "cpu"
-        except ImportError:
-            self.device = "cpu"
-        logger.info(f"Embedding device: {self.device}")
+        self.device = _detect_device()
+
+    @property
+    def _registry_key(self) -> str:
+        return f"sentence-transformer:{self.model_name}@{self.device}"
+
+    @property
+    def _model(self):
+        """The shared model, or None until _ensure_loaded() has loaded it."""
+        return get_model_registry().peek(self._registry_key)
 
     def _ensure_loaded(self):
-        """Lazy load the embedding model in a thread-safe manner."""
-        if self._model is None:
-            with self._model_lock:
-                if self._model is None:  # Double-check locking pattern
-                    import os
-                    deployment_mode = os.getenv("MODE", "EDGE")
-                    if deployment_mode == "CLOUD":
-                        logger.info("Cloud mode detected - skipping embedding model load (query embeddings via Tailscale Funnel)")
-                        return
-                    
-                    if SentenceTransformer is None:  # pragma: no cover
-                        # Leave model as None; caller will use fallback
-                        return
-                    try:
-                        # FIX: Add trust_remote_code=True for nomic models
-                        # FIX: Use GPU if available for 4-10x speedup
-                        self._model = SentenceTransformer(
-                            self.model_name,
-                            trust_remote_code=True,
-                            device=self.device
-                        )
-                        logger.info(f"Loaded embedding model on {self.device}: {self.model_name}")
-                    except Exception as e:  # pragma: no cover - model loading failures
-                        # Model loading failed, leave as None for fallback
-                        logger.error(f"Failed to load embedding model: {e}")
-                        pass
+        """Load the embedding model into the shared registry if needed."""
+        if self._model is not None:
+            return
+
+        import os
+        deployment_mode = os.getenv("MODE", "EDGE")
+        if deployment_mode == "CLOUD":
+            logger.info("Cloud mode detected - skipping embedding model load (query embeddings via Tailscale Funnel)")
+            return
+
+        if SentenceTransformer is None:  # pragma: no cover
+            # Leave model as None; caller will use fallback
+            return
+
+        # The registry serialises concurrent loads and remembers failures,
+        # so callers fall back instead of retrying the load on every request
+        get_model_registry().get(
+            self._registry_key,
+            partial(_load_sentence_transformer, self.model_name, self.device),
+        )
 
     def warmup(self) -> bool:
         """Warmup the model with a dummy encoding to avoid cold start latency.
@@ -94,10 +114,11 @@ class EmbeddingGenerator:
             return True
 
         self._ensure_loaded()
-        if self._model is not None:
+        model = self._model
+        if model is not None:
             try:
                 # Perform a dummy encoding to warm up the model
-                _ = self._model.encode("warmup", convert_to_tensor=False)
+                _ = model.encode("warmup", convert_to_tensor=False)
                 self._warmed_up = True
                 logger.info(f"Embedding model warmed up: {self.model_name}")
                 return True
@@ -118,10 +139,11 @@ class EmbeddingGenerator:
             return []
 
         self._ensure_loaded()
-        if self._model is not None:
+        model = self._model
+        if model is not None:
             try:
                 # sentence-transformers returns numpy array, convert to list
-                embedding = self._model.encode(text, convert_to_tensor=False)
+                embedding = model.encode(text, convert_to_tensor=False)
                 return embedding.tolist()
             except Exception:  # pragma: no cover - encoding failures
                 pass
@@ -274,12 +296,13 @@ class EmbeddingService:
         # Delegate to the generator which owns the model instance
         gen = self.embedding_generator
         gen._ensure_loaded()
-        if gen._model is not None:
+        model = gen._model
+        if model is not None:
             try:
                 texts_to_encode = [text for _, text in valid_texts]
 
                 # Use model's native batch encoding (6-7x faster than loop)
-                embeddings = gen._model.encode(
+                embeddings = model.encode(
                     texts_to_encode,
                     convert_to_tensor=False,
                     batch_size=batch_size,
@@ -424,6 +447,13 @@ class EmbeddingService:
             resource.embedding = embedding
             self.db.commit()
 
+            # Keep this process's embedding store (and the ANN index over it)
+            # in step; other processes pick the change up through their
+            # updated_at delta refresh
+            from .vector_index import get_resource_vector_index
+
+            get_resource_vector_index().upsert(resource_id, embedding)
+
             # Store in cache if available
             if self.cache:
                 cache_key = f"embedding:{resource_id}"
@@ -1,15 +1,32 @@
 """
 Shared event bus for inter-module communication.
 
-Implements publish-subscribe pattern with synchronous delivery.
+Implements publish-subscribe pattern with synchronous delivery by default
+and an optional asynchronous dispatch mode (start_async_dispatch) in which
+emit() only enqueues the event and a pool of worker threads runs the
+handlers.
 Provides error isolation, metrics tracking, and logging.
+
+Async dispatch:
+- One bounded FIFO queue per EventPriority; workers always take from the
+  highest non-empty priority
+- Handlers subscribed with synchronous=True still run inside emit()
+- Optional coalescing per event type: while an event is still queued, a
+  newer one with the same key (e.g. resource.updated for the same
+  resource_id) replaces its payload instead of queueing again
+- Backpressure: when a priority's queue is full the caller runs the
+  handlers inline, so events are never dropped; queue depth, wait time,
+  coalesced and inline-fallback counts are reported by get_metrics()
 """
 
-from typing import Callable, Dict, List, Any, Optional
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Tuple
 from enum import Enum
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
+import inspect
 import logging
+import threading
 import time
 import uuid
 
@@ -17,7 +34,7 @@ logger = logging.getLogger(__name__)
 
 
 class EventPriority(Enum):
-    """Event priority levels for logging and metrics."""
+    """Event priority levels (queue order in async dispatch, logging, metrics)."""
 
     CRITICAL = 100
     HIGH = 75
@@ -36,13 +53,181 @@ class Event:
     correlation_id: Optional[str] = field(default_factory=lambda: str(uuid.uuid4()))
 
 
+# Highest priority first; workers scan the queues in this order
+_PRIORITY_ORDER = sorted(EventPriority, key=lambda p: p.value, reverse=True)
+
+
+class _Job:
+    """A queued event and the handlers still to run for it."""
+
+    __slots__ = ("event", "handlers", "key", "enqueued_at")
+
+    def __init__(
+        self,
+        event: Event,
+        handlers: List[Callable],
+        key: Optional[Tuple[str, Hashable]],
+    ):
+        self.event = event
+        self.handlers = handlers
+        self.key = key
+        self.enqueued_at = time.monotonic()
+
+
+class _AsyncDispatcher:
+    """Bounded per-priority queues drained by a pool of worker threads."""
+
+    def __init__(self, bus: "EventBus", workers: int, queue_size: int):
+        self._bus = bus
+        self.workers = workers
+        self.queue_size = queue_size
+        self._cond = threading.Condition()
+        self._queues: Dict[EventPriority, Deque[_Job]] = {
+            priority: deque() for priority in _PRIORITY_ORDER
+        }
+        # Queued (not yet started) jobs by coalescing key
+        self._pending: Dict[Tuple[str, Hashable], _Job] = {}
+        self._in_flight = 0
+        self._stopping = False
+        self._stats = {
+            "events_queued": 0,
+            "events_coalesced": 0,
+            "events_run_inline": 0,
+            "max_queue_depth": 0,
+        }
+        self._wait_latencies: Deque[float] = deque(maxlen=1000)
+        self._threads = [
+            threading.Thread(target=self._run, name=f"event-bus-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(
+        self,
+        event: Event,
+        handlers: List[Callable],
+        key: Optional[Tuple[str, Hashable]] = None,
+    ) -> bool:
+        """Queue an event; False if the caller must run the handlers itself."""
+        with self._cond:
+            if self._stopping:
+                return False
+            if key is not None:
+                queued = self._pending.get(key)
+                if queued is not None:
+                    # Still waiting: deliver the newest payload once
+                    queued.event = event
+                    queued.handlers = handlers
+                    self._stats["events_coalesced"] += 1
+                    return True
+            queue = self._queues[event.priority]
+            if len(queue) >= self.queue_size:
+                self._stats["events_run_inline"] += 1
+                return False
+            job = _Job(event, handlers, key)
+            queue.append(job)
+            if key is not None:
+                self._pending[key] = job
+            self._stats["events_queued"] += 1
+            depth = sum(len(q) for q in self._queues.values())
+            if depth > self._stats["max_queue_depth"]:
+                self._stats["max_queue_depth"] = depth
+            self._cond.notify()
+            return True
+
+    def _next(self) -> Optional[_Job]:
+        with self._cond:
+            while True:
+                for priority in _PRIORITY_ORDER:
+                    queue = self._queues[priority]
+                    if queue:
+                        job = queue.popleft()
+                        if job.key is not None and self._pending.get(job.key) is job:
+                            del self._pending[job.key]
+                        self._in_flight += 1
+                        return job
+                if self._stopping:
+                    return None
+                self._cond.wait()
+
+    def _run(self) -> None:
+        while True:
+            job = self._next()
+            if job is None:
+                return
+            try:
+                self._wait_latencies.append((time.monotonic() - job.enqueued_at) * 1000)
+                for handler in job.handlers:
+                    self._bus._deliver(job.event, handler)
+            finally:
+                with self._cond:
+                    self._in_flight -= 1
+                    self._cond.notify_all()
+
+    def _idle(self) -> bool:
+        return self._in_flight == 0 and not any(self._queues.values())
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued event has been handled."""
+        with self._cond:
+            return self._cond.wait_for(self._idle, timeout)
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """Drain the queues, then stop the workers."""
+        drained = self.flush(timeout)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        return drained
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._cond:
+            metrics: Dict[str, Any] = dict(self._stats)
+            metrics["queue_depth"] = {
+                priority.name: len(queue) for priority, queue in self._queues.items()
+            }
+            metrics["in_flight"] = self._in_flight
+        metrics["workers"] = self.workers
+        metrics["queue_size"] = self.queue_size
+        waits = sorted(self._wait_latencies)
+        metrics["queue_wait_p50"] = _percentile(waits, 0.50)
+        metrics["queue_wait_p95"] = _percentile(waits, 0.95)
+        return metrics
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return round(sorted_values[int(len(sorted_values) * q)], 2)
+
+
+def _wants_event_object(handler: Callable) -> bool:
+    """Whether a handler's first parameter is annotated as Event."""
+    try:
+        sig = inspect.signature(handler)
+    except (TypeError, ValueError):
+        return False
+    if not sig.parameters:
+        return False
+    annotation = next(iter(sig.parameters.values())).annotation
+    return annotation is not inspect.Parameter.empty and (
+        annotation is Event
+        or str(annotation) == "Event"
+        or str(annotation).endswith(".Event")
+    )
+
+
 class EventBus:
     """
-    Synchronous event bus for module communication.
+    Event bus for module communication.
 
     Features:
     - Type-safe event names
-    - Priority-based delivery
+    - Synchronous delivery, or prioritized asynchronous dispatch to a
+      worker pool (start_async_dispatch)
     - Error isolation (handler failures don't affect other handlers)
     - Logging and metrics tracking
     - Handler execution time tracking
@@ -61,9 +246,15 @@ class EventBus:
     def __init__(self):
         """Initialize event bus with empty handlers and metrics (only once due to singleton)."""
         if not EventBus._initialized:
-            from collections import deque
-
             self._handlers: Dict[str, List[Callable]] = {}
+            # Resolved once per handler at subscribe time
+            self._wants_event: Dict[Callable, bool] = {}
+            # Handlers that run inside emit() even in async mode
+            self._synchronous: Dict[str, List[Callable]] = {}
+            # Coalescing key functions by event type (async mode only)
+            self._coalesce_keys: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+            self._dispatcher: Optional[_AsyncDispatcher] = None
+            self._metrics_lock = threading.Lock()
             self._metrics = {
                 "events_emitted": 0,
                 "events_delivered": 0,
@@ -72,27 +263,38 @@ class EventBus:
                 "total_emission_time_ms": 0.0,
             }
             self._event_types: Dict[str, int] = {}
-            self._handler_latencies: List[float] = []
-            self._emission_latencies: List[float] = []
-            self._event_history: deque = deque(maxlen=1000)
+            self._handler_latencies: Deque[float] = deque(maxlen=1000)
+            self._emission_latencies: Deque[float] = deque(maxlen=1000)
+            self._event_history: Deque[Event] = deque(maxlen=1000)
             EventBus._initialized = True
             logger.info("EventBus initialized")
 
     def subscribe(
-        self, event_type: str, handler: Callable[[Dict[str, Any]], None]
+        self,
+        event_type: str,
+        handler: Callable[[Dict[str, Any]], None],
+        synchronous: bool = False,
     ) -> None:
         """
         Subscribe to an event type.
 
         Args:
             event_type: Event type to subscribe to (e.g., "resource.deleted")
-            handler: Callable that receives event payload as dict
+            handler: Callable that receives event payload as dict (or the
+                Event object if its first parameter is annotated as Event)
+            synchronous: Run inside emit() even when async dispatch is on
         """
         if event_type not in self._handlers:
             self._handlers[event_type] = []
 
+        if synchronous:
+            inline = self._synchronous.setdefault(event_type, [])
+            if handler not in inline:
+                inline.append(handler)
+
         # Avoid duplicate registrations
         if handler not in self._handlers[event_type]:
+            self._wants_event[handler] = _wants_event_object(handler)
             self._handlers[event_type].append(handler)
             logger.info(
                 f"Subscribed handler '{handler.__name__}' to event '{event_type}'"
@@ -125,6 +327,10 @@ class EventBus:
             self._handlers[event_type] = [
                 h for h in self._handlers[event_type] if h != handler
             ]
+            if event_type in self._synchronous:
+                self._synchronous[event_type] = [
+                    h for h in self._synchronous[event_type] if h != handler
+                ]
             logger.info(
                 f"Unsubscribed handler '{handler.__name__}' from event '{event_type}'"
             )
@@ -139,6 +345,79 @@ class EventBus:
         """
         self.unsubscribe(event_name, handler)
 
+    def coalesce(
+        self,
+        event_type: str,
+        key: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ) -> None:
+        """
+        Coalesce queued duplicates of an event type in async dispatch.
+
+        While an event is waiting in the queue, a newer event of the same
+        type with the same key replaces its payload instead of being queued
+        again, so handlers run once with the latest payload.
+
+        Args:
+            event_type: Event type to coalesce (e.g., "resource.updated")
+            key: Payload -> key function (default: payload["resource_id"]);
+                events whose key is None are never coalesced
+        """
+        self._coalesce_keys[event_type] = key or (
+            lambda payload: payload.get("resource_id")
+        )
+
+    def start_async_dispatch(self, workers: int = 4, queue_size: int = 1000) -> None:
+        """
+        Switch to asynchronous dispatch: emit() enqueues, workers deliver.
+
+        Args:
+            workers: Number of worker threads
+            queue_size: Maximum queued events per priority before emit()
+                falls back to running the handlers inline
+        """
+        if self._dispatcher is not None:
+            return
+        self._dispatcher = _AsyncDispatcher(
+            self, workers=max(1, workers), queue_size=max(1, queue_size)
+        )
+        logger.info(
+            f"EventBus async dispatch started ({workers} workers, "
+            f"{queue_size} events per priority queue)"
+        )
+
+    def stop_async_dispatch(self, timeout: Optional[float] = 10.0) -> bool:
+        """
+        Deliver queued events, stop the workers and return to synchronous mode.
+
+        Args:
+            timeout: Seconds to wait for the queues to drain
+
+        Returns:
+            True if every queued event was delivered in time
+        """
+        dispatcher, self._dispatcher = self._dispatcher, None
+        if dispatcher is None:
+            return True
+        drained = dispatcher.stop(timeout)
+        if not drained:
+            logger.warning("EventBus stopped with events still queued")
+        return drained
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all queued events have been handled (no-op when synchronous).
+
+        Returns:
+            True if the queues drained within the timeout
+        """
+        dispatcher = self._dispatcher
+        return dispatcher.flush(timeout) if dispatcher is not None else True
+
+    @property
+    def is_async(self) -> bool:
+        """Whether emit() hands events to the async dispatcher."""
+        return self._dispatcher is not None
+
     def emit(
         self,
         event_type: str,
@@ -151,10 +430,13 @@ class EventBus:
         Implements error isolation - handler failures don't affect other handlers.
         Tracks metrics for monitoring and performance analysis.
 
+        In async mode only handlers subscribed with synchronous=True run
+        here; the rest are queued by priority and run on the worker pool.
+
         Args:
             event_type: Event type to emit (e.g., "resource.deleted")
             payload: Event data as dictionary
-            priority: Event priority (for logging/metrics)
+            priority: Event priority (queue order in async mode)
 
         Returns:
             The emitted Event object
@@ -165,150 +447,144 @@ class EventBus:
         # Create Event object for API compatibility
         event = Event(name=event_type, data=payload, priority=priority)
 
-        self._metrics["events_emitted"] += 1
+        with self._metrics_lock:
+            self._metrics["events_emitted"] += 1
+            self._event_types[event_type] = self._event_types.get(event_type, 0) + 1
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Emitting event '{event_type}' with priority {priority.name}",
+                extra={
+                    "component": "event_bus",
+                    "operation": "event_emission",
+                    "event_type": event_type,
+                    "priority": priority.name,
+                    "payload": payload,
+                    "correlation_id": event.correlation_id,
+                },
+            )
+
+        # Store in history (deque automatically maintains maxlen of 1000)
+        self._event_history.append(event)
+
+        handlers = self._handlers.get(event_type, [])
+
+        if not handlers:
+            logger.debug(f"No handlers registered for event '{event_type}'")
+            return event
 
-        # Track event types
-        if event_type not in self._event_types:
-            self._event_types[event_type] = 0
-        self._event_types[event_type] += 1
+        dispatcher = self._dispatcher
+        if dispatcher is None:
+            inline, deferred = handlers, []
+        else:
+            synchronous = self._synchronous.get(event_type)
+            if synchronous:
+                inline = [h for h in handlers if h in synchronous]
+                deferred = [h for h in handlers if h not in synchronous]
+            else:
+                inline, deferred = [], list(handlers)
+            if deferred:
+                key = None
+                key_fn = self._coalesce_keys.get(event_type)
+                if key_fn is not None:
+                    try:
+                        value = key_fn(payload)
+                        key = (event_type, value) if value is not None else None
+                    except Exception:
+                        key = None
+                if not dispatcher.submit(event, deferred, key):
+                    # Queue full (backpressure) or stopping: run here
+                    inline, deferred = handlers, []
+
+        for handler in inline:
+            self._deliver(event, handler)
+
+        # Track total emission time (handlers run inline plus enqueueing)
+        total_emission_time_ms = (time.time() - emission_start_time) * 1000
+        with self._metrics_lock:
+            self._metrics["total_emission_time_ms"] += total_emission_time_ms
+            self._emission_latencies.append(total_emission_time_ms)
 
+        # Log structured info about emission completion
         logger.debug(
-            f"Emitting event '{event_type}' with priority {priority.name}",
+            f"Event emission completed: '{event_type}' delivered to {len(inline)} "
+            f"handlers, queued for {len(deferred)}",
             extra={
                 "component": "event_bus",
-                "operation": "event_emission",
+                "operation": "emission_complete",
                 "event_type": event_type,
-                "priority": priority.name,
-                "payload": payload,
-                "correlation_id": event.correlation_id,
+                "handlers_count": len(handlers),
+                "queued_handlers": len(deferred),
+                "total_duration_ms": round(total_emission_time_ms, 2),
             },
         )
 
-        # Store in history (deque automatically maintains maxlen of 1000)
-        from datetime import timezone
-
-        self._event_history.append(
-            {
-                "name": event_type,
-                "data": payload,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "priority": priority.name,
-                "correlation_id": event.correlation_id,
-            }
-        )
-
-        handlers = self._handlers.get(event_type, [])
-
-        if not handlers:
-            logger.debug(f"No handlers registered for event '{event_type}'")
-            return event
+        return event
 
-        for handler in handlers:
-            start_time = time.time()
-            try:
-                # Try to call handler with Event object first (new API)
-                # Fall back to dict payload for backward compatibility
-                import inspect
-
-                sig = inspect.signature(handler)
-                pass_event_object = False
-
-                if len(sig.parameters) > 0:
-                    first_param = list(sig.parameters.values())[0]
-                    annotation = first_param.annotation
-
-                    # Check if handler explicitly requests Event object via type hint
-                    if annotation is not inspect.Parameter.empty and (
-                        annotation is Event
-                        or str(annotation) == "Event"
-                        or str(annotation).endswith(".Event")
-                    ):
-                        pass_event_object = True
-
-                if pass_event_object:
-                    handler(event)
-                else:
-                    # Fallback to dict payload for backward compatibility
-                    handler(payload)
-
-                # Track successful delivery
+    def _deliver(self, event: Event, handler: Callable) -> None:
+        """Run one handler with error isolation and latency tracking."""
+        event_type = event.name
+        start_time = time.time()
+        try:
+            wants_event = self._wants_event.get(handler)
+            if wants_event is None:
+                wants_event = self._wants_event[handler] = _wants_event_object(handler)
+
+            # Pass the Event object to handlers that ask for it by type
+            # hint, the dict payload otherwise (backward compatibility)
+            handler(event if wants_event else event.data)
+
+            # Track handler execution time
+            execution_time_ms = (time.time() - start_time) * 1000
+            with self._metrics_lock:
                 self._metrics["events_delivered"] += 1
-
-                # Track handler execution time
-                execution_time_ms = (time.time() - start_time) * 1000
                 self._metrics["total_handler_time_ms"] += execution_time_ms
                 self._handler_latencies.append(execution_time_ms)
 
-                # Keep only last 1000 latencies for percentile calculation
-                if len(self._handler_latencies) > 1000:
-                    self._handler_latencies = self._handler_latencies[-1000:]
+            # Structured logging for successful handler execution
+            logger.debug(
+                f"Event handler executed: '{handler.__name__}' for '{event_type}'",
+                extra={
+                    "component": "event_bus",
+                    "operation": "handler_execution",
+                    "event_type": event_type,
+                    "handler": handler.__name__,
+                    "duration_ms": round(execution_time_ms, 2),
+                    "status": "success",
+                },
+            )
 
-                # Structured logging for successful handler execution
-                logger.debug(
-                    f"Event handler executed: '{handler.__name__}' for '{event_type}'",
+            # Log warning for slow handlers
+            if execution_time_ms > 100:
+                logger.warning(
+                    f"Slow event handler detected: '{handler.__name__}' for "
+                    f"'{event_type}' took {execution_time_ms:.2f}ms",
                     extra={
                         "component": "event_bus",
-                        "operation": "handler_execution",
+                        "operation": "slow_handler",
                         "event_type": event_type,
                         "handler": handler.__name__,
                         "duration_ms": round(execution_time_ms, 2),
-                        "status": "success",
+                        "threshold_ms": 100,
                     },
                 )
 
-                # Log warning for slow handlers
-                if execution_time_ms > 100:
-                    logger.warning(
-                        f"Slow event handler detected: '{handler.__name__}' for '{event_type}' "
-                        f"took {execution_time_ms:.2f}ms",
-                        extra={
-                            "component": "event_bus",
-                            "operation": "slow_handler",
-                            "event_type": event_type,
-                            "handler": handler.__name__,
-                            "duration_ms": round(execution_time_ms, 2),
-                            "threshold_ms": 100,
-                        },
-                    )
-
-            except Exception as e:
-                # Log error but continue to next handler (error isolation)
+        except Exception as e:
+            # Log error but continue to next handler (error isolation)
+            with self._metrics_lock:
                 self._metrics["handler_errors"] += 1
-                logger.error(
-                    f"Handler error: '{handler.__name__}' for event '{event_type}': {e}",
-                    exc_info=True,
-                    extra={
-                        "component": "event_bus",
-                        "operation": "handler_error",
-                        "event_type": event_type,
-                        "handler": handler.__name__,
-                        "error": str(e),
-                        "status": "error",
-                    },
-                )
-
-        # Track total emission time (including all handler executions)
-        total_emission_time_ms = (time.time() - emission_start_time) * 1000
-        self._metrics["total_emission_time_ms"] += total_emission_time_ms
-        self._emission_latencies.append(total_emission_time_ms)
-
-        # Keep only last 1000 emission latencies for percentile calculation
-        if len(self._emission_latencies) > 1000:
-            self._emission_latencies = self._emission_latencies[-1000:]
-
-        # Log structured info about emission completion
-        logger.debug(
-            f"Event emission completed: '{event_type}' delivered to {len(handlers)} handlers",
-            extra={
-                "component": "event_bus",
-                "operation": "emission_complete",
-                "event_type": event_type,
-                "handlers_count": len(handlers),
-                "total_duration_ms": round(total_emission_time_ms, 2),
-            },
-        )
-
-        return event
+            logger.error(
+                f"Handler error: '{handler.__name__}' for event '{event_type}': {e}",
+                exc_info=True,
+                extra={
+                    "component": "event_bus",
+                    "operation": "handler_error",
+                    "event_type": event_type,
+                    "handler": handler.__name__,
+                    "error": str(e),
+                    "status": "error",
+                },
+            )
 
     def get_metrics(self) -> Dict[str, Any]:
         """
@@ -328,13 +604,20 @@ class EventBus:
                 - emission_latency_p50: 50th percentile emission latency (ms)
                 - emission_latency_p95: 95th percentile emission latency (ms)
                 - emission_latency_p99: 99th percentile emission latency (ms)
+                - dispatch_mode: "sync" or "async"
+                - dispatch: async queue metrics (events_queued,
+                  events_coalesced, events_run_inline, max_queue_depth,
+                  queue_depth per priority, in_flight, queue_wait_p50/p95)
         """
-        metrics = self._metrics.copy()
-        metrics["event_types"] = self._event_types.copy()
+        with self._metrics_lock:
+            metrics = self._metrics.copy()
+            metrics["event_types"] = self._event_types.copy()
+            handler_latencies = list(self._handler_latencies)
+            emission_latencies = list(self._emission_latencies)
 
         # Calculate handler latency percentiles
-        if self._handler_latencies:
-            sorted_latencies = sorted(self._handler_latencies)
+        if handler_latencies:
+            sorted_latencies = sorted(handler_latencies)
             n = len(sorted_latencies)
 
             metrics["handler_latency_p50"] = round(sorted_latencies[int(n * 0.50)], 2)
@@ -346,8 +629,8 @@ class EventBus:
             metrics["handler_latency_p99"] = 0.0
 
         # Calculate emission latency percentiles
-        if self._emission_latencies:
-            sorted_emission = sorted(self._emission_latencies)
+        if emission_latencies:
+            sorted_emission = sorted(emission_latencies)
             n = len(sorted_emission)
 
             metrics["emission_latency_p50"] = round(sorted_emission[int(n * 0.50)], 2)
@@ -358,6 +641,11 @@ class EventBus:
             metrics["emission_latency_p95"] = 0.0
             metrics["emission_latency_p99"] = 0.0
 
+        dispatcher = self._dispatcher
+        metrics["dispatch_mode"] = "async" if dispatcher is not None else "sync"
+        if dispatcher is not None:
+            metrics["dispatch"] = dispatcher.metrics()
+
         return metrics
 
     def get_handlers(self, event_type: str) -> List[Callable]:
@@ -393,9 +681,11 @@ class EventBus:
         """
         if event_type:
             self._handlers[event_type] = []
+            self._synchronous.pop(event_type, None)
             logger.debug(f"Cleared handlers for event '{event_type}'")
         else:
             self._handlers.clear()
+            self._synchronous.clear()
             logger.debug("Cleared all event handlers")
 
     def clear_listeners(self, event_name: str | None = None) -> None:
@@ -434,16 +724,17 @@ class EventBus:
 
     def reset_metrics(self) -> None:
         """Reset metrics for testing purposes."""
-        self._metrics = {
-            "events_emitted": 0,
-            "events_delivered": 0,
-            "handler_errors": 0,
-            "total_handler_time_ms": 0.0,
-            "total_emission_time_ms": 0.0,
-        }
-        self._event_types.clear()
-        self._handler_latencies.clear()
-        self._emission_latencies.clear()
+        with self._metrics_lock:
+            self._metrics = {
+                "events_emitted": 0,
+                "events_delivered": 0,
+                "handler_errors": 0,
+                "total_handler_time_ms": 0.0,
+                "total_emission_time_ms": 0.0,
+            }
+            self._event_types.clear()
+            self._handler_latencies.clear()
+            self._emission_latencies.clear()
         logger.debug("Reset event bus metrics")
 
     def get_event_history(self, limit: int = 100) -> List[Dict[str, Any]]:
@@ -456,11 +747,20 @@ class EventBus:
         Returns:
             List of event dictionaries with name, data, timestamp, priority
         """
-        if not self._event_history:
+        if not self._event_history or limit <= 0:
             return []
-        # Convert deque to list and slice
-        history_list = list(self._event_history)
-        return history_list[-limit:] if len(history_list) > limit else history_list
+        # Timestamps are formatted here rather than on every emit
+        events = list(self._event_history)[-limit:]
+        return [
+            {
+                "name": event.name,
+                "data": event.data,
+                "timestamp": event.timestamp.replace(tzinfo=timezone.utc).isoformat(),
+                "priority": event.priority.name,
+                "correlation_id": event.correlation_id,
+            }
+            for event in events
+        ]
 
     def clear_history(self) -> None:
         """Clear event history for testing purposes."""
@@ -0,0 +1,288 @@
+"""
+Neo Alexandria 2.0 - Graph Analytics Kernels
+
+Whole-graph NetworkX algorithms (betweenness, PageRank, Louvain) packaged
+as picklable functions over dense integer edge arrays, plus a process-wide
+pool to run them in, so the seconds they take never land on the FastAPI
+event loop.
+
+Features:
+- Kernels take (num_nodes, src, dst, weight) arrays and return per-node
+  NumPy arrays, so only arrays cross the process boundary
+- Betweenness on the undirected graph (parallel edges collapsed to their
+  lightest weight, which is the shortest-path view of the MultiGraph),
+  with k-sample approximation above a node-count threshold
+- PageRank on the directed edges (last write wins, like
+  GraphStore.to_digraph)
+- Louvain on the undirected graph with parallel edge weights summed
+- Long-lived spawn-context process pool; falls back to the default thread
+  executor when disabled or when running inside a daemonic worker (e.g.
+  Celery), and is recreated if a worker dies
+
+Related files:
+- app/modules/graph/analytics.py: Background analytics job and cache tables
+- app/modules/graph/service.py: GraphService centrality, community detection
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Kernels
+# ============================================================================
+
+
+def _undirected(
+    num_nodes: int, src: np.ndarray, dst: np.ndarray, weight: np.ndarray, how: str
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Collapse parallel edges into one (lo, hi) edge per node pair.
+
+    ``how`` is "min" (shortest-path weight) or "sum" (total weight).
+    """
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    weight = np.asarray(weight, dtype=np.float64)
+    lo, hi = np.minimum(src, dst), np.maximum(src, dst)
+    keys = lo * num_nodes + hi
+    if how == "min":
+        order = np.lexsort((weight, keys))
+        keys, weight = keys[order], weight[order]
+        unique, first = np.unique(keys, return_index=True)
+        collapsed = weight[first]
+    else:
+        unique, inverse = np.unique(keys, return_inverse=True)
+        collapsed = np.bincount(inverse, weights=weight, minlength=len(unique))
+    return unique // num_nodes, unique % num_nodes, collapsed
+
+
+def betweenness_scores(
+    num_nodes: int,
+    src: np.ndarray,
+    dst: np.ndarray,
+    weight: np.ndarray,
+    samples: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> np.ndarray:
+    """Normalized weighted betweenness centrality for nodes 0..num_nodes-1.
+
+    Args:
+        num_nodes: Number of nodes (isolated ones included)
+        src, dst, weight: Edge arrays (direction ignored)
+        samples: Source nodes to sample (None = exact, all nodes)
+        seed: Seed for the source sample
+
+    Returns:
+        float64 array of scores in [0, 1]
+    """
+    import networkx as nx
+
+    G = nx.Graph()
+    G.add_nodes_from(range(num_nodes))
+    lo, hi, w = _undirected(num_nodes, src, dst, weight, "min")
+    G.add_weighted_edges_from(zip(lo.tolist(), hi.tolist(), w.tolist()))
+    if samples is not None and samples >= num_nodes:
+        samples = None
+    scores = nx.betweenness_centrality(G, k=samples, weight="weight", seed=seed)
+    return _to_array(scores, num_nodes)
+
+
+def pagerank_scores(
+    num_nodes: int,
+    src: np.ndarray,
+    dst: np.ndarray,
+    weight: np.ndarray,
+    damping_factor: float = 0.85,
+) -> np.ndarray:
+    """Weighted PageRank over the directed edges.
+
+    Nodes without edges are not part of the ranked graph and score 0.
+
+    Args:
+        num_nodes: Number of nodes
+        src, dst, weight: Directed edge arrays; for repeated (src, dst)
+            pairs the last weight wins
+        damping_factor: Probability of following a link
+
+    Returns:
+        float64 array of scores
+    """
+    import networkx as nx
+
+    DG = nx.DiGraph()
+    DG.add_weighted_edges_from(
+        zip(
+            np.asarray(src).tolist(),
+            np.asarray(dst).tolist(),
+            np.asarray(weight, dtype=np.float64).tolist(),
+        )
+    )
+    if DG.number_of_nodes() == 0:
+        return np.zeros(num_nodes)
+    scores = nx.pagerank(DG, alpha=damping_factor, weight="weight")
+    return _to_array(scores, num_nodes)
+
+
+def centrality_scores(
+    num_nodes: int,
+    src: np.ndarray,
+    dst: np.ndarray,
+    weight: np.ndarray,
+    damping_factor: float = 0.85,
+    samples: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """(betweenness, pagerank) in one task, for the background job."""
+    betweenness = betweenness_scores(num_nodes, src, dst, weight, samples, seed)
+    try:
+        pagerank = pagerank_scores(num_nodes, src, dst, weight, damping_factor)
+    except Exception as e:
+        # PageRank can fail to converge; keep the betweenness results
+        logger.error(f"Error computing PageRank: {e}")
+        pagerank = np.zeros(num_nodes)
+    return betweenness, pagerank
+
+
+def louvain_partition(
+    num_nodes: int,
+    src: np.ndarray,
+    dst: np.ndarray,
+    weight: np.ndarray,
+    resolution: float = 1.0,
+    seed: Optional[int] = None,
+) -> Tuple[np.ndarray, float]:
+    """Louvain communities over the undirected graph.
+
+    Args:
+        num_nodes: Number of nodes (isolated ones get their own community)
+        src, dst, weight: Edge arrays; parallel edge weights are summed
+        resolution: Higher values give more, smaller communities
+        seed: Random state for the node visiting order
+
+    Returns:
+        (int64 community label per node, modularity)
+
+    Raises:
+        ImportError: If python-louvain is not installed
+    """
+    import community as community_louvain
+    import networkx as nx
+
+    if num_nodes == 0:
+        return np.zeros(0, dtype=np.int64), 0.0
+    G = nx.Graph()
+    G.add_nodes_from(range(num_nodes))
+    lo, hi, w = _undirected(num_nodes, src, dst, weight, "sum")
+    G.add_weighted_edges_from(zip(lo.tolist(), hi.tolist(), w.tolist()))
+    partition = community_louvain.best_partition(
+        G, weight="weight", resolution=resolution, random_state=seed
+    )
+    modularity = community_louvain.modularity(partition, G, weight="weight")
+    labels = np.fromiter(
+        (partition[node] for node in range(num_nodes)), dtype=np.int64, count=num_nodes
+    )
+    return labels, float(modularity)
+
+
+def _to_array(scores: dict, num_nodes: int) -> np.ndarray:
+    result = np.zeros(num_nodes)
+    if scores:
+        nodes = np.fromiter(scores.keys(), dtype=np.int64, count=len(scores))
+        result[nodes] = np.fromiter(
+            scores.values(), dtype=np.float64, count=len(scores)
+        )
+    return result
+
+
+def betweenness_sample_size(
+    num_nodes: int, exact_max_nodes: int, samples: int
+) -> Optional[int]:
+    """Number of betweenness sources to sample, or None for the exact value."""
+    if num_nodes <= exact_max_nodes or samples <= 0 or samples >= num_nodes:
+        return None
+    return samples
+
+
+# ============================================================================
+# Process pool
+# ============================================================================
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _analytics_executor() -> Optional[Executor]:
+    """Process pool for analytics, or None for the default thread executor."""
+    global _executor
+    if _executor is not None:
+        return _executor
+    from ..config.settings import get_settings
+
+    workers = get_settings().GRAPH_ANALYTICS_WORKERS
+    # Daemonic processes (Celery prefork workers) cannot have children
+    if workers <= 0 or multiprocessing.current_process().daemon:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _executor
+
+
+def _discard_executor(executor: Executor) -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def run_analytics(fn: Callable[..., Any], *args: Any) -> Any:
+    """Run a kernel in the analytics pool and wait for the result.
+
+    For background jobs; request handlers should await run_analytics_async.
+    """
+    executor = _analytics_executor()
+    if executor is None:
+        return fn(*args)
+    try:
+        return executor.submit(fn, *args).result()
+    except BrokenProcessPool:
+        # A worker died (e.g. out of memory); retry once on a new pool
+        logger.warning("Graph analytics pool broke, restarting it")
+        _discard_executor(executor)
+        executor = _analytics_executor()
+        if executor is None:
+            return fn(*args)
+        return executor.submit(fn, *args).result()
+
+
+async def run_analytics_async(fn: Callable[..., Any], *args: Any) -> Any:
+    """Await a kernel run in the analytics pool (or a thread if disabled)."""
+    loop = asyncio.get_running_loop()
+    executor = _analytics_executor()
+    try:
+        return await loop.run_in_executor(executor, fn, *args)
+    except BrokenProcessPool:
+        logger.warning("Graph analytics pool broke, restarting it")
+        _discard_executor(executor)
+        return await loop.run_in_executor(_analytics_executor(), fn, *args)
+
+
+def shutdown_analytics_pool() -> None:
+    """Stop the analytics pool (on shutdown and in tests)."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
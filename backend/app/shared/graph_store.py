@@ -0,0 +1,855 @@
+"""
+Neo Alexandria 2.0 - Shared Graph Store
+
+Keeps one compact copy of the multi-layer knowledge graph per process so
+graph endpoints stop rebuilding a NetworkX MultiGraph from every Resource,
+Citation and GraphEdge row on each request.
+
+Features:
+- Integer node ids with parallel NumPy edge arrays (source, target, edge
+  type code, weight) and lazily rebuilt CSR adjacency for out- and in-edges
+- Edge identity matches the old MultiGraph keys: one edge per unordered
+  node pair and edge type, last write wins
+- Incremental patches: an append-only edge log with tombstones, folded into
+  the arrays on the next read
+- Commit-time patches from any SQLAlchemy session that writes Resource,
+  Citation or GraphEdge rows in this process
+- Delta sync from the database via updated_at watermarks, plus a periodic
+  full rebuild to drop edges deleted behind our back
+- Optional on-disk snapshot under GRAPH_STORE_DIR so new workers start warm
+- A NetworkX view, materialised once per graph version, for algorithms
+  (betweenness, PageRank) that still run on NetworkX
+
+Related files:
+- app/modules/graph/service.py: GraphService neighbors and centrality
+- app/modules/graph/handlers.py: citation.extracted patching
+- app/tasks/celery_tasks.py: update_graph_edges_task
+- app/events/hooks.py: node removal on resource.deleted
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .delta_sync import advance_watermark, delta_window
+
+logger = logging.getLogger(__name__)
+
+CITATION_EDGE_TYPE = "citation"
+
+# Packed edge key: 24 bits per endpoint, 15 bits of edge type
+_NODE_BITS = 24
+_TYPE_BITS = 15
+_MAX_NODES = 1 << _NODE_BITS
+
+_DEFAULT_QUALITY = 0.5
+
+
+class GraphStore:
+    """Compact, incrementally patched multi-layer graph.
+
+    Nodes are resource id strings mapped to dense ints in first-seen order.
+    Edges are unique per (node pair, edge type), like the MultiGraph keys
+    GraphService used before, and are oriented from the earlier node to the
+    later one, which is how the old code's DiGraph conversion saw them.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """Create an empty store.
+
+        Args:
+            directory: Optional snapshot directory
+        """
+        self.directory = directory
+        self._lock = threading.RLock()
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        self.node_ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._node_alive: List[bool] = []
+        self._node_attrs: List[Optional[Dict[str, Any]]] = []
+
+        self._type_names: List[str] = []
+        self._type_codes: Dict[str, int] = {}
+
+        # Compacted, live edges oriented from the lower to the higher node
+        # id (NetworkX's edge iteration order) and kept in first-seen order
+        self._src = np.zeros(0, dtype=np.int32)
+        self._dst = np.zeros(0, dtype=np.int32)
+        self._etype = np.zeros(0, dtype=np.int16)
+        self._weight = np.zeros(0, dtype=np.float32)
+        # Pending writes; NaN weight marks a tombstone
+        self._log: List[Tuple[int, int, int, float]] = []
+
+        # CSR adjacency over the compacted edges
+        self._out_ptr = np.zeros(1, dtype=np.int64)
+        self._out_edges = np.zeros(0, dtype=np.int64)
+        self._in_ptr = np.zeros(1, dtype=np.int64)
+        self._in_edges = np.zeros(0, dtype=np.int64)
+
+        self.version = getattr(self, "version", 0) + 1
+        self._csr_version = -1
+        self._nx_cache: Dict[str, Tuple[int, Any]] = {}
+
+        self.loaded = False
+        self.watermarks: Dict[str, Any] = {}
+        self._last_sync = float("-inf")
+        self._last_rebuild = float("-inf")
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return sum(self._node_alive)
+
+    def has_node(self, node_id: str) -> bool:
+        idx = self._index.get(str(node_id))
+        return idx is not None and self._node_alive[idx]
+
+    @property
+    def edge_count(self) -> int:
+        with self._lock:
+            self._ensure_compact()
+            return len(self._src)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size and freshness information for monitoring."""
+        with self._lock:
+            return {
+                "nodes": len(self),
+                "edges": self.edge_count,
+                "edge_types": list(self._type_names),
+                "version": self.version,
+                "loaded": self.loaded,
+            }
+
+    def node_attrs(self, node_id: str) -> Dict[str, Any]:
+        idx = self._index.get(str(node_id))
+        if idx is None:
+            return {}
+        return self._node_attrs[idx] or {}
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def _node(self, node_id: str) -> int:
+        """Return the int id for a node, registering it if unseen."""
+        node_id = str(node_id)
+        idx = self._index.get(node_id)
+        if idx is None:
+            idx = len(self.node_ids)
+            if idx >= _MAX_NODES:
+                raise OverflowError(f"GraphStore supports at most {_MAX_NODES} nodes")
+            self.node_ids.append(node_id)
+            self._index[node_id] = idx
+            self._node_alive.append(True)
+            self._node_attrs.append(None)
+        elif not self._node_alive[idx]:
+            self._node_alive[idx] = True
+            self._node_attrs[idx] = None
+        return idx
+
+    def _type(self, edge_type: str) -> int:
+        code = self._type_codes.get(edge_type)
+        if code is None:
+            code = len(self._type_names)
+            if code >= 1 << _TYPE_BITS:
+                raise OverflowError("Too many distinct edge types")
+            self._type_names.append(edge_type)
+            self._type_codes[edge_type] = code
+        return code
+
+    def _touch(self) -> None:
+        self.version += 1
+
+    def upsert_node(
+        self,
+        node_id: str,
+        title: Optional[str] = None,
+        type: Optional[str] = None,
+        quality_overall: Optional[float] = None,
+    ) -> None:
+        """Add a node or replace its attributes."""
+        attrs = {
+            "title": title,
+            "type": type,
+            "quality_overall": _DEFAULT_QUALITY
+            if quality_overall is None
+            else quality_overall,
+        }
+        with self._lock:
+            idx = self._index.get(str(node_id))
+            if idx is not None and self._node_alive[idx] and self._node_attrs[idx] == attrs:
+                return
+            idx = self._node(node_id)
+            self._node_attrs[idx] = attrs
+            self._touch()
+
+    def add_edge(
+        self, source_id: str, target_id: str, edge_type: str, weight: float = 1.0
+    ) -> None:
+        """Add an edge, replacing any edge of the same type between the pair."""
+        self.add_edges([(source_id, target_id, edge_type, weight)])
+
+    def add_edges(
+        self,
+        edges: Iterable[Tuple[str, str, str, float]],
+        only_changed: bool = False,
+    ) -> int:
+        """Append (source, target, edge_type, weight) edges.
+
+        Args:
+            edges: Edges to write
+            only_changed: Skip edges already stored with the same weight, so
+                re-reading an unchanged window does not bump the version
+
+        Returns:
+            Number of edges written
+        """
+        with self._lock:
+            rows = [
+                (
+                    self._node(source_id),
+                    self._node(target_id),
+                    self._type(edge_type),
+                    1.0 if weight is None else float(weight),
+                )
+                for source_id, target_id, edge_type, weight in edges
+            ]
+            if only_changed and rows:
+                rows = self._changed(rows)
+            if rows:
+                self._log.extend(rows)
+                self._touch()
+            return len(rows)
+
+    def _changed(self, rows: List[Tuple[int, int, int, float]]):
+        """Drop rows that match a stored edge exactly."""
+        self._ensure_compact()
+        stored = _edge_keys(self._src, self._dst, self._etype)
+        if not len(stored):
+            return rows
+        order = np.argsort(stored)
+        stored = stored[order]
+        batch = np.asarray(rows, dtype=np.float64).reshape(-1, 4)
+        keys = _edge_keys(
+            batch[:, 0].astype(np.int64),
+            batch[:, 1].astype(np.int64),
+            batch[:, 2].astype(np.int64),
+        )
+        pos = np.minimum(np.searchsorted(stored, keys), len(stored) - 1)
+        same = (stored[pos] == keys) & (
+            self._weight[order[pos]] == batch[:, 3].astype(np.float32)
+        )
+        return [row for row, skip in zip(rows, same) if not skip]
+
+    def remove_edge(self, source_id: str, target_id: str, edge_type: str) -> None:
+        """Remove the edge of a type between a pair (either direction)."""
+        with self._lock:
+            src = self._index.get(str(source_id))
+            dst = self._index.get(str(target_id))
+            code = self._type_codes.get(edge_type)
+            if src is None or dst is None or code is None:
+                return
+            self._log.append((src, dst, code, float("nan")))
+            self._touch()
+
+    def remove_node(self, node_id: str) -> None:
+        """Remove a node and every edge touching it."""
+        with self._lock:
+            idx = self._index.get(str(node_id))
+            if idx is None or not self._node_alive[idx]:
+                return
+            self._ensure_compact()
+            for edge in self._incident(idx):
+                self._log.append(
+                    (
+                        int(self._src[edge]),
+                        int(self._dst[edge]),
+                        int(self._etype[edge]),
+                        float("nan"),
+                    )
+                )
+            self._node_alive[idx] = False
+            self._node_attrs[idx] = None
+            self._touch()
+
+    def replace_incident_edges(
+        self, node_id: str, edges: Iterable[Tuple[str, str, str, float]]
+    ) -> None:
+        """Swap every edge touching ``node_id`` for ``edges`` in one version."""
+        with self._lock:
+            idx = self._index.get(str(node_id))
+            if idx is not None:
+                self._ensure_compact()
+                for edge in self._incident(idx):
+                    self._log.append(
+                        (
+                            int(self._src[edge]),
+                            int(self._dst[edge]),
+                            int(self._etype[edge]),
+                            float("nan"),
+                        )
+                    )
+            self.add_edges(edges)
+            self._touch()
+
+    def clear(self) -> None:
+        """Drop all nodes and edges (keeps configuration)."""
+        with self._lock:
+            self._reset_state()
+
+    # ------------------------------------------------------------------
+    # Compaction and CSR
+    # ------------------------------------------------------------------
+
+    def _ensure_compact(self) -> None:
+        """Fold the pending log into the edge arrays and rebuild CSR."""
+        if self._log:
+            log = np.asarray(self._log, dtype=np.float64).reshape(-1, 4)
+            self._log = []
+            src = np.concatenate([self._src, log[:, 0].astype(np.int32)])
+            dst = np.concatenate([self._dst, log[:, 1].astype(np.int32)])
+            etype = np.concatenate([self._etype, log[:, 2].astype(np.int16)])
+            weight = np.concatenate([self._weight, log[:, 3].astype(np.float32)])
+
+            lo = np.minimum(src, dst)
+            hi = np.maximum(src, dst)
+            keys = _edge_keys(lo, hi, etype)
+            # Like a MultiGraph keyed by edge type: an edge keeps the position
+            # of its first write and the value of its last write
+            _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+            last = np.zeros(len(first), dtype=np.int64)
+            np.maximum.at(last, inverse.reshape(-1), np.arange(len(keys)))
+            live = ~np.isnan(weight[last])
+            first, last = first[live], last[live]
+            order = np.argsort(first, kind="stable")
+            first, last = first[order], last[order]
+
+            self._src, self._dst = lo[first], hi[first]
+            self._etype, self._weight = etype[first], weight[last]
+
+        if self._csr_version == self.version:
+            return
+        n = len(self.node_ids)
+        self._out_ptr, self._out_edges = _csr(self._src, n)
+        self._in_ptr, self._in_edges = _csr(self._dst, n)
+        self._csr_version = self.version
+
+    def _incident(self, idx: int) -> np.ndarray:
+        """Edge indices touching a node, in insertion order (self-loops once)."""
+        out = self._out_edges[self._out_ptr[idx] : self._out_ptr[idx + 1]]
+        inc = self._in_edges[self._in_ptr[idx] : self._in_ptr[idx + 1]]
+        inc = inc[self._src[inc] != idx]
+        edges = np.concatenate([out, inc])
+        edges.sort()
+        return edges
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def neighbors(self, node_id: str) -> Dict[str, List[Tuple[str, float]]]:
+        """Neighbors of a node with the (edge_type, weight) of each edge.
+
+        Neighbors appear in order of their first edge, like NetworkX
+        adjacency iteration; a self-loop lists the node as its own neighbor.
+        """
+        with self._lock:
+            idx = self._index.get(str(node_id))
+            if idx is None or not self._node_alive[idx]:
+                return {}
+            self._ensure_compact()
+            result: Dict[str, List[Tuple[str, float]]] = {}
+            for edge in self._incident(idx):
+                other = self._dst[edge] if self._src[edge] == idx else self._src[edge]
+                result.setdefault(self.node_ids[other], []).append(
+                    (self._type_names[self._etype[edge]], float(self._weight[edge]))
+                )
+            return result
+
+    def degrees(self, node_ids: Sequence[str]) -> Dict[str, Tuple[int, int]]:
+        """(in_degree, out_degree) counting distinct neighbors per direction."""
+        with self._lock:
+            self._ensure_compact()
+            result: Dict[str, Tuple[int, int]] = {}
+            for node_id in node_ids:
+                idx = self._index.get(str(node_id))
+                if idx is None or not self._node_alive[idx]:
+                    continue
+                out = self._out_edges[self._out_ptr[idx] : self._out_ptr[idx + 1]]
+                inc = self._in_edges[self._in_ptr[idx] : self._in_ptr[idx + 1]]
+                result[str(node_id)] = (
+                    int(np.unique(self._src[inc]).size),
+                    int(np.unique(self._dst[out]).size),
+                )
+            return result
+
+    def directed_edges(self) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+        """Return (node_ids, src, dst, weight) for the live directed edges."""
+        with self._lock:
+            self._ensure_compact()
+            return list(self.node_ids), self._src.copy(), self._dst.copy(), self._weight.copy()
+
+    def live_edges(self) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+        """Like directed_edges(), over the live nodes only.
+
+        Returns (node_ids, src, dst, weight) where src/dst index into the
+        returned node_ids, which lists every live node (isolated ones too).
+        """
+        with self._lock:
+            self._ensure_compact()
+            alive = np.fromiter(self._node_alive, dtype=bool, count=len(self.node_ids))
+            positions = np.flatnonzero(alive)
+            remap = np.full(len(self.node_ids), -1, dtype=np.int32)
+            remap[positions] = np.arange(len(positions), dtype=np.int32)
+            return (
+                [self.node_ids[idx] for idx in positions.tolist()],
+                remap[self._src],
+                remap[self._dst],
+                self._weight.copy(),
+            )
+
+    def to_networkx(self):
+        """Materialise an undirected MultiGraph once per graph version.
+
+        The returned graph is shared between callers and must be treated as
+        read-only.
+        """
+        return self._cached_view("multigraph", self._build_multigraph)
+
+    def to_digraph(self):
+        """Directed view (multi-edges collapsed, last write wins), cached."""
+        return self._cached_view("digraph", self._build_digraph)
+
+    def _cached_view(self, name: str, builder):
+        with self._lock:
+            cached = self._nx_cache.get(name)
+            if cached is not None and cached[0] == self.version:
+                return cached[1]
+            self._ensure_compact()
+            graph = builder()
+            self._nx_cache[name] = (self.version, graph)
+            return graph
+
+    def _build_multigraph(self):
+        import networkx as nx
+
+        G = nx.MultiGraph()
+        for idx, node_id in enumerate(self.node_ids):
+            if self._node_alive[idx]:
+                G.add_node(node_id, **(self._node_attrs[idx] or {}))
+        names, types = self.node_ids, self._type_names
+        G.add_edges_from(
+            (
+                names[s],
+                names[d],
+                types[t],
+                {"edge_type": types[t], "weight": float(w)},
+            )
+            for s, d, t, w in zip(
+                self._src.tolist(),
+                self._dst.tolist(),
+                self._etype.tolist(),
+                self._weight.tolist(),
+            )
+        )
+        return G
+
+    def _build_digraph(self):
+        import networkx as nx
+
+        DG = nx.DiGraph()
+        names = self.node_ids
+        DG.add_edges_from(
+            (names[s], names[d], {"weight": float(w)})
+            for s, d, w in zip(
+                self._src.tolist(), self._dst.tolist(), self._weight.tolist()
+            )
+        )
+        return DG
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def _snapshot_paths(self) -> Tuple[str, str]:
+        return (
+            os.path.join(self.directory, "graph_store.npz"),
+            os.path.join(self.directory, "graph_store.json"),
+        )
+
+    def save_snapshot(self) -> bool:
+        """Write the compacted graph to GRAPH_STORE_DIR (atomic rename)."""
+        if not self.directory:
+            return False
+        with self._lock:
+            self._ensure_compact()
+            os.makedirs(self.directory, exist_ok=True)
+            npz_path, meta_path = self._snapshot_paths()
+            tmp_npz = f"{npz_path}.{os.getpid()}.tmp.npz"
+            tmp_meta = f"{meta_path}.{os.getpid()}.tmp"
+            np.savez(
+                tmp_npz,
+                src=self._src,
+                dst=self._dst,
+                etype=self._etype,
+                weight=self._weight,
+            )
+            with open(tmp_meta, "w", encoding="utf-8") as fh:
+                json.dump(
+                    {
+                        "node_ids": self.node_ids,
+                        "node_alive": self._node_alive,
+                        "node_attrs": self._node_attrs,
+                        "edge_types": self._type_names,
+                        "watermarks": {
+                            k: v.isoformat() if v is not None else None
+                            for k, v in self.watermarks.items()
+                        },
+                    },
+                    fh,
+                )
+            os.replace(tmp_npz, npz_path)
+            os.replace(tmp_meta, meta_path)
+        return True
+
+    def load_snapshot(self) -> bool:
+        """Load a snapshot written by this or another worker."""
+        if not self.directory:
+            return False
+        npz_path, meta_path = self._snapshot_paths()
+        if not (os.path.exists(npz_path) and os.path.exists(meta_path)):
+            return False
+        from datetime import datetime
+
+        try:
+            with open(meta_path, encoding="utf-8") as fh:
+                meta = json.load(fh)
+            arrays = np.load(npz_path)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable graph snapshot: {e}")
+            return False
+        with self._lock:
+            self.node_ids = list(meta["node_ids"])
+            self._index = {node_id: i for i, node_id in enumerate(self.node_ids)}
+            self._node_alive = list(meta["node_alive"])
+            self._node_attrs = list(meta["node_attrs"])
+            self._type_names = list(meta["edge_types"])
+            self._type_codes = {name: i for i, name in enumerate(self._type_names)}
+            self._src = arrays["src"].astype(np.int32)
+            self._dst = arrays["dst"].astype(np.int32)
+            self._etype = arrays["etype"].astype(np.int16)
+            self._weight = arrays["weight"].astype(np.float32)
+            self._log = []
+            self.watermarks = {
+                k: datetime.fromisoformat(v) if v else None
+                for k, v in meta.get("watermarks", {}).items()
+            }
+            self.loaded = True
+            self._touch()
+        return True
+
+
+def _edge_keys(src: np.ndarray, dst: np.ndarray, etype: np.ndarray) -> np.ndarray:
+    """Pack (unordered pair, edge type) into one int64 per edge."""
+    lo = np.minimum(src, dst).astype(np.int64)
+    hi = np.maximum(src, dst).astype(np.int64)
+    return (lo << (_NODE_BITS + _TYPE_BITS)) | (hi << _TYPE_BITS) | etype.astype(np.int64)
+
+
+def _csr(rows: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Build (indptr, edge indices) grouping edges by ``rows``, stable order."""
+    order = np.argsort(rows, kind="stable").astype(np.int64)
+    counts = np.bincount(rows, minlength=n) if len(rows) else np.zeros(n, dtype=np.int64)
+    ptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(counts, out=ptr[1:])
+    return ptr, order
+
+
+# ============================================================================
+# Database sync
+# ============================================================================
+
+
+def _load_rows(store: GraphStore, db, since: Optional[Dict[str, Any]] = None) -> None:
+    """Read resources, citations and graph edges into the store.
+
+    Citations are applied before GraphEdge rows so an explicit graph edge
+    overrides a citation between the same pair, as the MultiGraph did.
+    """
+    from ..database.models import Citation, GraphEdge, Resource
+
+    def window(query, column, table):
+        return delta_window(query, column, (since or {}).get(table))
+
+    resources = window(
+        db.query(
+            Resource.id,
+            Resource.title,
+            Resource.type,
+            Resource.quality_overall,
+            Resource.updated_at,
+        ),
+        Resource.updated_at,
+        "resources",
+    )
+    for rid, title, rtype, quality, updated_at in resources.yield_per(5000):
+        store.upsert_node(str(rid), title=title, type=rtype, quality_overall=quality)
+        store.watermarks["resources"] = advance_watermark(
+            store.watermarks.get("resources"), updated_at
+        )
+
+    citations = window(
+        db.query(
+            Citation.source_resource_id,
+            Citation.target_resource_id,
+            Citation.updated_at,
+        ).filter(Citation.target_resource_id.isnot(None)),
+        Citation.updated_at,
+        "citations",
+    )
+    batch = []
+    for source_id, target_id, updated_at in citations.yield_per(5000):
+        batch.append((str(source_id), str(target_id), CITATION_EDGE_TYPE, 1.0))
+        store.watermarks["citations"] = advance_watermark(
+            store.watermarks.get("citations"), updated_at
+        )
+    store.add_edges(batch, only_changed=since is not None)
+
+    edges = window(
+        db.query(
+            GraphEdge.source_id,
+            GraphEdge.target_id,
+            GraphEdge.edge_type,
+            GraphEdge.weight,
+            GraphEdge.updated_at,
+        ),
+        GraphEdge.updated_at,
+        "graph_edges",
+    )
+    batch = []
+    for source_id, target_id, edge_type, weight, updated_at in edges.yield_per(5000):
+        batch.append((str(source_id), str(target_id), edge_type, weight))
+        store.watermarks["graph_edges"] = advance_watermark(
+            store.watermarks.get("graph_edges"), updated_at
+        )
+    store.add_edges(batch, only_changed=since is not None)
+
+
+def sync_graph_store(store: GraphStore, db, force: bool = False) -> GraphStore:
+    """Bring the store up to date with the database.
+
+    First use loads the on-disk snapshot (or builds from the database).
+    Afterwards only rows whose ``updated_at`` moved past the per-table
+    watermark are re-read, at most every GRAPH_STORE_REFRESH_SECONDS, and
+    the whole graph is rebuilt every GRAPH_STORE_REBUILD_SECONDS to drop
+    edges deleted without passing through this process.
+
+    Args:
+        store: Store to sync
+        db: Database session
+        force: Ignore the refresh throttle and rebuild from scratch
+
+    Returns:
+        The same store, for chaining
+    """
+    from ..config.settings import get_settings
+
+    settings = get_settings()
+    now = time.monotonic()
+
+    with store._lock:
+        if not force and not store.loaded and store.load_snapshot():
+            # Snapshot may be behind the database; the delta sync below
+            # catches up from its watermarks
+            store._last_rebuild = now
+        elif force or not store.loaded or (
+            now - store._last_rebuild >= settings.GRAPH_STORE_REBUILD_SECONDS
+        ):
+            started = time.monotonic()
+            store.clear()
+            _load_rows(store, db)
+            store.loaded = True
+            store._last_rebuild = store._last_sync = now
+            store.save_snapshot()
+            logger.info(
+                f"Built graph store with {len(store)} nodes and "
+                f"{store.edge_count} edges in {time.monotonic() - started:.2f}s"
+            )
+            return store
+
+        if now - store._last_sync < settings.GRAPH_STORE_REFRESH_SECONDS:
+            return store
+        store._last_sync = now
+        _load_rows(store, db, since=dict(store.watermarks))
+    return store
+
+
+def refresh_resource_edges(store: GraphStore, db, resource_id: str) -> None:
+    """Re-read every edge touching one resource and swap it into the store.
+
+    Used by citation.extracted handling so a resource's new citations show
+    up immediately instead of at the next delta sync.
+    """
+    if not store.loaded:
+        return
+    from sqlalchemy import or_
+
+    from ..database.models import Citation, GraphEdge
+
+    rid = str(resource_id)
+    edges: List[Tuple[str, str, str, float]] = []
+    citations = db.query(Citation.source_resource_id, Citation.target_resource_id).filter(
+        Citation.target_resource_id.isnot(None),
+        or_(Citation.source_resource_id == rid, Citation.target_resource_id == rid),
+    )
+    for source_id, target_id in citations:
+        edges.append((str(source_id), str(target_id), CITATION_EDGE_TYPE, 1.0))
+    graph_edges = db.query(
+        GraphEdge.source_id, GraphEdge.target_id, GraphEdge.edge_type, GraphEdge.weight
+    ).filter(or_(GraphEdge.source_id == rid, GraphEdge.target_id == rid))
+    for source_id, target_id, edge_type, weight in graph_edges:
+        edges.append((str(source_id), str(target_id), edge_type, weight))
+
+    store.replace_incident_edges(rid, edges)
+
+
+# ============================================================================
+# Commit-time patching
+# ============================================================================
+
+
+_PENDING_KEY = "graph_store_pending"
+
+
+def _collect_changes(session, flush_context) -> None:
+    """after_flush: record graph-relevant row changes until commit."""
+    store = _store
+    if store is None or not store.loaded:
+        return
+    from ..database.models import Citation, GraphEdge, Resource
+
+    pending = session.info.setdefault(_PENDING_KEY, [])
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, Resource):
+            pending.append(
+                ("node", str(obj.id), obj.title, obj.type, obj.quality_overall)
+            )
+        elif isinstance(obj, GraphEdge):
+            pending.append(
+                ("edge", str(obj.source_id), str(obj.target_id), obj.edge_type, obj.weight)
+            )
+        elif isinstance(obj, Citation) and obj.target_resource_id is not None:
+            pending.append(
+                (
+                    "edge",
+                    str(obj.source_resource_id),
+                    str(obj.target_resource_id),
+                    CITATION_EDGE_TYPE,
+                    1.0,
+                )
+            )
+    for obj in session.deleted:
+        if isinstance(obj, Resource):
+            pending.append(("drop_node", str(obj.id)))
+        elif isinstance(obj, GraphEdge):
+            pending.append(
+                ("drop_edge", str(obj.source_id), str(obj.target_id), obj.edge_type)
+            )
+        elif isinstance(obj, Citation) and obj.target_resource_id is not None:
+            pending.append(
+                (
+                    "drop_edge",
+                    str(obj.source_resource_id),
+                    str(obj.target_resource_id),
+                    CITATION_EDGE_TYPE,
+                )
+            )
+
+
+def _apply_changes(session) -> None:
+    """after_commit: apply the recorded changes to the shared store."""
+    pending = session.info.pop(_PENDING_KEY, None)
+    store = _store
+    if not pending or store is None or not store.loaded:
+        return
+    try:
+        for change in pending:
+            kind = change[0]
+            if kind == "node":
+                store.upsert_node(
+                    change[1], title=change[2], type=change[3], quality_overall=change[4]
+                )
+            elif kind == "edge":
+                store.add_edge(change[1], change[2], change[3], change[4])
+            elif kind == "drop_node":
+                store.remove_node(change[1])
+            elif kind == "drop_edge":
+                store.remove_edge(change[1], change[2], change[3])
+    except Exception as e:
+        logger.warning(f"Graph store patch failed, forcing rebuild: {e}")
+        store.loaded = False
+
+
+def _discard_changes(session, *args) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def _install_session_hooks() -> None:
+    """Attach the commit hooks to the application's session class only."""
+    from sqlalchemy import event
+
+    from .database import AppSession
+
+    if not event.contains(AppSession, "after_flush", _collect_changes):
+        event.listen(AppSession, "after_flush", _collect_changes)
+        event.listen(AppSession, "after_commit", _apply_changes)
+        event.listen(AppSession, "after_rollback", _discard_changes)
+
+
+# ============================================================================
+# Process-wide instance
+# ============================================================================
+
+
+_store: Optional[GraphStore] = None
+_store_lock = threading.Lock()
+
+
+def get_graph_store(db=None, force: bool = False) -> GraphStore:
+    """Return the process-wide graph store.
+
+    Args:
+        db: Optional session; when given, the store is synced before returning
+        force: Rebuild from the database even if the store is fresh
+
+    Returns:
+        The shared GraphStore
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                from ..config.settings import get_settings
+
+                _install_session_hooks()
+                _store = GraphStore(directory=get_settings().GRAPH_STORE_DIR)
+    if db is not None:
+        sync_graph_store(_store, db, force=force)
+    return _store
+
+
+def reset_graph_store() -> None:
+    """Discard the process-wide store (used by tests)."""
+    global _store
+    with _store_lock:
+        _store = None
@@ -0,0 +1,413 @@
+"""
+Neo Alexandria 2.0 - Vectorized Graph Walks
+
+Generates node2vec random walks over CSR adjacency arrays instead of one
+walk at a time over a NetworkX graph with a fresh neighbor and probability
+list per step.
+
+Features:
+- Directed graph as CSR arrays (indptr, sorted indices) over dense node
+  indexes, built once from (source, target) id pairs
+- All walks of a shard advance together, one NumPy step per hop
+- First hop samples a uniform out-neighbor straight from the CSR slice
+- Later hops draw the node2vec second-order transition (1/p to return,
+  1 to a neighbor of the previous node, 1/q outward) by rejection sampling:
+  a uniform candidate is accepted with probability weight / max weight,
+  which yields exactly the node2vec distribution without per-edge alias
+  tables (those grow with the sum of squared out-degrees)
+- Edge membership looked up (binary search over packed edge keys) only
+  for the proposals whose acceptance depends on it
+- Shards spread over a process pool and streamed to a line-per-walk
+  corpus file, so the full walk list never sits in memory
+
+Related files:
+- app/modules/graph/embeddings.py: GraphEmbeddingsService (node2vec/DeepWalk)
+"""
+
+import logging
+import multiprocessing
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Start nodes per shard: one (shard, walk_length) int32 matrix per task
+DEFAULT_SHARD_SIZE = 4096
+
+# Cap on rejection-sampling proposals drawn per pending walk and round
+_MAX_TRIALS = 32
+
+# Shards submitted ahead of the writer, per pool worker
+_IN_FLIGHT_PER_WORKER = 2
+
+
+class WalkGraph:
+    """Directed graph as CSR arrays over dense node indexes.
+
+    Attributes:
+        node_ids: Node id for each dense index
+        indptr: Out-edges of node i are ``indices[indptr[i]:indptr[i + 1]]``
+        indices: Edge targets, sorted within each row, no duplicates
+    """
+
+    def __init__(self, node_ids: List[str], indptr: np.ndarray, indices: np.ndarray):
+        self.node_ids = node_ids
+        self.indptr = indptr
+        self.indices = indices
+        self._edge_keys: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_edges(
+        cls, node_ids: Iterable[str], edges: Iterable[Tuple[str, str]]
+    ) -> "WalkGraph":
+        """Build the graph from node ids plus directed (source, target) pairs.
+
+        Edge endpoints missing from ``node_ids`` are added as nodes; duplicate
+        edges collapse into one, like a NetworkX DiGraph.
+        """
+        index = {}
+        ids: List[str] = []
+
+        def lookup(node_id: str) -> int:
+            idx = index.get(node_id)
+            if idx is None:
+                idx = index[node_id] = len(ids)
+                ids.append(node_id)
+            return idx
+
+        src, dst = array("q"), array("q")
+        for source, target in edges:
+            src.append(lookup(source))
+            dst.append(lookup(target))
+        for node_id in node_ids:
+            lookup(node_id)
+
+        n = len(ids)
+        keys = np.unique(
+            np.frombuffer(src, dtype=np.int64) * n + np.frombuffer(dst, dtype=np.int64)
+        )
+        counts = np.bincount(keys // n, minlength=n) if n else np.zeros(0, np.int64)
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        indices = (keys % n if n else keys).astype(np.int32)
+
+        graph = cls(ids, indptr, indices)
+        graph._edge_keys = keys
+        return graph
+
+    @classmethod
+    def from_networkx(cls, G) -> "WalkGraph":
+        """Build the graph from a NetworkX (Di)Graph."""
+        return cls.from_edges(G.nodes(), G.edges())
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.indices)
+
+    @property
+    def edge_keys(self) -> np.ndarray:
+        """Sorted ``source * num_nodes + target`` key per edge."""
+        if self._edge_keys is None:
+            degrees = np.diff(self.indptr)
+            self._edge_keys = (
+                np.repeat(np.arange(self.num_nodes, dtype=np.int64), degrees)
+                * self.num_nodes
+                + self.indices
+            )
+        return self._edge_keys
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (indptr, indices, edge_keys), the state walk workers need."""
+        return self.indptr, self.indices, self.edge_keys
+
+    def walk_starts(self) -> np.ndarray:
+        """Indexes of nodes with at least one out-edge (others yield no walks)."""
+        return np.flatnonzero(np.diff(self.indptr)).astype(np.int32)
+
+
+# ============================================================================
+# Walk kernel
+# ============================================================================
+
+
+def _has_edges(
+    edge_keys: np.ndarray, num_nodes: int, src: np.ndarray, dst: np.ndarray
+) -> np.ndarray:
+    """Vectorized ``has_edge(src[i], dst[i])``."""
+    keys = (src.astype(np.int64) * num_nodes + dst).ravel()
+    # Sorted probes walk edge_keys in order instead of jumping around it
+    order = np.argsort(keys)
+    pos = np.searchsorted(edge_keys, keys[order])
+    hit = pos < len(edge_keys)
+    hit[hit] = edge_keys[pos[hit]] == keys[order][hit]
+    found = np.empty_like(hit)
+    found[order] = hit
+    return found.reshape(np.shape(src))
+
+
+def walk_batch(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    edge_keys: np.ndarray,
+    starts: np.ndarray,
+    walk_length: int,
+    p: float = 1.0,
+    q: float = 1.0,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """Run one node2vec walk from each start node.
+
+    Args:
+        indptr, indices, edge_keys: CSR arrays from WalkGraph.arrays()
+        starts: Start node indexes
+        walk_length: Maximum number of nodes per walk
+        p: Return parameter
+        q: In-out parameter
+        rng: NumPy random generator
+
+    Returns:
+        (len(starts), walk_length) int32 matrix of node indexes; walks that
+        reach a node without out-edges stop early and are padded with -1
+    """
+    rng = rng or np.random.default_rng()
+    num_nodes = len(indptr) - 1
+    walks = np.full((len(starts), walk_length), -1, dtype=np.int32)
+    if not len(starts) or walk_length <= 0:
+        return walks
+    walks[:, 0] = starts
+
+    biased = p != 1.0 or q != 1.0
+    return_weight, out_weight = 1.0 / p, 1.0 / q
+    max_weight = max(return_weight, 1.0, out_weight)
+    low_weight, high_weight = min(1.0, out_weight), max(1.0, out_weight)
+
+    alive = np.arange(len(starts))
+    for step in range(1, walk_length):
+        cur = walks[alive, step - 1]
+        offset = indptr[cur]
+        degree = indptr[cur + 1] - offset
+        moving = degree > 0
+        alive, offset, degree = alive[moving], offset[moving], degree[moving]
+        if not len(alive):
+            break
+
+        if step == 1 or not biased:
+            pick = (rng.random(len(alive)) * degree).astype(np.int64)
+            walks[alive, step] = indices[offset + pick]
+            continue
+
+        prev = walks[alive, step - 2]
+        chosen = np.empty(len(alive), dtype=np.int32)
+        pending = np.arange(len(alive))
+        trials = 1
+        while len(pending):
+            # i.i.d. proposals per walk, doubling for the walks still
+            # pending; the first accepted proposal wins
+            shape = (len(pending), trials)
+            pick = (rng.random(shape) * degree[pending, None]).astype(np.int64)
+            candidate = indices[offset[pending, None] + pick]
+            came_from = np.broadcast_to(prev[pending, None], shape)
+            draw = rng.random(shape) * max_weight
+            returning = candidate == came_from
+            accept = np.where(returning, draw < return_weight, draw < low_weight)
+            # Only draws between the common-neighbor and outward weights
+            # depend on whether the previous node links to the candidate
+            check = ~returning & (draw >= low_weight) & (draw < high_weight)
+            if check.any():
+                linked = _has_edges(
+                    edge_keys, num_nodes, came_from[check], candidate[check]
+                )
+                accept[check] = linked if out_weight < 1.0 else ~linked
+            first = accept.argmax(axis=1)
+            done = accept[np.arange(len(pending)), first]
+            chosen[pending[done]] = candidate[done, first[done]]
+            pending = pending[~done]
+            trials = min(trials * 2, _MAX_TRIALS)
+        walks[alive, step] = chosen
+
+    return walks
+
+
+def walk_lengths(walks: np.ndarray) -> np.ndarray:
+    """Number of nodes in each padded walk."""
+    return (walks >= 0).sum(axis=1)
+
+
+def format_walks(walks: np.ndarray) -> Tuple[bytes, int]:
+    """Encode walks of two or more nodes as corpus lines of node indexes.
+
+    Returns:
+        (utf-8 text, number of walks written)
+    """
+    lines = [
+        " ".join(map(str, row[:length]))
+        for row, length in zip(walks.tolist(), walk_lengths(walks).tolist())
+        if length > 1
+    ]
+    if not lines:
+        return b"", 0
+    return ("\n".join(lines) + "\n").encode(), len(lines)
+
+
+# ============================================================================
+# Sharded generation
+# ============================================================================
+
+_worker_arrays: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+
+def _init_worker(
+    indptr: np.ndarray, indices: np.ndarray, edge_keys: np.ndarray
+) -> None:
+    """Pool initializer: receive the CSR arrays once per worker process."""
+    global _worker_arrays
+    _worker_arrays = (indptr, indices, edge_keys)
+
+
+def _walk_shard(task, arrays=None) -> Tuple[bytes, int]:
+    starts, walk_length, p, q, seed = task
+    walks = walk_batch(
+        *(arrays or _worker_arrays),
+        starts,
+        walk_length,
+        p,
+        q,
+        np.random.default_rng(seed),
+    )
+    return format_walks(walks)
+
+
+def _shard_tasks(
+    graph: WalkGraph,
+    num_walks: int,
+    walk_length: int,
+    p: float,
+    q: float,
+    shard_size: int,
+    seed: Optional[int],
+) -> Tuple[int, Iterator[tuple]]:
+    """Return (shard count, lazy task iterator).
+
+    Every round visits the start nodes in a fresh random order, like the
+    old per-node loop; seeds derive from one SeedSequence so the corpus is
+    reproducible for a given seed whatever the number of workers.
+    """
+    starts = graph.walk_starts()
+    shard_size = max(1, shard_size)
+    per_round = -(-len(starts) // shard_size)
+    seeds = np.random.SeedSequence(seed)
+
+    def tasks():
+        for _ in range(num_walks):
+            order = np.random.default_rng(seeds.spawn(1)[0]).permutation(starts)
+            for lo in range(0, len(order), shard_size):
+                yield (
+                    order[lo : lo + shard_size],
+                    walk_length,
+                    p,
+                    q,
+                    seeds.spawn(1)[0],
+                )
+
+    return per_round * num_walks, tasks()
+
+
+def generate_walks(
+    graph: WalkGraph,
+    num_walks: int,
+    walk_length: int,
+    p: float = 1.0,
+    q: float = 1.0,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    seed: Optional[int] = None,
+) -> Iterator[np.ndarray]:
+    """Yield padded walk matrices shard by shard, in this process."""
+    _, tasks = _shard_tasks(graph, num_walks, walk_length, p, q, shard_size, seed)
+    arrays = graph.arrays()
+    for starts, length, p_, q_, shard_seed in tasks:
+        yield walk_batch(
+            *arrays, starts, length, p_, q_, np.random.default_rng(shard_seed)
+        )
+
+
+def write_walk_corpus(
+    graph: WalkGraph,
+    path: str,
+    num_walks: int,
+    walk_length: int,
+    p: float = 1.0,
+    q: float = 1.0,
+    workers: int = 1,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    seed: Optional[int] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> int:
+    """Stream node2vec walks to ``path``, one space-separated walk per line.
+
+    Tokens are dense node indexes (``graph.node_ids[int(token)]``). With
+    ``workers > 1`` shards run in a process pool; at most a few shards per
+    worker are in flight, so memory stays bounded by the shard size.
+
+    Args:
+        graph: Graph to walk
+        path: Corpus file to (over)write
+        num_walks: Walks per start node
+        walk_length: Maximum nodes per walk
+        p: Return parameter
+        q: In-out parameter
+        workers: Walk processes; 1 runs in this process
+        shard_size: Start nodes per shard
+        seed: Optional seed for a reproducible corpus
+        progress: Optional callback(shards_done, shards_total)
+
+    Returns:
+        Number of walks written
+    """
+    total, tasks = _shard_tasks(graph, num_walks, walk_length, p, q, shard_size, seed)
+    written = 0
+    done = 0
+
+    with open(path, "wb") as corpus:
+
+        def consume(result: Tuple[bytes, int]) -> None:
+            nonlocal written, done
+            text, count = result
+            corpus.write(text)
+            written += count
+            done += 1
+            if progress is not None:
+                progress(done, total)
+
+        if workers <= 1 or total <= 1:
+            arrays = graph.arrays()
+            for task in tasks:
+                consume(_walk_shard(task, arrays))
+        else:
+            # Spawned workers do not inherit the server's threads and locks
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=graph.arrays(),
+            ) as pool:
+                in_flight = deque()
+                for task in tasks:
+                    in_flight.append(pool.submit(_walk_shard, task))
+                    if len(in_flight) >= workers * _IN_FLIGHT_PER_WORKER:
+                        consume(in_flight.popleft().result())
+                while in_flight:
+                    consume(in_flight.popleft().result())
+
+    logger.info(
+        f"Wrote {written} walks over {graph.num_nodes} nodes "
+        f"({total} shards, {workers} workers)"
+    )
+    return written
@@ -0,0 +1,343 @@
+"""
+Neo Alexandria 2.0 - Shared Model Registry
+
+Holds every heavyweight ML model at most once per process. Services are
+still constructed per request (EmbeddingService(db), RerankingService(db),
+RealSPLADEService(db), AICore()), but they fetch their model from this
+registry instead of loading a private copy.
+
+Features:
+- One load per (kind, model name, device) key, with per-key locks so
+  concurrent first requests wait for a single load
+- Failed loads are remembered for a cooldown instead of retried per request
+- Startup warmup of selected models (MODEL_WARMUP)
+- Explicit unload, idle unload and an optional resident-memory budget
+  (MODEL_REGISTRY_MAX_BYTES) that evicts least recently used models
+- Resident memory report per model (parameter/buffer bytes, falling back
+  to the process RSS growth measured during the load)
+
+Related files:
+- app/shared/embeddings.py: Dense embedding model
+- app/shared/ai_core.py: Summarizer and zero-shot tagger pipelines
+- app/modules/search/sparse_embeddings_real.py: SPLADE model
+- app/modules/search/reranking.py: Cross-encoder model
+"""
+
+import gc
+import logging
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds before a failed load is attempted again
+_FAILURE_COOLDOWN_SECONDS = 300.0
+
+
+@dataclass
+class ModelEntry:
+    """A loaded model and its bookkeeping."""
+
+    key: str
+    model: Any
+    load_seconds: float
+    resident_bytes: int
+    loaded_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    uses: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "resident_bytes": self.resident_bytes,
+            "resident_mb": round(self.resident_bytes / (1024 * 1024), 1),
+            "device": _device_of(self.model),
+            "load_seconds": round(self.load_seconds, 3),
+            "idle_seconds": round(now - self.last_used, 1),
+            "uses": self.uses,
+        }
+
+
+class ModelRegistry:
+    """Process-wide cache of loaded models keyed by string."""
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        """Create an empty registry.
+
+        Args:
+            max_bytes: Optional budget for the summed resident bytes of all
+                loaded models; least recently used models are unloaded to
+                make room for a new one
+        """
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._entries: Dict[str, ModelEntry] = {}
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._failures: Dict[str, float] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+
+    def get(self, key: str, loader: Optional[Callable[[], Any]] = None) -> Any:
+        """Return the model for ``key``, loading it on first use.
+
+        Args:
+            key: Registry key, e.g. "sentence-transformer:<name>@cpu"
+            loader: Zero-argument callable returning the model. The latest
+                loader is remembered so the model can be reloaded after an
+                unload or by warmup(); it must not capture request state
+                such as a database session.
+
+        Returns:
+            The shared model, or None if loading failed or no loader is known
+        """
+        if loader is not None:
+            self._loaders[key] = loader
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.last_used = time.monotonic()
+            entry.uses += 1
+            return entry.model
+
+        loader = self._loaders.get(key)
+        if loader is None:
+            return None
+
+        with self._key_lock(key):
+            entry = self._entries.get(key)
+            if entry is None:
+                failed_at = self._failures.get(key)
+                if (
+                    failed_at is not None
+                    and time.monotonic() - failed_at < _FAILURE_COOLDOWN_SECONDS
+                ):
+                    return None
+                entry = self._load(key, loader)
+                if entry is None:
+                    return None
+            entry.last_used = time.monotonic()
+            entry.uses += 1
+            return entry.model
+
+    def peek(self, key: str) -> Any:
+        """Return the model if it is loaded, without loading it."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        entry.last_used = time.monotonic()
+        return entry.model
+
+    def _load(self, key: str, loader: Callable[[], Any]) -> Optional[ModelEntry]:
+        rss_before = _process_rss()
+        started = time.monotonic()
+        try:
+            model = loader()
+        except Exception as e:
+            logger.error(f"Failed to load model {key}: {e}")
+            model = None
+        if model is None:
+            self._failures[key] = time.monotonic()
+            return None
+
+        load_seconds = time.monotonic() - started
+        resident = _resident_bytes(model)
+        if not resident and rss_before is not None:
+            resident = max(0, (_process_rss() or rss_before) - rss_before)
+
+        entry = ModelEntry(
+            key=key, model=model, load_seconds=load_seconds, resident_bytes=resident
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._failures.pop(key, None)
+        logger.info(
+            f"Loaded model {key} in {load_seconds:.2f}s "
+            f"(~{resident / (1024 * 1024):.0f} MB resident)"
+        )
+        self._enforce_budget(keep=key)
+        return entry
+
+    def _enforce_budget(self, keep: str) -> None:
+        if not self.max_bytes:
+            return
+        with self._lock:
+            by_age = sorted(
+                (e for e in self._entries.values() if e.key != keep),
+                key=lambda e: e.last_used,
+            )
+            total = sum(e.resident_bytes for e in self._entries.values())
+            evict = []
+            for entry in by_age:
+                if total <= self.max_bytes:
+                    break
+                evict.append(entry.key)
+                total -= entry.resident_bytes
+        for key in evict:
+            logger.info(f"Model budget exceeded, unloading {key}")
+            self.unload(key)
+
+    def warmup(self, keys: Optional[List[str]] = None) -> Dict[str, bool]:
+        """Load models with known loaders ahead of the first request.
+
+        Args:
+            keys: Keys to load; defaults to every key with a known loader
+
+        Returns:
+            Mapping of key to whether the model is loaded
+        """
+        keys = list(self._loaders) if keys is None else keys
+        return {key: self.get(key) is not None for key in keys}
+
+    def unload(self, key: str) -> bool:
+        """Drop a model so its memory can be reclaimed.
+
+        Services fetch models per call, so the next use reloads it.
+
+        Returns:
+            True if the model was loaded
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        del entry
+        _release_memory()
+        logger.info(f"Unloaded model {key}")
+        return True
+
+    def unload_idle(self, max_idle_seconds: float) -> List[str]:
+        """Unload every model unused for ``max_idle_seconds``."""
+        cutoff = time.monotonic() - max_idle_seconds
+        idle = [k for k, e in list(self._entries.items()) if e.last_used < cutoff]
+        for key in idle:
+            self.unload(key)
+        return idle
+
+    def unload_all(self) -> None:
+        for key in list(self._entries):
+            self.unload(key)
+        self._failures.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Resident memory and usage per loaded model."""
+        entries = list(self._entries.values())
+        return {
+            "models": {e.key: e.as_dict() for e in entries},
+            "total_resident_bytes": sum(e.resident_bytes for e in entries),
+            "max_bytes": self.max_bytes,
+            "process_rss_bytes": _process_rss(),
+            "failed": sorted(self._failures),
+        }
+
+
+# ============================================================================
+# Memory helpers
+# ============================================================================
+
+
+def _tensor_bytes(module) -> int:
+    total = 0
+    for tensors in (module.parameters(), module.buffers()):
+        for t in tensors:
+            total += t.numel() * t.element_size()
+    return total
+
+
+def _resident_bytes(model: Any) -> int:
+    """Best-effort parameter and buffer bytes of a torch-backed model.
+
+    Handles nn.Module subclasses (SentenceTransformer), wrappers exposing a
+    ``model`` attribute (CrossEncoder, transformers pipelines) and tuples
+    such as (tokenizer, model).
+    """
+    try:
+        if isinstance(model, (tuple, list)):
+            return sum(_resident_bytes(m) for m in model)
+        if callable(getattr(model, "parameters", None)) and callable(
+            getattr(model, "buffers", None)
+        ):
+            return _tensor_bytes(model)
+        inner = getattr(model, "model", None)
+        if inner is not None and inner is not model:
+            return _resident_bytes(inner)
+    except Exception:
+        pass
+    return 0
+
+
+def _device_of(model: Any) -> Optional[str]:
+    if isinstance(model, (tuple, list)):
+        for m in model:
+            device = _device_of(m)
+            if device:
+                return device
+        return None
+    device = getattr(model, "device", None)
+    if device is None and getattr(model, "model", None) is not None:
+        device = getattr(model.model, "device", None)
+    return str(device) if device is not None else None
+
+
+def _process_rss() -> Optional[int]:
+    try:
+        import psutil
+
+        return psutil.Process(os.getpid()).memory_info().rss
+    except Exception:
+        return None
+
+
+def _release_memory() -> None:
+    gc.collect()
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        try:
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except Exception:
+            pass
+
+
+# ============================================================================
+# Process-wide instance
+# ============================================================================
+
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Return the process-wide model registry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                from ..config.settings import get_settings
+
+                _registry = ModelRegistry(
+                    max_bytes=get_settings().MODEL_REGISTRY_MAX_BYTES
+                )
+    return _registry
+
+
+def reset_model_registry() -> None:
+    """Unload everything and discard the registry (used by tests)."""
+    global _registry
+    with _registry_lock:
+        if _registry is not None:
+            _registry.unload_all()
+        _registry = None
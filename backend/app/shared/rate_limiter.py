@@ -1,11 +1,13 @@
 """
 Neo Alexandria 2.0 - Rate Limiting Service
 
-This module provides API key-based rate limiting using Redis sliding window algorithm
-to prevent API abuse and ensure fair resource usage.
+This module provides API key-based rate limiting using the Generic Cell Rate
+Algorithm (GCRA) in Redis to prevent API abuse and ensure fair resource usage.
 
 Features:
-- Sliding window algorithm for accurate rate limiting
+- GCRA (smoothed sliding window) evaluated atomically in one Redis script call
+- In-process token leases: tokens are taken from Redis in small batches so
+  most requests are authorized without a Redis round trip
 - Configurable rate limits per tier (free, premium, admin)
 - HTTP 429 responses with Retry-After header
 - Rate limit headers (X-RateLimit-Limit, X-RateLimit-Remaining, X-RateLimit-Reset)
@@ -13,48 +15,162 @@ Features:
 
 Related files:
 - app/shared/security.py: API key authentication
+- app/modules/auth/router.py: Login/refresh limits and rate limit status
 - app/config/settings.py: Rate limit configuration
 - app/shared/cache.py: Redis cache service
 """
 
 import logging
+import math
+import threading
 import time
-from typing import Tuple
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
 
 
 from ..config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# GCRA over a theoretical arrival time (TAT, ms) stored per key.
+# KEYS[1]: bucket key; ARGV: limit, period_ms, tokens requested and
+# (optionally) unused tokens to give back first, e.g. from an expired lease.
+# Grants as many of the requested tokens as fit (0 requested only reads).
+# Returns {granted, remaining, retry_after_ms, reset_after_ms}.
+_GCRA_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local refund = tonumber(ARGV[4]) or 0
+local interval = period / limit
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+if tat < now then
+  tat = now
+end
+if refund > 0 then
+  tat = math.max(tat - refund * interval, now)
+end
+local available = math.max(math.floor((period - (tat - now)) / interval + 1e-9), 0)
+local granted = math.min(requested, available)
+if granted > 0 then
+  tat = tat + granted * interval
+end
+if granted > 0 or refund > 0 then
+  if tat > now then
+    redis.call('SET', KEYS[1], tostring(tat), 'PX', math.ceil(tat - now))
+  else
+    redis.call('DEL', KEYS[1])
+  end
+end
+local retry_after = 0
+if granted < requested then
+  retry_after = math.max(math.ceil(tat + interval - period - now), 1)
+end
+return {granted, available - granted, retry_after, math.ceil(tat - now)}
+"""
+
+
+@dataclass
+class RateLimitDecision:
+    """Outcome of a rate limit check.
+
+    Attributes:
+        allowed: Whether the request may proceed
+        limit: Requests allowed per period
+        remaining: Requests that could still be made right now
+        reset: Unix timestamp when the full allowance is available again
+        retry_after: Seconds until the next request is allowed (0 if allowed)
+    """
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset: int
+    retry_after: int = 0
+
+
+class _Lease:
+    """Tokens taken from Redis for one key and not yet used."""
+
+    __slots__ = ("tokens", "remaining", "reset", "expires_at")
+
+    def __init__(self, tokens: int, remaining: int, reset: int, expires_at: float):
+        self.tokens = tokens
+        self.remaining = remaining
+        self.reset = reset
+        self.expires_at = expires_at
+
 
 class RateLimiter:
-    """Rate limiting service using Redis sliding window algorithm.
+    """Rate limiting service using GCRA in Redis.
 
     This class implements per-API-key rate limiting with configurable tiers
     and graceful degradation when Redis is unavailable.
 
+    Every Redis check is one atomic script call (EVALSHA), so concurrent
+    requests can neither race nor undercount. For per-minute API limits the
+    limiter also leases up to RATE_LIMIT_LOCAL_BATCH tokens at a time (never
+    more than a tenth of the limit) and serves requests from the lease until
+    it is used up or RATE_LIMIT_LOCAL_LEASE_SECONDS pass. Leased tokens are
+    charged in Redis up front, so the combined rate across processes never
+    exceeds the limit; tokens left in an expired lease are given back by
+    the next Redis call for that key, so slow clients are not charged for
+    tokens they never used.
+
     Attributes:
-        cache: Redis cache instance for request counting
+        cache: Redis cache instance (its ``redis`` client runs the script)
         settings: Application settings with rate limit configuration
+        local_batch: Tokens leased per Redis call (<= 1 disables leasing)
+        lease_seconds: Lifetime of a lease
     """
 
-    def __init__(self, cache=None):
+    KEY_PREFIX = "rate_limit"
+    # Leases kept before expired ones are pruned
+    MAX_LEASES = 10000
+
+    def __init__(
+        self,
+        cache=None,
+        local_batch: Optional[int] = None,
+        lease_seconds: Optional[float] = None,
+    ):
         """Initialize rate limiter.
 
         Args:
-            cache: Optional Redis cache instance. If not provided,
-                  creates a new instance.
+            cache: Optional Redis cache instance. If not provided, the
+                  shared cache from app/shared/cache.py is used.
+            local_batch: Tokens leased per Redis call
+                (default: RATE_LIMIT_LOCAL_BATCH)
+            lease_seconds: Lease lifetime
+                (default: RATE_LIMIT_LOCAL_LEASE_SECONDS)
         """
         self.cache = cache
         self.settings = get_settings()
+        self.local_batch = (
+            local_batch
+            if local_batch is not None
+            else self.settings.RATE_LIMIT_LOCAL_BATCH
+        )
+        self.lease_seconds = (
+            lease_seconds
+            if lease_seconds is not None
+            else self.settings.RATE_LIMIT_LOCAL_LEASE_SECONDS
+        )
+        self._leases: Dict[str, _Lease] = {}
+        self._lock = threading.Lock()
+        self._script = None
+        self._script_client = None
 
     async def check_rate_limit(
         self, api_key: str, tier: str, endpoint: str
     ) -> Tuple[bool, dict]:
         """Check if request is within rate limits.
 
-        Uses sliding window algorithm with per-minute granularity.
-        Tracks requests in Redis with automatic TTL expiration.
+        Uses GCRA with a per-minute allowance: requests are spread over the
+        minute with bursts of up to the full limit. Served from a local
+        lease when one is available, otherwise with one Redis script call.
 
         Args:
             api_key: API key identifier
@@ -72,47 +188,173 @@ class RateLimiter:
 
         # Get rate limit for tier
         limit = self._get_tier_limit(tier)
-
-        # Calculate current minute window
-        current_minute = int(time.time() // 60)
-        window_key = f"rate_limit:{api_key}:{current_minute}"
+        if limit <= 0:
+            return True, self._get_rate_limit_headers(0, 0, 0)
 
         try:
-            if not self.cache:
-                # No cache available, fail open
-                return True, {}
-
-            # Get current count for this window
-            current_count_str = await self.cache.get(window_key)
-            current_count = int(current_count_str) if current_count_str else 0
-
-            # Check if limit exceeded
-            if current_count >= limit:
-                # Rate limit exceeded
-                reset_time = (current_minute + 1) * 60
-                headers = self._get_rate_limit_headers(limit, 0, reset_time)
-                logger.warning(
-                    f"Rate limit exceeded for API key (tier: {tier}): "
-                    f"{current_count}/{limit} requests"
-                )
-                return False, headers
+            decision = self._take(f"{self.KEY_PREFIX}:{api_key}", limit, 60)
+        except Exception as e:
+            # Fail open if Redis is unavailable
+            logger.warning(f"Rate limit check failed: {e} - allowing request")
+            return True, {}
+
+        if decision is None:
+            # No cache available, fail open
+            return True, {}
 
-            # Increment counter with TTL
-            await self.cache.set(window_key, str(current_count + 1), ttl=60)
+        headers = self._get_rate_limit_headers(
+            limit, decision.remaining, decision.reset
+        )
+        if not decision.allowed:
+            headers["Retry-After"] = str(decision.retry_after)
+            logger.warning(
+                f"Rate limit exceeded for API key (tier: {tier}): "
+                f"{limit} requests per minute"
+            )
+        return decision.allowed, headers
 
-            # Calculate remaining requests
-            remaining = limit - current_count - 1
-            reset_time = (current_minute + 1) * 60
-            headers = self._get_rate_limit_headers(limit, remaining, reset_time)
+    def hit(
+        self, key: str, limit: int, period: float, cost: int = 1
+    ) -> Optional[RateLimitDecision]:
+        """Count one request against ``limit`` per ``period`` seconds.
 
-            return True, headers
+        One atomic Redis script call; no local leasing.
 
-        except Exception as e:
-            # Fail open if Redis is unavailable
-            logger.warning(
-                f"Rate limit check failed: {e} - allowing request"
+        Args:
+            key: Redis key of the bucket
+            limit: Requests allowed per period
+            period: Period in seconds
+            cost: Tokens the request consumes
+
+        Returns:
+            RateLimitDecision, or None if Redis is not configured
+
+        Raises:
+            Exception: Redis errors (callers fail open)
+        """
+        result = self._run_script(key, limit, period, cost)
+        if result is None:
+            return None
+        granted, remaining, retry_after, reset = result
+        return RateLimitDecision(
+            allowed=granted >= cost,
+            limit=limit,
+            remaining=remaining,
+            reset=reset,
+            retry_after=retry_after,
+        )
+
+    def get_status(self, api_key: str, tier: str) -> Optional[RateLimitDecision]:
+        """Read an API key's allowance without consuming a request.
+
+        Returns:
+            RateLimitDecision, or None for unlimited tiers or without Redis
+        """
+        limit = 0 if tier == "admin" else self._get_tier_limit(tier)
+        if limit <= 0:
+            return None
+        key = f"{self.KEY_PREFIX}:{api_key}"
+        decision = self.hit(key, limit, 60, cost=0)
+        if decision is not None:
+            with self._lock:
+                lease = self._leases.get(key)
+                if lease is not None and lease.expires_at > time.monotonic():
+                    decision.remaining += lease.tokens
+        return decision
+
+    def _take(
+        self, key: str, limit: int, period: float
+    ) -> Optional[RateLimitDecision]:
+        """Take one token, from the local lease if possible."""
+        batch = min(self.local_batch, limit // 10)
+        if batch <= 1:
+            return self.hit(key, limit, period)
+
+        now = time.monotonic()
+        refund = 0
+        with self._lock:
+            lease = self._leases.get(key)
+            if lease is not None and lease.expires_at <= now:
+                # Give the expired lease's unused tokens back with this call
+                refund = lease.tokens
+                del self._leases[key]
+            elif lease is not None and lease.tokens > 0:
+                lease.tokens -= 1
+                return RateLimitDecision(
+                    allowed=True,
+                    limit=limit,
+                    remaining=lease.remaining + lease.tokens,
+                    reset=lease.reset,
+                )
+
+        result = self._run_script(key, limit, period, batch, refund=refund)
+        if result is None:
+            return None
+        granted, remaining, retry_after, reset = result
+        if granted == 0:
+            return RateLimitDecision(
+                allowed=False,
+                limit=limit,
+                remaining=0,
+                reset=reset,
+                retry_after=retry_after,
             )
-            return True, {}
+
+        with self._lock:
+            if len(self._leases) >= self.MAX_LEASES:
+                self._prune_leases(now)
+            lease = self._leases.get(key)
+            if lease is not None and lease.expires_at > now:
+                # A concurrent request leased too; pool the tokens
+                lease.tokens += granted - 1
+            else:
+                lease = _Lease(granted - 1, 0, reset, now + self.lease_seconds)
+                self._leases[key] = lease
+            lease.remaining = remaining
+            lease.reset = reset
+            return RateLimitDecision(
+                allowed=True,
+                limit=limit,
+                remaining=remaining + lease.tokens,
+                reset=reset,
+            )
+
+    def _prune_leases(self, now: float) -> None:
+        expired = [
+            key for key, lease in self._leases.items() if lease.expires_at <= now
+        ]
+        for key in expired:
+            del self._leases[key]
+
+    def _run_script(
+        self, key: str, limit: int, period: float, requested: int, refund: int = 0
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """Run the GCRA script; returns (granted, remaining, retry_after, reset).
+
+        ``refund`` unused tokens are given back before ``requested`` are taken.
+        """
+        redis = self._redis()
+        if redis is None:
+            return None
+        if self._script is None or self._script_client is not redis:
+            # register_script runs EVALSHA and falls back to EVAL once
+            self._script = redis.register_script(_GCRA_SCRIPT)
+            self._script_client = redis
+        granted, remaining, retry_after_ms, reset_after_ms = self._script(
+            keys=[key], args=[limit, int(period * 1000), requested, refund]
+        )
+        return (
+            int(granted),
+            int(remaining),
+            math.ceil(int(retry_after_ms) / 1000),
+            math.ceil(time.time() + int(reset_after_ms) / 1000),
+        )
+
+    def _redis(self):
+        cache_service = self.cache
+        if cache_service is None:
+            from .cache import cache as cache_service
+        return getattr(cache_service, "redis", None)
 
     def _get_tier_limit(self, tier: str) -> int:
         """Get rate limit for user tier.
@@ -121,15 +363,14 @@ class RateLimiter:
             tier: User tier (free, premium, admin)
 
         Returns:
-            Requests per minute limit
+            Requests per minute limit (0 = unlimited)
         """
-        # Default limits (can be configured via settings)
         limits = {
-            "free": 60,  # 60 requests per minute
-            "premium": 300,  # 300 requests per minute
-            "admin": 999999,  # Unlimited
+            "free": self.settings.RATE_LIMIT_FREE_TIER,
+            "premium": self.settings.RATE_LIMIT_PREMIUM_TIER,
+            "admin": self.settings.RATE_LIMIT_ADMIN_TIER,
         }
-        return limits.get(tier, 60)
+        return limits.get(tier, self.settings.RATE_LIMIT_FREE_TIER)
 
     def _get_rate_limit_headers(self, limit: int, remaining: int, reset: int) -> dict:
         """Generate rate limit headers.
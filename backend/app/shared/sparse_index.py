@@ -0,0 +1,415 @@
+"""
+Neo Alexandria 2.0 - Inverted Index for Sparse (SPLADE) Vectors
+
+This module provides a posting-list index over learned sparse embeddings so
+the sparse retrieval leg only touches the posting lists of the query tokens
+instead of loading and JSON-decoding every resource's sparse_embedding.
+
+Features:
+- Posting list per token with int32 doc numbers and float16 weights
+- MaxScore top-k evaluation: lists whose score upper bound can no longer
+  lift a new document into the top k are only probed for existing
+  candidates
+- Dot-product scoring (SPLADE) and min-overlap scoring (the pgvector
+  sparse_vector_search formula)
+- Incremental upsert/remove with periodic compaction of deleted postings
+- Process-wide resource index built from resources.sparse_embedding and
+  kept in sync via sparse_embedding_updated_at deltas
+
+Related files:
+- app/services/search_service.py: AdvancedSearchService._execute_sparse_search
+- app/modules/search/vector_search_real.py: RealVectorSearchService.sparse_vector_search
+- app/modules/search/sparse_embeddings_real.py: Batch sparse embedding updates
+- app/events/hooks.py: Deletion hook
+"""
+
+import json
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .delta_sync import WatermarkSyncedIndex
+from .embedding_store import top_k
+
+logger = logging.getLogger(__name__)
+
+SCORING_FUNCTIONS = ("dot", "min")
+
+
+def coerce_sparse(value: Any) -> Optional[Dict[str, float]]:
+    """Convert a stored sparse embedding (JSON text or dict) into a dict.
+
+    Args:
+        value: Sparse embedding as stored in the database
+
+    Returns:
+        Dict of token -> positive weight, or None if empty or unparseable
+    """
+    if value is None:
+        return None
+    if isinstance(value, (bytes, bytearray)):
+        value = value.decode("utf-8")
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return None
+        try:
+            value = json.loads(value)
+        except (ValueError, TypeError):
+            return None
+    if not isinstance(value, dict):
+        return None
+    vector = {}
+    for token, weight in value.items():
+        try:
+            weight = float(weight)
+        except (TypeError, ValueError):
+            continue
+        if weight > 0:
+            vector[str(token)] = weight
+    return vector or None
+
+
+class _PostingList:
+    """Doc numbers (ascending) and weights for one token."""
+
+    __slots__ = ("docs", "weights", "pending_docs", "pending_weights", "max_weight")
+
+    def __init__(self) -> None:
+        self.docs = np.zeros(0, dtype=np.int32)
+        self.weights = np.zeros(0, dtype=np.float16)
+        self.pending_docs: List[int] = []
+        self.pending_weights: List[float] = []
+        self.max_weight = 0.0
+
+    def append(self, doc: int, weight: float) -> None:
+        self.pending_docs.append(doc)
+        self.pending_weights.append(weight)
+        if weight > self.max_weight:
+            self.max_weight = weight
+
+    def freeze(self) -> None:
+        """Fold pending postings into the arrays (doc numbers stay sorted)."""
+        if not self.pending_docs:
+            return
+        self.docs = np.concatenate(
+            [self.docs, np.asarray(self.pending_docs, dtype=np.int32)]
+        )
+        self.weights = np.concatenate(
+            [self.weights, np.asarray(self.pending_weights, dtype=np.float16)]
+        )
+        self.pending_docs = []
+        self.pending_weights = []
+
+    def __len__(self) -> int:
+        return len(self.docs) + len(self.pending_docs)
+
+
+class SparseIndex:
+    """Inverted index over sparse token-weight vectors.
+
+    Documents get monotonically increasing internal doc numbers, so posting
+    lists stay sorted by doc number as documents are appended. Replacing or
+    removing a document only marks its old number dead; dead postings are
+    dropped by ``compact()`` once they exceed ``compact_ratio`` of the index.
+    """
+
+    def __init__(self, name: str = "resources", compact_ratio: float = 0.3) -> None:
+        self.name = name
+        self.compact_ratio = compact_ratio
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._postings: Dict[str, _PostingList] = {}
+        self._doc_ids: List[Optional[str]] = []
+        self._doc_numbers: Dict[str, int] = {}
+        self._live = np.zeros(0, dtype=bool)
+        self._dead = 0
+        self._built = False
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    @property
+    def is_built(self) -> bool:
+        return self._built
+
+    def __len__(self) -> int:
+        return len(self._doc_numbers)
+
+    def __contains__(self, item_id: str) -> bool:
+        return str(item_id) in self._doc_numbers
+
+    def stats(self) -> Dict[str, Any]:
+        """Return index statistics for monitoring endpoints."""
+        with self._lock:
+            postings = sum(len(plist) for plist in self._postings.values())
+            return {
+                "name": self.name,
+                "size": len(self),
+                "dead": self._dead,
+                "terms": len(self._postings),
+                "postings": postings,
+            }
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def build(self, items: Iterable[Tuple[str, Optional[Dict[str, float]]]]) -> int:
+        """Replace the index contents with the given (item_id, vector) pairs.
+
+        Args:
+            items: Iterable of (item_id, sparse vector) pairs
+
+        Returns:
+            Number of documents indexed
+        """
+        with self._lock:
+            self._reset()
+            for item_id, vector in items:
+                if vector:
+                    self._add(str(item_id), vector)
+            self._grow_live()
+            for plist in self._postings.values():
+                plist.freeze()
+            self._built = True
+            logger.info(
+                f"Built sparse index '{self.name}' with {len(self)} documents "
+                f"and {len(self._postings)} terms"
+            )
+            return len(self)
+
+    def upsert(self, item_id: str, vector: Optional[Dict[str, float]]) -> None:
+        """Insert or replace a document (an empty vector removes it)."""
+        item_id = str(item_id)
+        with self._lock:
+            self._kill(item_id)
+            if vector:
+                self._add(item_id, vector)
+                self._grow_live()
+            self._built = True
+            self._maybe_compact()
+
+    def remove(self, item_id: str) -> bool:
+        """Remove a document. Returns True if it was present."""
+        with self._lock:
+            removed = self._kill(str(item_id))
+            self._maybe_compact()
+            return removed
+
+    def _add(self, item_id: str, vector: Dict[str, float]) -> None:
+        doc = len(self._doc_ids)
+        self._doc_ids.append(item_id)
+        self._doc_numbers[item_id] = doc
+        for token, weight in vector.items():
+            plist = self._postings.get(token)
+            if plist is None:
+                plist = self._postings[token] = _PostingList()
+            plist.append(doc, float(weight))
+
+    def _grow_live(self) -> None:
+        needed = len(self._doc_ids)
+        capacity = len(self._live)
+        if needed > capacity:
+            grown = np.ones(max(needed, capacity * 2, 1024), dtype=bool)
+            grown[:capacity] = self._live
+            self._live = grown
+
+    def _kill(self, item_id: str) -> bool:
+        doc = self._doc_numbers.pop(item_id, None)
+        if doc is None:
+            return False
+        self._doc_ids[doc] = None
+        self._live[doc] = False
+        self._dead += 1
+        return True
+
+    def _maybe_compact(self) -> None:
+        total = len(self._doc_ids)
+        if total >= 1000 and self._dead > self.compact_ratio * total:
+            self.compact()
+
+    def compact(self) -> None:
+        """Drop dead postings and renumber documents densely."""
+        with self._lock:
+            self._grow_live()
+            renumber = np.cumsum(self._live, dtype=np.int64) - 1
+            for token in list(self._postings):
+                plist = self._postings[token]
+                plist.freeze()
+                keep = self._live[plist.docs]
+                if not keep.any():
+                    del self._postings[token]
+                    continue
+                plist.docs = renumber[plist.docs[keep]].astype(np.int32)
+                plist.weights = plist.weights[keep]
+                plist.max_weight = float(plist.weights.max())
+            self._doc_ids = [item_id for item_id in self._doc_ids if item_id is not None]
+            self._doc_numbers = {item_id: doc for doc, item_id in enumerate(self._doc_ids)}
+            self._live = np.ones(max(len(self._doc_ids), 1024), dtype=bool)
+            self._dead = 0
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def search(
+        self, query: Dict[Any, float], k: int = 10, scoring: str = "dot"
+    ) -> List[Tuple[str, float]]:
+        """Find the k highest-scoring documents for a sparse query.
+
+        Uses MaxScore: query terms are visited in decreasing order of their
+        score upper bound; once the bounds of the remaining terms cannot lift
+        an unseen document above the current k-th score, those lists are only
+        probed (by binary search) for documents already in the candidate set.
+
+        Args:
+            query: Sparse query vector {token: weight}
+            k: Number of results
+            scoring: "dot" (sum of products) or "min" (sum of min weights)
+
+        Returns:
+            List of (item_id, score) tuples with score > 0, sorted descending
+        """
+        if scoring not in SCORING_FUNCTIONS:
+            raise ValueError(f"Unknown sparse scoring function: {scoring}")
+        if k <= 0 or not query:
+            return []
+
+        with self._lock:
+            terms = []
+            for token, weight in query.items():
+                plist = self._postings.get(str(token))
+                if plist is None or weight is None or float(weight) <= 0:
+                    continue
+                plist.freeze()
+                weight = float(weight)
+                bound = (
+                    weight * plist.max_weight
+                    if scoring == "dot"
+                    else min(weight, plist.max_weight)
+                )
+                terms.append((bound, weight, plist))
+            if not terms:
+                return []
+
+            terms.sort(key=lambda term: term[0], reverse=True)
+            remaining = np.cumsum([bound for bound, _, _ in terms][::-1])[::-1]
+
+            cand_docs = np.zeros(0, dtype=np.int64)
+            cand_scores = np.zeros(0, dtype=np.float32)
+            for i, (_, weight, plist) in enumerate(terms):
+                threshold = self._kth_score(cand_scores, k)
+                if threshold is not None and remaining[i] <= threshold:
+                    if len(plist.docs) == 0:
+                        continue
+                    # Non-essential list: drop candidates that cannot reach the
+                    # top k, then probe the list for the survivors only
+                    keep = cand_scores + remaining[i] >= threshold
+                    cand_docs, cand_scores = cand_docs[keep], cand_scores[keep]
+                    pos = np.searchsorted(plist.docs, cand_docs)
+                    pos_clipped = np.minimum(pos, len(plist.docs) - 1)
+                    found = (pos < len(plist.docs)) & (plist.docs[pos_clipped] == cand_docs)
+                    cand_scores[found] += self._contribution(
+                        weight, plist.weights[pos_clipped[found]], scoring
+                    )
+                    continue
+
+                # Essential list: every live document in it is a candidate
+                live = self._live[plist.docs]
+                docs = plist.docs[live].astype(np.int64)
+                contrib = self._contribution(weight, plist.weights[live], scoring)
+                all_docs = np.concatenate([cand_docs, docs])
+                all_scores = np.concatenate([cand_scores, contrib])
+                cand_docs, inverse = np.unique(all_docs, return_inverse=True)
+                cand_scores = np.bincount(
+                    inverse.ravel(), weights=all_scores, minlength=len(cand_docs)
+                ).astype(np.float32)
+
+            order = top_k(cand_scores, k)
+            return [
+                (self._doc_ids[cand_docs[i]], float(cand_scores[i]))
+                for i in order
+                if cand_scores[i] > 0
+            ]
+
+    @staticmethod
+    def _contribution(weight: float, weights: np.ndarray, scoring: str) -> np.ndarray:
+        weights = weights.astype(np.float32)
+        if scoring == "dot":
+            return weight * weights
+        return np.minimum(weight, weights)
+
+    @staticmethod
+    def _kth_score(scores: np.ndarray, k: int) -> Optional[float]:
+        if len(scores) < k:
+            return None
+        return float(np.partition(scores, len(scores) - k)[len(scores) - k])
+
+
+class ResourceSparseIndex(WatermarkSyncedIndex):
+    """Process-wide inverted index over ``resources.sparse_embedding``.
+
+    Built lazily from the database and refreshed incrementally by reading
+    rows whose ``sparse_embedding_updated_at`` moved past the last sync
+    watermark (throttled to ``VECTOR_INDEX_REFRESH_SECONDS``). Batch sparse
+    embedding updates push their output straight into the index.
+    """
+
+    def __init__(self, index: Optional[SparseIndex] = None) -> None:
+        super().__init__(
+            index if index is not None else SparseIndex(name="resources")
+        )
+
+    def _columns(self):
+        from ..database.models import Resource
+
+        return (
+            Resource.id,
+            Resource.sparse_embedding,
+            Resource.sparse_embedding_updated_at,
+        )
+
+    def _build_rows(self, db):
+        from ..database.models import Resource
+
+        rows = (
+            db.query(Resource.id, Resource.sparse_embedding)
+            .filter(Resource.sparse_embedding.isnot(None))
+            .yield_per(2000)
+        )
+        return ((str(rid), coerce_sparse(sparse)) for rid, sparse in rows)
+
+    def _apply(self, item_id: str, sparse_embedding: Any) -> None:
+        self.index.upsert(item_id, coerce_sparse(sparse_embedding))
+
+    def upsert(self, resource_id: str, sparse_embedding: Any) -> None:
+        """Apply a known sparse embedding change (no-op until built)."""
+        if self.index.is_built:
+            self._apply(str(resource_id), sparse_embedding)
+
+
+_resource_sparse_index: Optional[ResourceSparseIndex] = None
+_resource_sparse_index_lock = threading.Lock()
+
+
+def get_resource_sparse_index() -> ResourceSparseIndex:
+    """Return the process-wide resource sparse index (created lazily)."""
+    global _resource_sparse_index
+    if _resource_sparse_index is None:
+        with _resource_sparse_index_lock:
+            if _resource_sparse_index is None:
+                _resource_sparse_index = ResourceSparseIndex()
+    return _resource_sparse_index
+
+
+def reset_resource_sparse_index() -> None:
+    """Discard the process-wide resource sparse index (used by tests)."""
+    global _resource_sparse_index
+    with _resource_sparse_index_lock:
+        _resource_sparse_index = None
@@ -0,0 +1,254 @@
+"""
+Neo Alexandria 2.0 - Inverted Subject Index
+
+This module provides an in-process inverted index from canonical subjects
+(and classification codes) to resources, so hybrid neighbor discovery looks
+up the resources sharing a subject instead of scanning ``resources.subject``
+with one ``LIKE '%subject%'`` clause per subject. Matching keeps the LIKE
+semantics (case-insensitive substring), but scans the distinct subject
+vocabulary rather than every resource row.
+
+Features:
+- Posting set per lower-cased subject and per classification code
+- Shared-subject ranking (resources sharing the most subjects first)
+- Incremental upsert/remove
+- Process-wide resource index built from resources.subject and
+  resources.classification_code and kept in sync via updated_at deltas
+
+Related files:
+- app/modules/graph/service.py: find_hybrid_neighbors candidate generation
+- app/events/hooks.py: Deletion hook
+"""
+
+import json
+import logging
+import threading
+from collections import Counter
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from .delta_sync import WatermarkSyncedIndex
+
+logger = logging.getLogger(__name__)
+
+
+def coerce_subjects(value: Any) -> FrozenSet[str]:
+    """Convert a stored subject list (JSON text or list) into a set of strings."""
+    if value is None:
+        return frozenset()
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except (ValueError, TypeError):
+            return frozenset()
+    if not isinstance(value, (list, tuple, set, frozenset)):
+        return frozenset()
+    return frozenset(str(s) for s in value if s)
+
+
+class SubjectIndex:
+    """Inverted index of subjects and classification codes to item ids."""
+
+    def __init__(self, name: str = "resources") -> None:
+        self.name = name
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._postings: Dict[str, Set[str]] = {}
+        self._subjects: Dict[str, FrozenSet[str]] = {}
+        self._by_code: Dict[str, Set[str]] = {}
+        self._codes: Dict[str, str] = {}
+        self._built = False
+
+    @property
+    def is_built(self) -> bool:
+        """Whether the index has been built (possibly empty)."""
+        return self._built
+
+    def __len__(self) -> int:
+        return len(set(self._subjects) | set(self._codes))
+
+    def __contains__(self, item_id: str) -> bool:
+        item_id = str(item_id)
+        return item_id in self._subjects or item_id in self._codes
+
+    def stats(self) -> Dict[str, Any]:
+        """Return index size statistics."""
+        with self._lock:
+            return {
+                "name": self.name,
+                "items": len(self),
+                "subjects": len(self._postings),
+                "classification_codes": len(self._by_code),
+            }
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def build(self, items: Iterable[Tuple[str, Any, Optional[str]]]) -> int:
+        """Rebuild the index from (item_id, subjects, classification_code) rows.
+
+        Returns:
+            Number of items indexed
+        """
+        with self._lock:
+            self._reset()
+            for item_id, subjects, code in items:
+                self._add(str(item_id), coerce_subjects(subjects), code)
+            self._built = True
+            logger.info(
+                f"Built subject index '{self.name}' with {len(self)} items and "
+                f"{len(self._postings)} subjects"
+            )
+            return len(self)
+
+    def upsert(self, item_id: str, subjects: Any, code: Optional[str]) -> None:
+        """Replace an item's subjects and classification code."""
+        item_id = str(item_id)
+        with self._lock:
+            self._discard(item_id)
+            self._add(item_id, coerce_subjects(subjects), code)
+
+    def remove(self, item_id: str) -> bool:
+        """Drop an item. Returns True if it was indexed."""
+        item_id = str(item_id)
+        with self._lock:
+            present = item_id in self
+            self._discard(item_id)
+            return present
+
+    def _add(self, item_id: str, subjects: FrozenSet[str], code: Optional[str]) -> None:
+        subjects = frozenset(subject.lower() for subject in subjects)
+        if subjects:
+            self._subjects[item_id] = subjects
+            for subject in subjects:
+                self._postings.setdefault(subject, set()).add(item_id)
+        if code:
+            self._codes[item_id] = code
+            self._by_code.setdefault(code, set()).add(item_id)
+
+    def _discard(self, item_id: str) -> None:
+        for subject in self._subjects.pop(item_id, ()):
+            posting = self._postings.get(subject)
+            if posting is not None:
+                posting.discard(item_id)
+                if not posting:
+                    del self._postings[subject]
+        code = self._codes.pop(item_id, None)
+        if code is not None:
+            members = self._by_code.get(code)
+            if members is not None:
+                members.discard(item_id)
+                if not members:
+                    del self._by_code[code]
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+
+    def shared_subjects(
+        self,
+        subjects: Iterable[str],
+        k: Optional[int] = None,
+        exclude_ids: Optional[Iterable[str]] = None,
+    ) -> List[Tuple[str, int]]:
+        """Rank items by the number of ``subjects`` they match.
+
+        A subject matches an item when it occurs, case-insensitively, inside
+        one of the item's subjects.
+
+        Args:
+            subjects: Subjects to match
+            k: Optional number of items to return
+            exclude_ids: Ids that must not appear in the results
+
+        Returns:
+            List of (item_id, shared_count) sorted by count descending, then id
+        """
+        excluded = {str(i) for i in exclude_ids} if exclude_ids else set()
+        counts: Counter = Counter()
+        with self._lock:
+            for subject in {s.lower() for s in coerce_subjects(list(subjects))}:
+                matched: Set[str] = set()
+                for key, posting in self._postings.items():
+                    if subject in key:
+                        matched.update(posting)
+                counts.update(matched)
+        ranked = sorted(
+            ((item_id, n) for item_id, n in counts.items() if item_id not in excluded),
+            key=lambda x: (-x[1], x[0]),
+        )
+        return ranked[:k] if k is not None else ranked
+
+    def with_classification(
+        self, code: Optional[str], exclude_ids: Optional[Iterable[str]] = None
+    ) -> List[str]:
+        """Return the ids of items with classification ``code`` (sorted)."""
+        if not code:
+            return []
+        excluded = {str(i) for i in exclude_ids} if exclude_ids else set()
+        with self._lock:
+            members = self._by_code.get(code, ())
+            return sorted(item_id for item_id in members if item_id not in excluded)
+
+
+# ============================================================================
+# Process-wide resource index
+# ============================================================================
+
+
+class ResourceSubjectIndex(WatermarkSyncedIndex):
+    """Process-wide subject index over ``resources.subject``.
+
+    Built lazily from the database and refreshed incrementally by reading
+    rows whose ``updated_at`` moved past the last sync watermark (throttled
+    to ``VECTOR_INDEX_REFRESH_SECONDS``).
+    """
+
+    def __init__(self, index: Optional[SubjectIndex] = None) -> None:
+        super().__init__(
+            index if index is not None else SubjectIndex(name="resources")
+        )
+
+    def _columns(self):
+        from ..database.models import Resource
+
+        return (
+            Resource.id,
+            Resource.subject,
+            Resource.classification_code,
+            Resource.updated_at,
+        )
+
+    def _build_rows(self, db):
+        from ..database.models import Resource
+
+        rows = db.query(
+            Resource.id, Resource.subject, Resource.classification_code
+        ).yield_per(2000)
+        return ((str(rid), subject, code) for rid, subject, code in rows)
+
+    def _apply(self, item_id: str, subject: Any, code: Optional[str]) -> None:
+        self.index.upsert(item_id, subject, code)
+
+
+_resource_subject_index: Optional[ResourceSubjectIndex] = None
+_resource_subject_index_lock = threading.Lock()
+
+
+def get_resource_subject_index() -> ResourceSubjectIndex:
+    """Return the process-wide resource subject index (created lazily)."""
+    global _resource_subject_index
+    if _resource_subject_index is None:
+        with _resource_subject_index_lock:
+            if _resource_subject_index is None:
+                _resource_subject_index = ResourceSubjectIndex()
+    return _resource_subject_index
+
+
+def reset_resource_subject_index() -> None:
+    """Discard the process-wide resource subject index (used by tests)."""
+    global _resource_subject_index
+    with _resource_subject_index_lock:
+        _resource_subject_index = None
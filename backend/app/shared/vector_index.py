@@ -0,0 +1,872 @@
+"""
+Neo Alexandria 2.0 - In-Process Vector Index
+
+This module provides an approximate nearest-neighbour (ANN) index over a
+contiguous float32 matrix so dense retrieval no longer scans and re-parses
+every embedding row per query.
+
+Features:
+- IVF-flat index (spherical k-means coarse quantizer + exact re-scoring)
+- Exact brute-force mode for small corpora (below the IVF threshold)
+- Incremental upsert/remove without a full rebuild
+- Optional on-disk persistence (.npz) for fast worker start-up
+- Store-backed variant that keeps only IVF lists and scores vectors in the
+  shared embedding store (memory-mapped, no second copy of the matrix)
+- Process-wide resource index over the "resources" embedding store
+- Process-wide synthetic question index (Reverse HyDE question search),
+  rebuilt from synthetic_questions.embedding and kept in sync via
+  updated_at deltas
+- Scoring shares the top-k kernel in app/shared/embedding_store.py
+
+Related files:
+- app/services/search_service.py: AdvancedSearchService._execute_dense_search
+- app/modules/search/vector_search_real.py: RealVectorSearchService.dense_vector_search
+- app/modules/search/service.py: SearchService.question_search
+- app/tasks/celery_tasks.py: regenerate_embedding_task keeps the index updated
+- app/events/hooks.py: Content-change and deletion hooks
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from .delta_sync import WatermarkSyncedIndex
+from .embedding_store import (
+    EmbeddingStore,
+    get_embedding_store,
+    normalize_rows,
+    parse_embedding,
+    sync_store,
+    top_k,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Stored-embedding parser shared with the embedding store
+coerce_vector = parse_embedding
+
+_KMEANS_ITERATIONS = 10
+_KMEANS_SAMPLES_PER_LIST = 64
+
+
+def _n_lists(n: int) -> int:
+    """Number of IVF inverted lists for ``n`` vectors."""
+    return int(min(4096, max(16, np.sqrt(n))))
+
+
+def spherical_kmeans(
+    sample: np.ndarray, n_lists: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Train ``n_lists`` unit-norm centroids on normalised sample rows.
+
+    Args:
+        sample: Normalised float32 rows (at least ``n_lists`` of them)
+        n_lists: Number of centroids
+        rng: Random generator (seeded by callers for reproducible lists)
+
+    Returns:
+        (n_lists, dim) float32 centroid matrix
+    """
+    sample_size = len(sample)
+    centroids = sample[rng.choice(sample_size, size=n_lists, replace=False)].copy()
+    for _ in range(_KMEANS_ITERATIONS):
+        labels = np.argmax(sample @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, sample)
+        counts = np.bincount(labels, minlength=n_lists)
+        empty = counts == 0
+        # Re-seed empty lists from random sample rows
+        sums[empty] = sample[rng.choice(sample_size, size=int(empty.sum()))]
+        centroids = normalize_rows(sums)
+    return centroids
+
+
+class VectorIndex:
+    """IVF-flat approximate nearest-neighbour index with cosine similarity.
+
+    Vectors are L2-normalised on insert and stored row-wise in a single
+    float32 matrix. Below ``exact_threshold`` live rows the index answers
+    queries exactly with one matrix-vector product; above it, a spherical
+    k-means coarse quantizer partitions rows into inverted lists and only
+    the ``n_probe`` closest lists are re-scored.
+
+    Attributes:
+        name: Index name (used for logging and persistence file names)
+        dim: Vector dimensionality (fixed by the first vector added)
+        n_probe: Number of inverted lists scanned per query
+        exact_threshold: Live-row count below which search is exact
+    """
+
+    _INITIAL_CAPACITY = 1024
+
+    def __init__(
+        self,
+        name: str = "default",
+        n_probe: int = 8,
+        exact_threshold: int = 4096,
+    ) -> None:
+        self.name = name
+        self.dim: Optional[int] = None
+        self.n_probe = n_probe
+        self.exact_threshold = exact_threshold
+
+        self._lock = threading.RLock()
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._ids: List[Optional[str]] = []
+        self._id_to_row: Dict[str, int] = {}
+        self._size = 0
+        self._centroids: Optional[np.ndarray] = None
+        self._trained_size = 0
+        self._built = False
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    @property
+    def is_built(self) -> bool:
+        """Whether the index has been built (possibly empty)."""
+        return self._built
+
+    def __len__(self) -> int:
+        return len(self._id_to_row)
+
+    def __contains__(self, item_id: str) -> bool:
+        return str(item_id) in self._id_to_row
+
+    def stats(self) -> Dict[str, Any]:
+        """Return index statistics for monitoring endpoints."""
+        with self._lock:
+            return {
+                "name": self.name,
+                "size": len(self._id_to_row),
+                "rows": self._size,
+                "dim": self.dim,
+                "n_lists": 0 if self._centroids is None else len(self._centroids),
+                "n_probe": self.n_probe,
+                "mode": "exact" if self._centroids is None else "ivf",
+                "memory_bytes": int(self._matrix.nbytes),
+            }
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def build(self, items: Iterable[Tuple[str, Sequence[float]]]) -> int:
+        """Rebuild the index from scratch.
+
+        Args:
+            items: Iterable of (item_id, vector) pairs
+
+        Returns:
+            Number of vectors indexed
+        """
+        ids: List[str] = []
+        rows: List[Sequence[float]] = []
+        dim: Optional[int] = None
+        for item_id, vector in items:
+            if vector is None or len(vector) == 0:
+                continue
+            if dim is None:
+                dim = len(vector)
+            elif len(vector) != dim:
+                logger.warning(
+                    f"Skipping {item_id} in index '{self.name}': dimension "
+                    f"{len(vector)} != {dim}"
+                )
+                continue
+            ids.append(str(item_id))
+            rows.append(vector)
+
+        with self._lock:
+            self._reset()
+            if rows:
+                matrix = normalize_rows(np.asarray(rows, dtype=np.float32))
+                self.dim = matrix.shape[1]
+                self._matrix = matrix
+                self._assignments = np.zeros(len(ids), dtype=np.int32)
+                self._ids = list(ids)
+                self._id_to_row = {item_id: row for row, item_id in enumerate(ids)}
+                self._size = len(ids)
+                self._train()
+            self._built = True
+            logger.info(f"Built vector index '{self.name}' with {len(ids)} vectors")
+            return len(ids)
+
+    def upsert(self, item_id: str, vector: Sequence[float]) -> bool:
+        """Insert or replace a single vector.
+
+        Args:
+            item_id: Item identifier
+            vector: Embedding vector
+
+        Returns:
+            True if the vector was stored, False if it was rejected
+        """
+        item_id = str(item_id)
+        if vector is None or len(vector) == 0:
+            self.remove(item_id)
+            return False
+
+        with self._lock:
+            if self.dim is None:
+                self.dim = len(vector)
+                self._matrix = np.zeros((self._INITIAL_CAPACITY, self.dim), dtype=np.float32)
+                self._assignments = np.full(self._INITIAL_CAPACITY, -1, dtype=np.int32)
+            elif len(vector) != self.dim:
+                logger.warning(
+                    f"Rejected vector for {item_id} in index '{self.name}': "
+                    f"dimension {len(vector)} != {self.dim}"
+                )
+                return False
+
+            row_vec = normalize_rows(np.asarray(vector, dtype=np.float32)[None, :])[0]
+            row = self._id_to_row.get(item_id)
+            if row is None:
+                self._ensure_capacity(self._size + 1)
+                row = self._size
+                self._size += 1
+                self._ids.append(item_id)
+                self._id_to_row[item_id] = row
+            self._matrix[row] = row_vec
+            self._assignments[row] = self._assign(row_vec[None, :])[0]
+            self._built = True
+
+            # Retrain the coarse quantizer once the corpus has doubled
+            live = len(self._id_to_row)
+            if (self._centroids is None and live >= self.exact_threshold) or (
+                self._centroids is not None and live >= 2 * self._trained_size
+            ):
+                self._compact()
+                self._train()
+            return True
+
+    def remove(self, item_id: str) -> bool:
+        """Remove a vector from the index.
+
+        Args:
+            item_id: Item identifier
+
+        Returns:
+            True if the item was present
+        """
+        item_id = str(item_id)
+        with self._lock:
+            row = self._id_to_row.pop(item_id, None)
+            if row is None:
+                return False
+            self._ids[row] = None
+            self._assignments[row] = -1
+            self._matrix[row] = 0.0
+            # Compact when tombstones dominate the matrix
+            if self._size > self._INITIAL_CAPACITY and len(self._id_to_row) < self._size // 2:
+                self._compact()
+            return True
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        query: Sequence[float],
+        k: int = 10,
+        n_probe: Optional[int] = None,
+    ) -> List[Tuple[str, float]]:
+        """Find the k most similar vectors by cosine similarity.
+
+        Args:
+            query: Query vector
+            k: Number of results
+            n_probe: Override for the number of inverted lists scanned
+
+        Returns:
+            List of (item_id, similarity) tuples sorted by similarity descending
+        """
+        if k <= 0 or query is None or len(query) == 0:
+            return []
+
+        q = np.asarray(query, dtype=np.float32)
+        norm = float(np.linalg.norm(q))
+        if norm == 0.0:
+            return []
+        q = q / norm
+
+        with self._lock:
+            if self.dim is None or self._size == 0 or len(q) != self.dim:
+                return []
+
+            assignments = self._assignments[: self._size]
+            if self._centroids is None:
+                candidates = np.flatnonzero(assignments >= 0)
+            else:
+                probes = min(n_probe or self.n_probe, len(self._centroids))
+                centroid_scores = self._centroids @ q
+                probe_lists = np.argpartition(-centroid_scores, probes - 1)[:probes]
+                candidates = np.flatnonzero(np.isin(assignments, probe_lists))
+                if len(candidates) < k:
+                    candidates = np.flatnonzero(assignments >= 0)
+
+            if len(candidates) == 0:
+                return []
+
+            scores = self._matrix[candidates] @ q
+            order = top_k(scores, k)
+            return [(self._ids[candidates[i]], float(scores[i])) for i in order]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: str) -> None:
+        """Persist the index to an .npz file (atomic replace).
+
+        Args:
+            path: Destination file path
+        """
+        with self._lock:
+            self._compact()
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as fh:
+                np.savez(
+                    fh,
+                    matrix=self._matrix[: self._size],
+                    assignments=self._assignments[: self._size],
+                    ids=np.asarray(self._ids[: self._size], dtype=object).astype(str),
+                    centroids=(
+                        self._centroids
+                        if self._centroids is not None
+                        else np.zeros((0, self.dim or 0), dtype=np.float32)
+                    ),
+                    trained_size=np.asarray([self._trained_size]),
+                )
+            os.replace(tmp_path, path)
+            logger.info(f"Saved vector index '{self.name}' ({self._size} vectors) to {path}")
+
+    def load(self, path: str) -> bool:
+        """Load a previously saved index.
+
+        Args:
+            path: Source file path
+
+        Returns:
+            True if loaded, False if the file does not exist or is invalid
+        """
+        if not os.path.exists(path):
+            return False
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                matrix = data["matrix"].astype(np.float32, copy=False)
+                assignments = data["assignments"].astype(np.int32, copy=False)
+                ids = [str(i) for i in data["ids"]]
+                centroids = data["centroids"]
+                trained_size = int(data["trained_size"][0])
+        except Exception as e:
+            logger.error(f"Failed to load vector index '{self.name}' from {path}: {e}")
+            return False
+
+        with self._lock:
+            self._reset()
+            self._matrix = np.array(matrix)
+            self._assignments = np.array(assignments)
+            self._ids = list(ids)
+            self._id_to_row = {item_id: row for row, item_id in enumerate(ids)}
+            self._size = len(ids)
+            self.dim = matrix.shape[1] if len(ids) else None
+            self._centroids = centroids if len(centroids) else None
+            self._trained_size = trained_size
+            self._built = True
+        logger.info(f"Loaded vector index '{self.name}' ({len(ids)} vectors) from {path}")
+        return True
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _reset(self) -> None:
+        self.dim = None
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._ids = []
+        self._id_to_row = {}
+        self._size = 0
+        self._centroids = None
+        self._trained_size = 0
+
+    def _ensure_capacity(self, rows: int) -> None:
+        capacity = self._matrix.shape[0]
+        if rows <= capacity:
+            return
+        new_capacity = max(rows, capacity * 2, self._INITIAL_CAPACITY)
+        matrix = np.zeros((new_capacity, self.dim), dtype=np.float32)
+        matrix[: self._size] = self._matrix[: self._size]
+        assignments = np.full(new_capacity, -1, dtype=np.int32)
+        assignments[: self._size] = self._assignments[: self._size]
+        self._matrix = matrix
+        self._assignments = assignments
+
+    def _compact(self) -> None:
+        """Drop tombstoned rows so row numbers are dense again."""
+        if len(self._id_to_row) == self._size:
+            return
+        live_rows = np.asarray(sorted(self._id_to_row.values()), dtype=np.int64)
+        self._matrix = self._matrix[live_rows].copy()
+        self._assignments = self._assignments[live_rows].copy()
+        self._ids = [self._ids[r] for r in live_rows]
+        self._id_to_row = {item_id: row for row, item_id in enumerate(self._ids)}
+        self._size = len(self._ids)
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        """Return the inverted-list id for each (normalised) vector."""
+        if self._centroids is None:
+            return np.zeros(len(vectors), dtype=np.int32)
+        return np.argmax(vectors @ self._centroids.T, axis=1).astype(np.int32)
+
+    def _train(self) -> None:
+        """Train the coarse quantizer with spherical k-means."""
+        live = self._matrix[: self._size]
+        n = len(live)
+        if n < self.exact_threshold:
+            self._centroids = None
+            self._assignments[: self._size] = 0
+            self._trained_size = n
+            return
+
+        n_lists = _n_lists(n)
+        rng = np.random.default_rng(0)
+        sample_size = min(n, n_lists * _KMEANS_SAMPLES_PER_LIST)
+        sample = live[rng.choice(n, size=sample_size, replace=False)]
+        centroids = spherical_kmeans(sample, n_lists, rng)
+
+        self._centroids = centroids
+        block = 65536
+        for start in range(0, n, block):
+            self._assignments[start : start + block] = self._assign(live[start : start + block])
+        self._assignments[: self._size][[r is None for r in self._ids]] = -1
+        self._trained_size = len(self._id_to_row)
+        logger.info(f"Trained vector index '{self.name}': {n} vectors in {n_lists} lists")
+
+
+class StoreVectorIndex:
+    """IVF-flat index over the vectors of a shared EmbeddingStore.
+
+    Holds only the coarse quantizer and each item's inverted list. Candidate
+    vectors are scored straight from the store, whose snapshot is
+    memory-mapped and shared by every worker on the host, so the index keeps
+    no second copy of the embeddings. Below ``exact_threshold`` items the
+    store is scanned exactly.
+
+    Attributes:
+        store: EmbeddingStore holding the vectors
+        n_probe: Number of inverted lists scanned per query
+        exact_threshold: Item count below which search is exact
+    """
+
+    def __init__(
+        self,
+        store: EmbeddingStore,
+        n_probe: int = 8,
+        exact_threshold: int = 4096,
+    ) -> None:
+        self.store = store
+        self.n_probe = n_probe
+        self.exact_threshold = exact_threshold
+
+        self._lock = threading.RLock()
+        self._centroids: Optional[np.ndarray] = None
+        self._lists: Dict[str, int] = {}
+        self._members: Dict[int, Set[str]] = {}
+        self._trained_size = 0
+        self._generation: Optional[int] = None
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    @property
+    def name(self) -> str:
+        return self.store.entity
+
+    @property
+    def dim(self) -> Optional[int]:
+        return self.store.dim
+
+    @property
+    def is_built(self) -> bool:
+        """Whether the underlying store has been loaded (possibly empty)."""
+        return self.store.is_loaded
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def __contains__(self, item_id: str) -> bool:
+        return str(item_id) in self.store
+
+    def stats(self) -> Dict[str, Any]:
+        """Return index statistics for monitoring endpoints."""
+        with self._lock:
+            return {
+                "name": self.name,
+                "size": len(self.store),
+                "dim": self.dim,
+                "n_lists": 0 if self._centroids is None else len(self._centroids),
+                "n_probe": self.n_probe,
+                "mode": "exact" if self._centroids is None else "ivf",
+                "memory_bytes": (
+                    0 if self._centroids is None else int(self._centroids.nbytes)
+                ),
+                "store": self.store.stats(),
+            }
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def sync(self) -> None:
+        """Bring the inverted lists in line with the store's current items."""
+        with self._lock:
+            generation = self.store.generation
+            if generation == self._generation:
+                return
+            self._generation = generation
+            live = self.store.ids()
+            if len(live) < self.exact_threshold:
+                self._centroids = None
+                self._lists, self._members = {}, {}
+                return
+            # Retrain the coarse quantizer once the corpus has doubled
+            if self._centroids is None or len(live) >= 2 * self._trained_size:
+                self._train(live)
+                return
+            for item_id in set(self._lists) - live:
+                self._drop(item_id)
+            self._assign([item_id for item_id in live if item_id not in self._lists])
+
+    def upsert(self, item_id: str, vector: Optional[Sequence[float]]) -> bool:
+        """Write a vector through to the store and file it in its list.
+
+        Returns:
+            True if the vector was stored (False until the store is loaded)
+        """
+        item_id = str(item_id)
+        with self._lock:
+            in_sync = self._generation == self.store.generation
+            stored = self.store.upsert(item_id, vector)
+            if self._centroids is not None:
+                self._drop(item_id)
+                if stored:
+                    self._assign([item_id])
+            if in_sync:
+                self._generation = self.store.generation
+            return stored
+
+    def remove(self, item_id: str) -> None:
+        """Remove an item from the store and its inverted list."""
+        item_id = str(item_id)
+        with self._lock:
+            in_sync = self._generation == self.store.generation
+            self.store.remove(item_id)
+            self._drop(item_id)
+            if in_sync:
+                self._generation = self.store.generation
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        query: Sequence[float],
+        k: int = 10,
+        n_probe: Optional[int] = None,
+    ) -> List[Tuple[str, float]]:
+        """Find the k most similar vectors by cosine similarity.
+
+        Args:
+            query: Query vector
+            k: Number of results
+            n_probe: Override for the number of inverted lists scanned
+
+        Returns:
+            List of (item_id, similarity) tuples sorted by similarity descending
+        """
+        if k <= 0 or query is None or len(query) == 0:
+            return []
+
+        self.sync()
+        candidates = None
+        with self._lock:
+            q = np.asarray(query, dtype=np.float32)
+            if self._centroids is not None and len(q) == self._centroids.shape[1]:
+                probes = min(n_probe or self.n_probe, len(self._centroids))
+                probe_lists = np.argpartition(-(self._centroids @ q), probes - 1)[
+                    :probes
+                ]
+                candidates = [
+                    item_id
+                    for list_id in probe_lists
+                    for item_id in self._members.get(int(list_id), ())
+                ]
+                if len(candidates) < k:
+                    candidates = None
+        return self.store.similar(query, k=k, candidate_ids=candidates)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _train(self, live: Set[str]) -> None:
+        """Train the coarse quantizer on a sample of the store's vectors."""
+        ids = sorted(live)
+        n_lists = _n_lists(len(ids))
+        rng = np.random.default_rng(0)
+        sample_size = min(len(ids), n_lists * _KMEANS_SAMPLES_PER_LIST)
+        picks = rng.choice(len(ids), size=sample_size, replace=False)
+        _, sample = self.store.gather(ids[i] for i in picks)
+
+        self._centroids = spherical_kmeans(sample, n_lists, rng)
+        self._lists, self._members = {}, {}
+        self._assign(ids)
+        self._trained_size = len(ids)
+        logger.info(
+            f"Trained vector index '{self.name}': {len(ids)} vectors in {n_lists} lists"
+        )
+
+    def _assign(self, item_ids: List[str]) -> None:
+        block = 65536
+        for start in range(0, len(item_ids), block):
+            found, vectors = self.store.gather(item_ids[start : start + block])
+            if not found:
+                continue
+            labels = np.argmax(vectors @ self._centroids.T, axis=1)
+            for item_id, label in zip(found, labels.tolist()):
+                self._lists[item_id] = label
+                self._members.setdefault(label, set()).add(item_id)
+
+    def _drop(self, item_id: str) -> None:
+        label = self._lists.pop(item_id, None)
+        if label is not None:
+            members = self._members.get(label)
+            if members is not None:
+                members.discard(item_id)
+
+
+# ============================================================================
+# Process-wide resource index
+# ============================================================================
+
+
+class TableVectorIndex(WatermarkSyncedIndex):
+    """Process-wide ANN index over an embedding column with its own matrix.
+
+    The index is built lazily from the database (or loaded from
+    ``VECTOR_INDEX_DIR`` when persisted) and refreshed incrementally by
+    reading rows whose ``updated_at`` moved past the last sync watermark.
+    Refreshes are throttled to ``VECTOR_INDEX_REFRESH_SECONDS``.
+
+    Subclasses set ``INDEX_NAME`` and implement ``_columns``. Tables that
+    have a shared EmbeddingStore use ResourceVectorIndex's approach instead.
+    """
+
+    INDEX_NAME = ""
+
+    def __init__(self, index: Optional[VectorIndex] = None) -> None:
+        from ..config.settings import get_settings
+
+        settings = get_settings()
+        if index is None:
+            index = VectorIndex(
+                name=self.INDEX_NAME,
+                n_probe=settings.VECTOR_INDEX_NPROBE,
+                exact_threshold=settings.VECTOR_INDEX_EXACT_THRESHOLD,
+            )
+        super().__init__(index)
+        self.persist_dir = settings.VECTOR_INDEX_DIR
+
+    def _columns(self):
+        """Return the (id, embedding, updated_at) columns to index."""
+        raise NotImplementedError
+
+    def _build_rows(self, db):
+        id_col, emb_col, _ = self._columns()
+        rows = db.query(id_col, emb_col).filter(emb_col.isnot(None)).yield_per(2000)
+        return ((str(rid), coerce_vector(embedding)) for rid, embedding in rows)
+
+    def _apply(self, item_id: str, embedding: Any) -> None:
+        vector = coerce_vector(embedding)
+        if vector:
+            self.index.upsert(item_id, vector)
+        else:
+            self.index.remove(item_id)
+
+    @property
+    def persist_path(self) -> Optional[str]:
+        if not self.persist_dir:
+            return None
+        return os.path.join(self.persist_dir, f"{self.index.name}.npz")
+
+    def rebuild(self, db) -> int:
+        """Rebuild the index from the embedding column and persist it.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of vectors indexed
+        """
+        count = super().rebuild(db)
+        self.save()
+        return count
+
+    def save(self) -> bool:
+        """Persist the index and its sync watermark, if configured."""
+        path = self.persist_path
+        if not path:
+            return False
+        try:
+            self.index.save(path)
+            with open(f"{path}.json", "w", encoding="utf-8") as fh:
+                json.dump(
+                    {"watermark": self._watermark.isoformat() if self._watermark else None},
+                    fh,
+                )
+            return True
+        except Exception as e:
+            logger.warning(f"Could not persist {self.INDEX_NAME} vector index: {e}")
+            return False
+
+    def load_persisted(self) -> bool:
+        """Load the persisted index snapshot, if configured and present."""
+        path = self.persist_path
+        if not path or not os.path.exists(f"{path}.json"):
+            return False
+        try:
+            with open(f"{path}.json", encoding="utf-8") as fh:
+                watermark = json.load(fh).get("watermark")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable vector index metadata: {e}")
+            return False
+        if not watermark or not self.index.load(path):
+            return False
+        # The next refresh re-reads everything touched since the snapshot
+        self._watermark = datetime.fromisoformat(watermark)
+        self._last_refresh = 0.0
+        return True
+
+    def upsert(self, item_id: str, embedding: Any) -> None:
+        """Apply a known embedding change (no-op until the index is built)."""
+        if self.index.is_built:
+            self._apply(str(item_id), embedding)
+
+
+class ResourceVectorIndex:
+    """Process-wide ANN index over ``resources.embedding``.
+
+    Vectors live in the shared "resources" EmbeddingStore, which maps the
+    on-disk snapshot and applies updated_at deltas (throttled to
+    ``VECTOR_INDEX_REFRESH_SECONDS``); the index only adds IVF lists on top.
+    """
+
+    def __init__(self, store: Optional[EmbeddingStore] = None) -> None:
+        from ..config.settings import get_settings
+
+        settings = get_settings()
+        self.index = StoreVectorIndex(
+            store if store is not None else get_embedding_store("resources"),
+            n_probe=settings.VECTOR_INDEX_NPROBE,
+            exact_threshold=settings.VECTOR_INDEX_EXACT_THRESHOLD,
+        )
+
+    def ensure_ready(self, db) -> StoreVectorIndex:
+        """Load or sync the resource store and update the inverted lists.
+
+        Args:
+            db: Database session
+
+        Returns:
+            The underlying StoreVectorIndex
+        """
+        sync_store(self.index.store, db)
+        self.index.sync()
+        return self.index
+
+    def expire(self) -> None:
+        """Force the next ensure_ready() call to apply database deltas."""
+        self.index.store.expire()
+
+    def upsert(self, resource_id: str, embedding: Any) -> None:
+        """Apply a known embedding change (no-op until the store is loaded)."""
+        self.index.upsert(str(resource_id), coerce_vector(embedding))
+
+    def remove(self, resource_id: str) -> None:
+        """Drop a resource from the store and the index."""
+        self.index.remove(str(resource_id))
+
+
+_resource_index: Optional[ResourceVectorIndex] = None
+_resource_index_lock = threading.Lock()
+
+
+def get_resource_vector_index() -> ResourceVectorIndex:
+    """Return the process-wide resource vector index (created lazily)."""
+    global _resource_index
+    if _resource_index is None:
+        with _resource_index_lock:
+            if _resource_index is None:
+                _resource_index = ResourceVectorIndex()
+    return _resource_index
+
+
+def reset_resource_vector_index() -> None:
+    """Discard the process-wide resource index (used by tests)."""
+    global _resource_index
+    with _resource_index_lock:
+        _resource_index = None
+
+
+class SyntheticQuestionVectorIndex(TableVectorIndex):
+    """Process-wide ANN index over ``synthetic_questions.embedding``.
+
+    Questions are matched by the user query vector in one index lookup
+    instead of scoring every question row per request.
+    """
+
+    INDEX_NAME = "synthetic_questions"
+
+    def _columns(self):
+        from ..database.models import SyntheticQuestion
+
+        return (
+            SyntheticQuestion.id,
+            SyntheticQuestion.embedding,
+            SyntheticQuestion.updated_at,
+        )
+
+
+_question_index: Optional[SyntheticQuestionVectorIndex] = None
+_question_index_lock = threading.Lock()
+
+
+def get_question_vector_index() -> SyntheticQuestionVectorIndex:
+    """Return the process-wide synthetic question index (created lazily)."""
+    global _question_index
+    if _question_index is None:
+        with _question_index_lock:
+            if _question_index is None:
+                _question_index = SyntheticQuestionVectorIndex()
+    return _question_index
+
+
+def reset_question_vector_index() -> None:
+    """Discard the process-wide synthetic question index (used by tests)."""
+    global _question_index
+    with _question_index_lock:
+        _question_index = None
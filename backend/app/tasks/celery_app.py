@@ -146,6 +146,12 @@ celery_app.conf.beat_schedule = {
         "schedule": crontab(hour=1, minute=0),
         "options": {"queue": "default", "priority": 5},
     },
+    # Synthetic question embedding backfill - daily at 5 AM
+    "backfill-question-embeddings": {
+        "task": "app.tasks.celery_tasks.backfill_question_embeddings_task",
+        "schedule": crontab(hour=5, minute=0),
+        "options": {"queue": "ml_tasks", "priority": 3},
+    },
 }
 
 # Import tasks to register them with Celery
@@ -239,14 +239,18 @@ def update_graph_edges_task(self, resource_id: str, citations: List[str], db=Non
             f"Updating graph edges for resource {resource_id} with {len(citations)} citations"
         )
 
-        from ..services.graph_service import GraphService
+        from ..modules.graph.service import GraphService
 
+        # Patches the shared graph store in this worker; other processes
+        # pick the edges up on their next delta sync
         graph_service = GraphService(db)
         graph_service.add_citation_edges(resource_id, citations)
 
         # Invalidate graph cache
         invalidate_cache_task.apply_async(
-            args=[[f"graph:neighbors:{resource_id}", "graph:*"]], priority=9
+            args=[[f"graph:neighbors:{resource_id}", "graph:*"]],
+            kwargs={"tags": [f"resource:{resource_id}"]},
+            priority=9,
         )
 
         logger.info(f"Successfully updated graph edges for resource {resource_id}")
@@ -259,24 +263,29 @@ def update_graph_edges_task(self, resource_id: str, citations: List[str], db=Non
 
 
 @celery_app.task(name="app.tasks.celery_tasks.invalidate_cache_task")
-def invalidate_cache_task(cache_keys: List[str]):
+def invalidate_cache_task(cache_keys: List[str], tags: Optional[List[str]] = None):
     """
     Invalidate cache entries.
 
     Triggered by: resource.updated event, graph updates
     Priority: URGENT (9)
 
-    Supports both exact keys and pattern-based invalidation (wildcard *).
+    Supports exact keys, tags (every key registered under the tag) and
+    pattern-based invalidation (wildcard *, walks the keyspace with SCAN).
 
     Args:
         cache_keys: List of cache keys or patterns to invalidate
+        tags: Cache tags to invalidate, e.g. "resource:<id>"
     """
     try:
-        logger.info(f"Invalidating {len(cache_keys)} cache keys/patterns")
+        logger.info(
+            f"Invalidating {len(cache_keys)} cache keys/patterns "
+            f"and {len(tags or [])} tags"
+        )
 
         from ..shared.cache import cache
 
-        invalidation_count = 0
+        invalidation_count = cache.invalidate_tags(*tags) if tags else 0
         for key in cache_keys:
             if "*" in key:
                 # Pattern-based invalidation
@@ -709,6 +718,45 @@ def cleanup_expired_cache_task():
         raise
 
 
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    max_retries=3,
+    default_retry_delay=60,
+    name="app.tasks.celery_tasks.backfill_question_embeddings_task",
+)
+def backfill_question_embeddings_task(
+    self, batch_size: int = 100, db=None
+) -> Dict[str, Any]:
+    """
+    Embed synthetic questions stored without an embedding.
+
+    question_search only ranks embedded questions by cosine similarity;
+    pending ones fall back to keyword overlap until this task fills them in.
+
+    Args:
+        batch_size: Questions embedded per commit
+        db: Database session (automatically provided by DatabaseTask)
+
+    Returns:
+        Dict with status and number of questions embedded
+    """
+    try:
+        from ..shared.embeddings import EmbeddingService
+        from ..modules.search.service import SyntheticQuestionService
+
+        service = SyntheticQuestionService(
+            db, embedding_service=EmbeddingService(db)
+        )
+        embedded = service.backfill_embeddings(batch_size=batch_size)
+
+        return {"status": "success", "questions_embedded": embedded}
+
+    except Exception as e:
+        logger.error(f"Error backfilling question embeddings: {e}", exc_info=True)
+        raise self.retry(exc=e, countdown=2**self.request.retries * 60)
+
+
 @celery_app.task(
     bind=True,
     base=DatabaseTask,
@@ -717,17 +765,20 @@ def cleanup_expired_cache_task():
     name="app.tasks.celery_tasks.update_collection_embeddings_task",
 )
 def update_collection_embeddings_task(
-    self, resource_id: str, db=None
+    self, resource_id: str, collection_ids: Optional[List[str]] = None, db=None
 ) -> Dict[str, Any]:
     """
     Update collection embeddings after a resource is deleted.
 
-    This task finds all collections that contained the deleted resource and
-    recomputes their embeddings. Collection embeddings are the average of
-    member resource embeddings, so they need to be updated when membership changes.
+    Recomputes the embeddings of the collections that contained the deleted
+    resource. Its memberships are gone by now (cascade delete), so
+    delete_resource records them in the event as collection_ids; each listed
+    collection is recomputed exactly from its remaining members.
 
     Args:
         resource_id: UUID of the deleted resource
+        collection_ids: Collections that contained the resource. None (tasks
+            queued before collection_ids existed) recomputes every collection.
         db: Database session (automatically provided by DatabaseTask)
 
     Returns:
@@ -737,7 +788,7 @@ def update_collection_embeddings_task(
         Exception: If collection embedding update fails (will retry)
     """
     import uuid
-    from ..services.collection_service import CollectionService
+    from ..modules.collections.service import CollectionService
     from ..database.models import Collection
 
     try:
@@ -748,28 +799,29 @@ def update_collection_embeddings_task(
         # Convert resource_id to UUID
         try:
             uuid.UUID(resource_id)
+            if collection_ids is not None:
+                collection_uuids = [uuid.UUID(cid) for cid in collection_ids]
         except (ValueError, TypeError) as e:
             logger.error(f"Invalid resource_id format: {resource_id}")
             return {"status": "error", "message": f"Invalid UUID: {e}"}
 
-        # Find all collections that contained this resource
-        # Note: The resource is already deleted, but we can find collections
-        # that need updating by checking for any that might have had it
         collection_service = CollectionService(db)
 
-        # Get all collections (we'll recompute all since we can't query deleted resource)
-        # In a production system, you might want to track this relationship before deletion
-        collections = db.query(Collection).all()
+        if collection_ids is None:
+            logger.warning(
+                f"No collection_ids for deleted resource {resource_id}; "
+                "recomputing all collections"
+            )
+            collection_uuids = [row.id for row in db.query(Collection.id).all()]
 
         updated_count = 0
-        for collection in collections:
+        for collection_id in collection_uuids:
             try:
-                # Recompute embedding for each collection
-                collection_service.compute_collection_embedding(collection.id)
+                collection_service.compute_collection_embedding(collection_id)
                 updated_count += 1
-                logger.debug(f"Updated embedding for collection {collection.id}")
+                logger.debug(f"Updated embedding for collection {collection_id}")
             except Exception as e:
-                logger.warning(f"Failed to update collection {collection.id}: {e}")
+                logger.warning(f"Failed to update collection {collection_id}: {e}")
                 # Continue with other collections
 
         logger.info(
@@ -0,0 +1,169 @@
+"""
+Micro-batching for the edge worker's /embed endpoints.
+
+Concurrent /embed requests used to run one forward pass each. EmbedBatcher
+collects the texts of concurrent callers for up to ``max_wait_ms`` or
+``max_batch`` texts, runs a single ``batch_generate`` call on a dedicated
+thread and hands each caller its slice of the result. While one batch is on
+the GPU the next one fills up, so throughput scales with concurrency instead
+of queueing behind per-request passes.
+
+Also provides the packed float32 response format used by
+``/embed?format=f32`` and ``/embed/batch?format=f32``: row-major
+little-endian float32, with the shape in X-Embedding-Count/X-Embedding-Dim.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+F32_MEDIA_TYPE = "application/octet-stream"
+
+
+class EmbedBatcher:
+    """Coalesce concurrent embedding requests into batched model calls."""
+
+    def __init__(
+        self,
+        embedding_service,
+        max_batch: int = 64,
+        max_wait_ms: float = 5.0,
+    ) -> None:
+        """
+        Args:
+            embedding_service: Object with ``batch_generate(texts, batch_size)``
+            max_batch: Texts per model call; a batch is dispatched as soon
+                as this many are waiting
+            max_wait_ms: Longest a request waits for company before its
+                batch is dispatched anyway
+        """
+        self.embedding_service = embedding_service
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self._pending: List[Tuple[List[str], asyncio.Future]] = []
+        self._pending_texts = 0
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        # One thread: batches run back to back on the model, never interleaved
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="pharos-embed"
+        )
+        self.stats: Dict[str, int] = {"requests": 0, "texts": 0, "batches": 0}
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        """Embed ``texts`` as part of the next batch.
+
+        Returns:
+            One vector per text, in order; failed texts map to ``[]``
+        """
+        if not texts:
+            return []
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((list(texts), future))
+        self._pending_texts += len(texts)
+        self.stats["requests"] += 1
+        self.stats["texts"] += len(texts)
+        self._ensure_running()
+        self._wakeup.set()
+        return await future
+
+    def _ensure_running(self) -> None:
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            if not self._pending:
+                continue
+
+            # Give concurrent callers up to max_wait to join this batch
+            deadline = loop.time() + self.max_wait
+            while self._pending_texts < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                self._wakeup.clear()
+
+            await self._dispatch(self._take())
+            if self._pending:
+                # Requests that arrived during the model call go next
+                self._wakeup.set()
+
+    def _take(self) -> List[Tuple[List[str], asyncio.Future]]:
+        """Pop whole requests up to max_batch texts (always at least one)."""
+        batch: List[Tuple[List[str], asyncio.Future]] = []
+        count = 0
+        while self._pending:
+            texts, future = self._pending[0]
+            if batch and count + len(texts) > self.max_batch:
+                break
+            self._pending.pop(0)
+            self._pending_texts -= len(texts)
+            if future.done():  # caller went away
+                continue
+            batch.append((texts, future))
+            count += len(texts)
+        return batch
+
+    async def _dispatch(self, batch: List[Tuple[List[str], asyncio.Future]]) -> None:
+        if not batch:
+            return
+        flat = [text for texts, _ in batch for text in texts]
+        self.stats["batches"] += 1
+        try:
+            vectors = await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                lambda: self.embedding_service.batch_generate(
+                    flat, batch_size=len(flat)
+                ),
+            )
+        except Exception as exc:
+            logger.error(f"Batched embedding of {len(flat)} texts failed: {exc}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        offset = 0
+        for texts, future in batch:
+            if not future.done():
+                future.set_result(vectors[offset : offset + len(texts)])
+            offset += len(texts)
+
+    def describe(self) -> Dict[str, Any]:
+        """Configuration and counters for the /health endpoint."""
+        batches = self.stats["batches"]
+        return {
+            "max_batch": self.max_batch,
+            "max_wait_ms": self.max_wait * 1000.0,
+            **self.stats,
+            "avg_batch_size": round(self.stats["texts"] / batches, 2) if batches else 0.0,
+        }
+
+
+def pack_f32(vectors: List[List[float]]) -> bytes:
+    """Pack equal-length vectors as row-major little-endian float32 bytes."""
+    import numpy as np
+
+    return np.asarray(vectors, dtype="<f4").tobytes()
+
+
+def unpack_f32(payload: bytes, dim: int) -> List[List[float]]:
+    """Inverse of :func:`pack_f32`."""
+    import numpy as np
+
+    return np.frombuffer(payload, dtype="<f4").reshape(-1, dim).tolist()
@@ -3,7 +3,8 @@ Pharos Unified Edge Worker
 
 Single long-running process that:
   - Loads the local embedding model (RTX 4070).
-  - Serves the FastAPI /embed endpoint on port EDGE_EMBED_PORT (default 8001).
+  - Serves the FastAPI /embed and /embed/batch endpoints on port
+    EDGE_EMBED_PORT (default 8001), micro-batching concurrent requests.
   - Blocks on BOTH Redis queues with one connection:
         BLPOP pharos:tasks ingest_queue 30
     Routing by source queue:
@@ -56,6 +57,12 @@ WORKER_VERSION = "1.0.0"
 INGESTION_THREADPOOL_SIZE = int(os.getenv("PHAROS_INGESTION_THREADS", "4"))
 _ingestion_executor: ThreadPoolExecutor | None = None
 
+# /embed micro-batching: a batch is dispatched once EMBED_MAX_BATCH texts are
+# waiting or the oldest has waited EMBED_MAX_WAIT_MS, whichever comes first.
+EMBED_MAX_BATCH = int(os.getenv("EDGE_EMBED_MAX_BATCH", "64"))
+EMBED_MAX_WAIT_MS = float(os.getenv("EDGE_EMBED_MAX_WAIT_MS", "5"))
+EMBED_BATCH_MAX_TEXTS = int(os.getenv("EDGE_EMBED_BATCH_MAX_TEXTS", "256"))
+
 
 def get_ingestion_executor() -> ThreadPoolExecutor:
     global _ingestion_executor
@@ -253,27 +260,86 @@ class RepositoryIngestor:
 
 async def run_embed_server(embedding_service) -> None:
     import uvicorn
-    from fastapi import FastAPI, HTTPException, Body
+    from fastapi import FastAPI, HTTPException, Body, Header, Query
+    from fastapi.responses import Response
+
+    from .embed_batcher import F32_MEDIA_TYPE, EmbedBatcher, pack_f32
 
     app = FastAPI(title="Pharos Edge Embed Server", docs_url=None, redoc_url=None)
 
+    # Concurrent requests share forward passes instead of running one each
+    batcher = EmbedBatcher(
+        embedding_service,
+        max_batch=EMBED_MAX_BATCH,
+        max_wait_ms=EMBED_MAX_WAIT_MS,
+    )
+
+    def _wants_f32(format: str, accept: str) -> bool:
+        if format not in ("json", "f32"):
+            raise HTTPException(status_code=400, detail="format must be json or f32")
+        return format == "f32" or F32_MEDIA_TYPE in (accept or "")
+
+    def _f32_response(vectors: list) -> Response:
+        return Response(
+            content=pack_f32(vectors),
+            media_type=F32_MEDIA_TYPE,
+            headers={
+                "X-Embedding-Count": str(len(vectors)),
+                "X-Embedding-Dim": str(len(vectors[0]) if vectors else 0),
+            },
+        )
+
     # Use Body() instead of a Pydantic model defined in this local scope.
     # Locally-scoped Pydantic models break FastAPI's body-parameter inference
     # and the parameter falls back to a query param — causing every Render
-    # call to /embed to 422 with `loc:["query","req"]`.
+    # call to /embed to 422 with `loc:["query","req"]`. The same applies to
+    # any annotation imported here (e.g. Request), hence Header() for Accept.
     @app.post("/embed")
-    def embed(text: str = Body(..., embed=True)) -> dict:
+    async def embed(
+        text: str = Body(..., embed=True),
+        format: str = Query("json"),
+        accept: str = Header(""),
+    ):
         text = (text or "").strip()
         if not text:
             raise HTTPException(status_code=400, detail="text must be non-empty")
-        vec = embedding_service.generate_embedding(text)
+        binary = _wants_f32(format, accept)
+        vec = (await batcher.embed([text]))[0]
         if not vec:
             raise HTTPException(status_code=503, detail="model unavailable")
+        if binary:
+            return _f32_response([vec])
         return {"embedding": vec}
 
+    @app.post("/embed/batch")
+    async def embed_batch(
+        texts: list[str] = Body(..., embed=True),
+        format: str = Query("json"),
+        accept: str = Header(""),
+    ):
+        texts = [(text or "").strip() for text in texts]
+        if not texts or not all(texts):
+            raise HTTPException(status_code=400, detail="texts must be non-empty")
+        if len(texts) > EMBED_BATCH_MAX_TEXTS:
+            raise HTTPException(
+                status_code=413,
+                detail=f"at most {EMBED_BATCH_MAX_TEXTS} texts per request",
+            )
+        binary = _wants_f32(format, accept)
+        vectors = await batcher.embed(texts)
+        if not all(vectors):
+            raise HTTPException(status_code=503, detail="model unavailable")
+        if binary:
+            return _f32_response(vectors)
+        return {"embeddings": vectors}
+
     @app.get("/health")
     def health() -> dict:
-        return {"status": "ok", "model": embedding_service.embedding_generator.model_name}
+        return {
+            "status": "ok",
+            "model": embedding_service.embedding_generator.model_name,
+            "batching": batcher.describe(),
+        }
 
     port = int(os.getenv("EDGE_EMBED_PORT", "8001"))
     config = uvicorn.Config(app, host="127.0.0.1", port=port, log_level="info", access_log=False)
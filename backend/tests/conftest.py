@@ -10,6 +10,8 @@ All fixtures are self-contained and independent.
 import os
 
 os.environ["TESTING"] = "true"
+# Run graph analytics kernels on threads instead of spawning a process pool
+os.environ.setdefault("GRAPH_ANALYTICS_WORKERS", "0")
 
 import logging
 import sys
@@ -30,8 +32,17 @@ if str(deployment_dir) not in sys.path:
 logger = logging.getLogger(__name__)
 
 # Direct imports from application code only
-from app.shared.database import Base
+from app.shared.database import AppSession, Base
 from app.shared.event_bus import event_bus
+from app.shared.cache import reset_query_embedding_cache, reset_rerank_score_cache
+from app.shared.subject_index import reset_resource_subject_index
+from app.shared.embedding_store import reset_embedding_stores
+from app.shared.graph_store import reset_graph_store
+from app.shared.sparse_index import reset_resource_sparse_index
+from app.shared.vector_index import (
+    reset_question_vector_index,
+    reset_resource_vector_index,
+)
 
 # Import create_app instead of app to avoid module-level initialization
 from app import create_app
@@ -121,6 +132,7 @@ def db_session(db_engine) -> Generator[Session, None, None]:
         autocommit=False,
         autoflush=False,
         bind=db_engine,
+        class_=AppSession,
         expire_on_commit=False,  # Prevent lazy loading errors after commit
     )
 
@@ -130,11 +142,30 @@ def db_session(db_engine) -> Generator[Session, None, None]:
     # This is critical for in-memory SQLite databases
     Base.metadata.create_all(bind=db_engine)
 
+    # Process-wide vector/sparse/subject indexes, embedding and graph stores and the
+    # query embedding and rerank score caches must not leak state between tests
+    reset_resource_vector_index()
+    reset_question_vector_index()
+    reset_embedding_stores()
+    reset_resource_sparse_index()
+    reset_resource_subject_index()
+    reset_query_embedding_cache()
+    reset_rerank_score_cache()
+    reset_graph_store()
+
     try:
         yield session
     finally:
         session.rollback()
         session.close()
+        reset_resource_vector_index()
+        reset_question_vector_index()
+        reset_embedding_stores()
+        reset_resource_sparse_index()
+        reset_resource_subject_index()
+        reset_query_embedding_cache()
+        reset_rerank_score_cache()
+        reset_graph_store()
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -288,6 +319,7 @@ def test_settings():
         "QUEUE_SIZE": "10",
         "TASK_TTL": "86400",
         "WORKER_POLL_INTERVAL": "2",
+        "QUERY_EMBEDDING_CACHE_REDIS": "false",
     }
 
     # Set test environment variables
@@ -144,6 +144,128 @@ class TestAggregateEmbedding:
         assert result is None
 
 
+class TestIncrementalEmbedding:
+    """Test running-sum embedding updates on membership changes."""
+
+    @staticmethod
+    def _setup(db_session, embeddings):
+        collection = Collection(
+            name="Incremental", description="Test", owner_id="user1"
+        )
+        db_session.add(collection)
+        resource_ids = []
+        for i, emb in enumerate(embeddings):
+            resource = Resource(
+                title=f"Resource {i}",
+                source=f"http://example.com/inc/{i}",
+                type="article",
+                embedding=json.dumps(emb) if emb else None,
+                quality_score=0.8,
+            )
+            db_session.add(resource)
+            db_session.flush()
+            resource_ids.append(resource.id)
+        db_session.commit()
+        return collection, resource_ids
+
+    def test_add_and_remove_update_running_sum(self, db_session, monkeypatch):
+        """Add/remove fold member embeddings in without an exact recompute."""
+        service = CollectionService(db_session)
+        collection, ids = self._setup(
+            db_session, [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 2.0], None]
+        )
+        monkeypatch.setattr(
+            service,
+            "compute_collection_embedding",
+            lambda collection_id: pytest.fail("recomputed all members"),
+        )
+
+        service.add_resources_to_collection(collection.id, ids[:2])
+        service.add_resources_batch(collection.id, ids[2:], "user1")
+        db_session.refresh(collection)
+        assert collection.embedding_sum == [1.0, 1.0, 2.0]
+        assert collection.embedding_count == 3
+
+        service.remove_resources_from_collection(collection.id, [ids[0], uuid.uuid4()])
+        service.remove_resources_batch(collection.id, [ids[3]], "user1")
+        db_session.refresh(collection)
+
+        assert collection.embedding_sum == [0.0, 1.0, 2.0]
+        assert collection.embedding_count == 2
+        expected = np.array([0.0, 1.0, 2.0]) / np.linalg.norm([0.0, 1.0, 2.0])
+        np.testing.assert_array_almost_equal(collection.embedding, expected)
+
+        service.remove_resources_batch(collection.id, ids[1:3], "user1")
+        db_session.refresh(collection)
+        assert collection.embedding is None
+        assert collection.embedding_count == 0
+
+    def test_matches_exact_recompute(self, db_session):
+        """Incremental and exact embeddings agree."""
+        service = CollectionService(db_session)
+        rng = np.random.default_rng(0)
+        collection, ids = self._setup(db_session, rng.normal(size=(6, 4)).tolist())
+
+        service.add_resources_batch(collection.id, ids, "user1")
+        service.remove_resources_batch(collection.id, ids[1:3], "user1")
+        db_session.refresh(collection)
+        incremental = list(collection.embedding)
+
+        exact = service.compute_collection_embedding(collection.id)
+
+        np.testing.assert_array_almost_equal(incremental, exact)
+        assert collection.embedding_count == 4
+
+    def test_remove_member_whose_embedding_changed(self, db_session):
+        """Only the vector a member contributed is subtracted."""
+        service = CollectionService(db_session)
+        collection, ids = self._setup(db_session, [[1.0, 0.0], None, [0.0, 1.0]])
+        service.add_resources_batch(collection.id, ids, "user1")
+
+        # B gains an embedding after it was added; C's embedding changes
+        resources = {r.id: r for r in db_session.query(Resource).all()}
+        resources[ids[1]].embedding = json.dumps([0.0, 1.0])
+        resources[ids[2]].embedding = json.dumps([0.0, 3.0])
+        db_session.commit()
+
+        service.remove_resources_batch(collection.id, [ids[1]], "user1")
+        db_session.refresh(collection)
+        # B contributed nothing, so nothing is subtracted
+        assert collection.embedding_sum == [1.0, 1.0]
+        assert collection.embedding_count == 2
+
+        service.remove_resources_batch(collection.id, [ids[2]], "user1")
+        db_session.refresh(collection)
+        # C's current vector was never counted: exact recompute
+        assert collection.embedding_sum == [1.0, 0.0]
+        assert collection.embedding_count == 1
+        assert collection.embedding == service.compute_collection_embedding(
+            collection.id
+        )
+
+    def test_periodic_and_legacy_resync(self, db_session, test_settings):
+        """Exact recompute every N updates and for pre-running-sum collections."""
+        test_settings.COLLECTION_EMBEDDING_RESYNC_EVERY = 3
+        service = CollectionService(db_session)
+        collection, ids = self._setup(db_session, [[1.0, 0.0]] * 3)
+
+        for resource_id in ids:
+            service.add_resources_to_collection(collection.id, [resource_id])
+            db_session.refresh(collection)
+        # Third update was an exact recompute, which resets the counter
+        assert collection.embedding_updates == 0
+        assert collection.embedding_sum == [3.0, 0.0]
+
+        # A collection embedded before running sums existed
+        collection.embedding_sum = None
+        collection.embedding = [1.0, 0.0]
+        db_session.commit()
+        service.remove_resources_from_collection(collection.id, ids[:1])
+        db_session.refresh(collection)
+        assert collection.embedding_sum == [2.0, 0.0]
+        assert collection.embedding_count == 2
+
+
 class TestResourceRecommendations:
     """Test resource recommendations based on collection embedding."""
 
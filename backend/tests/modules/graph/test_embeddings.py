@@ -10,7 +10,15 @@ import pytest
 from unittest.mock import Mock
 from uuid import uuid4
 
-from app.modules.graph.embeddings import GraphEmbeddingsService
+from app.modules.graph import embeddings as embeddings_module
+from app.modules.graph.embeddings import (
+    GraphEmbeddingsService,
+    active_embedding_job,
+    create_embedding_job,
+    get_embedding_job,
+    reset_embedding_jobs,
+    run_embedding_job,
+)
 
 
 class TestGraphEmbeddingsService:
@@ -278,6 +286,143 @@ class TestGraphEmbeddingsService:
         assert result["status"] == "error"
 
 
+class TestEmbeddingJobs:
+    """Tests for CSR graph loading and background generation jobs"""
+
+    @pytest.fixture(autouse=True)
+    def clean_jobs(self, monkeypatch):
+        monkeypatch.setattr(embeddings_module, "_job_redis", lambda: None)
+        reset_embedding_jobs()
+        yield
+        reset_embedding_jobs()
+
+    def test_build_walk_graph_from_id_columns(self):
+        """Walk graph is built from (source, target) and resource id rows"""
+        source, target, isolated = uuid4(), uuid4(), uuid4()
+        mock_db = Mock()
+        mock_db.query.return_value.all.side_effect = [
+            [(source, target), (source, None)],
+            [(source,), (target,), (isolated,)],
+        ]
+
+        graph = GraphEmbeddingsService(mock_db)._build_walk_graph()
+
+        assert graph.num_nodes == 3
+        assert graph.num_edges == 1
+        assert set(graph.node_ids) == {str(source), str(target), str(isolated)}
+
+    def test_job_reports_stage_progress(self, monkeypatch):
+        """A successful job records per-stage progress and the result"""
+        snapshots = []
+
+        def fake_compute(self, progress_callback=None, **parameters):
+            assert parameters == {"dimensions": 64, "p": 0.5, "q": 2.0}
+            progress_callback("walking", 0.5)
+            snapshots.append(get_embedding_job(job["job_id"]))
+            return {
+                "status": "success",
+                "embeddings_computed": 3,
+                "execution_time": 0.1,
+            }
+
+        monkeypatch.setattr(
+            GraphEmbeddingsService, "compute_node2vec_embeddings", fake_compute
+        )
+        job = create_embedding_job("node2vec", {"dimensions": 64, "p": 0.5, "q": 2.0})
+        assert active_embedding_job()["job_id"] == job["job_id"]
+
+        session = Mock()
+        run_embedding_job(job["job_id"], session_factory=lambda: session)
+
+        assert snapshots[0]["status"] == "running"
+        assert snapshots[0]["stage"] == "walking"
+        assert snapshots[0]["progress"] == pytest.approx(0.275)
+
+        finished = get_embedding_job(job["job_id"])
+        assert finished["status"] == "completed"
+        assert finished["progress"] == 1.0
+        assert finished["result"]["embeddings_computed"] == 3
+        assert active_embedding_job() is None
+        session.close.assert_called_once()
+
+    def test_job_failure_is_recorded(self, monkeypatch):
+        """Errors and error results mark the job failed"""
+
+        def failing_compute(self, progress_callback=None, **parameters):
+            raise ImportError("gensim is required")
+
+        monkeypatch.setattr(
+            GraphEmbeddingsService, "compute_deepwalk_embeddings", failing_compute
+        )
+        job = create_embedding_job("deepwalk", {})
+
+        run_embedding_job(job["job_id"], session_factory=Mock)
+
+        failed = get_embedding_job(job["job_id"])
+        assert failed["status"] == "failed"
+        assert "gensim" in failed["error"]
+
+    def test_empty_graph_job_fails_with_message(self):
+        """Compute errors (no nodes) surface as a failed job"""
+        session = Mock()
+        session.query.return_value.all.return_value = []
+        job = create_embedding_job("node2vec", {})
+
+        run_embedding_job(job["job_id"], session_factory=lambda: session)
+
+        failed = get_embedding_job(job["job_id"])
+        assert failed["status"] == "failed"
+        assert failed["error"] == "Graph has no nodes"
+
+    def test_only_one_job_is_admitted(self):
+        """A second job is refused while one is pending"""
+        first = create_embedding_job("node2vec", {})
+
+        assert create_embedding_job("deepwalk", {}) is None
+        assert active_embedding_job()["job_id"] == first["job_id"]
+
+    def test_job_state_is_shared_through_redis(self, monkeypatch):
+        """Workers with separate process registries see the same jobs"""
+        client = _FakeRedis()
+        monkeypatch.setattr(embeddings_module, "_job_redis", lambda: client)
+        job = create_embedding_job("node2vec", {})
+
+        # Another worker: empty local registry, same Redis
+        embeddings_module._jobs.clear()
+        assert get_embedding_job(job["job_id"])["status"] == "pending"
+        assert create_embedding_job("deepwalk", {}) is None
+
+        session = Mock()
+        session.query.return_value.all.return_value = []
+        run_embedding_job(job["job_id"], session_factory=lambda: session)
+
+        assert get_embedding_job(job["job_id"])["status"] == "failed"
+        assert active_embedding_job() is None
+        assert create_embedding_job("deepwalk", {}) is not None
+
+
+class _FakeRedis:
+    """The string commands the embedding job store uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def delete(self, key):
+        return int(self.data.pop(key, None) is not None)
+
+    def expire(self, key, seconds):
+        return key in self.data
+
+
 class TestGraphEmbeddingsPerformance:
     """Performance tests for graph embeddings"""
 
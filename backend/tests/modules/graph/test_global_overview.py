@@ -0,0 +1,110 @@
+"""
+Graph Module - Global Overview Tests
+
+Tests for the vectorized candidate-pair search behind generate_global_overview:
+shared-subject counting, vector similarity pairs and the resulting graph.
+"""
+
+import json
+import uuid
+from itertools import combinations
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.database.models import Resource
+from app.modules.graph.service import (
+    _find_high_tag_overlap_pairs,
+    _find_high_vector_similarity_pairs,
+    _shared_subject_counts,
+    generate_global_overview,
+)
+
+
+def _row(subject=None, embedding=None):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        subject=subject,
+        embedding=json.dumps(embedding) if embedding is not None else None,
+    )
+
+
+class TestSharedSubjectCounts:
+    """Sparse incidence product against a brute-force count."""
+
+    def test_counts_match_brute_force_across_blocks(self):
+        rng = np.random.default_rng(1)
+        vocab = [f"s{i}" for i in range(12)]
+        subject_lists = [
+            list(rng.choice(vocab, size=rng.integers(0, 5), replace=False))
+            for _ in range(40)
+        ]
+        expected = {
+            (i, j): len(set(subject_lists[i]) & set(subject_lists[j]))
+            for i, j in combinations(range(40), 2)
+            if set(subject_lists[i]) & set(subject_lists[j])
+        }
+
+        # A tiny budget splits the work into many row blocks
+        actual = {}
+        for left, right, shared in _shared_subject_counts(
+            subject_lists, max_block_entries=8
+        ):
+            for i, j, c in zip(left.tolist(), right.tolist(), shared.tolist()):
+                assert (i, j) not in actual
+                actual[(i, j)] = c
+
+        assert actual == expected
+
+    def test_top_pairs_by_shared_count(self):
+        rows = [
+            _row(["ml", "nlp", "cv"]),
+            _row(["ml", "nlp", "cv"]),
+            _row(["ml"]),
+            _row([]),
+        ]
+
+        pairs = _find_high_tag_overlap_pairs(rows, limit=1)
+
+        assert pairs == {tuple(sorted((rows[0].id, rows[1].id)))}
+
+
+class TestVectorPairs:
+    """Blocked similarity join on stored (JSON text) embeddings."""
+
+    def test_pairs_above_threshold(self):
+        rows = [
+            _row(embedding=[1.0, 0.0]),
+            _row(embedding=[0.99, 0.05]),
+            _row(embedding=[0.0, 1.0]),
+            _row(embedding=None),
+            _row(embedding=[1.0, 0.0, 0.0]),  # wrong dimension, skipped
+        ]
+
+        pairs = _find_high_vector_similarity_pairs(rows, 0.9)
+
+        assert set(pairs) == {tuple(sorted((rows[0].id, rows[1].id)))}
+        assert 0.99 < next(iter(pairs.values())) <= 1.0
+
+
+def test_global_overview_returns_strongest_edges(db_session):
+    close_a = Resource(
+        title="A", type="article", subject=["ml"], embedding=json.dumps([1.0, 0.0])
+    )
+    close_b = Resource(
+        title="B", type="article", subject=["ml"], embedding=json.dumps([0.98, 0.2])
+    )
+    far = Resource(
+        title="C", type="article", subject=["art"], embedding=json.dumps([0.0, 1.0])
+    )
+    db_session.add_all([close_a, close_b, far])
+    db_session.commit()
+
+    graph = generate_global_overview(db_session, limit=10, vector_threshold=0.9)
+
+    assert len(graph.edges) == 1
+    edge = graph.edges[0]
+    assert {edge.source, edge.target} == {close_a.id, close_b.id}
+    assert edge.details.shared_subjects == ["ml"]
+    assert edge.details.vector_similarity > 0.9
+    assert {node.id for node in graph.nodes} == {close_a.id, close_b.id}
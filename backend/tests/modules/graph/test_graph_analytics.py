@@ -0,0 +1,243 @@
+"""
+Graph Module - Background Analytics Tests
+
+Tests for the array-based centrality and community kernels, the analytics
+job that fills graph_centrality_cache and community_assignments, and the
+centrality endpoint that only reads those tables.
+"""
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from app.database.models import (
+    Citation,
+    CommunityAssignment,
+    GraphCentralityCache,
+    GraphEdge,
+    Resource,
+)
+from app.modules.graph import analytics
+from app.modules.graph.analytics import (
+    analytics_freshness,
+    compute_graph_analytics,
+    refresh_graph_analytics,
+)
+from app.shared.graph_analytics import (
+    betweenness_sample_size,
+    betweenness_scores,
+    louvain_partition,
+    pagerank_scores,
+)
+from app.shared.graph_store import GraphStore
+
+
+def _store():
+    store = GraphStore()
+    for node_id in "abcdef":
+        store.upsert_node(node_id)
+    store.add_edges(
+        [
+            ("a", "b", "citation", 1.0),
+            ("a", "b", "semantic", 0.3),
+            ("b", "c", "citation", 0.5),
+            ("c", "d", "semantic", 0.8),
+            ("b", "d", "citation", 2.0),
+            ("d", "e", "citation", 1.0),
+        ]
+    )
+    return store
+
+
+# ============================================================================
+# Kernels
+# ============================================================================
+
+
+class TestKernels:
+    """Array kernels against NetworkX on the store's own views."""
+
+    def test_betweenness_matches_multigraph(self):
+        store = _store()
+        node_ids, src, dst, weight = store.live_edges()
+
+        scores = betweenness_scores(len(node_ids), src, dst, weight)
+
+        expected = nx.betweenness_centrality(store.to_networkx(), weight="weight")
+        assert dict(zip(node_ids, scores.tolist())) == pytest.approx(expected)
+
+    def test_pagerank_matches_digraph(self):
+        store = _store()
+        node_ids, src, dst, weight = store.live_edges()
+
+        scores = pagerank_scores(len(node_ids), src, dst, weight, 0.85)
+
+        expected = nx.pagerank(store.to_digraph(), alpha=0.85, weight="weight")
+        actual = dict(zip(node_ids, scores.tolist()))
+        assert {n: actual[n] for n in expected} == pytest.approx(expected)
+        # The isolated node is not ranked
+        assert actual["f"] == 0.0
+
+    def test_live_edges_skip_removed_nodes(self):
+        store = _store()
+        store.remove_node("c")
+
+        node_ids, src, dst, _ = store.live_edges()
+
+        assert node_ids == ["a", "b", "d", "e", "f"]
+        assert sorted(zip(src.tolist(), dst.tolist())) == [
+            (0, 1),
+            (0, 1),
+            (1, 2),
+            (2, 3),
+        ]
+
+    def test_sampled_betweenness_above_threshold(self):
+        assert betweenness_sample_size(100, exact_max_nodes=200, samples=16) is None
+        assert betweenness_sample_size(100, exact_max_nodes=50, samples=16) == 16
+        assert betweenness_sample_size(10, exact_max_nodes=5, samples=16) is None
+
+        G = nx.connected_watts_strogatz_graph(300, 4, 0.1, seed=1)
+        src, dst = np.array(list(G.edges())).T
+        exact = betweenness_scores(300, src, dst, np.ones(len(src)))
+        approx = betweenness_scores(300, src, dst, np.ones(len(src)), 100, 0)
+
+        assert np.all((approx >= 0) & (approx <= 1))
+        assert np.corrcoef(exact, approx)[0, 1] > 0.8
+
+    def test_louvain_separates_cliques(self):
+        pytest.importorskip("community")
+        left = [(i, j) for i in range(4) for j in range(i + 1, 4)]
+        right = [(i + 4, j + 4) for i, j in left]
+        src, dst = np.array(left + right + [(3, 4)]).T
+
+        labels, modularity = louvain_partition(9, src, dst, np.ones(len(src)), seed=0)
+
+        assert len(set(labels[:4].tolist())) == 1
+        assert len(set(labels[4:8].tolist())) == 1
+        assert labels[0] != labels[4]
+        # The isolated node forms its own community
+        assert labels[8] not in labels[:8]
+        assert modularity > 0.3
+
+
+# ============================================================================
+# Analytics job
+# ============================================================================
+
+
+def _graph_rows(db_session):
+    a, b, c, lone = (Resource(title=t) for t in ("A", "B", "C", "Lone"))
+    db_session.add_all([a, b, c, lone])
+    db_session.commit()
+    db_session.add_all(
+        [
+            Citation(
+                source_resource_id=a.id,
+                target_resource_id=b.id,
+                target_url="https://example.com/b",
+            ),
+            GraphEdge(
+                source_id=b.id,
+                target_id=c.id,
+                edge_type="semantic",
+                weight=0.7,
+                created_by="test",
+            ),
+        ]
+    )
+    db_session.commit()
+    return a, b, c, lone
+
+
+def test_job_replaces_cached_rows(db_session):
+    a, b, c, lone = _graph_rows(db_session)
+    db_session.add(GraphCentralityCache(resource_id=a.id, pagerank=42.0))
+    db_session.commit()
+
+    summary = compute_graph_analytics(db_session, resolutions=[])
+
+    assert summary["resources"] == 4
+    assert summary["approximate"] is False
+    rows = {row.resource_id: row for row in db_session.query(GraphCentralityCache)}
+    assert set(rows) == {a.id, b.id, c.id, lone.id}
+    assert rows[b.id].betweenness == pytest.approx(1 / 3)
+    assert rows[a.id].betweenness == 0.0
+    assert (rows[b.id].in_degree + rows[b.id].out_degree) == 2
+    assert rows[a.id].pagerank != 42.0
+    assert rows[lone.id].pagerank == 0.0
+
+
+def test_job_stores_communities_per_resolution(db_session):
+    pytest.importorskip("community")
+    a, b, c, _ = _graph_rows(db_session)
+
+    compute_graph_analytics(db_session, resolutions=[1.0])
+    compute_graph_analytics(db_session, resolutions=[1.0])
+
+    assignments = db_session.query(CommunityAssignment).all()
+    assert {row.resource_id for row in assignments} >= {a.id, b.id, c.id}
+    assert len(assignments) == len({row.resource_id for row in assignments})
+    assert {row.resolution for row in assignments} == {1.0}
+
+
+def test_refresh_is_single_flight(db_session):
+    opened = []
+
+    def factory():
+        opened.append(True)
+        return db_session
+
+    with analytics._run_lock:
+        assert refresh_graph_analytics(session_factory=factory) is None
+    assert opened == []
+    assert not analytics.analytics_running()
+
+
+def test_freshness_metadata():
+    from datetime import datetime, timedelta, timezone
+
+    assert analytics_freshness(None)["stale"] is True
+
+    recent = analytics_freshness(datetime.now(timezone.utc) - timedelta(seconds=5))
+    assert recent["stale"] is False
+    assert 4 <= recent["age_seconds"] < 60
+
+    # Naive datetimes (SQLite) are read as UTC
+    old = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=1)
+    assert analytics_freshness(old)["stale"] is True
+
+
+# ============================================================================
+# Endpoint
+# ============================================================================
+
+
+def test_centrality_endpoint_reads_cached_metrics(client, db_session, monkeypatch):
+    a, b, c, _ = _graph_rows(db_session)
+    queued = []
+    monkeypatch.setattr(
+        analytics, "refresh_graph_analytics", lambda: queued.append(True)
+    )
+
+    # Nothing computed yet: zeros, stale, and a refresh is queued
+    response = client.get(
+        "/api/graph/centrality", params={"resource_ids": f"{a.id},{b.id}"}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["stale"] is True
+    assert data["refreshing"] is True
+    assert data["metrics"][str(b.id)]["betweenness"] == 0.0
+    assert queued == [True]
+
+    compute_graph_analytics(db_session, resolutions=[])
+    response = client.get(
+        "/api/graph/centrality", params={"resource_ids": f"{a.id},{b.id}"}
+    )
+    data = response.json()
+    assert data["stale"] is False
+    assert data["cached"] is True
+    assert data["metrics"][str(b.id)]["betweenness"] == pytest.approx(1 / 3)
+    assert data["metrics"][str(b.id)]["total_degree"] == 2
+    assert queued == [True]
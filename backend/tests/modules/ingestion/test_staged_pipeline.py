@@ -0,0 +1,248 @@
+"""Unit tests for the staged parse → embed → write ingestion pipeline.
+
+Tests cover:
+- Parsing a Python file into symbol chunk specs off the event loop
+- Generic line chunking for languages without an AST extractor
+- End-to-end stage execution with cross-file embedding batches
+- Per-file failure isolation and per-stage throughput reporting
+- Multi-row resource INSERT on PostgreSQL and executemany on SQLite
+"""
+
+import json
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from app.modules.ingestion.ast_pipeline import (
+    HybridIngestionPipeline,
+    IngestionResult,
+    StageStats,
+    _parse_source_file,
+)
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+class _FakeSession:
+    """Minimal AsyncSession stand-in that records what the writer sends."""
+
+    def __init__(self, dialect: str = "postgresql", fail_on: str | None = None):
+        self.dialect = dialect
+        self.fail_on = fail_on
+        self.statements = []   # committed
+        self._pending = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name=self.dialect))
+
+    async def execute(self, statement, params=None):
+        rows = params if isinstance(params, list) else [params or {}]
+        if self.fail_on and any(self.fail_on in row.values() for row in rows):
+            raise RuntimeError("insert failed")
+        self._pending.append((str(statement), params))
+
+    async def commit(self):
+        self.commits += 1
+        self.statements.extend(self._pending)
+        self._pending.clear()
+
+    async def rollback(self):
+        self.rollbacks += 1
+        self._pending.clear()
+
+    def executed(self, table: str):
+        return [params for sql, params in self.statements if f"INTO {table}" in sql]
+
+    @property
+    def chunk_rows(self):
+        return [row for params in self.executed("document_chunks") for row in params]
+
+
+class _FakeEmbedder:
+    def __init__(self):
+        self.batches = []
+
+    def batch_generate(self, texts):
+        self.batches.append(list(texts))
+        return [[float(len(t)), 1.0] for t in texts]
+
+
+@pytest.fixture
+def repo_tree(tmp_path: Path) -> Path:
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "auth.py").write_text(
+        "class Auth:\n"
+        "    \"\"\"Auth helper.\"\"\"\n"
+        "    def login(self, user: str) -> bool:\n"
+        "        return check(user)\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "pkg" / "util.py").write_text(
+        "def helper():\n    return 1\n", encoding="utf-8"
+    )
+    (tmp_path / "Main.java").write_text(
+        "\n".join(f"line {i}" for i in range(120)), encoding="utf-8"
+    )
+    return tmp_path
+
+
+# ============================================================================
+# Parse stage
+# ============================================================================
+
+
+def test_parse_python_file_yields_symbol_specs(repo_tree: Path):
+    parsed = _parse_source_file(str(repo_tree / "pkg" / "auth.py"), str(repo_tree))
+
+    assert parsed.rel_path == "pkg/auth.py"
+    assert parsed.language == "python"
+    names = [c.symbol_name for c in parsed.chunks]
+    assert names == ["pkg.auth.Auth", "pkg.auth.Auth.login"]
+    assert parsed.chunks[1].node_type == "method"
+    assert "check" in parsed.chunks[1].dependencies
+    assert parsed.storage_saved_bytes == 1600
+
+
+def test_parse_unsupported_language_falls_back_to_line_chunks(repo_tree: Path):
+    parsed = _parse_source_file(str(repo_tree / "Main.java"), str(repo_tree))
+
+    assert parsed.language == "java"
+    assert all(c.node_type == "block" for c in parsed.chunks)
+    assert parsed.chunks[0].start_line == 1
+    assert parsed.chunks[-1].end_line == 120
+
+
+# ============================================================================
+# Stage execution
+# ============================================================================
+
+
+async def test_run_stages_writes_every_file(repo_tree: Path):
+    db = _FakeSession()
+    embedder = _FakeEmbedder()
+    pipeline = HybridIngestionPipeline(
+        db, embedding_service=embedder, parse_workers=0, queue_size=1
+    )
+    result = IngestionResult(repo_url="https://github.com/o/r", branch="main", commit_sha="abc")
+
+    await pipeline._run_stages(
+        root_path=repo_tree,
+        gitignore_spec=None,
+        file_extensions=(".py", ".java"),
+        git_url="https://github.com/o/r",
+        commit_sha="abc",
+        result=result,
+        batch_size=50,
+    )
+
+    assert result.resources_created == 3
+    assert result.files_failed == 0
+    assert result.chunks_created == len(db.chunk_rows)
+    # Every chunk got its own vector back, in order
+    for row in db.chunk_rows:
+        vec = row["chunk_metadata"]["embedding_vector"]
+        assert vec[0] == float(len(row["semantic_summary"]))
+    assert sum(len(b) for b in embedder.batches) == len(db.chunk_rows)
+
+    for name in ("parse", "embed", "write"):
+        assert result.stage_stats[name].items == 3
+    assert result.bottleneck_stage in {"parse", "embed", "write"}
+
+
+async def test_write_failure_is_isolated_to_one_file(repo_tree: Path):
+    db = _FakeSession(fail_on="pkg/util.py")
+    pipeline = HybridIngestionPipeline(
+        db, embedding_service=_FakeEmbedder(), parse_workers=0
+    )
+    result = IngestionResult(repo_url="https://github.com/o/r", branch="main", commit_sha="abc")
+
+    await pipeline._run_stages(
+        root_path=repo_tree,
+        gitignore_spec=None,
+        file_extensions=(".py", ".java"),
+        git_url="https://github.com/o/r",
+        commit_sha="abc",
+        result=result,
+        batch_size=50,
+    )
+
+    assert result.files_failed == 1
+    assert result.errors[0]["path"] == "pkg/util.py"
+    assert result.resources_created == 2
+    # Whole batch rolled back once, then the bad file again on its own
+    assert db.rollbacks == 2
+    assert {row["resource_id"] for row in db.chunk_rows} == {
+        uuid.UUID(rid) for rid in result.resource_ids
+    }
+
+
+# ============================================================================
+# Bulk writes
+# ============================================================================
+
+
+async def test_postgres_batch_uses_one_multi_row_insert(repo_tree: Path):
+    db = _FakeSession()
+    pipeline = HybridIngestionPipeline(
+        db, embedding_service=_FakeEmbedder(), parse_workers=0
+    )
+    result = IngestionResult(repo_url="https://github.com/o/r", branch="main", commit_sha="abc")
+
+    await pipeline._run_stages(
+        root_path=repo_tree,
+        gitignore_spec=None,
+        file_extensions=(".py", ".java"),
+        git_url="https://github.com/o/r",
+        commit_sha="abc",
+        result=result,
+        batch_size=500,
+    )
+
+    resource_inserts = db.executed("resources")
+    assert len(resource_inserts) == 1
+    params = resource_inserts[0]
+    assert {params[f"identifier_{i}"] for i in range(3)} == {
+        "pkg/auth.py", "pkg/util.py", "Main.java",
+    }
+    assert json.loads(params["embedding_0"])[1] == 1.0
+    # Chunks go out as a single executemany and everything lands in one commit
+    assert len(db.executed("document_chunks")) == 1
+    assert db.commits == 1
+
+
+async def test_sqlite_batch_uses_executemany(repo_tree: Path):
+    db = _FakeSession(dialect="sqlite")
+    pipeline = HybridIngestionPipeline(
+        db, embedding_service=_FakeEmbedder(), parse_workers=0
+    )
+    result = IngestionResult(repo_url="https://github.com/o/r", branch="main", commit_sha="abc")
+
+    await pipeline._run_stages(
+        root_path=repo_tree,
+        gitignore_spec=None,
+        file_extensions=(".py",),
+        git_url="https://github.com/o/r",
+        commit_sha="abc",
+        result=result,
+        batch_size=500,
+    )
+
+    (rows,) = db.executed("resources")
+    assert isinstance(rows, list) and len(rows) == 2
+    assert all(isinstance(json.loads(row["embedding"]), list) for row in rows)
+    assert result.chunks_created == len(db.chunk_rows) == 3
+
+
+def test_stage_stats_throughput_accounts_for_workers():
+    stats = StageStats(items=40, busy_seconds=8.0, workers=4)
+
+    assert stats.items_per_second == pytest.approx(20.0)
+    assert StageStats().items_per_second == 0.0
+    assert stats.as_dict()["items"] == 40
@@ -0,0 +1,139 @@
+"""
+Unit tests for list_resources keyset pagination.
+
+Tests cursor paging across sort orders and ties, cursor validation, and
+planner-estimated versus exact totals.
+"""
+
+import pytest
+
+from app.modules.resources import service as resource_service
+from app.modules.resources.schema import PageParams, ResourceFilters, SortParams
+from app.modules.resources.service import (
+    decode_resource_cursor,
+    encode_resource_cursor,
+    list_resources,
+)
+
+
+@pytest.fixture
+def resources(create_test_resource):
+    """Seven resources; quality scores repeat so the id tie-breaker matters."""
+    return [
+        create_test_resource(
+            title=f"Resource {i}",
+            source=f"https://example.com/{i}",
+            quality_score=[0.2, 0.5, 0.5, 0.5, 0.9, 0.9, 0.1][i],
+        )
+        for i in range(7)
+    ]
+
+
+def _walk(db_session, sort, limit=3):
+    pages, cursor = [], None
+    while True:
+        result = list_resources(
+            db_session,
+            ResourceFilters(),
+            PageParams(limit=limit),
+            sort,
+            cursor=cursor,
+        )
+        pages.append(result)
+        if result.next_cursor is None:
+            return pages
+        assert result.next_cursor != cursor, "cursor did not advance"
+        assert len(pages) <= 10, "paging did not terminate"
+        cursor = result.next_cursor
+
+
+@pytest.mark.parametrize(
+    "sort_by,sort_dir",
+    [
+        ("created_at", "desc"),
+        ("quality_score", "desc"),
+        ("quality_score", "asc"),
+        ("title", "asc"),
+    ],
+)
+def test_cursor_pages_cover_every_resource_once(
+    db_session, resources, sort_by, sort_dir
+):
+    sort = SortParams(sort_by=sort_by, sort_dir=sort_dir)
+
+    pages = _walk(db_session, sort)
+
+    seen = [item for page in pages for item in page.items]
+    assert [len(page.items) for page in pages] == [3, 3, 1]
+    assert len({item.id for item in seen}) == 7
+
+    keys = [(getattr(item, sort_by), str(item.id)) for item in seen]
+    assert keys == sorted(keys, reverse=sort_dir == "desc")
+
+
+def test_offset_still_works_without_cursor(db_session, resources):
+    sort = SortParams(sort_by="title", sort_dir="asc")
+
+    result = list_resources(
+        db_session, ResourceFilters(), PageParams(limit=2, offset=5), sort
+    )
+
+    assert [item.title for item in result.items] == ["Resource 5", "Resource 6"]
+    assert result.next_cursor is None
+
+
+def test_cursor_respects_filters(db_session, resources):
+    sort = SortParams(sort_by="quality_score", sort_dir="desc")
+    filters = ResourceFilters(min_quality=0.5)
+
+    first = list_resources(db_session, filters, PageParams(limit=4), sort)
+    rest = list_resources(
+        db_session, filters, PageParams(limit=4), sort, cursor=first.next_cursor
+    )
+
+    assert first.total == 5
+    assert len(first.items) + len(rest.items) == 5
+    assert rest.next_cursor is None
+
+
+def test_cursor_round_trip_and_validation(resources):
+    sort = SortParams(sort_by="created_at", sort_dir="desc")
+    resource = resources[0]
+
+    cursor = encode_resource_cursor(resource, sort)
+    value, resource_id = decode_resource_cursor(cursor, sort)
+
+    assert resource_id == resource.id
+    assert value == resource.created_at
+    with pytest.raises(ValueError):
+        decode_resource_cursor(cursor, SortParams(sort_by="title", sort_dir="desc"))
+    with pytest.raises(ValueError):
+        decode_resource_cursor(cursor, SortParams(sort_by="created_at", sort_dir="asc"))
+    with pytest.raises(ValueError):
+        decode_resource_cursor("not-a-cursor", sort)
+
+
+def test_total_uses_planner_estimate_for_large_results(
+    db_session, resources, monkeypatch
+):
+    monkeypatch.setattr(
+        resource_service, "_estimate_row_count", lambda db, query: 2_000_000
+    )
+    sort = SortParams(sort_by="created_at", sort_dir="desc")
+
+    estimated = list_resources(db_session, ResourceFilters(), PageParams(), sort)
+    exact = list_resources(
+        db_session, ResourceFilters(), PageParams(), sort, exact_count=True
+    )
+
+    assert (estimated.total, estimated.total_exact) == (2_000_000, False)
+    assert (exact.total, exact.total_exact) == (7, True)
+
+
+def test_small_estimates_are_counted_exactly(db_session, resources, monkeypatch):
+    monkeypatch.setattr(resource_service, "_estimate_row_count", lambda db, query: 3)
+    sort = SortParams(sort_by="created_at", sort_dir="desc")
+
+    result = list_resources(db_session, ResourceFilters(), PageParams(), sort)
+
+    assert (result.total, result.total_exact) == (7, True)
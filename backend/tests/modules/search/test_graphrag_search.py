@@ -0,0 +1,134 @@
+"""
+GraphRAG Search Tests
+
+Tests for set-based GraphRAG retrieval: scoring by path length, relation
+filtering, serialized graph paths and a query count independent of the
+number of entities and paths.
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy import event
+
+from app.database.models import DocumentChunk, GraphEntity, GraphRelationship, Resource
+from app.modules.search.service import SearchService
+
+
+@pytest.fixture
+def chain_graph(db_session):
+    """Chain Alpha -SUPPORTS-> Beta -EXTENDS-> Gamma, each hop with a chunk."""
+    resource = Resource(id=uuid.uuid4(), title="Graph Paper", type="article")
+    db_session.add(resource)
+    db_session.flush()
+
+    chunks = [
+        DocumentChunk(
+            id=uuid.uuid4(), resource_id=resource.id, content=f"Chunk {i}", chunk_index=i
+        )
+        for i in range(2)
+    ]
+    entities = [
+        GraphEntity(id=uuid.uuid4(), name=name, type="Concept")
+        for name in ("Alpha", "Beta", "Gamma")
+    ]
+    db_session.add_all(chunks + entities)
+    db_session.flush()
+
+    relationships = [
+        GraphRelationship(
+            source_entity_id=entities[0].id,
+            target_entity_id=entities[1].id,
+            relation_type="SUPPORTS",
+            weight=1.0,
+            provenance_chunk_id=chunks[0].id,
+        ),
+        GraphRelationship(
+            source_entity_id=entities[1].id,
+            target_entity_id=entities[2].id,
+            relation_type="EXTENDS",
+            weight=1.0,
+            provenance_chunk_id=chunks[1].id,
+        ),
+    ]
+    db_session.add_all(relationships)
+    db_session.commit()
+    return {"resource": resource, "chunks": chunks, "entities": entities}
+
+
+def _count_queries(db_session):
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _record)
+    return statements, lambda: event.remove(engine, "before_cursor_execute", _record)
+
+
+def test_graphrag_scores_chunks_by_path_length(db_session, chain_graph):
+    results = SearchService(db_session).graphrag_search("Alpha", top_k=10, max_hops=2)
+
+    chunk_ids = [r["chunk"]["id"] for r in results]
+    assert chunk_ids == [str(c.id) for c in chain_graph["chunks"]]
+    # Alpha's own relationship scores 1.0, Beta's (one hop away) 0.5
+    assert [r["score"] for r in results] == [1.0, 0.5]
+    assert results[0]["parent_resource"].id == chain_graph["resource"].id
+
+
+def test_graphrag_serializes_graph_path(db_session, chain_graph):
+    results = SearchService(db_session).graphrag_search("Alpha", top_k=10, max_hops=2)
+
+    # Chunk 1 is reached through Alpha -> Beta
+    path = results[1]["graph_path"]
+    assert [node["entity_name"] for node in path] == ["Alpha", "Beta"]
+    assert path[0]["relation_type"] == "SUPPORTS"
+    assert path[-1]["relation_type"] is None
+
+
+def test_graphrag_respects_relation_filter(db_session, chain_graph):
+    results = SearchService(db_session).graphrag_search(
+        "Alpha", top_k=10, max_hops=2, relation_types=["EXTENDS"]
+    )
+
+    # Beta is not reachable, so only Alpha's own provenance chunk is returned
+    assert [r["chunk"]["id"] for r in results] == [str(chain_graph["chunks"][0].id)]
+
+
+def test_graphrag_query_count_does_not_grow_with_paths(db_session, chain_graph):
+    # Fan out: many entities hanging off Gamma, each with its own chunk
+    gamma = chain_graph["entities"][2]
+    for i in range(20):
+        chunk = DocumentChunk(
+            id=uuid.uuid4(),
+            resource_id=chain_graph["resource"].id,
+            content=f"Leaf chunk {i}",
+            chunk_index=10 + i,
+        )
+        leaf = GraphEntity(id=uuid.uuid4(), name=f"Leaf {i}", type="Concept")
+        db_session.add_all([chunk, leaf])
+        db_session.flush()
+        db_session.add(
+            GraphRelationship(
+                source_entity_id=gamma.id,
+                target_entity_id=leaf.id,
+                relation_type="EXTENDS",
+                weight=1.0,
+                provenance_chunk_id=chunk.id,
+            )
+        )
+    db_session.commit()
+    db_session.expunge_all()
+
+    statements, stop = _count_queries(db_session)
+    try:
+        results = SearchService(db_session).graphrag_search(
+            "Beta", top_k=50, max_hops=2
+        )
+    finally:
+        stop()
+
+    assert len(results) == 22
+    # entity lookup + 2 hops + provenance + chunks + path entities
+    assert len(statements) <= 6
@@ -0,0 +1,178 @@
+"""
+Question Search Tests
+
+Tests for Reverse HyDE question search over the in-process synthetic
+question vector index.
+"""
+
+import json
+import uuid
+
+import pytest
+
+from app.database.models import DocumentChunk, Resource, SyntheticQuestion
+from app.modules.search.service import SearchService, SyntheticQuestionService
+from app.shared.vector_index import get_question_vector_index
+
+
+@pytest.fixture
+def question_corpus(db_session):
+    """Two chunks; chunk 0 has two embedded questions, chunk 1 has one."""
+    resource = Resource(id=uuid.uuid4(), title="Questions", type="article")
+    db_session.add(resource)
+    db_session.flush()
+
+    chunks = [
+        DocumentChunk(
+            id=uuid.uuid4(), resource_id=resource.id, content=f"Chunk {i}", chunk_index=i
+        )
+        for i in range(2)
+    ]
+    db_session.add_all(chunks)
+    db_session.flush()
+
+    questions = [
+        SyntheticQuestion(
+            chunk_id=chunks[0].id,
+            question_text="What is a transformer?",
+            embedding=json.dumps([1.0, 0.0, 0.0]),
+        ),
+        SyntheticQuestion(
+            chunk_id=chunks[0].id,
+            question_text="How does attention work?",
+            embedding=json.dumps([0.9, 0.1, 0.0]),
+        ),
+        SyntheticQuestion(
+            chunk_id=chunks[1].id,
+            question_text="What is gradient descent?",
+            embedding=json.dumps([0.0, 1.0, 0.0]),
+        ),
+    ]
+    db_session.add_all(questions)
+    db_session.commit()
+    return {"chunks": chunks, "questions": questions}
+
+
+@pytest.fixture
+def search_service(db_session, monkeypatch):
+    service = SearchService(db_session)
+    monkeypatch.setattr(service, "_embed_query", lambda query: [1.0, 0.0, 0.0])
+    return service
+
+
+def test_question_search_ranks_by_question_embedding(search_service, question_corpus):
+    results = search_service.question_search("transformers", top_k=10)
+
+    # Chunk 0 appears once, via its closest question
+    assert [r["chunk"].id for r in results] == [
+        question_corpus["chunks"][0].id,
+        question_corpus["chunks"][1].id,
+    ]
+    assert results[0]["matching_question"].id == question_corpus["questions"][0].id
+    assert results[0]["score"] == pytest.approx(1.0)
+    assert results[1]["score"] == pytest.approx(0.0, abs=1e-6)
+
+
+def test_question_search_respects_top_k(search_service, question_corpus):
+    results = search_service.question_search("transformers", top_k=1)
+
+    assert len(results) == 1
+    assert results[0]["chunk"].id == question_corpus["chunks"][0].id
+
+
+def test_pending_questions_fall_back_to_text_similarity(
+    search_service, question_corpus, db_session
+):
+    pending = SyntheticQuestion(
+        chunk_id=question_corpus["chunks"][1].id,
+        question_text="transformers",
+    )
+    db_session.add(pending)
+    db_session.commit()
+
+    results = search_service.question_search("transformers", top_k=10)
+
+    # Keyword and cosine rankings are fused by rank, so a full keyword match
+    # does not outrank the best embedded question; each keeps its own score
+    assert results[0]["matching_question"].id == question_corpus["questions"][0].id
+    assert results[1]["matching_question"].id == pending.id
+    assert results[1]["score"] == pytest.approx(1.0)
+
+
+def test_new_questions_are_picked_up_on_refresh(
+    search_service, question_corpus, db_session
+):
+    search_service.question_search("warm up", top_k=10)
+    assert len(get_question_vector_index().index) == 3
+
+    db_session.add(
+        SyntheticQuestion(
+            chunk_id=question_corpus["chunks"][1].id,
+            question_text="Why are transformers parallel?",
+            embedding=json.dumps([1.0, 0.05, 0.0]),
+        )
+    )
+    db_session.commit()
+    get_question_vector_index().expire()
+
+    search_service.question_search("transformers", top_k=10)
+    assert len(get_question_vector_index().index) == 4
+
+
+def test_generated_questions_carry_embeddings(db_session):
+    class _Embedder:
+        def generate_embedding(self, text):
+            return [0.5, 0.5]
+
+    service = SyntheticQuestionService(db_session, embedding_service=_Embedder())
+    questions = service.generate_questions("A transformer is a model.", "chunk-1")
+
+    assert questions
+    assert json.loads(questions[0]["embedding"]) == [0.5, 0.5]
+
+
+class _Embedder:
+    def __init__(self, vector):
+        self.vector = vector
+
+    def generate_embedding(self, text):
+        if self.vector is None:
+            raise RuntimeError("embedding model unavailable")
+        return self.vector
+
+
+def test_stored_questions_are_indexed(search_service, question_corpus, db_session):
+    chunk = question_corpus["chunks"][1]
+    service = SyntheticQuestionService(
+        db_session, embedding_service=_Embedder([1.0, 0.0, 0.0])
+    )
+
+    stored = service.store_questions([chunk])
+
+    assert stored
+    assert all(json.loads(q.embedding) == [1.0, 0.0, 0.0] for q in stored)
+    get_question_vector_index().expire()
+    search_service.question_search("transformers", top_k=10)
+    assert len(get_question_vector_index().index) == 3 + len(stored)
+
+
+def test_backfill_embeds_pending_questions(question_corpus, db_session):
+    chunk = question_corpus["chunks"][1]
+    pending = [
+        SyntheticQuestion(chunk_id=chunk.id, question_text=f"Pending {i}?")
+        for i in range(3)
+    ]
+    db_session.add_all(pending)
+    db_session.commit()
+
+    failing = SyntheticQuestionService(db_session, embedding_service=_Embedder(None))
+    assert failing.backfill_embeddings(batch_size=2) == 0
+
+    service = SyntheticQuestionService(
+        db_session, embedding_service=_Embedder([0.0, 0.0, 1.0])
+    )
+    assert service.backfill_embeddings(batch_size=2) == 3
+
+    for question in pending:
+        db_session.refresh(question)
+        assert json.loads(question.embedding) == [0.0, 0.0, 1.0]
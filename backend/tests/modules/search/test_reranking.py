@@ -0,0 +1,130 @@
+"""
+Reranking Service Tests
+
+Tests for rerank score caching and length-batched cross-encoder inference.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.modules.search.reranking import RerankingService, predict_by_length
+from app.shared.cache import RerankScoreCache
+
+
+class _FakeCrossEncoder:
+    """Scores a pair by the document length and records every call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def predict(self, pairs, batch_size=32):
+        self.calls.append([list(pair) for pair in pairs])
+        return [float(len(doc)) for _, doc in pairs]
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def setex(self, key, ttl, value):
+        self.ops.append((key, value))
+
+    def execute(self):
+        for key, value in self.ops:
+            self.redis.data[key] = value.encode()
+
+
+class _FakeCacheService:
+    def __init__(self):
+        self.redis = _FakeRedis()
+
+
+@pytest.fixture
+def reranker(db_session):
+    service = RerankingService(db_session, backend="torch")
+    service.model = _FakeCrossEncoder()
+    service._model_loaded = True
+    return service
+
+
+def test_predict_by_length_returns_scores_in_input_order():
+    model = _FakeCrossEncoder()
+    pairs = [["q", "long document"], ["q", "a"], ["q", "mid doc"]]
+
+    scores = predict_by_length(model, pairs, batch_size=2)
+
+    assert scores == [13.0, 1.0, 7.0]
+    assert [doc for _, doc in model.calls[0]] == ["a", "mid doc", "long document"]
+
+
+def test_rerank_reuses_cached_scores(reranker, create_test_resource):
+    short = create_test_resource(title="ML", description="short")
+    long = create_test_resource(title="ML", description="a much longer description")
+    candidates = [(str(short.id), 0.9), (str(long.id), 0.5)]
+
+    first = reranker.rerank("machine learning", candidates)
+    # Same query up to whitespace: served from the cache
+    second = reranker.rerank("  machine   learning ", candidates, top_k=1)
+
+    assert [rid for rid, _ in first] == [str(long.id), str(short.id)]
+    assert second == first[:1]
+    assert len(reranker.model.calls) == 1
+
+
+def test_rerank_scores_only_new_or_updated_resources(
+    reranker, create_test_resource, db_session
+):
+    a = create_test_resource(title="A", description="alpha")
+    b = create_test_resource(title="B", description="beta")
+    reranker.rerank("query", [(str(a.id), 1.0)])
+
+    a.updated_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+    db_session.commit()
+    reranker.rerank("query", [(str(a.id), 1.0), (str(b.id), 0.5)])
+
+    # Second call rescored the edited resource and the new one
+    assert len(reranker.model.calls) == 2
+    assert len(reranker.model.calls[1]) == 2
+
+
+def test_rerank_without_model_keeps_original_order(db_session, create_test_resource):
+    resource = create_test_resource()
+    service = RerankingService(db_session)
+    service._model_loaded = True  # model unavailable
+    candidates = [(str(resource.id), 0.3)]
+
+    assert service.rerank("query", candidates) == candidates
+
+
+def test_unknown_backend_is_rejected(db_session):
+    with pytest.raises(ValueError):
+        RerankingService(db_session, backend="tpu")
+
+
+def test_score_cache_shares_scores_through_redis():
+    remote = _FakeCacheService()
+    writer = RerankScoreCache(cache_service=remote, max_entries=10, ttl=60)
+    reader = RerankScoreCache(cache_service=remote, max_entries=10, ttl=60)
+    version = datetime(2024, 1, 1)
+
+    writer.set_many("model", "query", [("r1", version, 0.75)])
+
+    assert reader.get_many("model", "query", [("r1", version), ("r2", version)]) == {
+        "r1": 0.75
+    }
+    assert reader.stats()["redis"]["hits"] == 1
+    # A newer resource version is a miss
+    assert reader.get_many("model", "query", [("r1", datetime(2024, 1, 2))]) == {}
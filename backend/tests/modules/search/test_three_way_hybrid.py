@@ -333,3 +333,111 @@ class TestQueryAnalysis:
             query = f"{starter} is machine learning"
             analysis = AdvancedSearchService._analyze_query(query)
             assert analysis["is_question"] is True
+
+
+class TestConcurrentRetrievalLegs:
+    """Test concurrent execution of the retrieval legs."""
+
+    def _file_session(self, tmp_path):
+        from sqlalchemy import create_engine
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'legs.db'}")
+        return Session(bind=engine)
+
+    def test_legs_overlap_and_use_own_sessions(self, tmp_path):
+        """Legs run concurrently, each on a session other than the caller's."""
+        db = self._file_session(tmp_path)
+        sessions = []
+
+        def slow_leg(session, query, limit=100):
+            sessions.append(session)
+            time.sleep(0.2)
+            return [("r1", 1.0)]
+
+        start = time.perf_counter()
+        legs = AdvancedSearchService._run_retrieval_legs(
+            db, "query", [("a", slow_leg), ("b", slow_leg), ("c", slow_leg)]
+        )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        assert all(leg["results"] == [("r1", 1.0)] for leg in legs.values())
+        assert elapsed_ms < 500, "Legs should overlap, not run back to back"
+        assert all(leg["start_ms"] < legs["a"]["end_ms"] for leg in legs.values())
+        assert db not in sessions
+        db.close()
+
+    def test_slow_leg_degrades_to_partial_results(self, tmp_path, monkeypatch):
+        """A leg that misses its deadline contributes no results."""
+        from app.config.settings import get_settings
+
+        monkeypatch.setattr(get_settings(), "SEARCH_LEG_TIMEOUT_MS", 100)
+        db = self._file_session(tmp_path)
+
+        def fast_leg(session, query, limit=100):
+            return [("fast", 1.0)]
+
+        def slow_leg(session, query, limit=100):
+            time.sleep(0.5)
+            return [("slow", 1.0)]
+
+        start = time.perf_counter()
+        legs = AdvancedSearchService._run_retrieval_legs(
+            db, "query", [("fast", fast_leg), ("slow", slow_leg)]
+        )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        assert legs["fast"]["results"] == [("fast", 1.0)]
+        assert legs["slow"]["results"] == []
+        assert legs["slow"]["timed_out"] is True
+        assert elapsed_ms < 400
+        db.close()
+
+    def test_saturated_pool_skips_legs(self, tmp_path, monkeypatch):
+        """Abandoned legs hold their workers, so new legs are skipped, not queued."""
+        from app.config.settings import get_settings
+        from app.services import search_service
+
+        monkeypatch.setattr(search_service, "_leg_executor", None)
+        monkeypatch.setattr(search_service, "_leg_slots", None)
+        monkeypatch.setattr(get_settings(), "SEARCH_LEG_WORKERS", 1)
+        monkeypatch.setattr(get_settings(), "SEARCH_LEG_TIMEOUT_MS", 100)
+        db = self._file_session(tmp_path)
+
+        def fast_leg(session, query, limit=100):
+            return [("fast", 1.0)]
+
+        def slow_leg(session, query, limit=100):
+            time.sleep(0.4)
+            return [("slow", 1.0)]
+
+        first = AdvancedSearchService._run_retrieval_legs(
+            db, "query", [("slow", slow_leg)]
+        )
+        second = AdvancedSearchService._run_retrieval_legs(
+            db, "query", [("fast", fast_leg)]
+        )
+        time.sleep(0.5)
+        third = AdvancedSearchService._run_retrieval_legs(
+            db, "query", [("fast", fast_leg)]
+        )
+
+        assert first["slow"]["timed_out"] is True
+        assert second["fast"]["results"] == []
+        assert second["fast"]["error"] == "search leg pool saturated"
+        assert third["fast"]["results"] == [("fast", 1.0)]
+        db.close()
+
+    def test_shared_connection_engine_runs_sequentially(self, db_session: Session):
+        """In-memory SQLite (StaticPool) legs reuse the caller's session."""
+        sessions = []
+
+        def leg(session, query, limit=100):
+            sessions.append(session)
+            return []
+
+        legs = AdvancedSearchService._run_retrieval_legs(
+            db_session, "query", [("a", leg), ("b", leg)]
+        )
+
+        assert sessions == [db_session, db_session]
+        assert legs["b"]["start_ms"] >= legs["a"]["end_ms"]
@@ -0,0 +1,363 @@
+"""Unit tests for CacheService invalidation and the near-cache tier.
+
+Tests cover:
+- Tag sets: invalidate_tags deletes only dependent keys
+- delete_pattern walks the keyspace with SCAN
+- Near-cache hits, expiry and pub/sub invalidation
+- msgpack serialization alongside JSON values
+- Stampede protection: single-flight, cross-process lock, early refresh
+  and stale-while-revalidate, and the @cached decorator
+"""
+
+import fnmatch
+import json
+import threading
+import time
+
+import pytest
+
+from app.shared import cache as cache_module
+from app.shared.cache import CacheService, cached
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+class _FakeRedis:
+    """Dict-backed Redis with the commands CacheService uses (no KEYS)."""
+
+    def __init__(self):
+        self.data = {}
+        self.sets = {}
+        self.published = []
+        self.gets = 0
+
+    def get(self, key):
+        self.gets += 1
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def set(self, key, value, nx=False, px=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def eval(self, script, numkeys, key, token):
+        if self.data.get(key) == token:
+            del self.data[key]
+
+    def delete(self, *keys):
+        return sum(
+            1
+            for key in keys
+            if self.data.pop(key, None) is not None or self.sets.pop(key, None)
+        )
+
+    def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(members)
+
+    def srem(self, key, *members):
+        self.sets.get(key, set()).difference_update(members)
+
+    def smembers(self, key):
+        return set(self.sets.get(key, ()))
+
+    def expire(self, key, ttl):
+        pass
+
+    def scan_iter(self, match=None, count=None):
+        return iter([key for key in list(self.data) if fnmatch.fnmatchcase(key, match)])
+
+    def publish(self, channel, message):
+        self.published.append((channel, json.loads(message)))
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def __getattr__(self, name):
+        command = getattr(self.redis, name)
+        return lambda *args, **kwargs: self.ops.append((command, args, kwargs))
+
+    def execute(self):
+        return [command(*args, **kwargs) for command, args, kwargs in self.ops]
+
+
+@pytest.fixture
+def fake_redis():
+    return _FakeRedis()
+
+
+@pytest.fixture
+def service(fake_redis):
+    service = CacheService(redis_client=fake_redis)
+    service.redis = fake_redis
+    return service
+
+
+# ============================================================================
+# Invalidation
+# ============================================================================
+
+
+def test_invalidate_tags_deletes_dependent_keys(service, fake_redis):
+    service.set("hover:r1:a.py:1:0", {"symbol": "a"}, ttl=300, tags=["resource:r1"])
+    service.set("communities:r1,r2:1.0", {"n": 2}, tags=["resource:r1", "resource:r2"])
+    service.set("quality:r2", {"accuracy": 1.0}, tags=["resource:r2"])
+    service.set("untagged", 1)
+
+    deleted = service.invalidate_tags("resource:r1")
+
+    assert deleted == 2
+    assert set(fake_redis.data) == {"quality:r2", "untagged"}
+    assert fake_redis.smembers("cache_tag:resource:r1") == set()
+    # The stale member left in r2's set is harmless
+    assert service.invalidate_tags("resource:r2") == 1
+    assert service.invalidate_tags("resource:unknown") == 0
+
+
+def test_delete_pattern_uses_scan(service, fake_redis):
+    for i in range(3):
+        service.set(f"graph:{i}", i)
+    service.set("quality:r1", 1)
+
+    assert service.delete_pattern("graph:*") == 3
+    assert list(fake_redis.data) == ["quality:r1"]
+    assert service.delete_pattern("graph:*") == 0
+
+
+def test_writes_publish_near_cacheable_keys(service, fake_redis):
+    service.set("hover:r1:a.py:1:0", {"symbol": "a"})
+    service.set("revoked_token:abc", "revoked")
+    service.delete("quality:r1")
+
+    published = [message["keys"] for _, message in fake_redis.published]
+    assert published == [["hover:r1:a.py:1:0"], ["quality:r1"]]
+
+
+def test_without_redis_everything_is_a_miss():
+    service = CacheService(redis_client=object())
+    service.redis = None
+
+    service.set("quality:r1", 1, tags=["resource:r1"])
+
+    assert service.get("quality:r1") is None
+    assert service.invalidate_tags("resource:r1") == 0
+    assert service.delete_pattern("*") == 0
+    assert service.enable_near_cache(listen=False) is False
+
+
+# ============================================================================
+# Near-cache
+# ============================================================================
+
+
+def test_near_cache_serves_repeated_reads(service, fake_redis):
+    assert service.enable_near_cache(listen=False)
+    service.set("quality:r1", {"accuracy": 0.5})
+    service.set("revoked_token:abc", "revoked")
+
+    for _ in range(3):
+        assert service.get("quality:r1") == {"accuracy": 0.5}
+        assert service.get("revoked_token:abc") == "revoked"
+
+    # One Redis read for the near-cached key, three for the other
+    assert fake_redis.gets == 4
+    assert service.near.stats.hits == 2
+
+
+def test_near_cache_applies_remote_invalidations(service):
+    service.enable_near_cache(listen=False)
+    service.set("hover:r1:a.py:1:0", {"symbol": "old"})
+    service.set("graph_layout:r1:force", {"layout": {}})
+    service.get("hover:r1:a.py:1:0")
+    service.get("graph_layout:r1:force")
+
+    service._apply_invalidation(
+        json.dumps({"origin": "other", "keys": ["hover:r1:a.py:1:0"]})
+    )
+    assert len(service.near) == 1
+
+    service._apply_invalidation(json.dumps({"origin": "other", "pattern": "graph_*"}))
+    assert len(service.near) == 0
+
+
+def test_near_cache_skips_values_read_during_invalidation(service, fake_redis):
+    service.enable_near_cache(listen=False)
+    service.set("quality:r1", {"accuracy": 0.5})
+    read = fake_redis.get
+
+    def racing_get(key):
+        value = read(key)
+        # Another process updates the key while this read is in flight
+        service._apply_invalidation(json.dumps({"origin": "other", "keys": [key]}))
+        return value
+
+    fake_redis.get = racing_get
+    service.get("quality:r1")
+
+    assert len(service.near) == 0
+
+
+def test_near_cache_entries_expire(service, fake_redis, monkeypatch):
+    service.enable_near_cache(listen=False)
+    service.set("quality:r1", {"accuracy": 0.5})
+    service.get("quality:r1")
+
+    now = cache_module.time.monotonic()
+    monkeypatch.setattr(
+        cache_module.time, "monotonic", lambda: now + service.near.ttl + 1
+    )
+    service.get("quality:r1")
+
+    assert fake_redis.gets == 2
+
+
+# ============================================================================
+# Serialization
+# ============================================================================
+
+
+def test_msgpack_values_round_trip_with_json(service, fake_redis, monkeypatch):
+    pytest.importorskip("msgpack")
+    service.set("quality:json", {"accuracy": 0.5})
+    monkeypatch.setattr(service, "_value_client", lambda: fake_redis)
+    service.serializer = "msgpack"
+
+    service.set("quality:packed", {"accuracy": 0.25, "tags": ["a"]})
+
+    assert fake_redis.data["quality:packed"][:1] == b"\xc1"
+    assert service.get("quality:packed") == {"accuracy": 0.25, "tags": ["a"]}
+    assert service.get("quality:json") == {"accuracy": 0.5}
+
+
+# ============================================================================
+# Stampede protection
+# ============================================================================
+
+
+def _expire(fake_redis, key, by=1.0):
+    entry = json.loads(fake_redis.data[key])
+    entry["x"] = time.time() - by
+    fake_redis.data[key] = json.dumps(entry)
+
+
+def test_concurrent_misses_compute_once(service):
+    calls = []
+    barrier = threading.Barrier(5)
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.1)
+        return {"score": 1}
+
+    def worker(results):
+        barrier.wait()
+        results.append(service.get_or_compute("quality:r1", compute, ttl=60))
+
+    results = []
+    threads = [threading.Thread(target=worker, args=(results,)) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1]
+    assert results == [{"score": 1}] * 5
+    assert service.stats.coalesced == 4
+
+
+def test_miss_waits_for_other_process(service, fake_redis):
+    service.lock_wait = 2.0
+    fake_redis.data["cache_lock:quality:r1"] = "other-process"
+
+    def other_process():
+        time.sleep(0.1)
+        entry = {"v": {"score": 2}, "x": time.time() + 60, "d": 0.1}
+        fake_redis.data["quality:r1"] = json.dumps(entry)
+
+    threading.Thread(target=other_process).start()
+    value = service.get_or_compute(
+        "quality:r1", lambda: pytest.fail("computed twice"), ttl=60
+    )
+
+    assert value == {"score": 2}
+    assert service.stats.coalesced == 1
+
+
+def test_expired_value_served_while_another_caller_refreshes(service, fake_redis):
+    service.get_or_compute("quality:r1", lambda: "old", ttl=60)
+    _expire(fake_redis, "quality:r1")
+    fake_redis.data["cache_lock:quality:r1"] = "other-process"
+
+    assert service.get_or_compute("quality:r1", lambda: "new", ttl=60) == "old"
+    assert service.stats.stale == 1
+
+    # Lock released: this caller refreshes
+    del fake_redis.data["cache_lock:quality:r1"]
+    assert service.get_or_compute("quality:r1", lambda: "new", ttl=60) == "new"
+    assert "cache_lock:quality:r1" not in fake_redis.data
+
+
+def test_failed_refresh_serves_stale_value(service, fake_redis):
+    service.get_or_compute("quality:r1", lambda: "old", ttl=60)
+    _expire(fake_redis, "quality:r1")
+
+    def broken():
+        raise RuntimeError("db down")
+
+    assert service.get_or_compute("quality:r1", broken, ttl=60) == "old"
+    assert service.stats.stale == 1
+
+    # Past the stale window the entry is gone and errors propagate
+    fake_redis.data.clear()
+    with pytest.raises(RuntimeError):
+        service.get_or_compute("quality:r1", broken, ttl=60)
+
+
+def test_early_refresh_near_expiry(service, fake_redis, monkeypatch):
+    service.get_or_compute("quality:r1", lambda: "old", ttl=60)
+    entry = json.loads(fake_redis.data["quality:r1"])
+    entry["x"], entry["d"] = time.time() + 1, 0.5
+    fake_redis.data["quality:r1"] = json.dumps(entry)
+
+    # random() close to 1 makes the XFetch jitter large
+    monkeypatch.setattr(cache_module.random, "random", lambda: 0.999)
+    service.early_refresh_beta = 0
+    assert service.get_or_compute("quality:r1", lambda: "new", ttl=60) == "old"
+
+    service.early_refresh_beta = 1.0
+    assert service.get_or_compute("quality:r1", lambda: "new", ttl=60) == "new"
+    assert service.stats.early_refreshes == 1
+
+
+def test_cached_decorator(service, fake_redis):
+    calls = []
+
+    @cached(
+        "hover:{resource_id}:{line}",
+        ttl=300,
+        tags=["resource:{resource_id}"],
+        cache_service=service,
+    )
+    def hover(resource_id, line=1, db=None):
+        calls.append((resource_id, line))
+        return None if line == 0 else {"line": line}
+
+    assert hover("r1") == {"line": 1}
+    assert hover("r1", line=1) == {"line": 1}
+    assert hover("r1", 0) is None
+    assert hover("r1", 0) is None
+
+    assert calls == [("r1", 1), ("r1", 0), ("r1", 0)]
+    assert fake_redis.smembers("cache_tag:resource:r1") == {"hover:r1:1"}
+    assert hover.__name__ == "hover"
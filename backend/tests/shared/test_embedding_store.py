@@ -0,0 +1,199 @@
+"""Unit tests for the shared embedding matrix store.
+
+Tests cover:
+- Top-k kernel ordering and thresholds
+- Blocked all-pairs similarity join against brute force
+- Similarity search with candidate and exclusion sets
+- Overlay upsert/remove and compaction
+- Memory-mapped snapshots shared between store instances
+- Database build and updated_at delta sync
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from app.database.models import Resource
+from app.shared.embedding_store import (
+    EmbeddingStore,
+    get_embedding_store,
+    load_missing,
+    normalize_rows,
+    similarity_join,
+    sync_store,
+    top_k,
+)
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def store():
+    """Create an in-memory store with three 2-D vectors."""
+    store = EmbeddingStore("resources")
+    store.load_items([("a", [1.0, 0.0]), ("b", [0.7, 0.7]), ("c", [0.0, 2.0])])
+    return store
+
+
+# ============================================================================
+# Kernel
+# ============================================================================
+
+
+def test_top_k_orders_and_filters_scores():
+    scores = np.array([0.1, 0.9, -np.inf, 0.5, 0.7], dtype=np.float32)
+
+    assert top_k(scores, 3).tolist() == [1, 4, 3]
+    assert top_k(scores, 10, min_score=0.6).tolist() == [1, 4]
+    assert top_k(scores, 0).tolist() == []
+
+
+def test_similarity_join_matches_brute_force_across_tiles():
+    rng = np.random.default_rng(0)
+    matrix = normalize_rows(rng.normal(size=(37, 8)))
+    sims = matrix @ matrix.T
+    expected = {
+        (i, j)
+        for i in range(37)
+        for j in range(i + 1, 37)
+        if sims[i, j] >= 0.3
+    }
+
+    # Tiles of 2 rows force many blocks
+    left, right, scores = similarity_join(matrix, 0.3, max_block_cells=2 * 37)
+
+    assert set(zip(left.tolist(), right.tolist())) == expected
+    assert np.allclose(scores, sims[left, right], atol=1e-5)
+
+
+def test_similarity_join_keeps_top_k_per_row():
+    matrix = normalize_rows(
+        np.array([[1.0, 0.0], [0.99, 0.1], [0.9, 0.4], [0.0, 1.0]], dtype=np.float32)
+    )
+
+    left, right, _ = similarity_join(matrix, -1.0, k=1)
+
+    assert list(zip(left.tolist(), right.tolist())) == [(0, 1), (1, 2), (2, 3)]
+
+
+# ============================================================================
+# EmbeddingStore
+# ============================================================================
+
+
+def test_similar_returns_cosine_order(store):
+    results = store.similar([1.0, 0.1], k=2)
+
+    assert [item_id for item_id, _ in results] == ["a", "b"]
+    assert results[0][1] == pytest.approx(1.0 / np.sqrt(1.01), rel=1e-5)
+
+
+def test_similar_respects_candidates_exclusions_and_threshold(store):
+    assert [i for i, _ in store.similar([1.0, 0.0], k=5, candidate_ids=["b", "c"])] == [
+        "b",
+        "c",
+    ]
+    assert [i for i, _ in store.similar([1.0, 0.0], k=5, exclude_ids=["a"])] == ["b", "c"]
+    assert [i for i, _ in store.similar([1.0, 0.0], k=5, min_similarity=0.5)] == ["a", "b"]
+    assert store.similar([1.0, 0.0, 0.0], k=5) == []
+    assert store.similar([0.0, 0.0], k=5) == []
+
+
+def test_overlay_upsert_remove_and_compact(store):
+    store.upsert("a", [0.2, 1.0])
+    store.upsert("d", [1.0, 0.05])
+    store.remove("b")
+
+    assert len(store) == 3
+    assert "b" not in store
+    assert store.similar([1.0, 0.0], k=1)[0][0] == "d"
+    assert store.upsert("e", [1.0, 0.0, 0.0]) is False
+
+    before = store.similar([1.0, 0.0], k=5)
+    store.compact()
+
+    assert store.stats()["overlay_rows"] == 0
+    assert len(store) == 3
+    assert [i for i, _ in store.similar([1.0, 0.0], k=5)] == [i for i, _ in before]
+
+
+def test_snapshots_are_memory_mapped_and_shared(tmp_path):
+    writer = EmbeddingStore("annotations", directory=str(tmp_path), dtype="float16")
+    writer.load_items([(f"n{i}", [float(i), 1.0, 0.0]) for i in range(10)])
+
+    reader = EmbeddingStore("annotations", directory=str(tmp_path), dtype="float16")
+    assert reader.load_snapshot() is True
+    assert reader.stats()["memory_mapped"] is True
+    assert len(reader) == 10
+    assert reader.similar([1.0, 0.0, 0.0], k=1)[0][0] == "n9"
+
+    # A compacted snapshot replaces the previous version for new readers
+    writer.upsert("z", [0.0, 0.0, 1.0])
+    writer.compact()
+    assert reader.load_snapshot() is True
+    assert "z" in reader
+
+
+# ============================================================================
+# Database sync
+# ============================================================================
+
+
+def test_resource_store_build_and_delta_sync(db_session):
+    first = Resource(title="First", embedding=json.dumps([1.0, 0.0, 0.0]))
+    second = Resource(title="Second", embedding=json.dumps([0.0, 1.0, 0.0]))
+    empty = Resource(title="No embedding")
+    db_session.add_all([first, second, empty])
+    db_session.commit()
+
+    store = get_embedding_store("resources", db_session)
+
+    assert len(store) == 2
+    assert store.similar([1.0, 0.0, 0.0], k=1)[0][0] == str(first.id)
+
+    second.embedding = json.dumps([1.0, 0.1, 0.0])
+    empty.embedding = json.dumps([0.0, 0.0, 1.0])
+    db_session.commit()
+    sync_store(store, db_session, force=True)
+
+    assert len(store) == 3
+    top_two = {item_id for item_id, _ in store.similar([1.0, 0.0, 0.0], k=2)}
+    assert top_two == {str(first.id), str(second.id)}
+
+
+def test_upsert_before_load_does_not_skip_the_build(db_session):
+    resources = [
+        Resource(title=f"R{i}", embedding=json.dumps([1.0, float(i)]))
+        for i in range(3)
+    ]
+    db_session.add_all(resources)
+    db_session.commit()
+
+    store = EmbeddingStore("resources")
+    assert store.upsert(str(resources[0].id), [0.0, 1.0]) is False
+    assert not store.is_loaded
+
+    # The first sync builds the snapshot instead of upserting every row
+    sync_store(store, db_session)
+    assert store.stats()["snapshot_rows"] == 3
+    assert store.stats()["overlay_rows"] == 0
+
+
+def test_load_missing_reads_only_unknown_ids(db_session):
+    resource = Resource(title="Late", embedding=json.dumps([0.0, 1.0]))
+    db_session.add(resource)
+    db_session.commit()
+
+    store = EmbeddingStore("resources")
+    # Nothing is written into a store that has not been loaded yet
+    assert load_missing(store, db_session, [str(resource.id)]) == 0
+    assert not store.is_loaded
+
+    store.load_items([])
+    assert load_missing(store, db_session, [str(resource.id)]) == 1
+    assert load_missing(store, db_session, [str(resource.id)]) == 0
+    assert str(resource.id) in store
@@ -0,0 +1,195 @@
+"""Unit tests for event bus dispatch.
+
+Tests cover:
+- Handler signatures resolved once at subscribe time
+- Event history formatted on read
+- Async dispatch: priority order, coalescing, backpressure, synchronous
+  handlers and queue metrics
+"""
+
+import threading
+
+import pytest
+
+from app.shared import event_bus as event_bus_module
+from app.shared.event_bus import Event, EventPriority
+
+
+@pytest.fixture
+def bus(clean_event_bus):
+    """Global bus with clean handlers; async dispatch stopped afterwards."""
+    yield clean_event_bus
+    clean_event_bus.stop_async_dispatch()
+    clean_event_bus._coalesce_keys.clear()
+
+
+@pytest.fixture
+def blocked(bus):
+    """Start one async worker and hold it on a 'block' event until released."""
+    started, gate = threading.Event(), threading.Event()
+
+    def block(payload):
+        started.set()
+        gate.wait(5)
+
+    bus.subscribe("block", block)
+    bus.start_async_dispatch(workers=1, queue_size=2)
+    bus.emit("block", {})
+    assert started.wait(5)
+    return gate
+
+
+# ============================================================================
+# Synchronous delivery
+# ============================================================================
+
+
+def test_signature_resolved_at_subscribe(bus, monkeypatch):
+    received = []
+
+    def wants_event(event: Event):
+        received.append(("event", event.name))
+
+    def wants_payload(payload):
+        received.append(("payload", payload["n"]))
+
+    bus.subscribe("thing.happened", wants_event)
+    bus.subscribe("thing.happened", wants_payload)
+
+    calls = []
+    signature = event_bus_module.inspect.signature
+    monkeypatch.setattr(
+        event_bus_module.inspect,
+        "signature",
+        lambda fn: calls.append(fn) or signature(fn),
+    )
+    for n in range(3):
+        bus.emit("thing.happened", {"n": n})
+
+    assert calls == []
+    assert received[:2] == [("event", "thing.happened"), ("payload", 0)]
+    assert bus.get_metrics()["events_delivered"] == 6
+
+
+def test_history_formats_timestamps_on_read(bus):
+    bus.emit("first", {"a": 1}, priority=EventPriority.HIGH)
+    bus.emit("second", {"b": 2})
+
+    history = bus.get_event_history(limit=1)
+
+    assert [entry["name"] for entry in history] == ["second"]
+    assert history[0]["timestamp"].endswith("+00:00")
+    assert bus.get_event_history()[0]["priority"] == "HIGH"
+
+
+# ============================================================================
+# Async dispatch
+# ============================================================================
+
+
+def test_emit_returns_before_handlers_run(bus):
+    gate, done = threading.Event(), threading.Event()
+
+    def slow(payload):
+        gate.wait(5)
+        done.set()
+
+    bus.subscribe("resource.updated", slow)
+    bus.start_async_dispatch(workers=2)
+
+    bus.emit("resource.updated", {"resource_id": "r1"})
+    assert not done.is_set()
+
+    gate.set()
+    assert bus.flush(5)
+    assert done.is_set()
+    assert bus.get_metrics()["dispatch_mode"] == "async"
+
+
+def test_higher_priority_events_run_first(bus, blocked):
+    order = []
+    bus.subscribe("work", lambda payload: order.append(payload["p"]))
+
+    bus.emit("work", {"p": "low"}, priority=EventPriority.LOW)
+    bus.emit("work", {"p": "critical"}, priority=EventPriority.CRITICAL)
+    bus.emit("work", {"p": "normal"}, priority=EventPriority.NORMAL)
+    blocked.set()
+
+    assert bus.flush(5)
+    assert order == ["critical", "normal", "low"]
+
+
+def test_queued_duplicates_are_coalesced(bus, blocked):
+    seen = []
+    bus.subscribe("resource.updated", lambda payload: seen.append(payload))
+    bus.coalesce("resource.updated")
+
+    bus.emit("resource.updated", {"resource_id": "a", "version": 1})
+    bus.emit("resource.updated", {"resource_id": "b", "version": 1})
+    bus.emit("resource.updated", {"resource_id": "a", "version": 2})
+    bus.emit("resource.updated", {"resource_id": "a", "version": 3})
+    blocked.set()
+
+    assert bus.flush(5)
+    assert seen == [
+        {"resource_id": "a", "version": 3},
+        {"resource_id": "b", "version": 1},
+    ]
+    assert bus.get_metrics()["dispatch"]["events_coalesced"] == 2
+
+
+def test_full_queue_runs_handlers_inline(bus, blocked):
+    threads = []
+    bus.subscribe("work", lambda payload: threads.append(threading.current_thread()))
+
+    for _ in range(3):
+        bus.emit("work", {})
+
+    # queue_size=2: the third event ran in the emitting thread
+    assert threads == [threading.current_thread()]
+    dispatch = bus.get_metrics()["dispatch"]
+    assert dispatch["events_run_inline"] == 1
+    assert dispatch["queue_depth"]["NORMAL"] == 2
+    assert dispatch["max_queue_depth"] == 2
+
+    blocked.set()
+    assert bus.flush(5)
+    assert len(threads) == 3
+
+
+def test_synchronous_handlers_run_in_emit(bus, blocked):
+    calls = []
+    bus.subscribe("resource.deleted", lambda payload: calls.append("sync"), True)
+    bus.subscribe("resource.deleted", lambda payload: calls.append("async"))
+
+    bus.emit("resource.deleted", {"resource_id": "r1"})
+    assert calls == ["sync"]
+
+    blocked.set()
+    assert bus.flush(5)
+    assert calls == ["sync", "async"]
+
+
+def test_stop_drains_queue_and_returns_to_sync(bus, blocked):
+    seen = []
+    bus.subscribe("work", lambda payload: seen.append(payload["n"]))
+    bus.emit("work", {"n": 1})
+
+    blocked.set()
+    assert bus.stop_async_dispatch(timeout=5)
+    assert seen == [1]
+    assert not bus.is_async
+
+    bus.emit("work", {"n": 2})
+    assert seen == [1, 2]
+
+
+def test_event_loop_handlers_stay_synchronous(bus):
+    from app.modules.resources import handlers as resource_handlers
+
+    resource_handlers.register_handlers()
+
+    # asyncio.run() on a worker thread would bypass the caller's event loop
+    assert resource_handlers.handle_resource_chunked in bus._synchronous.get(
+        "resource.chunked", []
+    )
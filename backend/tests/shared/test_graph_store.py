@@ -0,0 +1,218 @@
+"""Unit tests for the shared multi-layer graph store.
+
+Tests cover:
+- Last-write-wins edges keyed by node pair and edge type
+- Edge and node removal with tombstones
+- In/out degrees from CSR adjacency
+- NetworkX views cached per graph version
+- Snapshots shared between store instances
+- Database build, commit-time patches and GraphService queries
+"""
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.database.models import Citation, GraphEdge, Resource
+from app.modules.graph.service import GraphService
+from app.shared.graph_store import GraphStore, get_graph_store
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def store():
+    """Create a store with four nodes and a mix of edge types."""
+    store = GraphStore()
+    for node_id in "abcd":
+        store.upsert_node(node_id, title=node_id.upper(), type="article")
+    store.add_edges(
+        [
+            ("a", "b", "citation", 1.0),
+            ("a", "c", "semantic", 0.4),
+            ("b", "a", "semantic", 0.9),
+            ("a", "b", "citation", 0.5),
+        ]
+    )
+    return store
+
+
+def _weights(neighbors):
+    return {
+        node: [(edge_type, pytest.approx(weight)) for edge_type, weight in edges]
+        for node, edges in neighbors.items()
+    }
+
+
+# ============================================================================
+# GraphStore
+# ============================================================================
+
+
+def test_neighbors_keep_one_edge_per_pair_and_type(store):
+    neighbors = store.neighbors("a")
+
+    assert list(neighbors) == ["b", "c"]
+    assert _weights(neighbors) == {
+        "b": [("citation", 0.5), ("semantic", 0.9)],
+        "c": [("semantic", 0.4)],
+    }
+    assert store.edge_count == 3
+    assert store.neighbors("d") == {}
+    assert store.neighbors("missing") == {}
+
+
+def test_remove_edge_and_node(store):
+    store.remove_edge("b", "a", "citation")
+    assert _weights(store.neighbors("a")) == {
+        "b": [("semantic", 0.9)],
+        "c": [("semantic", 0.4)],
+    }
+
+    store.remove_node("c")
+    assert not store.has_node("c")
+    assert list(store.neighbors("a")) == ["b"]
+
+    # A re-added node comes back without its old edges
+    store.upsert_node("c", title="C again")
+    assert store.has_node("c")
+    assert store.neighbors("c") == {}
+    assert store.node_attrs("c")["quality_overall"] == 0.5
+
+
+def test_degrees_count_distinct_neighbors(store):
+    assert store.degrees(["a", "b", "c", "d", "missing"]) == {
+        "a": (0, 2),
+        "b": (1, 0),
+        "c": (1, 0),
+        "d": (0, 0),
+    }
+
+
+def test_unchanged_edges_do_not_bump_version(store):
+    version = store.version
+
+    assert store.add_edges([("a", "b", "semantic", 0.9)], only_changed=True) == 0
+    assert store.version == version
+
+    assert store.add_edges([("a", "b", "semantic", 0.8)], only_changed=True) == 1
+    assert store.version > version
+
+
+def test_networkx_views_are_cached_per_version(store):
+    G = store.to_networkx()
+
+    assert store.to_networkx() is G
+    assert G.number_of_nodes() == 4
+    assert G.number_of_edges() == 3
+    assert G.nodes["a"]["title"] == "A"
+    assert G.get_edge_data("a", "b")["citation"]["weight"] == pytest.approx(0.5)
+
+    store.add_edge("c", "d", "semantic", 0.3)
+    assert store.to_networkx() is not G
+    assert store.to_digraph().has_edge("c", "d")
+
+
+def test_snapshots_are_shared_between_instances(tmp_path, store):
+    store.directory = str(tmp_path)
+    assert store.save_snapshot() is True
+
+    reader = GraphStore(directory=str(tmp_path))
+    assert reader.load_snapshot() is True
+    assert reader.neighbors("a") == store.neighbors("a")
+    assert reader.node_attrs("b")["title"] == "B"
+
+
+# ============================================================================
+# Database sync
+# ============================================================================
+
+
+def _graph_rows(db_session):
+    a = Resource(title="A", quality_overall=0.8)
+    b = Resource(title="B")
+    c = Resource(title="C")
+    db_session.add_all([a, b, c])
+    db_session.commit()
+    db_session.add_all(
+        [
+            Citation(
+                source_resource_id=a.id,
+                target_resource_id=b.id,
+                target_url="https://example.com/b",
+            ),
+            GraphEdge(
+                source_id=b.id,
+                target_id=c.id,
+                edge_type="semantic",
+                weight=0.7,
+                created_by="test",
+            ),
+        ]
+    )
+    db_session.commit()
+    return str(a.id), str(b.id), str(c.id)
+
+
+def test_build_and_commit_time_patches(db_session):
+    a, b, c = _graph_rows(db_session)
+
+    store = get_graph_store(db_session)
+    assert _weights(store.neighbors(a)) == {b: [("citation", 1.0)]}
+    assert store.node_attrs(a)["quality_overall"] == pytest.approx(0.8)
+
+    # Committed ORM writes reach the store without another sync
+    db_session.add(
+        GraphEdge(
+            source_id=a, target_id=c, edge_type="semantic", weight=0.25, created_by="test"
+        )
+    )
+    db_session.commit()
+    assert list(store.neighbors(a)) == [b, c]
+
+    # Rolled back writes do not
+    db_session.add(
+        GraphEdge(
+            source_id=b, target_id=b, edge_type="semantic", weight=1.0, created_by="test"
+        )
+    )
+    db_session.flush()
+    db_session.rollback()
+    assert b not in store.neighbors(b)
+
+
+def test_commit_hooks_ignore_foreign_sessions(db_session):
+    a, b, c = _graph_rows(db_session)
+    store = get_graph_store(db_session)
+
+    # Sessions not created by the app's session factories are not hooked
+    other = Session(bind=db_session.get_bind())
+    other.add(
+        GraphEdge(
+            source_id=c, target_id=a, edge_type="semantic", weight=0.5, created_by="test"
+        )
+    )
+    other.commit()
+    other.close()
+
+    assert a not in store.neighbors(c)
+
+
+async def test_graph_service_reads_shared_store(db_session):
+    a, b, c = _graph_rows(db_session)
+    service = GraphService(db_session)
+
+    one_hop = service.get_neighbors_multihop(a, hops=1)
+    assert [n["resource_id"] for n in one_hop] == [b]
+
+    two_hop = service.get_neighbors_multihop(a, hops=2)
+    assert [(n["resource_id"], n["path"]) for n in two_hop] == [(c, [a, b, c])]
+
+    degrees = await service.compute_degree_centrality([a, b, c])
+    assert {rid: d["total_degree"] for rid, d in degrees.items()} == {a: 1, b: 2, c: 1}
+
+    # A second service in the same process reuses the store's graph view
+    graph = service.build_multilayer_graph()
+    assert GraphService(db_session).build_multilayer_graph() is graph
@@ -0,0 +1,197 @@
+"""Unit tests for vectorized node2vec walks over CSR arrays.
+
+Tests cover:
+- CSR construction (duplicate edges, implicit and isolated nodes)
+- Walks following out-edges and stopping at dead ends
+- Second-order transition probabilities matching node2vec
+- Sharded corpus writing, in-process and in a process pool
+"""
+
+import numpy as np
+import pytest
+
+from app.shared.graph_walks import (
+    WalkGraph,
+    format_walks,
+    generate_walks,
+    walk_batch,
+    walk_lengths,
+    write_walk_corpus,
+)
+
+
+def _graph():
+    # a -> {b, c}, b -> {a, c, d}, c -> d; d is a dead end, e is isolated
+    return WalkGraph.from_edges(
+        ["a", "b", "c", "d", "e"],
+        [
+            ("a", "b"),
+            ("b", "a"),
+            ("b", "c"),
+            ("b", "d"),
+            ("a", "c"),
+            ("c", "d"),
+            ("a", "b"),
+        ],
+    )
+
+
+def _edges(graph):
+    return {
+        (src, int(dst))
+        for src in range(graph.num_nodes)
+        for dst in graph.indices[graph.indptr[src] : graph.indptr[src + 1]]
+    }
+
+
+# ============================================================================
+# CSR construction
+# ============================================================================
+
+
+def test_csr_collapses_duplicates_and_keeps_isolated_nodes():
+    graph = _graph()
+
+    assert graph.node_ids == ["a", "b", "c", "d", "e"]
+    assert graph.indptr.tolist() == [0, 2, 5, 6, 6, 6]
+    assert graph.indices.tolist() == [1, 2, 0, 2, 3, 3]
+    assert graph.num_edges == 6
+    assert graph.walk_starts().tolist() == [0, 1, 2]
+
+
+def test_edge_keys_match_adjacency():
+    graph = _graph()
+    rebuilt = WalkGraph(graph.node_ids, graph.indptr, graph.indices)
+
+    assert rebuilt.edge_keys.tolist() == graph.edge_keys.tolist()
+
+
+# ============================================================================
+# Walk kernel
+# ============================================================================
+
+
+def test_walks_follow_edges_and_stop_at_dead_ends():
+    graph = _graph()
+    edges = _edges(graph)
+    starts = np.array([0, 1, 2] * 50, dtype=np.int32)
+
+    walks = walk_batch(
+        *graph.arrays(), starts, 6, p=0.5, q=2.0, rng=np.random.default_rng(0)
+    )
+
+    assert walks.shape == (150, 6)
+    assert walks[:, 0].tolist() == starts.tolist()
+    for row, length in zip(walks.tolist(), walk_lengths(walks).tolist()):
+        assert all(node == -1 for node in row[length:])
+        assert all((u, v) in edges for u, v in zip(row[: length - 1], row[1:length]))
+        if length < 6:
+            # Only the dead end stops a walk early
+            assert row[length - 1] == 3
+
+
+@pytest.mark.parametrize("p,q", [(0.5, 2.0), (2.0, 0.5), (1.0, 4.0)])
+def test_second_order_transitions_follow_node2vec_bias(p, q):
+    # From t -> v, v can return to t (1/p), move to x1, which t also links
+    # to (1), or move outward to x2 (1/q)
+    graph = WalkGraph.from_edges(
+        [], [("t", "v"), ("v", "t"), ("v", "x1"), ("v", "x2"), ("t", "x1")]
+    )
+    t, v, x1, x2 = (graph.node_ids.index(n) for n in ("t", "v", "x1", "x2"))
+
+    walks = walk_batch(
+        *graph.arrays(),
+        np.full(40000, t, dtype=np.int32),
+        3,
+        p=p,
+        q=q,
+        rng=np.random.default_rng(42),
+    )
+    third = walks[walks[:, 1] == v, 2]
+
+    weights = np.array([1 / p, 1.0, 1 / q])
+    expected = weights / weights.sum()
+    observed = np.array([(third == n).mean() for n in (t, x1, x2)])
+    assert np.allclose(observed, expected, atol=0.02)
+
+
+def test_unbiased_walks_are_uniform():
+    graph = WalkGraph.from_edges([], [("s", "a"), ("s", "b"), ("s", "c")])
+    s = graph.node_ids.index("s")
+
+    walks = walk_batch(
+        *graph.arrays(),
+        np.full(30000, s, dtype=np.int32),
+        2,
+        rng=np.random.default_rng(1),
+    )
+
+    counts = np.bincount(walks[:, 1], minlength=graph.num_nodes)
+    assert counts[s] == 0
+    assert np.allclose(counts[counts > 0] / 30000, 1 / 3, atol=0.02)
+
+
+def test_format_walks_drops_single_node_walks():
+    walks = np.array([[0, 1, -1], [2, -1, -1], [3, 4, 5]], dtype=np.int32)
+
+    text, count = format_walks(walks)
+
+    assert count == 2
+    assert text == b"0 1\n3 4 5\n"
+
+
+# ============================================================================
+# Sharded generation
+# ============================================================================
+
+
+def test_generate_walks_runs_every_round():
+    graph = _graph()
+
+    batches = list(
+        generate_walks(graph, num_walks=3, walk_length=4, shard_size=2, seed=3)
+    )
+
+    rows = np.vstack(batches)
+    assert len(rows) == 3 * len(graph.walk_starts())
+    assert sorted(rows[:, 0].tolist()) == sorted([0, 1, 2] * 3)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_corpus_is_reproducible_across_worker_counts(tmp_path, workers):
+    graph = _graph()
+    reference = tmp_path / "reference.txt"
+    write_walk_corpus(
+        graph,
+        str(reference),
+        num_walks=4,
+        walk_length=5,
+        p=0.5,
+        q=2.0,
+        shard_size=2,
+        seed=11,
+    )
+
+    progress = []
+    path = tmp_path / f"walks-{workers}.txt"
+    written = write_walk_corpus(
+        graph,
+        str(path),
+        num_walks=4,
+        walk_length=5,
+        p=0.5,
+        q=2.0,
+        workers=workers,
+        shard_size=2,
+        seed=11,
+        progress=lambda done, total: progress.append((done, total)),
+    )
+
+    lines = path.read_text().splitlines()
+    assert path.read_bytes() == reference.read_bytes()
+    assert written == len(lines) == 12
+    assert progress[-1] == (8, 8)
+    edges = _edges(graph)
+    for line in lines:
+        nodes = [int(token) for token in line.split()]
+        assert all(edge in edges for edge in zip(nodes, nodes[1:]))
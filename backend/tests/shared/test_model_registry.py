@@ -0,0 +1,179 @@
+"""Unit tests for the process-wide model registry.
+
+Tests cover:
+- Single load per key under concurrent first use
+- Failure cooldown instead of per-request reloads
+- Unload, idle unload and reload on next use
+- Resident-memory budget with least recently used eviction
+- EmbeddingGenerator instances sharing one SentenceTransformer
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from app.shared import embeddings
+from app.shared.embeddings import EmbeddingService
+from app.shared.model_registry import (
+    ModelRegistry,
+    get_model_registry,
+    reset_model_registry,
+)
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+class _FakeTensor:
+    def __init__(self, numel):
+        self._numel = numel
+
+    def numel(self):
+        return self._numel
+
+    def element_size(self):
+        return 4
+
+
+class _FakeModule:
+    """Stands in for a torch module with ``size`` float32 parameters."""
+
+    def __init__(self, size):
+        self.size = size
+
+    def parameters(self):
+        return [_FakeTensor(self.size)]
+
+    def buffers(self):
+        return []
+
+
+@pytest.fixture
+def registry():
+    reset_model_registry()
+    yield get_model_registry()
+    reset_model_registry()
+
+
+# ============================================================================
+# ModelRegistry
+# ============================================================================
+
+
+def test_concurrent_first_use_loads_once():
+    registry = ModelRegistry()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return _FakeModule(10)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get("m", loader)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert len({id(model) for model in results}) == 1
+    assert registry.stats()["models"]["m"]["resident_bytes"] == 40
+
+
+def test_failed_load_is_not_retried_during_cooldown():
+    registry = ModelRegistry()
+    loader = MagicMock(side_effect=OSError("download failed"))
+
+    assert registry.get("broken", loader) is None
+    assert registry.get("broken", loader) is None
+    assert loader.call_count == 1
+    assert registry.stats()["failed"] == ["broken"]
+
+
+def test_unload_and_reload_on_next_use():
+    registry = ModelRegistry()
+    loader = MagicMock(side_effect=lambda: _FakeModule(1))
+
+    first = registry.get("m", loader)
+    assert registry.unload("m") is True
+    assert registry.peek("m") is None
+    assert registry.unload("m") is False
+
+    # The loader is remembered, so warmup() and get() can reload it
+    assert registry.warmup() == {"m": True}
+    assert registry.get("m") is not first
+    assert loader.call_count == 2
+
+
+def test_latest_loader_replaces_earlier_one():
+    registry = ModelRegistry()
+    first = MagicMock(side_effect=lambda: _FakeModule(1))
+    second = MagicMock(side_effect=lambda: _FakeModule(1))
+
+    registry.get("m", first)
+    registry.get("m", second)
+    registry.unload("m")
+    registry.warmup()
+
+    # The first caller's loader (and anything it captured) is not retained
+    assert first.call_count == 1
+    assert second.call_count == 1
+
+
+def test_unload_idle_models():
+    registry = ModelRegistry()
+    registry.get("old", lambda: _FakeModule(1))
+    registry.get("new", lambda: _FakeModule(1))
+    registry._entries["old"].last_used -= 120
+
+    assert registry.unload_idle(60) == ["old"]
+    assert "old" not in registry
+    assert "new" in registry
+
+
+def test_budget_evicts_least_recently_used():
+    registry = ModelRegistry(max_bytes=100)
+    registry.get("a", lambda: _FakeModule(10))
+    registry.get("b", lambda: _FakeModule(10))
+    registry.get("a")  # "b" is now least recently used
+
+    registry.get("c", lambda: _FakeModule(10))
+
+    assert "a" in registry
+    assert "b" not in registry
+    assert "c" in registry
+    assert registry.stats()["total_resident_bytes"] == 80
+
+
+# ============================================================================
+# Service integration
+# ============================================================================
+
+
+def test_embedding_services_share_one_model(registry, monkeypatch):
+    model = MagicMock()
+    model.encode.side_effect = lambda text, **kwargs: np.array([0.1, 0.2])
+    model_cls = MagicMock(return_value=model)
+    monkeypatch.setattr(embeddings, "SentenceTransformer", model_cls)
+    monkeypatch.setenv("MODE", "EDGE")
+
+    first = EmbeddingService().generate_embedding("alpha")
+    second = EmbeddingService().generate_embedding("beta")
+
+    assert first == second == pytest.approx([0.1, 0.2])
+    assert model_cls.call_count == 1
+    assert len(registry.stats()["models"]) == 1
+
+    # After an unload the next request loads the model again
+    registry.unload_all()
+    EmbeddingService().generate_embedding("gamma")
+    assert model_cls.call_count == 2
@@ -0,0 +1,163 @@
+"""Unit tests for the two-tier query embedding cache.
+
+Tests cover:
+- In-process LRU hits, misses and eviction
+- Redis tier reads/writes (dense and sparse)
+- Model version changes invalidating cached vectors
+- Backoff when Redis is unreachable
+- Concurrent identical queries sharing one encoder call
+"""
+
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from app.shared.cache import CacheService, QueryEmbeddingCache
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def mock_redis():
+    """Create a dict-backed mock Redis client."""
+    store = {}
+    redis_mock = Mock()
+    redis_mock.get = Mock(side_effect=lambda key: store.get(key))
+    redis_mock.setex = Mock(side_effect=lambda key, ttl, value: store.__setitem__(key, value))
+    redis_mock.scan_iter = Mock(return_value=iter([]))
+    redis_mock.store = store
+    return redis_mock
+
+
+@pytest.fixture
+def encoder():
+    """Create a counting fake encoder."""
+    return Mock(side_effect=lambda text: [float(len(text)), 1.0])
+
+
+def make_cache(redis_client=None, **kwargs):
+    service = CacheService(redis_client=redis_client or Mock())
+    if redis_client is None:
+        service.redis = None
+    return QueryEmbeddingCache(cache_service=service, **kwargs)
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+
+def test_repeated_query_hits_local_tier(encoder):
+    cache = make_cache(max_entries=10)
+
+    first = cache.get_or_compute("dense", "machine learning", "model-a", encoder)
+    second = cache.get_or_compute("dense", "  machine   learning ", "model-a", encoder)
+
+    assert first == second
+    assert encoder.call_count == 1
+    assert cache.stats()["local"]["hits"] == 1
+    assert cache.stats()["local"]["misses"] == 1
+
+
+def test_lru_evicts_least_recently_used(encoder):
+    cache = make_cache(max_entries=2)
+
+    cache.get_or_compute("dense", "a", "m", encoder)
+    cache.get_or_compute("dense", "b", "m", encoder)
+    cache.get_or_compute("dense", "a", "m", encoder)  # refresh "a"
+    cache.get_or_compute("dense", "c", "m", encoder)  # evicts "b"
+    cache.get_or_compute("dense", "b", "m", encoder)
+
+    assert encoder.call_count == 4
+    assert cache.stats()["entries"] == 2
+
+
+def test_empty_results_are_not_cached():
+    cache = make_cache()
+    failing = Mock(return_value=[])
+
+    cache.get_or_compute("dense", "query", "m", failing)
+    cache.get_or_compute("dense", "query", "m", failing)
+
+    assert failing.call_count == 2
+
+
+def test_redis_tier_shared_between_processes(mock_redis, encoder):
+    writer = make_cache(mock_redis)
+    reader = make_cache(mock_redis)
+
+    writer.get_or_compute("dense", "query", "m", encoder)
+    value = reader.get_or_compute("dense", "query", "m", encoder)
+
+    assert value == [5.0, 1.0]
+    assert encoder.call_count == 1
+    assert reader.stats()["redis"]["hits"] == 1
+
+
+def test_sparse_vectors_keep_integer_token_ids(mock_redis):
+    writer = make_cache(mock_redis)
+    reader = make_cache(mock_redis)
+
+    writer.get_or_compute("sparse", "query", "splade", lambda text: {101: 0.5})
+    value = reader.get_or_compute("sparse", "query", "splade", Mock())
+
+    assert value == {101: 0.5}
+    stored = next(iter(mock_redis.store.values()))
+    assert json.loads(stored) == [[101, 0.5]]
+
+
+def test_model_version_change_invalidates(encoder):
+    cache = make_cache()
+
+    cache.get_or_compute("dense", "query", "m", encoder, model_version="1")
+    cache.get_or_compute("dense", "query", "m", encoder, model_version="2")
+    cache.get_or_compute("dense", "query", "m", encoder, model_version="2")
+
+    assert encoder.call_count == 2
+    assert cache.stats()["entries"] == 1
+    assert cache.stats()["local"]["invalidations"] == 1
+
+
+def test_unreachable_redis_backs_off(encoder):
+    broken = Mock()
+    broken.get = Mock(side_effect=ConnectionError("refused"))
+    cache = make_cache(broken)
+
+    cache.get_or_compute("dense", "a", "m", encoder)
+    cache.get_or_compute("dense", "b", "m", encoder)
+
+    assert broken.get.call_count == 1
+    assert broken.setex.call_count == 0
+    assert encoder.call_count == 2
+
+
+def test_concurrent_identical_queries_encode_once():
+    cache = make_cache()
+    barrier = threading.Barrier(4)
+    calls = []
+
+    def slow_encoder(text):
+        calls.append(text)
+        time.sleep(0.1)
+        return [1.0, 2.0]
+
+    def search(results):
+        barrier.wait()
+        results.append(cache.get_or_compute("dense", "query", "m", slow_encoder))
+
+    results = []
+    threads = [threading.Thread(target=search, args=(results,)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["query"]
+    assert results == [[1.0, 2.0]] * 4
+    assert cache.stats()["coalesced"] == 3
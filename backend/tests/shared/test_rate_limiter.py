@@ -2,16 +2,22 @@
 
 Tests cover:
 - Rate limit checking with various tiers
-- Sliding window algorithm
+- GCRA evaluated in one Redis script call per check
+- Local token leases serving most requests without Redis
+- Unused leased tokens given back once a lease expires
+- The Lua script itself, when fakeredis with Lua support is installed
 - HTTP 429 responses
 - Rate limit headers
 - Graceful degradation when Redis unavailable
 """
 
-import pytest
+import math
 import time
-from unittest.mock import Mock, MagicMock, patch, AsyncMock
 
+import pytest
+from unittest.mock import Mock
+
+from app.shared import rate_limiter as rate_limiter_module
 from app.shared.rate_limiter import RateLimiter
 
 
@@ -20,22 +26,48 @@ from app.shared.rate_limiter import RateLimiter
 # ============================================================================
 
 
-@pytest.fixture
-def mock_redis():
-    """Create a mock Redis client."""
-    redis_mock = Mock()
-    redis_mock.get = Mock(return_value=None)
-    redis_mock.incr = Mock(return_value=1)
-    redis_mock.expire = Mock(return_value=True)
+class _FakeRedis:
+    """Runs the GCRA script's logic in Python against a fake clock."""
+
+    def __init__(self):
+        self.data = {}
+        self.now_ms = 1_700_000_000_000
+        self.script_calls = 0
+        self.error = None
+
+    def register_script(self, script):
+        assert "redis.call('TIME')" in script
+        return self._gcra
+
+    def _gcra(self, keys, args):
+        if self.error:
+            raise self.error
+        self.script_calls += 1
+        limit, period, requested, refund = args
+        interval = period / limit
+        now = self.now_ms
+        tat = max(self.data.get(keys[0], now), now)
+        if refund > 0:
+            tat = max(tat - refund * interval, now)
+        available = max(math.floor((period - (tat - now)) / interval + 1e-9), 0)
+        granted = min(requested, available)
+        if granted > 0:
+            tat += granted * interval
+        if granted > 0 or refund > 0:
+            if tat > now:
+                self.data[keys[0]] = tat
+            else:
+                self.data.pop(keys[0], None)
+        retry_after = 0
+        if granted < requested:
+            retry_after = max(math.ceil(tat + interval - period - now), 1)
+        return [granted, available - granted, retry_after, math.ceil(tat - now)]
 
-    # Setup pipeline mock
-    pipeline_mock = Mock()
-    pipeline_mock.incr = Mock(return_value=pipeline_mock)
-    pipeline_mock.expire = Mock(return_value=pipeline_mock)
-    pipeline_mock.execute = Mock(return_value=[1, True])
-    redis_mock.pipeline = Mock(return_value=pipeline_mock)
 
-    return redis_mock
+@pytest.fixture
+def mock_redis():
+    """Create a fake Redis client that evaluates the GCRA script."""
+    return _FakeRedis()
 
 
 @pytest.fixture
@@ -48,8 +80,16 @@ def mock_cache(mock_redis):
 
 @pytest.fixture
 def rate_limiter(mock_cache, test_settings):
-    """Create a RateLimiter instance with test settings."""
-    limiter = RateLimiter(cache=mock_cache)
+    """Create a RateLimiter instance with test settings (no local leases)."""
+    limiter = RateLimiter(cache=mock_cache, local_batch=1)
+    limiter.settings = test_settings
+    return limiter
+
+
+@pytest.fixture
+def leasing_limiter(mock_cache, test_settings):
+    """Create a RateLimiter that leases 10 tokens per Redis call."""
+    limiter = RateLimiter(cache=mock_cache, local_batch=10, lease_seconds=60)
     limiter.settings = test_settings
     return limiter
 
@@ -66,8 +106,6 @@ async def test_check_rate_limit_free_tier_first_request(rate_limiter, mock_redis
     tier = "free"
     endpoint = "/api/resources"
 
-    mock_redis.get.return_value = None
-
     allowed, headers = await rate_limiter.check_rate_limit(user_id, tier, endpoint)
 
     assert allowed is True
@@ -75,6 +113,7 @@ async def test_check_rate_limit_free_tier_first_request(rate_limiter, mock_redis
     assert "X-RateLimit-Remaining" in headers
     assert "X-RateLimit-Reset" in headers
     assert headers["X-RateLimit-Limit"] == "100"
+    assert headers["X-RateLimit-Remaining"] == "99"
 
 
 @pytest.mark.asyncio
@@ -84,8 +123,6 @@ async def test_check_rate_limit_premium_tier(rate_limiter, mock_redis):
     tier = "premium"
     endpoint = "/api/search"
 
-    mock_redis.get.return_value = "50"
-
     allowed, headers = await rate_limiter.check_rate_limit(user_id, tier, endpoint)
 
     assert allowed is True
@@ -93,7 +130,7 @@ async def test_check_rate_limit_premium_tier(rate_limiter, mock_redis):
 
 
 @pytest.mark.asyncio
-async def test_check_rate_limit_admin_tier_unlimited(rate_limiter):
+async def test_check_rate_limit_admin_tier_unlimited(rate_limiter, mock_redis):
     """Test rate limit check for admin tier (unlimited)."""
     user_id = 3
     tier = "admin"
@@ -103,6 +140,7 @@ async def test_check_rate_limit_admin_tier_unlimited(rate_limiter):
 
     assert allowed is True
     assert headers["X-RateLimit-Limit"] == "0"
+    assert mock_redis.script_calls == 0
 
 
 @pytest.mark.asyncio
@@ -112,46 +150,133 @@ async def test_check_rate_limit_exceeded(rate_limiter, mock_redis):
     tier = "free"
     endpoint = "/api/resources"
 
-    # At free tier limit
-    mock_redis.get.return_value = "100"
+    for _ in range(100):
+        allowed, _ = await rate_limiter.check_rate_limit(user_id, tier, endpoint)
+        assert allowed is True
 
     allowed, headers = await rate_limiter.check_rate_limit(user_id, tier, endpoint)
 
     assert allowed is False
     assert headers["X-RateLimit-Remaining"] == "0"
+    # One request is earned back every 600ms
+    assert headers["Retry-After"] == "1"
 
 
 @pytest.mark.asyncio
 async def test_check_rate_limit_sliding_window(rate_limiter, mock_redis):
-    """Test sliding window algorithm with multiple requests."""
+    """Test that capacity is earned back gradually, not per fixed minute."""
     user_id = 1
     tier = "free"
     endpoint = "/api/resources"
 
-    # First request
-    mock_redis.get.return_value = None
-    allowed1, headers1 = await rate_limiter.check_rate_limit(user_id, tier, endpoint)
-    assert allowed1 is True
+    for _ in range(100):
+        await rate_limiter.check_rate_limit(user_id, tier, endpoint)
+    allowed, _ = await rate_limiter.check_rate_limit(user_id, tier, endpoint)
+    assert allowed is False
 
-    # Second request
-    mock_redis.get.return_value = "1"
-    allowed2, headers2 = await rate_limiter.check_rate_limit(user_id, tier, endpoint)
-    assert allowed2 is True
+    # 6 seconds later: 10 requests earned back
+    mock_redis.now_ms += 6000
+    results = [
+        (await rate_limiter.check_rate_limit(user_id, tier, endpoint))[0]
+        for _ in range(11)
+    ]
+    assert results == [True] * 10 + [False]
 
 
 @pytest.mark.asyncio
-async def test_check_rate_limit_ttl_set(rate_limiter, mock_redis):
-    """Test that TTL is set on rate limit keys."""
+async def test_check_rate_limit_one_round_trip(rate_limiter, mock_redis):
+    """Test that each check is a single atomic script call."""
     user_id = 1
     tier = "free"
     endpoint = "/api/resources"
 
-    mock_redis.get.return_value = None
+    for _ in range(3):
+        await rate_limiter.check_rate_limit(user_id, tier, endpoint)
 
-    await rate_limiter.check_rate_limit(user_id, tier, endpoint)
+    assert mock_redis.script_calls == 3
+
+
+# ============================================================================
+# Test Local Token Leases
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_local_leases_skip_redis(leasing_limiter, mock_redis):
+    """Test that leased tokens authorize requests without Redis calls."""
+    results = [
+        (await leasing_limiter.check_rate_limit(1, "free", "/api/resources"))[0]
+        for _ in range(101)
+    ]
+
+    assert results == [True] * 100 + [False]
+    # 10 leases of 10 tokens, plus the denied request
+    assert mock_redis.script_calls == 11
+
+
+@pytest.mark.asyncio
+async def test_local_leases_never_exceed_limit_across_processes(
+    mock_cache, mock_redis, test_settings
+):
+    """Test that two processes sharing Redis admit at most the limit."""
+    limiters = [
+        RateLimiter(cache=mock_cache, local_batch=10, lease_seconds=60)
+        for _ in range(2)
+    ]
+    for limiter in limiters:
+        limiter.settings = test_settings
+
+    allowed = 0
+    for _ in range(150):
+        for limiter in limiters:
+            ok, _ = await limiter.check_rate_limit(1, "free", "/api/resources")
+            allowed += ok
+
+    assert allowed == 100
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_tokens_are_given_back(
+    mock_cache, mock_redis, test_settings, monkeypatch
+):
+    """Test that a slow client can still burst up to the limit."""
+    clock = Mock(monotonic=lambda: mock_redis.now_ms / 1000, time=time.time)
+    monkeypatch.setattr(rate_limiter_module, "time", clock)
+    limiter = RateLimiter(cache=mock_cache, local_batch=10, lease_seconds=1.0)
+    limiter.settings = test_settings
 
-    # Verify pipeline was used
-    mock_redis.pipeline.assert_called()
+    # 20 requests at 40/min, well under the free tier's 100/min
+    for _ in range(20):
+        allowed, _ = await limiter.check_rate_limit(1, "free", "/api/resources")
+        assert allowed is True
+        mock_redis.now_ms += 1500
+
+    burst = [
+        (await limiter.check_rate_limit(1, "free", "/api/resources"))[0]
+        for _ in range(60)
+    ]
+
+    assert burst == [True] * 60
+
+
+@pytest.mark.asyncio
+async def test_lease_headers_count_unused_tokens(leasing_limiter):
+    """Test that remaining includes tokens still held locally."""
+    _, first = await leasing_limiter.check_rate_limit(1, "free", "/api/resources")
+    _, second = await leasing_limiter.check_rate_limit(1, "free", "/api/resources")
+
+    assert first["X-RateLimit-Remaining"] == "99"
+    assert second["X-RateLimit-Remaining"] == "98"
+
+
+def test_get_status_does_not_consume(rate_limiter, mock_redis):
+    """Test reading the allowance without counting a request."""
+    status = rate_limiter.get_status("1", "free")
+
+    assert status.limit == 100
+    assert status.remaining == 100
+    assert mock_redis.data == {}
+    assert rate_limiter.get_status("1", "admin") is None
 
 
 # ============================================================================
@@ -204,7 +329,7 @@ async def test_check_rate_limit_redis_error(rate_limiter, mock_redis):
     endpoint = "/api/resources"
 
     # Simulate Redis error
-    mock_redis.get.side_effect = Exception("Redis connection failed")
+    mock_redis.error = Exception("Redis connection failed")
 
     # Should fail open
     allowed, headers = await rate_limiter.check_rate_limit(user_id, tier, endpoint)
@@ -214,22 +339,16 @@ async def test_check_rate_limit_redis_error(rate_limiter, mock_redis):
 
 
 @pytest.mark.asyncio
-async def test_check_rate_limit_concurrent_requests(rate_limiter, mock_redis):
-    """Test handling of concurrent requests."""
-    user_id = 1
-    tier = "free"
-    endpoint = "/api/resources"
-
-    mock_redis.get.return_value = "50"
+async def test_check_rate_limit_without_redis(mock_cache, test_settings):
+    """Test that a cache without a Redis client fails open."""
+    mock_cache.redis = None
+    limiter = RateLimiter(cache=mock_cache)
+    limiter.settings = test_settings
 
-    # Simulate concurrent requests
-    results = []
-    for _ in range(5):
-        allowed, headers = await rate_limiter.check_rate_limit(user_id, tier, endpoint)
-        results.append(allowed)
+    allowed, headers = await limiter.check_rate_limit(1, "free", "/api/resources")
 
-    # All should be allowed (under limit)
-    assert all(results)
+    assert allowed is True
+    assert headers == {}
 
 
 @pytest.mark.asyncio
@@ -239,24 +358,40 @@ async def test_check_rate_limit_exactly_at_limit(rate_limiter, mock_redis):
     tier = "free"
     endpoint = "/api/resources"
 
-    # Exactly at limit
-    mock_redis.get.return_value = "100"
+    # Exactly at limit: the bucket is a full period ahead
+    mock_redis.data["rate_limit:1"] = mock_redis.now_ms + 60000
 
     allowed, headers = await rate_limiter.check_rate_limit(user_id, tier, endpoint)
 
     assert allowed is False
 
 
-@pytest.mark.asyncio
-async def test_check_rate_limit_over_limit(rate_limiter, mock_redis):
-    """Test behavior when over rate limit."""
-    user_id = 1
-    tier = "free"
-    endpoint = "/api/resources"
+# ============================================================================
+# Test the Lua script
+# ============================================================================
 
-    # Over limit
-    mock_redis.get.return_value = "150"
 
-    allowed, headers = await rate_limiter.check_rate_limit(user_id, tier, endpoint)
+def test_gcra_script_runs_in_redis(test_settings):
+    """Test _GCRA_SCRIPT itself against fakeredis's Lua interpreter."""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    cache = Mock()
+    cache.redis = fakeredis.FakeRedis()
+    limiter = RateLimiter(cache=cache, local_batch=1)
+    limiter.settings = test_settings
 
-    assert allowed is False
+    decisions = [limiter.hit("rate_limit:lua", limit=5, period=3600) for _ in range(6)]
+
+    assert [d.allowed for d in decisions] == [True] * 5 + [False]
+    assert decisions[4].remaining == 0
+    assert decisions[5].retry_after > 0
+
+    # Two unused tokens given back are available again
+    granted, remaining, _, _ = limiter._run_script(
+        "rate_limit:lua", 5, 3600, 1, refund=2
+    )
+    assert (granted, remaining) == (1, 1)
+
+    # Refunding more than was taken empties the bucket
+    limiter._run_script("rate_limit:lua", 5, 3600, 0, refund=10)
+    assert cache.redis.get("rate_limit:lua") is None
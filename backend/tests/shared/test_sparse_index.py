@@ -0,0 +1,145 @@
+"""Unit tests for the sparse (SPLADE) inverted index.
+
+Tests cover:
+- MaxScore top-k against brute-force scoring (dot and min)
+- Incremental upsert/remove and compaction
+- Resource index rebuild and sparse_embedding_updated_at delta refresh
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.database.models import Resource
+from app.shared.sparse_index import (
+    ResourceSparseIndex,
+    SparseIndex,
+    coerce_sparse,
+)
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def sparse_docs():
+    """Create 2,000 documents over a Zipf-like 500-token vocabulary."""
+    rng = np.random.default_rng(11)
+    docs = []
+    for i in range(2000):
+        tokens = rng.zipf(1.3, size=20) % 500
+        docs.append(
+            (f"d{i}", {str(int(t)): float(rng.uniform(0.1, 2.0)) for t in tokens})
+        )
+    return docs
+
+
+def brute_force(docs, query, k, scoring):
+    scores = []
+    for doc_id, vector in docs:
+        score = 0.0
+        for token, weight in query.items():
+            if token in vector:
+                doc_weight = float(np.float16(vector[token]))
+                score += weight * doc_weight if scoring == "dot" else min(weight, doc_weight)
+        if score > 0:
+            scores.append((doc_id, score))
+    scores.sort(key=lambda item: item[1], reverse=True)
+    return scores[:k]
+
+
+# ============================================================================
+# SparseIndex
+# ============================================================================
+
+
+@pytest.mark.parametrize("scoring", ["dot", "min"])
+def test_maxscore_matches_brute_force(sparse_docs, scoring):
+    index = SparseIndex()
+    index.build(sparse_docs)
+    rng = np.random.default_rng(3)
+
+    for _ in range(10):
+        query = {str(int(t)): float(rng.uniform(0.1, 1.0)) for t in rng.integers(0, 60, 6)}
+        expected = brute_force(sparse_docs, query, 10, scoring)
+        results = index.search(query, k=10, scoring=scoring)
+
+        assert [score for _, score in results] == pytest.approx(
+            [score for _, score in expected], rel=1e-3
+        )
+
+
+def test_search_ignores_unknown_tokens_and_bad_scoring():
+    index = SparseIndex()
+    index.build([("a", {"1": 1.0})])
+
+    assert index.search({"999": 1.0}, k=5) == []
+    assert index.search({}, k=5) == []
+    assert index.search({1: 0.5}, k=5) == [("a", 0.5)]
+    with pytest.raises(ValueError):
+        index.search({"1": 1.0}, scoring="bm25")
+
+
+def test_upsert_remove_and_compact():
+    index = SparseIndex()
+    index.build([("a", {"1": 1.0, "2": 0.5}), ("b", {"2": 1.0})])
+
+    index.upsert("a", {"3": 1.0})
+    assert index.search({"1": 1.0}, k=5) == []
+    assert index.search({"3": 1.0}, k=5) == [("a", 1.0)]
+
+    assert index.remove("b") is True
+    assert index.remove("missing") is False
+    assert index.search({"2": 1.0}, k=5) == []
+
+    index.compact()
+    assert index.stats()["dead"] == 0
+    assert len(index) == 1
+    assert index.search({"3": 1.0}, k=5) == [("a", 1.0)]
+
+
+def test_coerce_sparse_parses_stored_formats():
+    assert coerce_sparse('{"1": 0.5, "2": 0}') == {"1": 0.5}
+    assert coerce_sparse({7: 1.0}) == {"7": 1.0}
+    assert coerce_sparse("") is None
+    assert coerce_sparse("[1, 2]") is None
+    assert coerce_sparse(None) is None
+
+
+# ============================================================================
+# ResourceSparseIndex
+# ============================================================================
+
+
+def test_resource_index_rebuild_and_delta_refresh(db_session):
+    now = datetime.utcnow()
+    first = Resource(
+        title="First",
+        sparse_embedding=json.dumps({"10": 1.0}),
+        sparse_embedding_updated_at=now,
+    )
+    second = Resource(
+        title="Second",
+        sparse_embedding=json.dumps({"20": 1.0}),
+        sparse_embedding_updated_at=now,
+    )
+    db_session.add_all([first, second])
+    db_session.commit()
+
+    resource_index = ResourceSparseIndex(SparseIndex())
+    index = resource_index.ensure_ready(db_session)
+
+    assert len(index) == 2
+    assert index.search({"10": 1.0}, k=5) == [(str(first.id), 1.0)]
+
+    second.sparse_embedding = json.dumps({"10": 0.5})
+    second.sparse_embedding_updated_at = now + timedelta(seconds=1)
+    db_session.commit()
+    resource_index.refresh(db_session)
+
+    results = index.search({"10": 1.0}, k=5)
+    assert [rid for rid, _ in results] == [str(first.id), str(second.id)]
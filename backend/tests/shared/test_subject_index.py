@@ -0,0 +1,129 @@
+"""Unit tests for the inverted subject index.
+
+Tests cover:
+- Shared-subject ranking and exclusion
+- Classification code lookup
+- Upsert/remove keeping postings consistent
+- Database build and updated_at delta sync
+- find_hybrid_neighbors candidates from the subject and ANN indexes
+"""
+
+import json
+
+from app.database.models import Resource
+from app.shared.subject_index import SubjectIndex, get_resource_subject_index
+
+
+def _index():
+    index = SubjectIndex()
+    index.build(
+        [
+            ("a", ["ml", "nlp"], "006"),
+            ("b", ["ml", "nlp", "cv"], "006"),
+            ("c", ["ml"], "510"),
+            ("d", json.dumps(["art"]), None),
+        ]
+    )
+    return index
+
+
+# ============================================================================
+# SubjectIndex
+# ============================================================================
+
+
+def test_shared_subjects_ranked_by_overlap():
+    index = _index()
+
+    assert index.shared_subjects(["ml", "nlp"], exclude_ids=["a"]) == [
+        ("b", 2),
+        ("c", 1),
+    ]
+    assert index.shared_subjects(["ml", "nlp"], k=1) == [("a", 2)]
+    assert index.shared_subjects(["unknown"]) == []
+
+
+def test_subjects_match_case_insensitive_substrings():
+    index = SubjectIndex()
+    index.build(
+        [
+            ("a", ["Machine Learning"], None),
+            ("b", ["machine learning", "Deep LEARNING"], None),
+            ("c", ["Art"], None),
+        ]
+    )
+
+    # Same matching as the LIKE '%subject%' filter the index replaced;
+    # an item counts once per query subject
+    assert index.shared_subjects(["LEARNING"]) == [("a", 1), ("b", 1)]
+    assert index.shared_subjects(["machine", "deep"]) == [("b", 2), ("a", 1)]
+
+
+def test_classification_lookup():
+    index = _index()
+
+    assert index.with_classification("006") == ["a", "b"]
+    assert index.with_classification("006", exclude_ids=["a"]) == ["b"]
+    assert index.with_classification(None) == []
+
+
+def test_upsert_and_remove_update_postings():
+    index = _index()
+
+    index.upsert("c", ["art"], "006")
+    assert index.shared_subjects(["ml"]) == [("a", 1), ("b", 1)]
+    assert index.shared_subjects(["art"]) == [("c", 1), ("d", 1)]
+    assert index.with_classification("510") == []
+
+    assert index.remove("d") is True
+    assert index.remove("d") is False
+    assert "d" not in index
+    assert index.stats()["subjects"] == 4
+
+
+# ============================================================================
+# Database-backed index
+# ============================================================================
+
+
+def test_resource_index_builds_and_refreshes(db_session):
+    first = Resource(title="First", subject=["ml"], classification_code="006")
+    db_session.add(first)
+    db_session.commit()
+
+    resource_index = get_resource_subject_index()
+    index = resource_index.ensure_ready(db_session)
+    assert index.shared_subjects(["ml"]) == [(str(first.id), 1)]
+
+    second = Resource(title="Second", subject=["ml", "cv"])
+    db_session.add(second)
+    db_session.commit()
+    resource_index.expire()
+
+    index = resource_index.ensure_ready(db_session)
+    assert {item_id for item_id, _ in index.shared_subjects(["ml"])} == {
+        str(first.id),
+        str(second.id),
+    }
+
+
+def test_hybrid_neighbors_use_indexed_candidates(db_session):
+    from app.modules.graph.service import find_hybrid_neighbors
+
+    source = Resource(
+        title="Source", subject=["ml"], embedding=json.dumps([1.0, 0.0])
+    )
+    near = Resource(title="Near", subject=[], embedding=json.dumps([0.95, 0.1]))
+    topical = Resource(title="Topical", subject=["ml"], embedding=json.dumps([0.0, 1.0]))
+    unrelated = Resource(title="Unrelated", subject=["art"])
+    db_session.add_all([source, near, topical, unrelated])
+    db_session.commit()
+
+    graph = find_hybrid_neighbors(db_session, source.id, limit=5)
+
+    neighbor_ids = {edge.target for edge in graph.edges}
+    assert near.id in neighbor_ids
+    assert topical.id in neighbor_ids
+    assert unrelated.id not in neighbor_ids
+    # The nearest embedding ranks first
+    assert graph.edges[0].target == near.id
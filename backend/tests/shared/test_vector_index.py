@@ -0,0 +1,241 @@
+"""Unit tests for the in-process ANN vector index.
+
+Tests cover:
+- Exact search ordering and cosine scores
+- IVF search recall against brute force
+- Incremental upsert/remove
+- Save/load round trip
+- Store-backed index over the shared embedding store
+- Table index rebuild and updated_at delta refresh
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from app.database.models import Resource
+from app.shared.embedding_store import EmbeddingStore
+from app.shared.vector_index import (
+    ResourceVectorIndex,
+    StoreVectorIndex,
+    TableVectorIndex,
+    VectorIndex,
+    coerce_vector,
+)
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def clustered_vectors():
+    """Create 5,000 vectors drawn around 50 random centres."""
+    rng = np.random.default_rng(42)
+    centres = rng.normal(size=(50, 32))
+    labels = rng.integers(0, 50, size=5000)
+    vectors = centres[labels] + 0.1 * rng.normal(size=(5000, 32))
+    return [(f"r{i}", vectors[i].tolist()) for i in range(len(vectors))]
+
+
+# ============================================================================
+# VectorIndex
+# ============================================================================
+
+
+def test_exact_search_returns_cosine_order():
+    index = VectorIndex(exact_threshold=100)
+    index.build([("a", [1.0, 0.0]), ("b", [0.7, 0.7]), ("c", [0.0, 1.0])])
+
+    results = index.search([1.0, 0.1], k=2)
+
+    assert [rid for rid, _ in results] == ["a", "b"]
+    assert results[0][1] == pytest.approx(1.0 / np.sqrt(1.01), rel=1e-5)
+
+
+def test_search_handles_empty_and_zero_queries():
+    index = VectorIndex()
+    assert index.search([1.0, 0.0], k=5) == []
+
+    index.build([("a", [1.0, 0.0])])
+    assert index.search([0.0, 0.0], k=5) == []
+    assert index.search([], k=5) == []
+
+
+def test_ivf_search_recall_against_brute_force(clustered_vectors):
+    index = VectorIndex(exact_threshold=1000, n_probe=8)
+    index.build(clustered_vectors)
+    assert index.stats()["mode"] == "ivf"
+
+    exact = VectorIndex(exact_threshold=10**9)
+    exact.build(clustered_vectors)
+
+    rng = np.random.default_rng(7)
+    hits = 0
+    for _ in range(20):
+        query = clustered_vectors[int(rng.integers(0, 5000))][1]
+        truth = {rid for rid, _ in exact.search(query, k=10)}
+        found = {rid for rid, _ in index.search(query, k=10)}
+        hits += len(truth & found)
+
+    assert hits / 200 >= 0.9
+
+
+def test_upsert_and_remove_are_incremental():
+    index = VectorIndex(exact_threshold=100)
+    index.build([("a", [1.0, 0.0]), ("b", [0.0, 1.0])])
+
+    index.upsert("c", [1.0, 0.05])
+    assert index.search([1.0, 0.0], k=1)[0][0] == "a"
+
+    index.upsert("a", [0.0, 1.0])
+    assert index.search([1.0, 0.0], k=1)[0][0] == "c"
+
+    assert index.remove("c") is True
+    assert index.remove("missing") is False
+    assert "c" not in index
+    assert len(index) == 2
+    assert all(rid != "c" for rid, _ in index.search([1.0, 0.0], k=5))
+
+
+def test_upsert_rejects_dimension_mismatch():
+    index = VectorIndex()
+    index.build([("a", [1.0, 0.0])])
+
+    assert index.upsert("b", [1.0, 0.0, 0.0]) is False
+    assert "b" not in index
+
+
+def test_save_and_load_round_trip(tmp_path, clustered_vectors):
+    index = VectorIndex(exact_threshold=1000)
+    index.build(clustered_vectors)
+    index.remove("r0")
+    path = str(tmp_path / "index.npz")
+    index.save(path)
+
+    loaded = VectorIndex(exact_threshold=1000)
+    assert loaded.load(path) is True
+    assert len(loaded) == len(index)
+    query = clustered_vectors[1][1]
+    assert loaded.search(query, k=5) == index.search(query, k=5)
+
+
+def test_coerce_vector_parses_stored_formats():
+    assert coerce_vector("[0.1, 0.2]") == [0.1, 0.2]
+    assert coerce_vector([0.1]) == [0.1]
+    assert coerce_vector("") is None
+    assert coerce_vector("not json") is None
+    assert coerce_vector(None) is None
+
+
+# ============================================================================
+# StoreVectorIndex / ResourceVectorIndex
+# ============================================================================
+
+
+def test_store_index_ivf_recall_and_updates(clustered_vectors):
+    store = EmbeddingStore("resources")
+    store.load_items(clustered_vectors)
+    index = StoreVectorIndex(store, n_probe=8, exact_threshold=1000)
+
+    exact = VectorIndex(exact_threshold=10**9)
+    exact.build(clustered_vectors)
+
+    rng = np.random.default_rng(7)
+    hits = 0
+    for _ in range(20):
+        query = clustered_vectors[int(rng.integers(0, 5000))][1]
+        truth = {rid for rid, _ in exact.search(query, k=10)}
+        found = {rid for rid, _ in index.search(query, k=10)}
+        hits += len(truth & found)
+
+    assert index.stats()["mode"] == "ivf"
+    # Only the centroids are held; vectors are read from the store
+    assert index.stats()["memory_bytes"] < store.stats()["snapshot_bytes"] / 10
+    assert hits / 200 >= 0.9
+
+    query = clustered_vectors[0][1]
+    index.upsert("new", query)
+    assert index.search(query, k=1)[0][0] in {"new", "r0"}
+    index.remove("new")
+    index.remove("r0")
+    assert {rid for rid, _ in index.search(query, k=10)}.isdisjoint({"new", "r0"})
+    assert "r0" not in store
+
+
+def test_resource_index_reads_the_shared_store(db_session):
+    first = Resource(title="First", embedding=json.dumps([1.0, 0.0, 0.0]))
+    second = Resource(title="Second", embedding=json.dumps([0.0, 1.0, 0.0]))
+    db_session.add_all([first, second])
+    db_session.commit()
+
+    store = EmbeddingStore("resources")
+    resource_index = ResourceVectorIndex(store)
+    resource_index.upsert(first.id, [0.0, 0.0, 1.0])  # ignored until loaded
+    index = resource_index.ensure_ready(db_session)
+
+    assert index.store is store and len(store) == 2
+    assert index.search([1.0, 0.0, 0.0], k=1)[0][0] == str(first.id)
+
+    second.embedding = json.dumps([1.0, 0.1, 0.0])
+    db_session.commit()
+    resource_index.expire()
+    index = resource_index.ensure_ready(db_session)
+
+    top_two = {rid for rid, _ in index.search([1.0, 0.0, 0.0], k=2)}
+    assert top_two == {str(first.id), str(second.id)}
+
+
+# ============================================================================
+# TableVectorIndex
+# ============================================================================
+
+
+class _ResourceTableIndex(TableVectorIndex):
+    INDEX_NAME = "resources"
+
+    def _columns(self):
+        return Resource.id, Resource.embedding, Resource.updated_at
+
+
+def test_table_index_rebuild_and_delta_refresh(db_session):
+    first = Resource(title="First", embedding=json.dumps([1.0, 0.0, 0.0]))
+    second = Resource(title="Second", embedding=json.dumps([0.0, 1.0, 0.0]))
+    empty = Resource(title="No embedding")
+    db_session.add_all([first, second, empty])
+    db_session.commit()
+
+    table_index = _ResourceTableIndex(VectorIndex(name="resources"))
+    index = table_index.ensure_ready(db_session)
+
+    assert len(index) == 2
+    assert index.search([1.0, 0.0, 0.0], k=1)[0][0] == str(first.id)
+
+    # Embedding change is picked up by the delta refresh
+    second.embedding = json.dumps([1.0, 0.1, 0.0])
+    empty.embedding = json.dumps([0.0, 0.0, 1.0])
+    db_session.commit()
+    table_index.refresh(db_session)
+
+    assert len(index) == 3
+    assert str(empty.id) in index
+    top_two = {rid for rid, _ in index.search([1.0, 0.0, 0.0], k=2)}
+    assert top_two == {str(first.id), str(second.id)}
+
+
+def test_table_index_built_empty_picks_up_new_rows(db_session):
+    # An injected index is used even though an empty one is falsy
+    injected = VectorIndex(name="resources")
+    table_index = _ResourceTableIndex(injected)
+    assert table_index.ensure_ready(db_session) is injected
+    assert len(injected) == 0
+
+    # No watermark yet: the first refresh reads every timestamped row
+    added = Resource(title="Added", embedding=json.dumps([1.0, 0.0, 0.0]))
+    db_session.add(added)
+    db_session.commit()
+    table_index.refresh(db_session)
+
+    assert str(added.id) in table_index.index
@@ -6,6 +6,9 @@ Tests three scenarios per the spec:
   2. Cache HIT   — second fetch is served from Redis,    latency < 500 ms
   3. Invalid URI — SSRF guard raises ValueError immediately
 
+Plus whole-file coalescing: chunks of one file share a single download and
+SHA-pinned bodies are reused from the in-process and Redis file caches.
+
 Run
 ───
   # Requires a running Redis; set GITHUB_API_TOKEN for authenticated limits.
@@ -28,8 +31,10 @@ from app.modules.github.fetcher import (
     FetchRequest,
     FetchResult,
     GitHubFetcher,
+    _file_cache,
     _validate_github_uri,
     CACHE_TTL_SECONDS,
+    FILE_CACHE_TTL_SECONDS,
 )
 
 # ── Shared test fixtures ───────────────────────────────────────────────────────
@@ -268,6 +273,129 @@ async def test_line_range_slicing_is_correct():
     assert len(lines) == 11,         f"Expected 11 lines (10–20 inclusive), got {len(lines)}"
 
 
+# ── Whole-file coalescing and cache ──────────────────────────────────────────
+
+_PINNED_SHA = "0123456789abcdef0123456789abcdef01234567"
+_PINNED_URI = f"https://raw.githubusercontent.com/o/r/{_PINNED_SHA}/src/big.py"
+
+
+def _ok_response(text: str) -> MagicMock:
+    response = MagicMock()
+    response.status_code = 200
+    response.text = text
+    response.raise_for_status = MagicMock()
+    return response
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chunks_from_same_file_share_one_download():
+    """Ten line ranges of one file cost a single GitHub request."""
+    _file_cache.clear()
+    source = "\n".join(f"line_{i}" for i in range(1, 201))
+    requests = [
+        _make_request(uri=_PINNED_URI, ref=_PINNED_SHA, start=i * 10 + 1, end=i * 10 + 5)
+        for i in range(10)
+    ]
+
+    mock_redis = AsyncMock()
+    mock_redis.get = AsyncMock(return_value=None)
+
+    async def _slow_get(url):
+        await asyncio.sleep(0.01)
+        return _ok_response(source)
+
+    mock_http = AsyncMock()
+    mock_http.get = AsyncMock(side_effect=_slow_get)
+
+    async with GitHubFetcher(
+        redis_client=mock_redis, http_client=mock_http
+    ) as fetcher:
+        results = await fetcher.fetch_many(requests)
+
+    assert mock_http.get.await_count == 1
+    assert fetcher.stats["github_requests"] == 1
+    assert fetcher.stats["coalesced"] == 9
+    for i, result in enumerate(results):
+        assert result.code.split("\n")[0] == f"line_{i * 10 + 1}"
+
+    # Body is compressed into Redis under the file key with the long TTL
+    mock_redis.set.assert_awaited_once()
+    assert mock_redis.set.call_args.kwargs["ex"] == FILE_CACHE_TTL_SECONDS
+    assert mock_redis.set.call_args.args[0] == requests[0].file_cache_key()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_pinned_file_body_served_from_process_cache():
+    """A second fetcher slices pinned files from the in-process body cache."""
+    _file_cache.clear()
+    source = "\n".join(f"line_{i}" for i in range(1, 51))
+
+    mock_redis = AsyncMock()
+    mock_redis.get = AsyncMock(return_value=None)
+    mock_http = AsyncMock()
+    mock_http.get = AsyncMock(return_value=_ok_response(source))
+
+    async with GitHubFetcher(redis_client=mock_redis, http_client=mock_http) as fetcher:
+        await fetcher.fetch_chunk(_make_request(uri=_PINNED_URI, ref=_PINNED_SHA, start=1, end=2))
+
+    async with GitHubFetcher(redis_client=mock_redis, http_client=mock_http) as fetcher:
+        result = await fetcher.fetch_chunk(
+            _make_request(uri=_PINNED_URI, ref=_PINNED_SHA, start=40, end=41)
+        )
+
+    assert mock_http.get.await_count == 1
+    assert result.cache_hit is True
+    assert result.code == "line_40\nline_41"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_pinned_file_body_restored_from_redis():
+    """A compressed body written by another process is reused from Redis."""
+    import base64
+    import zlib
+
+    _file_cache.clear()
+    source = "\n".join(f"line_{i}" for i in range(1, 51))
+    req = _make_request(uri=_PINNED_URI, ref=_PINNED_SHA, start=5, end=6)
+    stored = base64.b64encode(zlib.compress(source.encode())).decode()
+
+    mock_redis = AsyncMock()
+    mock_redis.get = AsyncMock(
+        side_effect=lambda key: stored if key == req.file_cache_key() else None
+    )
+    mock_http = AsyncMock()
+
+    async with GitHubFetcher(redis_client=mock_redis, http_client=mock_http) as fetcher:
+        result = await fetcher.fetch_chunk(req)
+
+    mock_http.get.assert_not_called()
+    assert result.code == "line_5\nline_6"
+    assert result.cache_hit is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_branch_refs_are_coalesced_but_not_cached():
+    """Mutable refs share in-flight downloads but never enter the body cache."""
+    _file_cache.clear()
+    uri = "https://raw.githubusercontent.com/o/r/HEAD/src/main.py"
+
+    mock_redis = AsyncMock()
+    mock_redis.get = AsyncMock(return_value=None)
+    mock_http = AsyncMock()
+    mock_http.get = AsyncMock(return_value=_ok_response("a\nb\nc"))
+
+    async with GitHubFetcher(redis_client=mock_redis, http_client=mock_http) as fetcher:
+        await fetcher.fetch_chunk(_make_request(uri=uri, ref="HEAD", start=1, end=1))
+        await fetcher.fetch_chunk(_make_request(uri=uri, ref="HEAD", start=2, end=2))
+
+    assert mock_http.get.await_count == 2
+    mock_redis.set.assert_not_called()
+
+
 # ── Integration tests (require network + Redis) ───────────────────────────────
 
 @pytest.mark.asyncio
@@ -293,9 +421,11 @@ async def test_real_github_fetch_cache_miss_latency():
     )
 
     async with GitHubFetcher() as fetcher:
-        # Bust cache first
+        # Bust cache first (chunk key, file body in Redis and in-process)
         cache_key = req.cache_key()
         await fetcher._redis.delete(cache_key)
+        await fetcher._redis.delete(req.file_cache_key())
+        _file_cache.clear()
 
         t0 = time.monotonic()
         result = await fetcher.fetch_chunk(req)
@@ -0,0 +1,27 @@
+"""
+Alembic revision graph checks.
+
+entrypoint.sh runs ``alembic upgrade head``, which aborts when the revision
+graph has more than one head, so every new migration must chain from the
+current head (or a merge revision must join them).
+"""
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("alembic")
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_single_migration_head():
+    config = Config(str(BACKEND_ROOT / "config" / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_ROOT / "alembic"))
+
+    heads = ScriptDirectory.from_config(config).get_heads()
+
+    assert len(heads) == 1, f"multiple alembic heads: {heads}"
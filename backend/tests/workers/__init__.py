@@ -0,0 +1 @@
+"""Edge worker tests package."""
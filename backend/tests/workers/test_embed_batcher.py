@@ -0,0 +1,109 @@
+"""Unit tests for the edge /embed micro-batcher.
+
+Tests cover:
+- Concurrent requests coalesced into one batch_generate call
+- max_batch splitting without breaking up a request
+- Errors propagated to every caller in the failed batch
+- Packed float32 response round trip
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.workers.embed_batcher import EmbedBatcher, pack_f32, unpack_f32
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+class _FakeEmbeddingService:
+    """Records batch sizes; the embedding of text t is [len(t), 1.0]."""
+
+    def __init__(self, fail: bool = False):
+        self.calls = []
+        self.fail = fail
+        self.release = threading.Event()
+        self.release.set()
+
+    def batch_generate(self, texts, batch_size=32):
+        self.release.wait(timeout=5)
+        self.calls.append(list(texts))
+        if self.fail:
+            raise RuntimeError("CUDA out of memory")
+        return [[float(len(t)), 1.0] for t in texts]
+
+
+# ============================================================================
+# EmbedBatcher
+# ============================================================================
+
+
+async def test_concurrent_requests_share_one_batch():
+    service = _FakeEmbeddingService()
+    batcher = EmbedBatcher(service, max_batch=64, max_wait_ms=50)
+
+    results = await asyncio.gather(
+        batcher.embed(["a"]), batcher.embed(["bb", "ccc"]), batcher.embed(["dddd"])
+    )
+
+    assert results == [[[1.0, 1.0]], [[2.0, 1.0], [3.0, 1.0]], [[4.0, 1.0]]]
+    assert service.calls == [["a", "bb", "ccc", "dddd"]]
+    assert batcher.describe()["avg_batch_size"] == 4.0
+
+
+async def test_max_batch_splits_between_requests():
+    service = _FakeEmbeddingService()
+    batcher = EmbedBatcher(service, max_batch=3, max_wait_ms=50)
+
+    await asyncio.gather(
+        batcher.embed(["a", "b"]), batcher.embed(["c", "d"]), batcher.embed(["e"])
+    )
+
+    assert service.calls == [["a", "b"], ["c", "d", "e"]]
+
+
+async def test_requests_during_a_batch_form_the_next_one():
+    service = _FakeEmbeddingService()
+    service.release.clear()
+    batcher = EmbedBatcher(service, max_batch=64, max_wait_ms=0)
+
+    first = asyncio.ensure_future(batcher.embed(["a"]))
+    await asyncio.sleep(0.05)  # "a" is now on the model
+    later = [asyncio.ensure_future(batcher.embed([t])) for t in ("b", "c")]
+    await asyncio.sleep(0.01)
+    service.release.set()
+
+    await asyncio.gather(first, *later)
+    assert service.calls == [["a"], ["b", "c"]]
+
+
+async def test_batch_errors_reach_every_caller():
+    batcher = EmbedBatcher(_FakeEmbeddingService(fail=True), max_wait_ms=20)
+
+    results = await asyncio.gather(
+        batcher.embed(["a"]), batcher.embed(["b"]), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    # The scheduler survives a failed batch
+    batcher.embedding_service.fail = False
+    assert await batcher.embed(["ok"]) == [[2.0, 1.0]]
+
+
+# ============================================================================
+# Binary format
+# ============================================================================
+
+
+def test_pack_f32_round_trip():
+    vectors = [[0.5, -1.25, 3.0], [1.0, 2.0, 4.0]]
+
+    payload = pack_f32(vectors)
+
+    assert len(payload) == 2 * 3 * 4
+    assert unpack_f32(payload, dim=3) == vectors
+    assert pack_f32([]) == b""
@@ -19,6 +19,7 @@ class PaginatedResponse(BaseModel):
     page: int = 1
     per_page: int = 100
     has_more: bool = False
+    next_cursor: Optional[str] = None
 
 
 class Resource(BaseModel):
@@ -63,6 +63,7 @@ class ResourceClient:
         min_quality: Optional[float] = None,
         collection_id: Optional[int] = None,
         tags: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
     ) -> PaginatedResponse:
         """List resources with optional filters.
 
@@ -75,6 +76,8 @@ class ResourceClient:
             min_quality: Minimum quality score filter.
             collection_id: Filter by collection ID.
             tags: Filter by tags (list of tag names).
+            cursor: next_cursor from the previous page; pages by keyset
+                instead of skip, so deep pages stay fast.
 
         Returns:
             Paginated response containing resources.
@@ -93,6 +96,8 @@ class ResourceClient:
             params["collection_id"] = collection_id
         if tags is not None:
             params["tags"] = ",".join(tags)
+        if cursor is not None:
+            params["cursor"] = cursor
 
         response = self.api.get("/api/v1/resources", params=params)
         return PaginatedResponse(**response)
@@ -397,6 +397,11 @@ def list_resources(
         "--per-page",
         help="Items per page (1-100)",
     ),
+    cursor: Optional[str] = typer.Option(
+        None,
+        "--cursor",
+        help="Continue from a previous page's next cursor (faster than --page)",
+    ),
     output_format: str = typer.Option(
         "table",
         "--format",
@@ -412,6 +417,7 @@ def list_resources(
         pharos resource list --query "machine learning"
         pharos resource list --min-quality 0.8
         pharos resource list --tags important,python
+        pharos resource list --cursor <next cursor>
     """
     console = get_console()
 
@@ -441,6 +447,7 @@ def list_resources(
             min_quality=min_quality,
             collection_id=collection_id,
             tags=tag_list,
+            cursor=cursor,
         )
 
         # Format output
@@ -457,6 +464,7 @@ def list_resources(
                 "page": result.page,
                 "per_page": result.per_page,
                 "has_more": result.has_more,
+                "next_cursor": result.next_cursor,
             }
             print(formatter.format(output))
         else:
@@ -478,7 +486,11 @@ def list_resources(
 
             # Show pagination info
             console.print(f"\n[dim]Showing {len(result.items)} of {result.total} resources[/dim]")
-            if result.has_more:
+            if result.next_cursor:
+                console.print(
+                    f"[dim]Use --cursor {result.next_cursor} for next page[/dim]"
+                )
+            elif result.has_more:
                 console.print(f"[dim]Use --page {page + 1} for next page[/dim]")
 
     except APIError as e:
@@ -211,6 +211,26 @@ class TestResourceClient:
         )
         assert len(result.items) == 1
 
+    def test_list_with_cursor(
+        self,
+        resource_client: ResourceClient,
+        mock_api_client: MagicMock,
+    ) -> None:
+        """Test continuing a listing from a keyset cursor."""
+        mock_api_client.get.return_value = {
+            "items": [{"id": 3, "title": "Next Resource"}],
+            "total": 3,
+            "next_cursor": "eyJpZCI6IjMifQ",
+        }
+
+        result = resource_client.list(limit=1, cursor="eyJpZCI6IjIifQ")
+
+        mock_api_client.get.assert_called_once_with(
+            "/api/v1/resources",
+            params={"skip": 0, "limit": 1, "cursor": "eyJpZCI6IjIifQ"},
+        )
+        assert result.next_cursor == "eyJpZCI6IjMifQ"
+
     def test_list_with_collection_id(
         self,
         resource_client: ResourceClient,